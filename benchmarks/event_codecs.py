@@ -0,0 +1,120 @@
+"""Benchmark: generated event codecs vs. ``dataclasses.fields`` reflection.
+
+For each of tabb's nine event types, times ``--repeat`` rounds of:
+validating a constructed event, encoding it to a payload dict and decoding
+it back, with the generated codec and with the reflection the codecs
+replaced; and encoding plus decoding through the binary codec and through
+JSON. Reports mean ns per call and the record size of each encoding.
+
+Usage::
+
+    uv run python benchmarks/event_codecs.py --repeat 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from dataclasses import fields
+from typing import Any
+
+from tabb.adapters.outbound.persistence.event_store.binary_codec import (
+    decode_binary,
+    encode_binary,
+)
+from tabb.domain.events.base import DomainEvent
+from tabb.domain.events.codecs import codec_for
+from tabb.domain.events.events import (
+    DishMarkedReady,
+    MenuItemAvailable,
+    MenuItemCreated,
+    MenuItemSoldOut,
+    OrderCancelled,
+    OrderCompleted,
+    OrderItemAdded,
+    OrderItemCancelled,
+    OrderPlaced,
+)
+
+EVENTS: list[DomainEvent] = [
+    OrderPlaced(order_id="o-1042", table_number=12),
+    OrderItemAdded(
+        order_id="o-1042",
+        order_item_id="oi-88121",
+        menu_item_id="m-17",
+        name="Double cheeseburger",
+        unit_price="12.50",
+        quantity=2,
+    ),
+    OrderItemCancelled(order_id="o-1042", order_item_id="oi-88121"),
+    DishMarkedReady(order_id="o-1042", order_item_id="oi-88121"),
+    OrderCompleted(order_id="o-1042"),
+    OrderCancelled(order_id="o-1042"),
+    MenuItemSoldOut(menu_item_id="m-17"),
+    MenuItemCreated(menu_item_id="m-17", name="Double cheeseburger", price="12.50"),
+    MenuItemAvailable(menu_item_id="m-17"),
+]
+
+
+def _reflect_validate(event: DomainEvent) -> None:
+    for f in fields(event):
+        if getattr(event, f.name) is None:
+            raise ValueError(f.name)
+
+
+def _reflect_encode(event: DomainEvent) -> dict[str, Any]:
+    return {f.name: getattr(event, f.name) for f in fields(event)}
+
+
+def _json_round_trip(event: DomainEvent) -> DomainEvent:
+    codec = codec_for(type(event))
+    return codec.decode(json.loads(json.dumps(codec.encode(event))))
+
+
+def _ns(call: Any, repeat: int) -> float:
+    return timeit.timeit(call, number=repeat) / repeat * 1e9
+
+
+def _row(event: DomainEvent, repeat: int) -> str:
+    event_type = type(event)
+    codec = codec_for(event_type)
+    payload = codec.encode(event)
+    record = encode_binary(event)
+    text = json.dumps(payload).encode()
+    timings = [
+        _ns(lambda: _reflect_validate(event), repeat),
+        _ns(lambda: codec.validate(event), repeat),
+        _ns(lambda: _reflect_encode(event), repeat),
+        _ns(lambda: codec.encode(event), repeat),
+        _ns(lambda: event_type(**payload), repeat),
+        _ns(lambda: codec.decode(payload), repeat),
+    ]
+    binary_ns = _ns(lambda: decode_binary(encode_binary(event)), repeat)
+    json_ns = _ns(lambda: _json_round_trip(event), repeat)
+    return (
+        f"{event.event_name:<19} "
+        + " ".join(f"{ns:>8.0f}" for ns in timings)
+        + f" {binary_ns:>6.0f} {len(record):>6} {json_ns:>6.0f} {len(text):>6}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'event':<19} {'validate':>17} {'encode':>17} {'decode':>17}"
+        f" {'binary':>13} {'json':>13}"
+    )
+    print(
+        f"{'':<19} {'reflect':>8} {'codec':>8} {'reflect':>8} {'codec':>8}"
+        f" {'kwargs':>8} {'codec':>8} {'ns':>6} {'B':>6} {'ns':>6} {'B':>6}"
+    )
+    for event in EVENTS:
+        print(_row(event, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Benchmark: MarkItemReadyHandler on the WAL store vs. the event store.
+
+Places ``--orders`` orders of ``--size`` items, then marks every item ready,
+one command each. The WAL run uses ``InMemoryUnitOfWork`` with a
+write-ahead log, which records the whole order and an outbox copy of each
+event per commit; the event-store run uses ``EventSourcedUnitOfWork``,
+which appends each event once. Reports bytes written per command and mean
+latency, with a hot-aggregate cache large enough for every order and with
+none (every load rehydrates from the log).
+
+Usage::
+
+    uv run python benchmarks/event_store.py --orders 500 --size 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from collections.abc import Callable
+from decimal import Decimal
+from pathlib import Path
+
+from tabb.adapters.outbound.persistence.event_store.aggregate_cache import (
+    AggregateCache,
+)
+from tabb.adapters.outbound.persistence.event_store.outbox import EventLogOutbox
+from tabb.adapters.outbound.persistence.event_store.segmented_event_store import (
+    SegmentedEventStore,
+)
+from tabb.adapters.outbound.persistence.event_store.unit_of_work import (
+    EventSourcedUnitOfWork,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.unit_of_work import (
+    InMemoryUnitOfWork,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.write_ahead_log import (
+    WriteAheadLog,
+)
+from tabb.application.commands.mark_item_ready import (
+    MarkItemReadyCommand,
+    MarkItemReadyHandler,
+)
+from tabb.application.ports.outbound.unit_of_work import UnitOfWork
+from tabb.domain.models.menu_item import MenuItemId
+from tabb.domain.models.order import Order, OrderId, OrderItemId
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+
+def _order(order_id: str, size: int) -> Order:
+    order = Order.place(OrderId(order_id), TableNumber(1))
+    for i in range(size):
+        order.add_item(
+            OrderItemId(f"{order_id}-{i}"),
+            MenuItemId(f"m-{i}"),
+            "Burger",
+            Money(Decimal("9.99")),
+            Quantity(2),
+        )
+    return order
+
+
+def _log_bytes(path: Path) -> int:
+    if path.is_dir():
+        return sum(segment.stat().st_size for segment in path.glob("*.seg"))
+    return path.stat().st_size
+
+
+async def _run(
+    new_uow: Callable[[], UnitOfWork], log_path: Path, orders: int, size: int
+) -> tuple[float, float]:
+    """Bytes written per command and mean latency in µs."""
+    for n in range(orders):
+        uow = new_uow()
+        async with uow:
+            await uow.order_repository.save(_order(f"o-{n}", size))
+            await uow.commit()
+    commands = [
+        MarkItemReadyCommand(order_id=f"o-{n}", order_item_id=f"o-{n}-{i}")
+        for i in range(size)
+        for n in range(orders)
+    ]
+
+    written = _log_bytes(log_path)
+    started = time.perf_counter()
+    for command in commands:
+        await MarkItemReadyHandler(new_uow()).handle(command)
+    elapsed = time.perf_counter() - started
+    per_command = (_log_bytes(log_path) - written) / len(commands)
+    return per_command, elapsed / len(commands) * 1e6
+
+
+async def _wal(directory: Path, orders: int, size: int) -> tuple[float, float]:
+    path = directory / "wal.log"
+    log = WriteAheadLog(path)
+    order_store: InMemoryVersionedStore[Order] = InMemoryVersionedStore()
+    menu_item_store = InMemoryVersionedStore()
+    outbox_store = InMemoryOutboxStore()
+    try:
+        return await _run(
+            lambda: InMemoryUnitOfWork(
+                order_store, menu_item_store, outbox_store, write_ahead_log=log
+            ),
+            path,
+            orders,
+            size,
+        )
+    finally:
+        log.close()
+
+
+async def _events(
+    directory: Path, orders: int, size: int, cache_size: int
+) -> tuple[float, float]:
+    path = directory / f"events-{cache_size}"
+    store = SegmentedEventStore(path)
+    outbox = EventLogOutbox(store)
+    menu_item_store = InMemoryVersionedStore()
+    cache: AggregateCache[Order] | None = (
+        AggregateCache(cache_size) if cache_size else None
+    )
+    try:
+        return await _run(
+            lambda: EventSourcedUnitOfWork(outbox, menu_item_store, cache),
+            path,
+            orders,
+            size,
+        )
+    finally:
+        store.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--size", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        runs = {
+            "wal": await _wal(directory, args.orders, args.size),
+            "events, hot cache": await _events(
+                directory, args.orders, args.size, args.orders
+            ),
+            "events, no cache": await _events(directory, args.orders, args.size, 0),
+        }
+
+    print(f"{'store':<18} {'bytes/cmd':>10} {'latency':>12}")
+    for name, (per_command, latency) in runs.items():
+        print(f"{name:<18} {per_command:>10.0f} {latency:>9.1f} µs")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
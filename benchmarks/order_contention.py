@@ -0,0 +1,155 @@
+"""Benchmark: kitchen stations marking items ready on one shared order.
+
+``--stations`` concurrent tasks each mark their share of the items of one
+``--items``-item order ready through an ``InProcessCommandBus``. Loading the
+order awaits ``--latency`` seconds to simulate I/O, so the stations'
+units of work overlap. The merging run uses the in-memory repository as
+shipped; the strict run rejects every concurrent commit, as a
+whole-aggregate version check would. The mailbox run uses the strict
+repository behind a bus in mailbox mode, which queues the stations'
+commands on the order instead of letting them race.
+
+Usage::
+
+    uv run python benchmarks/order_contention.py --stations 20 --items 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+
+from tabb.adapters.outbound.persistence.in_memory.order_repository import (
+    InMemoryOrderRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.unit_of_work import (
+    InMemoryUnitOfWork,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.application.bus import InProcessCommandBus, command_aggregate_key
+from tabb.application.commands.mark_item_ready import (
+    MarkItemReadyCommand,
+    MarkItemReadyHandler,
+)
+from tabb.application.exceptions import ConcurrencyConflictError
+from tabb.domain.models.menu_item import MenuItemId
+from tabb.domain.models.order import Order, OrderId, OrderItemId, OrderItemStatus
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+
+class SlowOrderRepository(InMemoryOrderRepository):
+    """Order repository whose reads take ``latency`` seconds to return."""
+
+    latency = 0.0
+
+    async def find_by_id(self, order_id: OrderId) -> Order | None:
+        order = await super().find_by_id(order_id)
+        await asyncio.sleep(self.latency)
+        return order
+
+
+class StrictOrderRepository(SlowOrderRepository):
+    """Rejects every concurrent commit instead of merging."""
+
+    def _merge(self, key: str, order: Order, committed: Order | None) -> None:
+        return None
+
+
+class StationUnitOfWork(InMemoryUnitOfWork):
+    repository_type: type[InMemoryOrderRepository] = SlowOrderRepository
+
+    async def __aenter__(self) -> InMemoryUnitOfWork:
+        await super().__aenter__()
+        if self._order_repo is not None:
+            self._order_repo.close()
+        self._order_repo = self.repository_type(self._order_store)
+        return self
+
+
+class StrictUnitOfWork(StationUnitOfWork):
+    repository_type = StrictOrderRepository
+
+
+def _order(size: int) -> Order:
+    order = Order.place(OrderId("o-1"), TableNumber(1))
+    for i in range(size):
+        order.add_item(
+            OrderItemId(f"oi-{i}"),
+            MenuItemId(f"m-{i}"),
+            "Burger",
+            Money(Decimal("9.99")),
+            Quantity(1),
+        )
+    order.collect_events()
+    return order
+
+
+async def _run(
+    uow_type: type[StationUnitOfWork], args: argparse.Namespace, mailbox: bool
+) -> tuple[float, int, int]:
+    """Return (successful commands/s, handler attempts, commands given up)."""
+    order_store = InMemoryVersionedStore({"o-1": _order(args.items)})
+    outbox_store = InMemoryOutboxStore()
+    attempts = 0
+
+    def factory() -> MarkItemReadyHandler:
+        nonlocal attempts
+        attempts += 1
+        uow = uow_type(order_store, InMemoryVersionedStore(), outbox_store)
+        return MarkItemReadyHandler(uow)
+
+    bus = InProcessCommandBus(
+        max_attempts=args.max_attempts,
+        mailbox_key=command_aggregate_key if mailbox else None,
+    )
+    bus.register(MarkItemReadyCommand, factory)
+    failed = 0
+
+    async def station(index: int) -> None:
+        nonlocal failed
+        for item in range(index, args.items, args.stations):
+            try:
+                await bus.dispatch(
+                    MarkItemReadyCommand(order_id="o-1", order_item_id=f"oi-{item}")
+                )
+            except ConcurrencyConflictError:
+                failed += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(station(i) for i in range(args.stations)))
+    elapsed = time.perf_counter() - started
+
+    ready = sum(i.status == OrderItemStatus.READY for i in order_store["o-1"].items)
+    assert ready == args.items - failed
+    return (args.items - failed) / elapsed, attempts, failed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=20)
+    parser.add_argument("--items", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.001)
+    parser.add_argument("--max-attempts", type=int, default=3)
+    args = parser.parse_args()
+    SlowOrderRepository.latency = args.latency
+
+    print(f"{'mode':>8} {'commands/s':>12} {'attempts':>10} {'gave up':>8}")
+    modes = (
+        ("strict", StrictUnitOfWork, False),
+        ("merge", StationUnitOfWork, False),
+        ("mailbox", StrictUnitOfWork, True),
+    )
+    for label, uow_type, mailbox in modes:
+        throughput, attempts, failed = await _run(uow_type, args, mailbox)
+        print(f"{label:>8} {throughput:>12,.0f} {attempts:>10} {failed:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
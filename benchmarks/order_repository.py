@@ -0,0 +1,115 @@
+"""Benchmark: MarkItemReadyHandler latency, deep copy vs. copy-on-write.
+
+Runs ``MarkItemReadyHandler`` against orders of ``--sizes`` items. The
+copy-on-write run uses the in-memory repositories as shipped; the deep-copy
+run swaps in subclasses that restore the former ``copy.deepcopy`` on every
+``find_by_id`` and ``save``.
+
+Usage::
+
+    uv run python benchmarks/order_repository.py --sizes 5 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import time
+from decimal import Decimal
+
+from tabb.adapters.outbound.persistence.in_memory.order_repository import (
+    InMemoryOrderRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.unit_of_work import (
+    InMemoryUnitOfWork,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.application.commands.mark_item_ready import (
+    MarkItemReadyCommand,
+    MarkItemReadyHandler,
+)
+from tabb.domain.models.menu_item import MenuItemId
+from tabb.domain.models.order import Order, OrderId, OrderItemId
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+
+class DeepcopyOrderRepository(InMemoryOrderRepository):
+    """Previous behaviour: deep-copy on every read and write."""
+
+    def _load(self, key: str) -> Order | None:
+        committed = self._snapshot.get(key)
+        if committed is None:
+            return None
+        order = copy.deepcopy(committed)
+        self._bases[key] = committed
+        self._identity[key] = order
+        return order
+
+    async def save(self, order: Order) -> None:
+        self._track(copy.deepcopy(order))
+
+
+class DeepcopyUnitOfWork(InMemoryUnitOfWork):
+    async def __aenter__(self) -> InMemoryUnitOfWork:
+        await super().__aenter__()
+        if self._order_repo is not None:
+            self._order_repo.close()
+        self._order_repo = DeepcopyOrderRepository(self._order_store)
+        return self
+
+
+def _order(order_id: str, size: int) -> Order:
+    order = Order.place(OrderId(order_id), TableNumber(1))
+    for i in range(size):
+        order.add_item(
+            OrderItemId(f"{order_id}-{i}"),
+            MenuItemId(f"m-{i}"),
+            "Burger",
+            Money(Decimal("9.99")),
+            Quantity(2),
+        )
+    order.collect_events()
+    return order
+
+
+async def _run(uow_type: type[InMemoryUnitOfWork], size: int, orders: int) -> float:
+    """Mean handler latency in µs, marking one item ready per command."""
+    order_store = InMemoryVersionedStore(
+        {f"o-{n}": _order(f"o-{n}", size) for n in range(orders)}
+    )
+    outbox_store = InMemoryOutboxStore()
+    commands = [
+        MarkItemReadyCommand(order_id=f"o-{n}", order_item_id=f"o-{n}-{i}")
+        for i in range(size)
+        for n in range(orders)
+    ]
+
+    started = time.perf_counter()
+    for command in commands:
+        uow = uow_type(order_store, InMemoryVersionedStore(), outbox_store)
+        await MarkItemReadyHandler(uow).handle(command)
+    return (time.perf_counter() - started) / len(commands) * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 200])
+    parser.add_argument("--commands", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"{'items':>6} {'deepcopy':>12} {'cow':>12} {'speedup':>8}")
+    for size in args.sizes:
+        orders = max(1, args.commands // size)
+        deep = await _run(DeepcopyUnitOfWork, size, orders)
+        cow = await _run(InMemoryUnitOfWork, size, orders)
+        print(f"{size:>6} {deep:>9.1f} µs {cow:>9.1f} µs {deep / cow:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
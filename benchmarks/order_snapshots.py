@@ -0,0 +1,107 @@
+"""Benchmark: event-sourced Order load time against stream length.
+
+Builds one order per ``--lengths`` value whose stream holds that many
+events, one commit each, as an all-day bar tab does: every round is added
+and then marked ready. Loads it with a cold
+repository (no hot-aggregate cache) from the full stream, and from the
+snapshot the ``--every`` snapshot policy would have left plus the tail.
+
+Usage::
+
+    uv run python benchmarks/order_snapshots.py --lengths 10 100 1000 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from tabb.adapters.outbound.persistence.event_store.aggregate_snapshots import (
+    AggregateSnapshot,
+    AggregateSnapshotStore,
+)
+from tabb.adapters.outbound.persistence.event_store.event_codec import encode_event
+from tabb.adapters.outbound.persistence.event_store.order_repository import (
+    EventSourcedOrderRepository,
+)
+from tabb.adapters.outbound.persistence.event_store.segmented_event_store import (
+    SegmentedEventStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.serialization import (
+    order_to_record,
+)
+from tabb.domain.models.menu_item import MenuItemId
+from tabb.domain.models.order import Order, OrderId, OrderItemId
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+
+def _build(
+    event_store: SegmentedEventStore,
+    snapshots: AggregateSnapshotStore,
+    order_id: str,
+    length: int,
+    every: int,
+) -> None:
+    """Append a ``length``-event stream, snapshotting every ``every`` events."""
+    order = Order.place(OrderId(order_id), TableNumber(1))
+    for n in range(length - 1):
+        item_id = OrderItemId(f"{order_id}-{n // 2}")
+        if n % 2:
+            order.mark_item_ready(item_id)
+        else:
+            order.add_item(
+                item_id, MenuItemId("m-1"), "Beer", Money(Decimal("5.50")), Quantity(1)
+            )
+    history = order.collect_events()
+    replayed = Order.from_events(history[:1])
+    for version, event in enumerate(history, start=1):
+        event_store.append("Order", order_id, version - 1, [encode_event(event)])
+        if version > 1:
+            replayed.apply(event)
+        if version % every == 0:
+            replayed._version = version
+            snapshots.save(
+                "Order", order_id, AggregateSnapshot(version, order_to_record(replayed))
+            )
+
+
+async def _load_us(
+    event_store: SegmentedEventStore,
+    snapshots: AggregateSnapshotStore | None,
+    order_id: str,
+    repeat: int,
+) -> float:
+    """Mean cold load time in µs."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        repo = EventSourcedOrderRepository(event_store, snapshots=snapshots)
+        await repo.find_by_id(OrderId(order_id))
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--every", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        event_store = SegmentedEventStore(Path(tmp) / "events")
+        snapshots = AggregateSnapshotStore(Path(tmp) / "snapshots")
+        print(f"{'events':>7} {'full replay':>14} {'snapshot':>14} {'speedup':>8}")
+        for length in args.lengths:
+            order_id = f"tab-{length}"
+            _build(event_store, snapshots, order_id, length, args.every)
+            full = await _load_us(event_store, None, order_id, args.repeat)
+            tail = await _load_us(event_store, snapshots, order_id, args.repeat)
+            print(f"{length:>7} {full:>11.1f} µs {tail:>11.1f} µs {full / tail:>7.1f}x")
+        event_store.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
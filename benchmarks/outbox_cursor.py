@@ -0,0 +1,102 @@
+"""Benchmark: in-memory outbox batch fetch cost against history size.
+
+Fills an ``InMemoryOutboxStore`` with ``--history`` processed entries, as
+left by the worker that processed them, and ``--pending`` pending ones,
+every tenth of which fails once. Then drains the pending entries in
+``--batch`` sized ``find_ready`` calls, marking each batch, and reads the
+whole log through ``read_after`` as a cursor-holding consumer would.
+Reports mean µs per fetched batch.
+
+Usage::
+
+    uv run python benchmarks/outbox_cursor.py --history 0 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import UTC, datetime, timedelta
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.application.outbox import OutboxEntry
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = _EPOCH
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _entry(n: int) -> OutboxEntry:
+    return OutboxEntry(
+        _entry_id=f"e-{n}",
+        _event_type="DishMarkedReady",
+        _event_data={"order_id": f"o-{n}", "order_item_id": f"oi-{n}"},
+        _aggregate_id=f"o-{n}",
+        _aggregate_type="Order",
+        _occurred_at=_EPOCH,  # every entry ties on occurred_at
+    )
+
+
+def _run(history: int, pending: int, batch: int) -> tuple[float, float]:
+    """Mean µs per find_ready batch and per read_after batch."""
+    clock = _Clock()
+    store = InMemoryOutboxStore(clock=clock)
+    for n in range(history):
+        store.add(_entry(n))
+        store.mark_processed(f"e-{n}")
+    store.find_ready(batch)  # leave the store as the worker that drained it
+    for n in range(history, history + pending):
+        store.add(_entry(n))
+
+    fetches = 0
+    elapsed = 0.0
+    failed: set[str] = set()
+    while store.pending_count:
+        started = time.perf_counter()
+        ready = store.find_ready(batch)
+        elapsed += time.perf_counter() - started
+        fetches += 1
+        if not ready:
+            clock.now += timedelta(hours=1)
+            continue
+        for entry in ready:
+            if (entry.sequence or 0) % 10 == 0 and entry.entry_id not in failed:
+                failed.add(entry.entry_id)
+                store.mark_failed(entry.entry_id, "boom")
+                continue
+            store.mark_processed(entry.entry_id)
+    drain_us = elapsed / fetches * 1e6
+
+    reads = 0
+    position = history
+    started = time.perf_counter()
+    while entries := store.read_after(position, batch):
+        position = entries[-1].sequence or position
+        reads += 1
+    read_us = (time.perf_counter() - started) / max(reads, 1) * 1e6
+    return drain_us, read_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--history", type=int, nargs="+", default=[0, 100_000])
+    parser.add_argument("--pending", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'history':>9} {'find_ready':>14} {'read_after':>14}")
+    for history in args.history:
+        drain_us, read_us = _run(history, args.pending, args.batch)
+        print(f"{history:>9} {drain_us:>11.1f} µs {read_us:>11.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark: OutboxEntry footprint, creation and payload access.
+
+Creates ``--entries`` outbox entries from ``DishMarkedReady`` events with
+``OutboxEntry.create`` and reports the bytes traced per entry (the entry and
+its payload dict), ``create`` throughput, ``event_data`` reads per second
+(one key looked up per read, as a projector does) and
+``InMemoryOutboxRepository.save`` throughput.
+
+Usage::
+
+    uv run python benchmarks/outbox_entry.py --entries 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_repository import (
+    InMemoryOutboxRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.application.outbox import OutboxEntry
+from tabb.domain.events.events import DishMarkedReady
+
+
+def _events(count: int) -> list[DishMarkedReady]:
+    return [
+        DishMarkedReady(order_id=f"o-{i // 10}", order_item_id=f"oi-{i}")
+        for i in range(count)
+    ]
+
+
+def _create(events: list[DishMarkedReady]) -> list[OutboxEntry]:
+    return [
+        OutboxEntry.create(f"e-{i}", event, event.order_id, "Order")
+        for i, event in enumerate(events)
+    ]
+
+
+def _bytes_per_entry(events: list[DishMarkedReady]) -> float:
+    entry_ids = [f"e-{i}" for i in range(len(events))]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entries = [
+        OutboxEntry.create(entry_id, event, event.order_id, "Order")
+        for entry_id, event in zip(entry_ids, events, strict=True)
+    ]
+    traced = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # The list holding the entries is not part of their footprint.
+    return (traced - entries.__sizeof__()) / len(entries)
+
+
+def _rate(count: int, elapsed: float) -> float:
+    return count / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200_000)
+    args = parser.parse_args()
+
+    events = _events(args.entries)
+    per_entry = _bytes_per_entry(events)
+
+    started = time.perf_counter()
+    entries = _create(events)
+    create_rate = _rate(len(entries), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for entry in entries:
+        entry.event_data["order_id"]
+    read_rate = _rate(len(entries), time.perf_counter() - started)
+
+    repository = InMemoryOutboxRepository(InMemoryOutboxStore())
+    started = time.perf_counter()
+    for entry in entries:
+        await repository.save(entry)
+    repository.flush()
+    save_rate = _rate(len(entries), time.perf_counter() - started)
+
+    print(f"bytes/entry  {per_entry:>10.0f}")
+    print(f"create/s     {create_rate:>10.0f}")
+    print(f"reads/s      {read_rate:>10.0f}")
+    print(f"save/s       {save_rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""Benchmark: outbox projection throughput vs. processing lane count.
+
+Each projector call awaits ``--latency`` seconds to simulate I/O against a
+read store. Events are spread over ``--aggregates`` orders.
+
+Usage::
+
+    uv run python benchmarks/outbox_lanes.py --lanes 1 2 4 8 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_repository import (
+    InMemoryOutboxRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.workers.outbox_processor import InMemoryOutboxProcessor
+from tabb.application.outbox import OutboxEntry
+from tabb.application.ports.inbound.projector import Projector
+
+
+class SlowProjector(Projector):
+    """Projector that only simulates I/O latency."""
+
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+
+    def handles(self) -> list[str]:
+        return ["DishMarkedReady"]
+
+    async def project(self, event_type: str, event_data: Mapping[str, object]) -> None:
+        await asyncio.sleep(self._latency)
+
+
+def _fill(store: InMemoryOutboxStore, events: int, aggregates: int) -> None:
+    start = datetime.now(UTC)
+    for i in range(events):
+        order_id = f"o-{i % aggregates}"
+        store.add(
+            OutboxEntry(
+                _entry_id=f"e-{i}",
+                _event_type="DishMarkedReady",
+                _event_data={"order_id": order_id, "order_item_id": f"oi-{i}"},
+                _aggregate_id=order_id,
+                _aggregate_type="Order",
+                _occurred_at=start + timedelta(microseconds=i),
+            )
+        )
+
+
+async def _run(lanes: int, args: argparse.Namespace) -> float:
+    store = InMemoryOutboxStore()
+    _fill(store, args.events, args.aggregates)
+    processor = InMemoryOutboxProcessor(
+        outbox_repository=InMemoryOutboxRepository(store),
+        projectors=[SlowProjector(args.latency)],
+        lanes=lanes,
+        batch_size=args.batch_size,
+    )
+    started = time.perf_counter()
+    processed = 0
+    while processed < args.events:
+        processed += await processor.process_pending()
+    return args.events / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lanes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--events", type=int, default=2_000)
+    parser.add_argument("--aggregates", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.001)
+    args = parser.parse_args()
+
+    print(f"{'lanes':>6} {'events/s':>12}")
+    for lanes in args.lanes:
+        throughput = await _run(lanes, args)
+        print(f"{lanes:>6} {throughput:>12,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
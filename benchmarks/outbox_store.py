@@ -0,0 +1,98 @@
+"""Benchmark: indexed outbox store vs. the original list scan.
+
+Fills the outbox with N pending entries, then measures one worker poll:
+``find_pending(limit=10)`` followed by ``mark_processed`` for each entry.
+
+Usage::
+
+    uv run python benchmarks/outbox_store.py --sizes 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import UTC, datetime, timedelta
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+
+POLL_LIMIT = 10
+
+
+class ListScanOutbox:
+    """The pre-index implementation: linear scans and a sort per poll."""
+
+    def __init__(self) -> None:
+        self._store: list[OutboxEntry] = []
+
+    def add(self, entry: OutboxEntry) -> None:
+        self._store.append(entry)
+
+    def find_ready(self, limit: int) -> list[OutboxEntry]:
+        pending = [
+            e
+            for e in self._store
+            if e.status in (OutboxEntryStatus.PENDING, OutboxEntryStatus.FAILED)
+            and e.can_retry
+            and e.is_ready_for_retry
+        ]
+        pending.sort(key=lambda e: e.occurred_at)
+        return pending[:limit]
+
+    def mark_processed(self, entry_id: str) -> None:
+        for entry in self._store:
+            if entry.entry_id == entry_id:
+                entry.mark_processed()
+                return
+
+
+def _entries(n: int) -> list[OutboxEntry]:
+    start = datetime.now(UTC)
+    return [
+        OutboxEntry(
+            _entry_id=f"e-{i}",
+            _event_type="DishMarkedReady",
+            _event_data={"order_id": "o-1", "order_item_id": f"oi-{i}"},
+            _aggregate_id="o-1",
+            _aggregate_type="Order",
+            _occurred_at=start + timedelta(microseconds=i),
+        )
+        for i in range(n)
+    ]
+
+
+def _poll_seconds(store: ListScanOutbox | InMemoryOutboxStore, polls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(polls):
+        for entry in store.find_ready(POLL_LIMIT):
+            store.mark_processed(entry.entry_id)
+    return (time.perf_counter() - started) / polls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--polls", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'entries':>10} {'list scan':>14} {'indexed':>14} {'speedup':>9}")
+    for size in args.sizes:
+        timings = []
+        for store in (ListScanOutbox(), InMemoryOutboxStore()):
+            for entry in _entries(size):
+                store.add(entry)
+            timings.append(_poll_seconds(store, args.polls))
+        scan, indexed = timings
+        print(
+            f"{size:>10,} {scan * 1e3:>11.3f} ms {indexed * 1e3:>11.3f} ms "
+            f"{scan / indexed:>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark: command-to-projection latency, interval polling vs. commit wakeup.
+
+Runs ``CreateMenuItemHandler`` commands at random intervals against the
+in-memory stack with a live ``AsyncOutboxWorker`` and measures the time
+from commit to the read model being saved.
+
+Usage::
+
+    uv run python benchmarks/outbox_wakeup.py --commands 50 --interval 1.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from decimal import Decimal
+
+from tabb.adapters.outbound.persistence.in_memory.menu_item_read_model_repository import (
+    InMemoryMenuItemReadModelRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_repository import (
+    InMemoryOutboxRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.unit_of_work import (
+    InMemoryUnitOfWork,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.adapters.outbound.projectors.menu_item_projector import MenuItemProjector
+from tabb.adapters.outbound.workers.background_outbox_worker import AsyncOutboxWorker
+from tabb.adapters.outbound.workers.outbox_processor import InMemoryOutboxProcessor
+from tabb.adapters.outbound.workers.outbox_wakeup import AsyncioOutboxWakeup
+from tabb.application.commands.create_menu_item import (
+    CreateMenuItemCommand,
+    CreateMenuItemHandler,
+)
+from tabb.application.read_models.menu_item_read_model import MenuItemReadModel
+from tabb.domain.models.menu_item import MenuItem
+from tabb.domain.models.order import Order
+
+
+class TimedReadRepository(InMemoryMenuItemReadModelRepository):
+    """Read repository that timestamps the first save of each read model."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.saved_at: dict[str, float] = {}
+
+    async def save(self, read_model: MenuItemReadModel) -> None:
+        self.saved_at.setdefault(read_model.menu_item_id, time.perf_counter())
+        await super().save(read_model)
+
+
+async def _measure(use_wakeup: bool, args: argparse.Namespace) -> list[float]:
+    outbox_store = InMemoryOutboxStore()
+    read_repo = TimedReadRepository()
+    wakeup = AsyncioOutboxWakeup() if use_wakeup else None
+    worker = AsyncOutboxWorker(
+        processor=InMemoryOutboxProcessor(
+            outbox_repository=InMemoryOutboxRepository(outbox_store),
+            projectors=[MenuItemProjector(read_repo)],
+        ),
+        interval_seconds=args.interval,
+        wakeup=wakeup,
+    )
+    order_store: InMemoryVersionedStore[Order] = InMemoryVersionedStore()
+    menu_item_store: InMemoryVersionedStore[MenuItem] = InMemoryVersionedStore()
+    committed_at: dict[str, float] = {}
+
+    await worker.start()
+    for i in range(args.commands):
+        await asyncio.sleep(random.uniform(0, args.interval))
+        uow = InMemoryUnitOfWork(order_store, menu_item_store, outbox_store, wakeup)
+        menu_item_id = f"m-{i}"
+        await CreateMenuItemHandler(uow).handle(
+            CreateMenuItemCommand(
+                menu_item_id=menu_item_id, name="Burger", price=Decimal("9.99")
+            )
+        )
+        committed_at[menu_item_id] = time.perf_counter()
+    while len(read_repo.saved_at) < args.commands:
+        await asyncio.sleep(args.interval / 10)
+    await worker.stop()
+
+    return [read_repo.saved_at[k] - v for k, v in committed_at.items()]
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':>10} {'p50':>12} {'p99':>12} {'mean':>12}")
+    for label, use_wakeup in (("polling", False), ("wakeup", True)):
+        samples = await _measure(use_wakeup, args)
+        print(
+            f"{label:>10} {_percentile(samples, 0.50) * 1e3:>9.3f} ms "
+            f"{_percentile(samples, 0.99) * 1e3:>9.3f} ms "
+            f"{statistics.fmean(samples) * 1e3:>9.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,165 @@
+"""Benchmark: read-model query latency and allocations, deepcopy vs. shared.
+
+Compares ``GetAvailableMenuItemsHandler`` and ``GetOrderHandler`` against
+the in-memory read repositories, which hand out immutable read models by
+reference, and against subclasses that restore the former deep-copy on
+every read and write.
+
+Usage::
+
+    uv run python benchmarks/read_models.py --menu-items 200 --order-items 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+
+from tabb.adapters.outbound.persistence.in_memory.menu_item_read_model_repository import (
+    InMemoryMenuItemReadModelRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.order_read_model_repository import (
+    InMemoryOrderReadModelRepository,
+)
+from tabb.application.queries.get_available_menu_items import (
+    GetAvailableMenuItemsHandler,
+    GetAvailableMenuItemsQuery,
+)
+from tabb.application.queries.get_order import GetOrderHandler, GetOrderQuery
+from tabb.application.read_models.menu_item_read_model import MenuItemReadModel
+from tabb.application.read_models.order_read_model import (
+    OrderItemReadModel,
+    OrderReadModel,
+)
+
+
+class DeepcopyMenuItemReadModelRepository(InMemoryMenuItemReadModelRepository):
+    """Previous behaviour: deep-copy on every read and write."""
+
+    async def find_by_id(self, menu_item_id: str) -> MenuItemReadModel | None:
+        return copy.deepcopy(await super().find_by_id(menu_item_id))
+
+    async def find_all_available(self) -> list[MenuItemReadModel]:
+        return [copy.deepcopy(rm) for rm in await super().find_all_available()]
+
+    async def save(self, read_model: MenuItemReadModel) -> None:
+        await super().save(copy.deepcopy(read_model))
+
+
+class DeepcopyOrderReadModelRepository(InMemoryOrderReadModelRepository):
+    """Previous behaviour: deep-copy on every read and write."""
+
+    async def find_by_id(self, order_id: str) -> OrderReadModel | None:
+        return copy.deepcopy(await super().find_by_id(order_id))
+
+    async def save(self, read_model: OrderReadModel) -> None:
+        await super().save(copy.deepcopy(read_model))
+
+
+async def _fill_menu(repo: InMemoryMenuItemReadModelRepository, size: int) -> None:
+    for i in range(size):
+        await repo.save(
+            MenuItemReadModel(
+                menu_item_id=f"m-{i}", name=f"Dish {i}", price="9.99", available=True
+            )
+        )
+
+
+async def _fill_order(repo: InMemoryOrderReadModelRepository, size: int) -> None:
+    items = tuple(
+        OrderItemReadModel(
+            order_item_id=f"oi-{i}",
+            menu_item_id=f"m-{i}",
+            name=f"Dish {i}",
+            unit_price="9.99",
+            quantity=1,
+            status="pending",
+            total_price="9.99",
+        )
+        for i in range(size)
+    )
+    await repo.save(
+        OrderReadModel(order_id="o-1", table_number=1, status="open", items=items)
+    )
+
+
+async def _latency(query: Callable[[], Awaitable[object]], iterations: int) -> float:
+    """Mean end-to-end query handler latency in µs."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await query()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+async def _allocations(read: Callable[[], Awaitable[object]], samples: int) -> float:
+    """Mean memory blocks allocated by one repository read.
+
+    Results are kept alive until the second snapshot so that every block a
+    read allocates is counted.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [await read() for _ in range(samples)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del results
+    diff = after.compare_to(before, "filename")
+    return sum(s.count_diff for s in diff) / samples
+
+
+async def _run(
+    label: str,
+    menu_repo: InMemoryMenuItemReadModelRepository,
+    order_repo: InMemoryOrderReadModelRepository,
+    args: argparse.Namespace,
+) -> None:
+    await _fill_menu(menu_repo, args.menu_items)
+    await _fill_order(order_repo, args.order_items)
+    menu_handler = GetAvailableMenuItemsHandler(menu_repo)
+    order_handler = GetOrderHandler(order_repo)
+
+    for name, query, read in (
+        (
+            "menu",
+            lambda: menu_handler.handle(GetAvailableMenuItemsQuery()),
+            menu_repo.find_all_available,
+        ),
+        (
+            "order",
+            lambda: order_handler.handle(GetOrderQuery(order_id="o-1")),
+            lambda: order_repo.find_by_id("o-1"),
+        ),
+    ):
+        latency = await _latency(query, args.iterations)
+        blocks = await _allocations(read, samples=100)
+        print(f"{name:>8} {label:>10} {latency:>9.1f} µs {blocks:>14,.0f}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--menu-items", type=int, default=200)
+    parser.add_argument("--order-items", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"{'query':>8} {'repository':>10} {'latency':>12} {'blocks/read':>14}")
+    await _run(
+        "deepcopy",
+        DeepcopyMenuItemReadModelRepository(),
+        DeepcopyOrderReadModelRepository(),
+        args,
+    )
+    await _run(
+        "shared",
+        InMemoryMenuItemReadModelRepository(),
+        InMemoryOrderReadModelRepository(),
+        args,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,146 @@
+"""Benchmark: outbox retry storms under each backoff, heap vs. timer wheel.
+
+Simulates an outage: ``--entries`` pending entries all fail at once, and
+every retry fails until ``--outage`` seconds have passed. The in-memory
+store is driven on a simulated clock in 0.1 s ticks, handing every due
+entry to a processor that fails or succeeds it. For each backoff reports
+the peak retries in any one tick (the thundering herd), the retries in
+the first second after the outage, total retries, and when the last
+entry was processed.
+
+Then times scheduling and expiring ``--entries`` jittered deadlines on a
+``heapq`` and on the ``TimerWheel`` that replaced it, in µs per entry.
+
+Usage::
+
+    uv run python benchmarks/retry_wheel.py --entries 100000 --outage 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import random
+import time
+from datetime import UTC, datetime, timedelta
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.timer_wheel import TimerWheel
+from tabb.application.backoff import (
+    BackoffStrategy,
+    DecorrelatedJitterBackoff,
+    ExponentialBackoff,
+    FullJitterBackoff,
+)
+from tabb.application.outbox import OutboxEntry
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
+_STEP = timedelta(seconds=0.1)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = _EPOCH
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _entry(n: int) -> OutboxEntry:
+    return OutboxEntry(
+        _entry_id=f"e-{n}",
+        _event_type="DishMarkedReady",
+        _event_data={"order_id": f"o-{n}", "order_item_id": f"oi-{n}"},
+        _aggregate_id=f"o-{n}",
+        _aggregate_type="Order",
+        _occurred_at=_EPOCH,
+        _max_retries=100,
+    )
+
+
+def _simulate(
+    backoff: BackoffStrategy, entries: int, outage: float
+) -> tuple[int, int, int, float]:
+    """Peak retries per tick, retries on recovery, total, seconds to drain."""
+    clock = _Clock()
+    store = InMemoryOutboxStore(clock=clock, backoff=backoff)
+    for n in range(entries):
+        store.add(_entry(n))
+    for entry in store.find_ready(entries):
+        store.mark_failed(entry.entry_id, "outage")
+
+    per_tick: list[int] = []
+    recovery = 0
+    while store.pending_count:
+        clock.now += _STEP
+        elapsed = (clock.now - _EPOCH).total_seconds()
+        ready = store.find_ready(entries)
+        per_tick.append(len(ready))
+        if outage <= elapsed < outage + 1:
+            recovery += len(ready)
+        for entry in ready:
+            if elapsed < outage:
+                store.mark_failed(entry.entry_id, "outage")
+            else:
+                store.mark_processed(entry.entry_id)
+    drained = (clock.now - _EPOCH).total_seconds()
+    return max(per_tick), recovery, sum(per_tick), drained
+
+
+def _heap_us(deadlines: list[float]) -> float:
+    started = time.perf_counter()
+    heap: list[tuple[float, int]] = []
+    for n, deadline in enumerate(deadlines):
+        heapq.heappush(heap, (deadline, n))
+    now = 0.0
+    while heap:
+        now += 0.1
+        while heap and heap[0][0] <= now:
+            heapq.heappop(heap)
+    return (time.perf_counter() - started) / len(deadlines) * 1e6
+
+
+def _wheel_us(deadlines: list[float]) -> float:
+    started = time.perf_counter()
+    wheel: TimerWheel[int] = TimerWheel(start=0.0)
+    for n, deadline in enumerate(deadlines):
+        wheel.schedule(deadline, n)
+    now = 0.0
+    while wheel:
+        now += 0.1
+        wheel.expire(now)
+    return (time.perf_counter() - started) / len(deadlines) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--outage", type=float, default=60.0)
+    parser.add_argument("--cap", type=float, default=60.0)
+    args = parser.parse_args()
+
+    strategies: dict[str, BackoffStrategy] = {
+        "exponential": ExponentialBackoff(cap=args.cap),
+        "full jitter": FullJitterBackoff(cap=args.cap, rng=random.Random(1)),
+        "decorrelated": DecorrelatedJitterBackoff(cap=args.cap, rng=random.Random(1)),
+    }
+    print(
+        f"{'backoff':<13} {'peak/tick':>9} {'recovery/s':>10}"
+        f" {'retries':>9} {'drained':>9}"
+    )
+    for name, backoff in strategies.items():
+        peak, recovery, retries, drained = _simulate(backoff, args.entries, args.outage)
+        print(f"{name:<13} {peak:>9} {recovery:>10} {retries:>9} {drained:>8.1f}s")
+
+    rng = random.Random(2)
+    deadlines = [rng.uniform(0, args.cap) for _ in range(args.entries)]
+    print()
+    print(f"{'queue':<13} {'µs/entry':>9}")
+    print(f"{'heapq':<13} {_heap_us(deadlines):>9.2f}")
+    print(f"{'timer wheel':<13} {_wheel_us(deadlines):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
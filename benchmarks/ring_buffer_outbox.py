@@ -0,0 +1,151 @@
+"""Benchmark: memory-mapped ring-buffer outbox vs. the in-memory object store.
+
+For each backend, in a fresh child process: stages and flushes ``--entries``
+outbox entries through the repository, measures the resident set size they
+add, then drains them through ``InMemoryOutboxProcessor`` with a no-op
+projector. Reports RSS growth per entry and write and drain throughput.
+The ring's RSS is the mapped pages it touched, ``--record-size`` bytes per
+entry; they are file-backed, so the kernel can reclaim them.
+
+Usage::
+
+    uv run python benchmarks/ring_buffer_outbox.py --entries 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_repository import (
+    InMemoryOutboxRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.ring_buffer_outbox import (
+    RingBufferOutbox,
+    RingBufferOutboxRepository,
+)
+from tabb.adapters.outbound.workers.outbox_processor import InMemoryOutboxProcessor
+from tabb.application.outbox import OutboxEntry
+from tabb.application.ports.inbound.projector import Projector
+
+BACKENDS = ("objects", "ring")
+
+
+class NoOpProjector(Projector):
+    def handles(self) -> list[str]:
+        return ["DishMarkedReady"]
+
+    async def project(self, event_type: str, event_data: Mapping[str, object]) -> None:
+        pass
+
+
+def _rss_bytes() -> int:
+    """Current resident set size, from /proc."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * 4096
+
+
+async def _measure(
+    backend: str, entries: int, record_size: int, directory: Path
+) -> dict[str, float]:
+    repository: InMemoryOutboxRepository | RingBufferOutboxRepository
+    if backend == "ring":
+        ring = RingBufferOutbox(
+            directory / "outbox.ring", capacity=entries, record_size=record_size
+        )
+        repository = RingBufferOutboxRepository(ring)
+    else:
+        repository = InMemoryOutboxRepository(InMemoryOutboxStore())
+    now = datetime.now(UTC)
+
+    gc.collect()
+    rss_before = _rss_bytes()
+    started = time.perf_counter()
+    for n in range(0, entries, 1_000):
+        for i in range(n, min(n + 1_000, entries)):
+            await repository.save(
+                OutboxEntry(
+                    _entry_id=f"e-{i}",
+                    _event_type="DishMarkedReady",
+                    _event_data={
+                        "order_id": f"o-{i // 10}",
+                        "order_item_id": f"oi-{i}",
+                    },
+                    _aggregate_id=f"o-{i // 10}",
+                    _aggregate_type="Order",
+                    _occurred_at=now,
+                )
+            )
+        repository.flush()
+    written = time.perf_counter() - started
+    gc.collect()
+    rss_growth = _rss_bytes() - rss_before
+
+    processor = InMemoryOutboxProcessor(
+        outbox_repository=repository, projectors=[NoOpProjector()], batch_size=500
+    )
+    started = time.perf_counter()
+    while await processor.process_pending():
+        pass
+    drained = time.perf_counter() - started
+    return {
+        "rss_per_entry": rss_growth / entries,
+        "write_per_s": entries / written,
+        "drain_per_s": entries / drained,
+    }
+
+
+def _child(backend: str, entries: int, record_size: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        result = asyncio.run(_measure(backend, entries, record_size, Path(tmp)))
+    print(json.dumps(result))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200_000)
+    parser.add_argument("--record-size", type=int, default=128)
+    parser.add_argument("--backend", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.backend:
+        _child(args.backend, args.entries, args.record_size)
+        return
+
+    print(f"{'backend':<8} {'RSS/entry':>10} {'write/s':>10} {'drain/s':>10}")
+    for backend in BACKENDS:
+        output = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--backend",
+                backend,
+                "--entries",
+                str(args.entries),
+                "--record-size",
+                str(args.record_size),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        print(
+            f"{backend:<8} {result['rss_per_entry']:>8.0f} B "
+            f"{result['write_per_s']:>10.0f} {result['drain_per_s']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
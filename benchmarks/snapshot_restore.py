@@ -0,0 +1,188 @@
+"""Benchmark: warm restart from a store snapshot plus the write-ahead log tail.
+
+Builds ``--orders`` orders with their read models, snapshots them with
+``SnapshotFile``, commits ``--tail`` more orders through a write-ahead log,
+then times a restart: loading the snapshot, replaying the log tail and the
+first queries against the restored stores. A full replay of the same number
+of log records is timed for comparison unless ``--skip-full-replay`` is given.
+
+Usage::
+
+    uv run python benchmarks/snapshot_restore.py --orders 500000 --tail 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from tabb.adapters.outbound.persistence.in_memory.order_read_model_repository import (
+    InMemoryOrderReadModelRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.serialization import (
+    order_to_record,
+)
+from tabb.adapters.outbound.persistence.in_memory.snapshot_file import (
+    InMemoryStores,
+    SnapshotFile,
+)
+from tabb.adapters.outbound.persistence.in_memory.unit_of_work import (
+    InMemoryUnitOfWork,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.write_ahead_log import (
+    WriteAheadLog,
+    restore_from_log,
+)
+from tabb.application.read_models.order_read_model import (
+    OrderItemReadModel,
+    OrderReadModel,
+)
+from tabb.domain.models.menu_item import MenuItemId
+from tabb.domain.models.order import Order, OrderId, OrderItemId
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+_PRICE = Money(Decimal("9.99"))
+
+
+def _order(n: int) -> Order:
+    order = Order.place(OrderId(f"o-{n}"), TableNumber(n % 50 + 1))
+    order.add_item(
+        OrderItemId(f"oi-{n}"), MenuItemId("m-1"), "Burger", _PRICE, Quantity(2)
+    )
+    order.collect_events()
+    return order
+
+
+def _read_model(order: Order) -> OrderReadModel:
+    return OrderReadModel(
+        order_id=str(order.id),
+        table_number=order.table.value,
+        status=order.status.value,
+        items=tuple(
+            OrderItemReadModel(
+                order_item_id=str(item.id),
+                menu_item_id=item.menu_item_id,
+                name=item.name,
+                unit_price=str(item.unit_price.amount),
+                quantity=item.quantity.value,
+                status=item.status.value,
+                total_price=str(item.total_price.amount),
+            )
+            for item in order.items
+        ),
+    )
+
+
+async def _build(count: int) -> InMemoryStores:
+    orders = {f"o-{n}": _order(n) for n in range(count)}
+    read_models = InMemoryOrderReadModelRepository()
+    for order in orders.values():
+        await read_models.save(_read_model(order))
+    stores = InMemoryStores.empty()
+    return InMemoryStores(
+        order_store=InMemoryVersionedStore(orders),
+        menu_item_store=stores.menu_item_store,
+        outbox_store=stores.outbox_store,
+        order_read_models=read_models,
+        menu_item_read_models=stores.menu_item_read_models,
+    )
+
+
+async def _commit_tail(
+    stores: InMemoryStores, log: WriteAheadLog, start: int, count: int
+) -> None:
+    for n in range(start, start + count):
+        uow = InMemoryUnitOfWork(
+            stores.order_store,
+            stores.menu_item_store,
+            stores.outbox_store,
+            write_ahead_log=log,
+        )
+        async with uow:
+            order = Order.place(OrderId(f"o-{n}"), TableNumber(n % 50 + 1))
+            order.add_item(
+                OrderItemId(f"oi-{n}"), MenuItemId("m-1"), "Burger", _PRICE, Quantity(2)
+            )
+            await uow.order_repository.save(order)
+            await uow.commit()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=500_000)
+    parser.add_argument("--tail", type=int, default=1_000)
+    parser.add_argument("--directory", type=Path, default=None)
+    parser.add_argument("--skip-full-replay", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as directory:
+        snapshot_file = SnapshotFile(Path(directory) / "stores.snapshot")
+        log_path = Path(directory) / "wal.log"
+        stores = await _build(args.orders)
+
+        started = time.perf_counter()
+        await snapshot_file.save(stores)
+        print(
+            f"{'save snapshot':>22} {time.perf_counter() - started:>8.3f} s "
+            f"({snapshot_file.path.stat().st_size / 2**20:,.1f} MiB)"
+        )
+        log = WriteAheadLog(log_path)
+        await _commit_tail(stores, log, args.orders, args.tail)
+        log.close()
+
+        started = time.perf_counter()
+        restored = snapshot_file.load()
+        assert restored is not None
+        loaded = time.perf_counter()
+        tail = WriteAheadLog(log_path, start_offset=restored.log_offset)
+        commits = restore_from_log(
+            tail,
+            restored.stores.order_store,
+            restored.stores.menu_item_store,
+            restored.stores.outbox_store,
+        )
+        tail.close()
+        replayed = time.perf_counter()
+        order = restored.stores.order_store["o-0"]
+        by_table = await restored.stores.order_read_models.find_by_table(1, "open")
+        queried = time.perf_counter()
+        assert order.table == TableNumber(1) and by_table
+        print(f"{'load snapshot':>22} {loaded - started:>8.3f} s")
+        print(f"{f'replay {commits} commits':>22} {replayed - loaded:>8.3f} s")
+        print(f"{'first queries':>22} {queried - replayed:>8.3f} s")
+        print(f"{'restart total':>22} {queried - started:>8.3f} s")
+
+        if args.skip_full_replay:
+            return
+        full_path = Path(directory) / "full.log"
+        full_log = WriteAheadLog(full_path)
+        for order in stores.order_store.values():
+            full_log.append(
+                {"orders": [order_to_record(order)], "menu_items": [], "outbox": []}
+            )
+        full_log.close()
+        started = time.perf_counter()
+        restore_from_log(
+            WriteAheadLog(full_path),
+            InMemoryVersionedStore(),
+            InMemoryVersionedStore(),
+            InMemoryOutboxStore(),
+        )
+        print(
+            f"{'full log replay':>22} {time.perf_counter() - started:>8.3f} s "
+            "(stores only, no read models)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
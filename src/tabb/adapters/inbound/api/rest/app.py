@@ -1,28 +1,92 @@
 """FastAPI application factory for tabb — composition root."""
 
 import logging
-from contextlib import asynccontextmanager
+import os
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from tabb.adapters.config.settings import settings
 from tabb.adapters.outbound.logging.logger import setup_logging
-from tabb.adapters.outbound.persistence.in_memory.menu_item_read_model_repository import (
-    InMemoryMenuItemReadModelRepository,
+from tabb.adapters.outbound.persistence.event_store.aggregate_cache import (
+    AggregateCache,
+)
+from tabb.adapters.outbound.persistence.event_store.aggregate_snapshots import (
+    AggregateSnapshotStore,
+    SnapshotPolicy,
+)
+from tabb.adapters.outbound.persistence.event_store.outbox import (
+    EventLogOutbox,
+    EventLogOutboxRepository,
+)
+from tabb.adapters.outbound.persistence.event_store.segmented_event_store import (
+    SegmentedEventStore,
 )
-from tabb.adapters.outbound.persistence.in_memory.order_read_model_repository import (
-    InMemoryOrderReadModelRepository,
+from tabb.adapters.outbound.persistence.event_store.unit_of_work import (
+    EventSourcedUnitOfWork,
+    restore_menu_items,
 )
 from tabb.adapters.outbound.persistence.in_memory.outbox_repository import (
     InMemoryOutboxRepository,
 )
+from tabb.adapters.outbound.persistence.in_memory.outbox_retention import (
+    InMemoryOutboxRetention,
+)
+from tabb.adapters.outbound.persistence.in_memory.snapshot_file import (
+    InMemoryStores,
+    SnapshotFile,
+)
+from tabb.adapters.outbound.persistence.in_memory.unit_of_work import (
+    InMemoryUnitOfWork,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.write_ahead_log import (
+    WriteAheadLog,
+    restore_from_log,
+)
+from tabb.adapters.outbound.persistence.sqlalchemy.engine import create_engine
+from tabb.adapters.outbound.persistence.sqlalchemy.outbox_repository import (
+    SqlAlchemyOutboxRepository,
+)
+from tabb.adapters.outbound.persistence.sqlalchemy.unit_of_work import (
+    SqlAlchemyUnitOfWork,
+)
 from tabb.adapters.outbound.projectors.menu_item_projector import MenuItemProjector
 from tabb.adapters.outbound.projectors.order_projector import OrderProjector
+from tabb.adapters.outbound.workers.adaptive_batch import AdaptiveBatchController
 from tabb.adapters.outbound.workers.background_outbox_worker import AsyncOutboxWorker
 from tabb.adapters.outbound.workers.outbox_processor import InMemoryOutboxProcessor
-from tabb.application.outbox import OutboxEntry
-
+from tabb.adapters.outbound.workers.outbox_wakeup import AsyncioOutboxWakeup
+from tabb.adapters.outbound.workers.snapshot_worker import AsyncSnapshotWorker
+from tabb.application.backoff import (
+    BackoffStrategy,
+    DecorrelatedJitterBackoff,
+    ExponentialBackoff,
+    FullJitterBackoff,
+)
+from tabb.application.bus import InProcessQueryBus
+from tabb.application.ports.outbound.outbox_repository import OutboxRepository
+from tabb.application.ports.outbound.unit_of_work import UnitOfWork
+from tabb.application.queries.get_available_menu_items import (
+    GetAvailableMenuItemsHandler,
+    GetAvailableMenuItemsQuery,
+)
+from tabb.application.queries.get_order import GetOrderHandler, GetOrderQuery
+from tabb.application.queries.get_orders_by_status import (
+    GetOrdersByStatusHandler,
+    GetOrdersByStatusQuery,
+)
+from tabb.application.queries.get_orders_by_table import (
+    GetOrdersByTableHandler,
+    GetOrdersByTableQuery,
+)
+from tabb.domain.models.menu_item import MenuItem
+from tabb.domain.models.order import Order
 
 setup_logging()
 
@@ -33,21 +97,101 @@ logger = logging.getLogger("tabb")
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manage application startup and shutdown."""
     worker: AsyncOutboxWorker = app.state.outbox_worker
+    snapshot_worker: AsyncSnapshotWorker | None = app.state.snapshot_worker
     await worker.start()
+    if snapshot_worker is not None:
+        await snapshot_worker.start()
     try:
         yield
     finally:
         await worker.stop()
+        if snapshot_worker is not None:
+            await snapshot_worker.stop()
+        write_ahead_log: WriteAheadLog | None = app.state.write_ahead_log
+        if write_ahead_log is not None:
+            write_ahead_log.close()
+        event_store: SegmentedEventStore | None = app.state.event_store
+        if event_store is not None:
+            event_store.close()
+        engine: AsyncEngine | None = app.state.database_engine
+        if engine is not None:
+            await engine.dispose()
+
+
+def _stop_on_log_failure(exc: BaseException) -> None:
+    """Exit at once when the write-ahead log or event store fails.
+
+    Commits published since the last fsync may not be on disk; restarting
+    from the snapshot and the log, as after a crash, drops them everywhere
+    instead of serving state that the next start would not have.
+    """
+    logger.critical("Durable log failed, stopping: %s", exc)
+    logging.shutdown()
+    os._exit(1)
+
+
+def _retry_backoff() -> BackoffStrategy:
+    """The outbox retry backoff configured in settings."""
+    base = settings.outbox_retry_base_seconds
+    cap = settings.outbox_retry_max_seconds
+    match settings.outbox_retry_backoff:
+        case "full_jitter":
+            return FullJitterBackoff(base, cap)
+        case "decorrelated_jitter":
+            return DecorrelatedJitterBackoff(base, cap)
+        case _:
+            return ExponentialBackoff(base, cap)
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
-    # Shared in-memory stores (scoped to this app instance)
-    outbox_store: list[OutboxEntry] = []
+    retry_backoff = _retry_backoff()
+
+    # Shared in-memory stores (scoped to this app instance), restored from
+    # the latest snapshot file when one is configured
+    snapshot_file = (
+        SnapshotFile(settings.snapshot_path) if settings.snapshot_path else None
+    )
+    restored = snapshot_file.load(retry_backoff) if snapshot_file else None
+    stores = restored.stores if restored else InMemoryStores.empty(retry_backoff)
+    if restored:
+        logger.info("Restored stores from snapshot %s", settings.snapshot_path)
+    order_store = stores.order_store
+    menu_item_store = stores.menu_item_store
+    outbox_store = stores.outbox_store
+
+    # Optional write-ahead log: replay the commits made after the snapshot
+    # into the stores, then append to it
+    write_ahead_log = None
+    if settings.write_ahead_log_path:
+        write_ahead_log = WriteAheadLog(
+            settings.write_ahead_log_path,
+            group_commit=settings.write_ahead_log_group_commit,
+            start_offset=restored.log_offset if restored else 0,
+            on_failure=_stop_on_log_failure,
+        )
+        replayed = restore_from_log(
+            write_ahead_log, order_store, menu_item_store, outbox_store
+        )
+        logger.info("Replayed %d commits from the write-ahead log", replayed)
 
     # Read-model repositories
-    order_read_repo = InMemoryOrderReadModelRepository()
-    menu_item_read_repo = InMemoryMenuItemReadModelRepository()
+    order_read_repo = stores.order_read_models
+    menu_item_read_repo = stores.menu_item_read_models
+
+    # Query bus (read side)
+    query_bus = InProcessQueryBus()
+    query_bus.register(GetOrderQuery, lambda: GetOrderHandler(order_read_repo))
+    query_bus.register(
+        GetOrdersByTableQuery, lambda: GetOrdersByTableHandler(order_read_repo)
+    )
+    query_bus.register(
+        GetOrdersByStatusQuery, lambda: GetOrdersByStatusHandler(order_read_repo)
+    )
+    query_bus.register(
+        GetAvailableMenuItemsQuery,
+        lambda: GetAvailableMenuItemsHandler(menu_item_read_repo),
+    )
 
     # Projectors
     projectors = [
@@ -55,12 +199,93 @@ def create_app() -> FastAPI:
         MenuItemProjector(menu_item_read_repo),
     ]
 
+    # Commit-triggered wakeup; pass to every unit of work as notifier
+    outbox_wakeup = AsyncioOutboxWakeup()
+
+    # Write side: the in-memory stores, the database at database_url
+    # through one connection pool shared by every unit of work, or orders
+    # as event streams in the event store, which the outbox also reads
+    engine = None
+    event_store = None
+    outbox_repo: OutboxRepository
+    retention = None
+    next_retry_at = None
+    if settings.persistence_backend == "sqlalchemy":
+        engine = create_engine(settings)
+        outbox_repo = SqlAlchemyOutboxRepository(engine, backoff=retry_backoff)
+
+        def unit_of_work() -> UnitOfWork:
+            return SqlAlchemyUnitOfWork(engine, notifier=outbox_wakeup)
+
+    elif settings.persistence_backend == "event_store":
+        event_store = SegmentedEventStore(
+            settings.event_store_path,
+            segment_bytes=settings.event_store_segment_bytes,
+            on_failure=_stop_on_log_failure,
+        )
+        event_log_outbox = EventLogOutbox(event_store, backoff=retry_backoff)
+        outbox_repo = EventLogOutboxRepository(event_log_outbox)
+        event_menu_items: InMemoryVersionedStore[MenuItem] = InMemoryVersionedStore()
+        restored_items = restore_menu_items(event_store, event_menu_items)
+        logger.info("Restored %d menu items from the event store", restored_items)
+        order_cache: AggregateCache[Order] = AggregateCache(
+            settings.event_store_cache_size
+        )
+        order_snapshots = AggregateSnapshotStore(
+            Path(settings.event_store_path) / "snapshots",
+            SnapshotPolicy(
+                every_events=settings.event_store_snapshot_every_events,
+                every_bytes=settings.event_store_snapshot_every_bytes,
+            ),
+        )
+
+        def unit_of_work() -> UnitOfWork:
+            return EventSourcedUnitOfWork(
+                event_log_outbox,
+                event_menu_items,
+                order_cache=order_cache,
+                order_snapshots=order_snapshots,
+                notifier=outbox_wakeup,
+            )
+
+    else:
+        outbox_repo = InMemoryOutboxRepository(outbox_store)
+        next_retry_at = outbox_store.next_retry_at
+
+        # Retention of processed outbox entries
+        retention = InMemoryOutboxRetention(
+            outbox_store,
+            max_age_seconds=settings.outbox_retention_max_age_seconds,
+            max_processed=settings.outbox_retention_max_processed,
+            archive_size=settings.outbox_archive_size,
+            batch_size=settings.outbox_compaction_batch_size,
+        )
+
+        def unit_of_work() -> UnitOfWork:
+            return InMemoryUnitOfWork(
+                order_store,
+                menu_item_store,
+                outbox_store,
+                notifier=outbox_wakeup,
+                write_ahead_log=write_ahead_log,
+            )
+
     # Outbox processor
-    outbox_repo = InMemoryOutboxRepository(outbox_store)
     processor = InMemoryOutboxProcessor(
         outbox_repository=outbox_repo,
         projectors=projectors,
         logger=logger,
+        lanes=settings.outbox_processing_lanes,
+        batch_size=settings.outbox_min_batch_size,
+    )
+
+    # Adaptive batch size and idle backoff (the poll interval is the floor)
+    batch_controller = AdaptiveBatchController(
+        min_batch_size=settings.outbox_min_batch_size,
+        max_batch_size=settings.outbox_max_batch_size,
+        target_batch_seconds=settings.outbox_target_batch_seconds,
+        min_idle_seconds=settings.outbox_poll_interval_seconds,
+        max_idle_seconds=settings.outbox_max_idle_seconds,
     )
 
     # Background worker
@@ -68,14 +293,37 @@ def create_app() -> FastAPI:
         processor=processor,
         interval_seconds=settings.outbox_poll_interval_seconds,
         logger=logger,
+        retention=retention,
+        wakeup=outbox_wakeup,
+        controller=batch_controller,
+        next_retry_at=next_retry_at,
     )
 
+    # Periodic snapshots, plus a final one on shutdown
+    snapshot_worker = None
+    if snapshot_file is not None:
+        snapshot_worker = AsyncSnapshotWorker(
+            snapshot_file,
+            stores,
+            write_ahead_log=write_ahead_log,
+            interval_seconds=settings.snapshot_interval_seconds,
+            logger=logger,
+        )
+
     app = FastAPI(
         title=settings.app_name,
         debug=settings.debug,
         lifespan=lifespan,
     )
     app.state.outbox_worker = worker
+    app.state.snapshot_worker = snapshot_worker
+    app.state.unit_of_work_factory = unit_of_work
+    app.state.write_ahead_log = write_ahead_log
+    app.state.event_store = event_store
+    app.state.database_engine = engine
+    app.state.query_bus = query_bus
+    app.state.outbox_wakeup = outbox_wakeup
+    app.state.outbox_batch_controller = batch_controller
 
     _register_routes(app)
 
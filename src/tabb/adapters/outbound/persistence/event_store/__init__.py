@@ -0,0 +1 @@
+"""Event-sourced persistence adapters over a segmented local event log."""
@@ -0,0 +1,49 @@
+"""Least-recently-used cache of rehydrated aggregates."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+from tabb.domain.shared.building_blocks import AggregateRoot
+
+
+class AggregateCache[A: AggregateRoot[Any]]:
+    """The ``capacity`` most recently used committed aggregates, by key.
+
+    Shared by every unit of work over one event store. Cached aggregates
+    are committed state and are never changed in place: repositories fork
+    them before handing them out or applying newer events. Each entry
+    keeps the aggregate's version, so a stale entry is caught up with the
+    events committed since rather than rebuilt from the whole stream.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._entries: OrderedDict[str, A] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> A | None:
+        aggregate = self._entries.get(key)
+        if aggregate is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return aggregate
+
+    def put(self, key: str, aggregate: A) -> None:
+        """Cache ``aggregate`` unless a newer version of it is cached."""
+        cached = self._entries.get(key)
+        if cached is not None and cached.version > aggregate.version:
+            return
+        self._entries[key] = aggregate
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
@@ -0,0 +1,133 @@
+"""Snapshots of event-sourced aggregates, kept next to the event log."""
+
+from __future__ import annotations
+
+import json
+import os
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+SNAPSHOT_FORMAT = 1
+"""Version of the snapshot file layout and of the state records in it.
+
+Bump it when either changes: snapshots in another format are ignored and
+the aggregate is rebuilt from its stream, then snapshotted again.
+"""
+
+
+@dataclass(frozen=True)
+class SnapshotPolicy:
+    """When an aggregate is due for a new snapshot.
+
+    A snapshot is taken once ``every_events`` events or ``every_bytes``
+    bytes of events have been appended to its stream since the last one,
+    whichever comes first. None disables a threshold.
+    """
+
+    every_events: int | None = 100
+    every_bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.every_events is not None and self.every_events < 1:
+            raise ValueError("every_events must be at least 1")
+        if self.every_bytes is not None and self.every_bytes < 1:
+            raise ValueError("every_bytes must be at least 1")
+
+    def due(self, events: int, size: int) -> bool:
+        """True if ``events`` events of ``size`` bytes call for a snapshot."""
+        return (self.every_events is not None and events >= self.every_events) or (
+            self.every_bytes is not None and size >= self.every_bytes
+        )
+
+
+@dataclass(frozen=True)
+class AggregateSnapshot:
+    """An aggregate's state as a plain record, at a stream version."""
+
+    version: int
+    state: dict[str, Any]
+
+
+class AggregateSnapshotStore:
+    """The latest snapshot of each aggregate, one file per aggregate.
+
+    A file holds one checksummed line, as in the event log, with the
+    snapshot format, the stream version and the state record; it is
+    replaced atomically by the next snapshot. Snapshots are not fsynced:
+    they only shorten replays, so one lost in a crash, torn or written in
+    another format is ignored and the aggregate is rebuilt from its events.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        policy: SnapshotPolicy | None = None,
+    ) -> None:
+        self._directory = Path(directory)
+        self._policy = policy or SnapshotPolicy()
+        self._versions: dict[tuple[str, str], int] = {}
+
+    @property
+    def policy(self) -> SnapshotPolicy:
+        return self._policy
+
+    def load(self, aggregate_type: str, aggregate_id: str) -> AggregateSnapshot | None:
+        """Return an aggregate's latest usable snapshot, if any."""
+        snapshot = self._read(self._path(aggregate_type, aggregate_id))
+        self._versions[(aggregate_type, aggregate_id)] = (
+            snapshot.version if snapshot is not None else 0
+        )
+        return snapshot
+
+    def save(
+        self, aggregate_type: str, aggregate_id: str, snapshot: AggregateSnapshot
+    ) -> None:
+        """Replace an aggregate's snapshot."""
+        path = self._path(aggregate_type, aggregate_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(
+            {
+                "format": SNAPSHOT_FORMAT,
+                "version": snapshot.version,
+                "state": snapshot.state,
+            },
+            separators=(",", ":"),
+        ).encode()
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(b"%08x %s\n" % (zlib.crc32(payload), payload))
+        os.replace(tmp_path, path)
+        self._versions[(aggregate_type, aggregate_id)] = snapshot.version
+
+    def version(self, aggregate_type: str, aggregate_id: str) -> int:
+        """Stream version of an aggregate's latest snapshot (0 if none)."""
+        version = self._versions.get((aggregate_type, aggregate_id))
+        if version is None:
+            snapshot = self.load(aggregate_type, aggregate_id)
+            version = snapshot.version if snapshot is not None else 0
+        return version
+
+    def _path(self, aggregate_type: str, aggregate_id: str) -> Path:
+        return self._directory / aggregate_type / f"{quote(aggregate_id, safe='')}.snap"
+
+    @staticmethod
+    def _read(path: Path) -> AggregateSnapshot | None:
+        try:
+            line = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if not line.endswith(b"\n") or line[8:9] != b" ":
+            return None
+        payload = line[9:-1]
+        try:
+            checksum = int(line[:8], 16)
+        except ValueError:
+            return None
+        if zlib.crc32(payload) != checksum:
+            return None
+        data = json.loads(payload)
+        if data.get("format") != SNAPSHOT_FORMAT:
+            return None
+        return AggregateSnapshot(version=data["version"], state=data["state"])
@@ -0,0 +1,111 @@
+"""Compact binary encoding of domain events for storage backends.
+
+An alternative to the JSON payloads of the event log for backends that
+store events as bytes. A record is::
+
+    format (u8) | type name length (u8) | type name (UTF-8)
+    | int fields (i64 each) | str field byte lengths (u32 each)
+    | str field bytes, back to back
+
+all little-endian, with fields in declaration order within each group.
+The fixed part is one ``struct`` per event type, built once from the
+event's field annotations, so encoding and decoding do no per-field
+type dispatch. Only ``str`` and ``int`` fields, which is all tabb's
+events carry, are supported.
+"""
+
+from __future__ import annotations
+
+import struct
+import typing
+from dataclasses import dataclass
+from typing import Any
+
+from tabb.domain.events import events  # noqa: F401  (registers the event codecs)
+from tabb.domain.events.base import DomainEvent
+from tabb.domain.events.codecs import EventCodec, codec_for, codec_named
+
+BINARY_FORMAT = 1
+"""Version of the record layout, written as each record's first byte.
+
+Bump it when the layout changes: records in another format are rejected
+rather than misread.
+"""
+
+_PREFIX = struct.Struct("<BB")
+
+
+@dataclass(frozen=True, slots=True)
+class _Layout:
+    codec: EventCodec
+    header: bytes
+    fixed: struct.Struct
+    int_fields: tuple[str, ...]
+    str_fields: tuple[str, ...]
+
+
+_LAYOUTS: dict[str, _Layout] = {}
+
+
+def encode_binary(event: DomainEvent) -> bytes:
+    """Encode an event as a binary record."""
+    layout = _layout(event.event_name, type(event))
+    strings = [getattr(event, name).encode() for name in layout.str_fields]
+    fixed = layout.fixed.pack(
+        *[getattr(event, name) for name in layout.int_fields],
+        *[len(value) for value in strings],
+    )
+    return b"".join([layout.header, fixed, *strings])
+
+
+def decode_binary(record: bytes) -> DomainEvent:
+    """Rebuild the event a binary record was encoded from."""
+    record_format, name_length = _PREFIX.unpack_from(record)
+    if record_format != BINARY_FORMAT:
+        raise ValueError(f"Unsupported binary event format: {record_format}")
+    offset = _PREFIX.size + name_length
+    layout = _layout(record[_PREFIX.size : offset].decode())
+    values = layout.fixed.unpack_from(record, offset)
+    offset += layout.fixed.size
+    data: dict[str, Any] = dict(
+        zip(layout.int_fields, values[: len(layout.int_fields)], strict=True)
+    )
+    for name, length in zip(
+        layout.str_fields, values[len(layout.int_fields) :], strict=True
+    ):
+        data[name] = record[offset : offset + length].decode()
+        offset += length
+    if offset != len(record):
+        raise ValueError("Binary event record has trailing bytes")
+    return layout.codec.decode(data)
+
+
+def _layout(name: str, event_type: type[DomainEvent] | None = None) -> _Layout:
+    layout = _LAYOUTS.get(name)
+    if layout is None:
+        codec = codec_named(name) if event_type is None else codec_for(event_type)
+        layout = _LAYOUTS[name] = _compile_layout(codec)
+    return layout
+
+
+def _compile_layout(codec: EventCodec) -> _Layout:
+    hints = typing.get_type_hints(codec.event_type)
+    int_fields: list[str] = []
+    str_fields: list[str] = []
+    for name in codec.field_names:
+        if hints[name] is int:
+            int_fields.append(name)
+        elif hints[name] is str:
+            str_fields.append(name)
+        else:
+            raise TypeError(
+                f"{codec.name}.{name}: binary codec supports str and int fields"
+            )
+    encoded_name = codec.name.encode()
+    return _Layout(
+        codec=codec,
+        header=_PREFIX.pack(BINARY_FORMAT, len(encoded_name)) + encoded_name,
+        fixed=struct.Struct("<" + "q" * len(int_fields) + "I" * len(str_fields)),
+        int_fields=tuple(int_fields),
+        str_fields=tuple(str_fields),
+    )
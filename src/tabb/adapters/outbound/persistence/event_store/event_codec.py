@@ -0,0 +1,24 @@
+"""Conversion between domain events and event store records."""
+
+from __future__ import annotations
+
+from tabb.adapters.outbound.persistence.event_store.segmented_event_store import (
+    EventRecord,
+    StoredEvent,
+)
+from tabb.domain.events import events  # noqa: F401  (registers the event codecs)
+from tabb.domain.events.base import DomainEvent
+from tabb.domain.events.codecs import codec_for, codec_named
+
+
+def encode_event(event: DomainEvent) -> EventRecord:
+    """Record an event by its class name and field values."""
+    return EventRecord(
+        event_type=event.event_name,
+        event_data=codec_for(type(event)).encode(event),
+    )
+
+
+def decode_event(stored: StoredEvent) -> DomainEvent:
+    """Rebuild the domain event a stored record was encoded from."""
+    return codec_named(stored.event_type).decode(stored.event_data)
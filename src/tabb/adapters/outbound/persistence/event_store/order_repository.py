@@ -0,0 +1,210 @@
+"""Event-sourced Order repository adapter with staged writes for UoW."""
+
+from __future__ import annotations
+
+from tabb.adapters.outbound.persistence.event_store.aggregate_cache import (
+    AggregateCache,
+)
+from tabb.adapters.outbound.persistence.event_store.aggregate_snapshots import (
+    AggregateSnapshot,
+    AggregateSnapshotStore,
+)
+from tabb.adapters.outbound.persistence.event_store.event_codec import (
+    decode_event,
+    encode_event,
+)
+from tabb.adapters.outbound.persistence.event_store.segmented_event_store import (
+    SegmentedEventStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.serialization import (
+    order_from_record,
+    order_to_record,
+)
+from tabb.application.exceptions import ConcurrencyConflictError
+from tabb.domain.events.base import DomainEvent
+from tabb.domain.models.order import Order, OrderId
+from tabb.domain.ports.order_repository import OrderRepository
+
+
+class EventSourcedOrderRepository(OrderRepository):
+    """Write-side repository storing each order as its stream of events.
+
+    - Loading rebuilds an order from its events (``Order.from_events``).
+      Hot orders come from a shared ``AggregateCache``; a cached order
+      behind the stream is caught up by applying only the newer events.
+      Without a cached copy, an order starts from its latest snapshot, if
+      an ``AggregateSnapshotStore`` is given, and replays only the events
+      after it.
+      Within a unit of work each order is loaded once and the same
+      ``Order.fork()`` copy is returned; the loaded version is its base.
+    - ``save`` only registers an order with the identity map.
+    - ``stage_changes`` stages the orders that recorded events; the events
+      are all that is written.
+    - ``prepare_commit`` checks each staged order's version against its
+      stream. If another unit of work appended first, commuting changes
+      are merged (``Order.merge_concurrent``) and the same events are
+      appended after theirs; only real conflicts raise
+      ``ConcurrencyConflictError``.
+    - ``flush`` appends each staged order's events as one commit and
+      notes the orders the snapshot policy finds due; ``write_snapshots``
+      writes them once the appended events are on disk, so no snapshot
+      describes events a crash could still take from the log.
+    """
+
+    aggregate_type = "Order"
+
+    def __init__(
+        self,
+        event_store: SegmentedEventStore,
+        cache: AggregateCache[Order] | None = None,
+        snapshots: AggregateSnapshotStore | None = None,
+    ) -> None:
+        self._event_store = event_store
+        self._cache = cache
+        self._snapshots = snapshots
+        self._identity: dict[str, Order] = {}
+        self._bases: dict[str, Order] = {}
+        self._staging: dict[str, tuple[Order, list[DomainEvent]]] = {}
+        self._due_snapshots: dict[str, Order] = {}
+
+    async def find_by_id(self, order_id: OrderId) -> Order | None:
+        key = str(order_id)
+        if key in self._identity:
+            return self._identity[key]
+        committed = self._committed(key)
+        if committed is None:
+            return None
+        order = committed.fork()
+        self._bases[key] = committed
+        self._identity[key] = order
+        return order
+
+    async def save(self, order: Order) -> None:
+        self._identity[str(order.id)] = order
+
+    def stage_changes(self) -> list[tuple[Order, list[DomainEvent]]]:
+        """Stage orders that recorded events; return each with its events."""
+        changes: list[tuple[Order, list[DomainEvent]]] = []
+        for key, order in self._identity.items():
+            events = order.collect_events()
+            if not events:
+                continue
+            self._staging[key] = (order.fork(), events)
+            changes.append((order, events))
+        return changes
+
+    def prepare_commit(self) -> None:
+        """Raise ConcurrencyConflictError if a staged order cannot be appended."""
+        for key, (staged, events) in self._staging.items():
+            current = self._event_store.version(self.aggregate_type, key)
+            if current == staged.version:
+                continue
+            merged = self._merge(key, staged)
+            if merged is None:
+                raise ConcurrencyConflictError(
+                    self.aggregate_type, key, staged.version, current
+                )
+            self._staging[key] = (merged, events)
+
+    def flush(self) -> list[Order]:
+        """Append staged events, one commit per order; return the orders.
+
+        Tracked orders advance with their staged copy, unless it was merged
+        with a concurrent commit, in which case they keep their old version
+        and base.
+        """
+        committed: list[Order] = []
+        for key, (staged, events) in self._staging.items():
+            version = self._event_store.append(
+                self.aggregate_type,
+                key,
+                staged.version,
+                [encode_event(event) for event in events],
+            )
+            tracked = self._identity[key]
+            if tracked.version == staged.version:
+                tracked._version = version
+                self._bases[key] = staged
+            staged._version = version
+            if self._cache is not None:
+                self._cache.put(key, staged)
+            if self._snapshot_due(key):
+                self._due_snapshots[key] = staged
+            committed.append(staged)
+        self._staging.clear()
+        return committed
+
+    def write_snapshots(self) -> None:
+        """Snapshot the orders found due by ``flush``; call after a sync."""
+        if self._snapshots is None:
+            return
+        for key, order in self._due_snapshots.items():
+            if order.version > self._snapshots.version(self.aggregate_type, key):
+                self._snapshots.save(
+                    self.aggregate_type,
+                    key,
+                    AggregateSnapshot(order.version, order_to_record(order)),
+                )
+        self._due_snapshots.clear()
+
+    def discard(self) -> None:
+        """Discard staged writes and forget every tracked order."""
+        self._staging.clear()
+        self._due_snapshots.clear()
+        self._identity.clear()
+        self._bases.clear()
+
+    def _committed(self, key: str) -> Order | None:
+        """The latest committed order, rebuilt or caught up from its stream."""
+        version = self._event_store.version(self.aggregate_type, key)
+        if version == 0:
+            return None
+        cached = self._cache.get(key) if self._cache is not None else None
+        if cached is not None and cached.version == version:
+            return cached
+        order = cached.fork() if cached is not None else self._from_snapshot(key)
+        if order is None:
+            order = Order.from_events(
+                decode_event(stored)
+                for stored in self._event_store.read_stream(self.aggregate_type, key)
+            )
+        else:
+            for stored in self._event_store.read_stream(
+                self.aggregate_type, key, after_version=order.version
+            ):
+                order.apply(decode_event(stored))
+        order._version = version
+        if self._cache is not None:
+            self._cache.put(key, order)
+        return order
+
+    def _from_snapshot(self, key: str) -> Order | None:
+        """The order as of its latest snapshot, unless it is ahead of the log.
+
+        Snapshots are only written once their events are on disk; one ahead
+        of the stream, as after the log was truncated by hand, is ignored.
+        """
+        if self._snapshots is None:
+            return None
+        snapshot = self._snapshots.load(self.aggregate_type, key)
+        if snapshot is None or snapshot.version > self._event_store.version(
+            self.aggregate_type, key
+        ):
+            return None
+        return order_from_record(snapshot.state)
+
+    def _snapshot_due(self, key: str) -> bool:
+        if self._snapshots is None:
+            return False
+        since = self._snapshots.version(self.aggregate_type, key)
+        events, size = self._event_store.stream_size(
+            self.aggregate_type, key, after_version=since
+        )
+        return self._snapshots.policy.due(events, size)
+
+    def _merge(self, key: str, staged: Order) -> Order | None:
+        base = self._bases.get(key)
+        committed = self._committed(key)
+        if base is None or committed is None or base.version != staged.version:
+            return None
+        return staged.merge_concurrent(base, committed)
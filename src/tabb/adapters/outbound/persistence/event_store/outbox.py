@@ -0,0 +1,186 @@
+"""Outbox read from the event store log instead of a second copy of each event."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from tabb.adapters.outbound.persistence.event_store.segmented_event_store import (
+    EventRecord,
+    SegmentedEventStore,
+    StoredEvent,
+)
+from tabb.application.backoff import BackoffStrategy
+from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+from tabb.application.ports.outbound.outbox_repository import OutboxRepository
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class EventLogOutbox:
+    """Projection progress over the events of a ``SegmentedEventStore``.
+
+    Every event in the log is an outbox entry whose id is its position, so
+    events are written once. Only progress is kept, in memory: a
+    checkpoint below which every position is settled (processed or
+    dead-lettered), the settled positions above it, and failed entries
+    awaiting retry. Read models are in memory too, so after a restart the
+    checkpoint starts at 0 and the whole log is projected again.
+
+    As in ``InMemoryOutboxStore``, an aggregate whose entry failed and
+    waits to be retried has its later entries held back, so they are
+    projected in order. Streams are known from the log index, so skipping
+    settled and held-back entries reads nothing from disk.
+
+    ``backoff`` sets the delay before each retry of a failed entry; by
+    default a plain exponential backoff.
+    """
+
+    def __init__(
+        self,
+        event_store: SegmentedEventStore,
+        clock: Callable[[], datetime] = _utc_now,
+        backoff: BackoffStrategy | None = None,
+    ) -> None:
+        self._event_store = event_store
+        self._clock = clock
+        self._backoff = backoff
+        self._checkpoint = 0
+        self._settled: set[int] = set()
+        self._failed: dict[int, OutboxEntry] = {}
+        self._blocked: dict[tuple[str, str], int] = {}
+
+    @property
+    def event_store(self) -> SegmentedEventStore:
+        return self._event_store
+
+    @property
+    def checkpoint(self) -> int:
+        """Position below which every entry is settled."""
+        return self._checkpoint
+
+    @property
+    def pending_count(self) -> int:
+        return self._event_store.head - self._checkpoint - len(self._settled)
+
+    def find_ready(self, limit: int) -> list[OutboxEntry]:
+        """Return up to ``limit`` processable entries, in log order."""
+        now = self._clock()
+        ready: list[OutboxEntry] = []
+        position = self._checkpoint
+        while position < self._event_store.head and len(ready) < limit:
+            entry = self._ready_entry(position, now)
+            if entry is not None:
+                ready.append(entry)
+            position += 1
+        return ready
+
+    def mark_processed(self, entry_id: str) -> None:
+        self._settle(int(entry_id))
+
+    def mark_failed(self, entry_id: str, error: str) -> None:
+        position = int(entry_id)
+        if position in self._settled or position < self._checkpoint:
+            return
+        entry = self._failed.get(position) or _entry(self._event_store.read(position))
+        entry.mark_failed(error, self._backoff, now=self._clock())
+        if entry.status == OutboxEntryStatus.DEAD_LETTERED:
+            self._settle(position)
+            return
+        self._failed[position] = entry
+        self._blocked.setdefault(self._event_store.stream_of(position), position)
+
+    def mark_dead_lettered(self, entry_id: str) -> None:
+        self._settle(int(entry_id))
+
+    def _ready_entry(self, position: int, now: datetime) -> OutboxEntry | None:
+        if position in self._settled:
+            return None
+        blocker = self._blocked.get(self._event_store.stream_of(position))
+        if blocker is not None and blocker != position:
+            return None
+        failed = self._failed.get(position)
+        if failed is None:
+            return _entry(self._event_store.read(position))
+        if failed.next_retry_at is not None and failed.next_retry_at > now:
+            return None
+        return failed
+
+    def _settle(self, position: int) -> None:
+        if position < self._checkpoint:
+            return
+        self._failed.pop(position, None)
+        stream = self._event_store.stream_of(position)
+        if self._blocked.get(stream) == position:
+            del self._blocked[stream]
+        self._settled.add(position)
+        while self._checkpoint in self._settled:
+            self._settled.remove(self._checkpoint)
+            self._checkpoint += 1
+
+
+class EventLogOutboxRepository(OutboxRepository):
+    """Outbox repository over an ``EventLogOutbox``.
+
+    Entries saved through a unit of work, for aggregates that are not
+    event-sourced, are staged and ``flush`` appends their events to the
+    log, one commit per aggregate. Entry ids given on save are not kept:
+    once in the log, an entry's id is its position.
+    """
+
+    def __init__(self, outbox: EventLogOutbox) -> None:
+        self._outbox = outbox
+        self._staging: list[OutboxEntry] = []
+
+    async def save(self, entry: OutboxEntry) -> None:
+        self._staging.append(entry)
+
+    async def find_pending(self, limit: int = 10) -> list[OutboxEntry]:
+        """Return pending or failed (retryable) entries, in log order."""
+        return self._outbox.find_ready(limit)
+
+    async def count_pending(self) -> int:
+        return self._outbox.pending_count
+
+    async def mark_processed(self, entry_id: str) -> None:
+        self._outbox.mark_processed(entry_id)
+
+    async def mark_failed(self, entry_id: str, error: str) -> None:
+        self._outbox.mark_failed(entry_id, error)
+
+    async def mark_dead_lettered(self, entry_id: str) -> None:
+        self._outbox.mark_dead_lettered(entry_id)
+
+    def flush(self) -> int:
+        """Append staged entries to the log.
+
+        Returns the number of entries flushed.
+        """
+        commits: defaultdict[tuple[str, str], list[EventRecord]] = defaultdict(list)
+        for entry in self._staging:
+            commits[(entry.aggregate_type, entry.aggregate_id)].append(
+                EventRecord(entry.event_type, dict(entry.event_data))
+            )
+        for (aggregate_type, aggregate_id), records in commits.items():
+            self._outbox.event_store.append(aggregate_type, aggregate_id, None, records)
+        flushed = len(self._staging)
+        self._staging.clear()
+        return flushed
+
+    def discard(self) -> None:
+        """Discard staged writes."""
+        self._staging.clear()
+
+
+def _entry(stored: StoredEvent) -> OutboxEntry:
+    return OutboxEntry(
+        _entry_id=str(stored.position),
+        _event_type=stored.event_type,
+        _event_data=stored.event_data,
+        _aggregate_id=stored.aggregate_id,
+        _aggregate_type=stored.aggregate_type,
+        _occurred_at=stored.occurred_at,
+    )
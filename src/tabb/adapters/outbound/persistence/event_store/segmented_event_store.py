@@ -0,0 +1,443 @@
+"""Append-only event store split into segment files on local disk."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import os
+import zlib
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from tabb.application.exceptions import ConcurrencyConflictError
+
+
+@dataclass(frozen=True)
+class EventRecord:
+    """An event to append: its type name and field values."""
+
+    event_type: str
+    event_data: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class StoredEvent:
+    """An event read back from the log.
+
+    ``position`` is its global sequence number in the log and ``version``
+    the number of the commit that appended it to its aggregate's stream.
+    """
+
+    position: int
+    aggregate_type: str
+    aggregate_id: str
+    version: int
+    event_type: str
+    event_data: dict[str, Any]
+    occurred_at: datetime
+
+
+@dataclass
+class _Segment:
+    first_position: int
+    path: Path
+    fd: int
+
+
+class SegmentedEventStore:
+    """Events of every aggregate, appended to one log of segment files.
+
+    Each record is one line, as in the write-ahead log: the CRC-32 of its
+    JSON payload in hex, a space, the payload. Records are appended to the
+    active segment; once it reaches ``segment_bytes`` it is sealed, with a
+    sidecar index of its records, and a new segment starts. Segment files
+    are named by the position of their first record.
+
+    An in-memory index keeps, per position, the segment offset, length,
+    stream and version of the record, and per stream (aggregate type and
+    id) the positions of its events. Reading a stream therefore reads only
+    its own records, one ``pread`` each. On open, sealed segments load
+    their sidecar index and only the active segment is scanned; a torn or
+    corrupt tail left by a crash is truncated.
+
+    ``append`` writes one commit for a stream without waiting for the disk
+    and raises ``ConcurrencyConflictError`` if the stream is not at the
+    expected version; ``sync`` returns once everything appended so far is
+    on disk, sharing one fsync between concurrent callers.
+
+    A write that fails is truncated away before ``append`` raises, so the
+    index never points at bytes that are not in the segment. A failed
+    fsync leaves the store ``failed``, as in ``WriteAheadLog``: every later
+    ``append``, ``sync`` and ``check`` raises, as a retried fsync may
+    report success for data it never wrote, and ``on_failure`` is called
+    once with the error.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        segment_bytes: int = 64 * 1024 * 1024,
+        on_failure: Callable[[BaseException], None] | None = None,
+    ) -> None:
+        if segment_bytes < 1:
+            raise ValueError("segment_bytes must be at least 1")
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._segment_bytes = segment_bytes
+
+        self._segments: list[_Segment] = []
+        self._segment_starts: list[int] = []
+        self._offsets = array("Q")
+        self._lengths = array("L")
+        self._record_streams = array("L")
+        self._record_versions = array("L")
+        self._stream_names: list[tuple[str, str]] = []
+        self._stream_numbers: dict[tuple[str, str], int] = {}
+        self._stream_positions: list[list[int]] = []
+        self._stream_versions: list[int] = []
+
+        self._synced = 0
+        self._syncs = 0
+        self._sync_lock = asyncio.Lock()
+        self._error: Exception | None = None
+        self._on_failure = on_failure
+        self._open()
+
+    @property
+    def head(self) -> int:
+        """Position the next appended event will get."""
+        return len(self._offsets)
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    @property
+    def failed(self) -> bool:
+        """True once a write could not be undone or an fsync has failed."""
+        return self._error is not None
+
+    @property
+    def sync_count(self) -> int:
+        """Number of fsync calls made by ``sync`` so far."""
+        return self._syncs
+
+    def version(self, aggregate_type: str, aggregate_id: str) -> int:
+        """Number of commits appended to a stream (0 if it has none)."""
+        number = self._stream_numbers.get((aggregate_type, aggregate_id))
+        return 0 if number is None else self._stream_versions[number]
+
+    def stream_ids(self, aggregate_type: str) -> list[str]:
+        """Ids of the streams of ``aggregate_type``, oldest stream first."""
+        return [
+            aggregate_id
+            for stream_type, aggregate_id in self._stream_names
+            if stream_type == aggregate_type
+        ]
+
+    def stream_of(self, position: int) -> tuple[str, str]:
+        """Aggregate type and id of the event at ``position``, without reading it."""
+        return self._stream_names[self._record_streams[position]]
+
+    def check(self) -> None:
+        """Raise if the store has failed and can take no more events."""
+        if self._error is not None:
+            raise RuntimeError("event store failed") from self._error
+
+    def append(
+        self,
+        aggregate_type: str,
+        aggregate_id: str,
+        expected_version: int | None,
+        records: Sequence[EventRecord],
+    ) -> int:
+        """Append one commit of ``records`` to a stream; return its new version.
+
+        With an ``expected_version``, the stream must be at exactly that
+        version. Nothing is written for an empty commit.
+        """
+        self.check()
+        current = self.version(aggregate_type, aggregate_id)
+        if expected_version is not None and current != expected_version:
+            raise ConcurrencyConflictError(
+                aggregate_type, aggregate_id, expected_version, current
+            )
+        if not records:
+            return current
+        version = current + 1
+        occurred_at = datetime.now(UTC).isoformat()
+        stream = self._stream_number(aggregate_type, aggregate_id)
+        lines = [
+            _encode_line(
+                {
+                    "aggregate_type": aggregate_type,
+                    "aggregate_id": aggregate_id,
+                    "version": version,
+                    "event_type": record.event_type,
+                    "event_data": record.event_data,
+                    "occurred_at": occurred_at,
+                }
+            )
+            for record in records
+        ]
+        segment = self._segments[-1]
+        offset = os.lseek(segment.fd, 0, os.SEEK_END)
+        self._write(segment, offset, b"".join(lines))
+        for line in lines:
+            self._index(stream, version, offset, len(line))
+            offset += len(line)
+        self._stream_versions[stream] = version
+        if offset >= self._segment_bytes:
+            self._roll()
+        return version
+
+    async def sync(self) -> None:
+        """Return once every event appended so far is on disk."""
+        self.check()
+        target = self.head
+        if self._synced >= target:
+            return
+        async with self._sync_lock:
+            self.check()
+            if self._synced >= target:
+                return
+            # Cover commits appended while waiting for the lock as well.
+            covered = self.head
+            try:
+                await asyncio.to_thread(os.fsync, self._segments[-1].fd)
+            except OSError as exc:
+                self._fail(exc)
+                raise
+            self._syncs += 1
+            self._synced = covered
+
+    def read(self, position: int) -> StoredEvent:
+        """Return the event at ``position``."""
+        if not 0 <= position < self.head:
+            raise IndexError(f"No event at position {position}")
+        index = bisect.bisect_right(self._segment_starts, position) - 1
+        line = os.pread(
+            self._segments[index].fd, self._lengths[position], self._offsets[position]
+        )
+        return _decode_line(position, line)
+
+    def read_stream(
+        self, aggregate_type: str, aggregate_id: str, after_version: int = 0
+    ) -> list[StoredEvent]:
+        """Return a stream's events committed after ``after_version``, in order."""
+        number = self._stream_numbers.get((aggregate_type, aggregate_id))
+        if number is None:
+            return []
+        positions = self._stream_positions[number]
+        start = self._first_after(number, after_version)
+        return [self.read(position) for position in positions[start:]]
+
+    def stream_size(
+        self, aggregate_type: str, aggregate_id: str, after_version: int = 0
+    ) -> tuple[int, int]:
+        """Count and total bytes of a stream's events after ``after_version``."""
+        number = self._stream_numbers.get((aggregate_type, aggregate_id))
+        if number is None:
+            return 0, 0
+        positions = self._stream_positions[number][
+            self._first_after(number, after_version) :
+        ]
+        return len(positions), sum(self._lengths[p] for p in positions)
+
+    def read_all(self, from_position: int = 0) -> Iterator[StoredEvent]:
+        """Yield every event from ``from_position`` on, in log order."""
+        for position in range(from_position, self.head):
+            yield self.read(position)
+
+    def close(self) -> None:
+        """Fsync the active segment and close every segment file."""
+        if not self._segments:
+            return
+        if self._error is None:
+            os.fsync(self._segments[-1].fd)
+        for segment in self._segments:
+            os.close(segment.fd)
+        self._segments.clear()
+
+    # -- Segments ---------------------------------------------------------
+
+    def _open(self) -> None:
+        paths = sorted(self._directory.glob("*.seg"))
+        for number, path in enumerate(paths):
+            first_position = int(path.stem)
+            if first_position != self.head:
+                raise ValueError(
+                    f"{path} starts at position {first_position}, expected {self.head}"
+                )
+            active = number == len(paths) - 1
+            fd = os.open(path, os.O_RDWR if active else os.O_RDONLY)
+            self._add_segment(first_position, path, fd)
+            if active or not self._load_index(path):
+                self._scan(path, truncate=active)
+        if not self._segments:
+            self._start_segment()
+
+    def _start_segment(self) -> None:
+        path = self._directory / f"{self.head:020d}.seg"
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._add_segment(self.head, path, fd)
+
+    def _add_segment(self, first_position: int, path: Path, fd: int) -> None:
+        self._segments.append(_Segment(first_position, path, fd))
+        self._segment_starts.append(first_position)
+
+    def _roll(self) -> None:
+        """Seal the active segment with a sidecar index and start a new one."""
+        segment = self._segments[-1]
+        try:
+            os.fsync(segment.fd)
+        except OSError as exc:
+            self._fail(exc)
+            raise
+        self._write_index(segment)
+        self._synced = self.head
+        self._start_segment()
+
+    def _write(self, segment: _Segment, offset: int, data: bytes) -> None:
+        """Write all of ``data`` at the segment's end, or none of it."""
+        view = memoryview(data)
+        try:
+            while view:
+                view = view[os.write(segment.fd, view) :]
+        except OSError as exc:
+            try:
+                os.ftruncate(segment.fd, offset)
+            except OSError:
+                self._fail(exc)
+            raise
+
+    def _fail(self, exc: Exception) -> None:
+        if self._error is not None:
+            return
+        self._error = exc
+        if self._on_failure is not None:
+            self._on_failure(exc)
+
+    def _write_index(self, segment: _Segment) -> None:
+        positions = range(segment.first_position, self.head)
+        index = {
+            "size": os.fstat(segment.fd).st_size,
+            "records": [
+                [
+                    *self.stream_of(position),
+                    self._record_versions[position],
+                    self._offsets[position],
+                    self._lengths[position],
+                ]
+                for position in positions
+            ],
+        }
+        path = segment.path.with_suffix(".idx")
+        tmp_path = path.with_suffix(".idx.tmp")
+        with tmp_path.open("w") as file:
+            json.dump(index, file, separators=(",", ":"))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+
+    def _load_index(self, path: Path) -> bool:
+        """Index a sealed segment from its sidecar; False if it is missing or stale."""
+        try:
+            text = path.with_suffix(".idx").read_text()
+        except OSError:
+            return False
+        try:
+            index = json.loads(text)
+        except ValueError:
+            return False
+        if index.get("size") != path.stat().st_size:
+            return False
+        for aggregate_type, aggregate_id, version, offset, length in index["records"]:
+            stream = self._stream_number(aggregate_type, aggregate_id)
+            self._index(stream, version, offset, length)
+            self._stream_versions[stream] = version
+        return True
+
+    def _scan(self, path: Path, truncate: bool) -> None:
+        """Index a segment's complete records; truncate a bad tail if asked."""
+        offset = 0
+        with path.open("rb") as file:
+            for line in file:
+                payload = _checked_payload(line)
+                if payload is None:
+                    break
+                data = json.loads(payload)
+                stream = self._stream_number(
+                    data["aggregate_type"], data["aggregate_id"]
+                )
+                self._index(stream, data["version"], offset, len(line))
+                self._stream_versions[stream] = data["version"]
+                offset += len(line)
+        if offset < path.stat().st_size:
+            if not truncate:
+                raise ValueError(f"{path} is corrupt at offset {offset}")
+            os.truncate(path, offset)
+
+    # -- Index ------------------------------------------------------------
+
+    def _stream_number(self, aggregate_type: str, aggregate_id: str) -> int:
+        key = (aggregate_type, aggregate_id)
+        number = self._stream_numbers.get(key)
+        if number is None:
+            number = len(self._stream_names)
+            self._stream_numbers[key] = number
+            self._stream_names.append(key)
+            self._stream_positions.append([])
+            self._stream_versions.append(0)
+        return number
+
+    def _first_after(self, stream: int, version: int) -> int:
+        """Index in a stream's positions of its first event after ``version``."""
+        versions = self._record_versions
+        return bisect.bisect_right(
+            self._stream_positions[stream],
+            version,
+            key=lambda position: versions[position],
+        )
+
+    def _index(self, stream: int, version: int, offset: int, length: int) -> None:
+        self._stream_positions[stream].append(self.head)
+        self._offsets.append(offset)
+        self._lengths.append(length)
+        self._record_streams.append(stream)
+        self._record_versions.append(version)
+
+
+def _encode_line(record: dict[str, Any]) -> bytes:
+    payload = json.dumps(record, separators=(",", ":")).encode()
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+
+def _checked_payload(line: bytes) -> bytes | None:
+    """The payload of a complete, checksummed line, or None."""
+    if not line.endswith(b"\n") or len(line) < 10 or line[8:9] != b" ":
+        return None
+    payload = line[9:-1]
+    try:
+        checksum = int(line[:8], 16)
+    except ValueError:
+        return None
+    return payload if zlib.crc32(payload) == checksum else None
+
+
+def _decode_line(position: int, line: bytes) -> StoredEvent:
+    data = json.loads(line[9:])
+    return StoredEvent(
+        position=position,
+        aggregate_type=data["aggregate_type"],
+        aggregate_id=data["aggregate_id"],
+        version=data["version"],
+        event_type=data["event_type"],
+        event_data=data["event_data"],
+        occurred_at=datetime.fromisoformat(data["occurred_at"]),
+    )
@@ -0,0 +1,181 @@
+"""Unit of Work adapter over the event store for orders."""
+
+from __future__ import annotations
+
+from types import TracebackType
+
+from tabb.adapters.outbound.id_generator.uuid_generator import UuidIdGenerator
+from tabb.adapters.outbound.persistence.event_store.aggregate_cache import (
+    AggregateCache,
+)
+from tabb.adapters.outbound.persistence.event_store.aggregate_snapshots import (
+    AggregateSnapshotStore,
+)
+from tabb.adapters.outbound.persistence.event_store.event_codec import decode_event
+from tabb.adapters.outbound.persistence.event_store.order_repository import (
+    EventSourcedOrderRepository,
+)
+from tabb.adapters.outbound.persistence.event_store.outbox import (
+    EventLogOutbox,
+    EventLogOutboxRepository,
+)
+from tabb.adapters.outbound.persistence.event_store.segmented_event_store import (
+    SegmentedEventStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.menu_item_repository import (
+    InMemoryMenuItemRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.application.outbox import OutboxEntry
+from tabb.application.ports.outbound.outbox_notifier import OutboxNotifier
+from tabb.application.ports.outbound.outbox_repository import OutboxRepository
+from tabb.application.ports.outbound.unit_of_work import UnitOfWork
+from tabb.domain.models.menu_item import MenuItem
+from tabb.domain.models.order import Order
+from tabb.domain.ports.id_generator import IdGenerator
+from tabb.domain.ports.menu_item_repository import MenuItemRepository
+from tabb.domain.ports.order_repository import OrderRepository
+
+
+class EventSourcedUnitOfWork(UnitOfWork):
+    """UoW storing orders as event streams and projecting from the same log.
+
+    Orders are event-sourced in the outbox's ``SegmentedEventStore``:
+    ``commit()`` appends only the events each changed order recorded, one
+    commit per order, and once they are on disk snapshots long streams if
+    ``order_snapshots`` is given. Menu items keep their state in an in-memory versioned store;
+    their events are appended to the same log, and ``restore_menu_items``
+    rebuilds the store from it on startup. The outbox reads the log, so
+    each event is written once and no outbox copy is kept.
+
+    Every staged write is checked before anything is appended, merging
+    commuting order changes, and ``ConcurrencyConflictError`` is raised
+    without writing if a conflict remains. ``commit()`` returns once the
+    appended events are on disk; concurrent commits share one fsync.
+    ``rollback()`` discards staged changes. When a notifier is given, a
+    commit that appends events signals it so the outbox worker wakes
+    immediately.
+    """
+
+    def __init__(
+        self,
+        outbox: EventLogOutbox,
+        menu_item_store: InMemoryVersionedStore[MenuItem],
+        order_cache: AggregateCache[Order] | None = None,
+        order_snapshots: AggregateSnapshotStore | None = None,
+        notifier: OutboxNotifier | None = None,
+        id_generator: IdGenerator | None = None,
+    ) -> None:
+        self._outbox = outbox
+        self._menu_item_store = menu_item_store
+        self._order_cache = order_cache
+        self._order_snapshots = order_snapshots
+        self._notifier = notifier
+        self._id_generator = id_generator or UuidIdGenerator()
+
+        self._order_repo: EventSourcedOrderRepository | None = None
+        self._menu_item_repo: InMemoryMenuItemRepository | None = None
+        self._outbox_repo: EventLogOutboxRepository | None = None
+
+    @property
+    def order_repository(self) -> OrderRepository:
+        if self._order_repo is None:
+            raise RuntimeError("UnitOfWork not entered")
+        return self._order_repo
+
+    @property
+    def menu_item_repository(self) -> MenuItemRepository:
+        if self._menu_item_repo is None:
+            raise RuntimeError("UnitOfWork not entered")
+        return self._menu_item_repo
+
+    @property
+    def outbox_repository(self) -> OutboxRepository:
+        if self._outbox_repo is None:
+            raise RuntimeError("UnitOfWork not entered")
+        return self._outbox_repo
+
+    async def commit(self) -> None:
+        order_repo = self._order_repo
+        menu_item_repo = self._menu_item_repo
+        outbox_repo = self._outbox_repo
+        if order_repo is None or menu_item_repo is None or outbox_repo is None:
+            raise RuntimeError("UnitOfWork not entered")
+        order_repo.stage_changes()
+        menu_item_changes = menu_item_repo.stage_changes()
+        order_repo.prepare_commit()
+        menu_item_repo.prepare_commit()
+
+        for menu_item, events in menu_item_changes:
+            for event in events:
+                await outbox_repo.save(
+                    OutboxEntry.create(
+                        entry_id=self._id_generator.generate(),
+                        event=event,
+                        aggregate_id=str(menu_item.id),
+                        aggregate_type=type(menu_item).__name__,
+                    )
+                )
+
+        orders = order_repo.flush()
+        menu_item_repo.flush()
+        flushed = outbox_repo.flush()
+        if orders or flushed:
+            await self._outbox.event_store.sync()
+            order_repo.write_snapshots()
+            if self._notifier is not None:
+                self._notifier.notify()
+
+    async def rollback(self) -> None:
+        if self._order_repo is not None:
+            self._order_repo.discard()
+        if self._menu_item_repo is not None:
+            self._menu_item_repo.discard()
+        if self._outbox_repo is not None:
+            self._outbox_repo.discard()
+
+    async def __aenter__(self) -> EventSourcedUnitOfWork:
+        self._order_repo = EventSourcedOrderRepository(
+            self._outbox.event_store, self._order_cache, self._order_snapshots
+        )
+        self._menu_item_repo = InMemoryMenuItemRepository(self._menu_item_store)
+        self._outbox_repo = EventLogOutboxRepository(self._outbox)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            await self.rollback()
+        if self._menu_item_repo is not None:
+            self._menu_item_repo.close()
+        self._order_repo = None
+        self._menu_item_repo = None
+        self._outbox_repo = None
+
+
+def restore_menu_items(
+    event_store: SegmentedEventStore,
+    menu_item_store: InMemoryVersionedStore[MenuItem],
+) -> int:
+    """Rebuild every menu item from its stream in one store commit.
+
+    Each item gets its stream's version. Returns the number restored.
+    """
+    aggregate_type = MenuItem.__name__
+    restored: dict[str, MenuItem] = {}
+    for aggregate_id in event_store.stream_ids(aggregate_type):
+        item = MenuItem.from_events(
+            decode_event(stored)
+            for stored in event_store.read_stream(aggregate_type, aggregate_id)
+        )
+        item._version = event_store.version(aggregate_type, aggregate_id)
+        restored[aggregate_id] = item
+    if restored:
+        menu_item_store.commit(restored)
+    return len(restored)
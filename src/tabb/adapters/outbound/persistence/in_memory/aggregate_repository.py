@@ -0,0 +1,121 @@
+"""Shared unit-of-work machinery for the in-memory write repositories."""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.application.exceptions import ConcurrencyConflictError
+from tabb.domain.events.base import DomainEvent
+from tabb.domain.shared.building_blocks import AggregateRoot
+
+
+class InMemoryAggregateRepository[A: AggregateRoot[Any]]:
+    """Identity map, dirty tracking and versioned staging for one unit of work.
+
+    - Reads come from a snapshot of the store pinned when the repository
+      is created, so every lookup in a unit of work sees the same committed
+      state. ``close()`` releases the pin.
+    - Loading forks the snapshot's aggregate once per key; repeated loads
+      return the same instance. The loaded version is kept as the base.
+    - ``save`` only registers an aggregate with the identity map.
+    - ``stage_changes`` collects the events of every tracked aggregate and
+      stages a fork of those that recorded events, are new or differ from
+      their base; unchanged aggregates are not written.
+    - ``prepare_commit`` checks staged versions against the latest store
+      version and ``flush`` commits the staged writes as a new store
+      version, advancing aggregate versions and re-pinning the snapshot.
+    """
+
+    aggregate_type: ClassVar[str]
+
+    def __init__(self, store: InMemoryVersionedStore[A]) -> None:
+        self._store = store
+        self._snapshot = store.snapshot()
+        self._identity: dict[str, A] = {}
+        self._bases: dict[str, A] = {}
+        self._staging: dict[str, A] = {}
+
+    def stage_changes(self) -> list[tuple[A, list[DomainEvent]]]:
+        """Stage changed aggregates; return each with its collected events."""
+        changes: list[tuple[A, list[DomainEvent]]] = []
+        for key, aggregate in self._identity.items():
+            events = aggregate.collect_events()
+            base = self._bases.get(key)
+            if not events and base is not None and aggregate == base:
+                continue
+            self._staging[key] = aggregate.fork()
+            changes.append((aggregate, events))
+        return changes
+
+    def prepare_commit(self) -> None:
+        """Raise ConcurrencyConflictError if a staged write is stale.
+
+        A staged aggregate carries the version it was loaded at (0 for a
+        new one). When the store has moved on, ``_merge`` may reconcile the
+        two; otherwise the commit is rejected.
+        """
+        for key, aggregate in self._staging.items():
+            committed = self._store.get(key)
+            current = committed.version if committed is not None else 0
+            if current == aggregate.version:
+                continue
+            merged = self._merge(key, aggregate, committed)
+            if merged is None:
+                raise ConcurrencyConflictError(
+                    self.aggregate_type, key, aggregate.version, current
+                )
+            self._staging[key] = merged
+
+    def flush(self) -> list[A]:
+        """Commit staged writes as a new store version; return them.
+
+        Tracked instances stay usable after a commit: each one advances with
+        its staged copy, unless that copy was merged with a concurrent write,
+        in which case it keeps its old version and base. Nothing staged
+        publishes nothing.
+        """
+        if not self._staging:
+            return []
+        for key, staged in self._staging.items():
+            tracked = self._identity[key]
+            if tracked.version == staged.version:
+                tracked._version += 1
+                self._bases[key] = staged
+            staged._version += 1
+        self._store.commit(self._staging)
+        committed = list(self._staging.values())
+        self._staging.clear()
+        self._snapshot.release()
+        self._snapshot = self._store.snapshot()
+        return committed
+
+    def discard(self) -> None:
+        """Discard staged writes and forget every tracked aggregate."""
+        self._staging.clear()
+        self._identity.clear()
+        self._bases.clear()
+
+    def close(self) -> None:
+        """Release the pinned snapshot so its version can be reclaimed."""
+        self._snapshot.release()
+
+    def _load(self, key: str) -> A | None:
+        if key in self._identity:
+            return self._identity[key]
+        committed = self._snapshot.get(key)
+        if committed is None:
+            return None
+        aggregate = committed.fork()
+        self._bases[key] = committed
+        self._identity[key] = aggregate
+        return aggregate
+
+    def _track(self, aggregate: A) -> None:
+        self._identity[str(aggregate.id)] = aggregate
+
+    def _merge(self, key: str, staged: A, committed: A | None) -> A | None:
+        """Reconcile a stale staged write; None rejects it. Merges nothing."""
+        return None
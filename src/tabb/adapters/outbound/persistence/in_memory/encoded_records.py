@@ -0,0 +1,61 @@
+"""Mapping of records restored in encoded form and decoded on first read."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+
+
+class EncodedRecords[V](MutableMapping[str, V]):
+    """Mapping whose values may still be encoded bytes.
+
+    A restored snapshot holds hundreds of thousands of records; decoding
+    them all up front would dominate startup. Values loaded as bytes are
+    decoded the first time they are read and the decoded value replaces
+    them. ``encoded()`` hands untouched values back without decoding, so
+    writing the next snapshot only encodes what was read or changed.
+    """
+
+    __slots__ = ("_data", "_decode")
+
+    def __init__(
+        self,
+        decode: Callable[[bytes], V],
+        encoded: Mapping[str, bytes] | None = None,
+    ) -> None:
+        self._decode = decode
+        self._data: dict[str, V | bytes] = dict(encoded or {})
+
+    def copy(self) -> EncodedRecords[V]:
+        """Shallow copy that shares the decoder and every value."""
+        clone: EncodedRecords[V] = EncodedRecords(self._decode)
+        clone._data = self._data.copy()
+        return clone
+
+    def encoded(self, encode: Callable[[V], bytes]) -> dict[str, bytes]:
+        """Every record as bytes; values never decoded are passed through."""
+        return {
+            key: value if isinstance(value, bytes) else encode(value)
+            for key, value in self._data.items()
+        }
+
+    def __getitem__(self, key: str) -> V:
+        value = self._data[key]
+        if isinstance(value, bytes):
+            decoded = self._data[key] = self._decode(value)
+            return decoded
+        return value
+
+    def __setitem__(self, key: str, value: V) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
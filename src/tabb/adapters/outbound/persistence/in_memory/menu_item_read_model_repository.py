@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import copy
+from collections.abc import Mapping
 
 from tabb.application.ports.outbound.menu_item_read_model_repository import (
     MenuItemReadModelRepository,
@@ -11,17 +11,26 @@ from tabb.application.read_models.menu_item_read_model import MenuItemReadModel
 
 
 class InMemoryMenuItemReadModelRepository(MenuItemReadModelRepository):
-    """In-memory repository for menu item read models."""
+    """In-memory repository for menu item read models.
 
-    def __init__(self) -> None:
-        self._store: dict[str, MenuItemReadModel] = {}
+    Read models are immutable, so they are stored and handed out by
+    reference without copying.
+    """
+
+    def __init__(
+        self, read_models: Mapping[str, MenuItemReadModel] | None = None
+    ) -> None:
+        self._store: dict[str, MenuItemReadModel] = dict(read_models or {})
+
+    def export_state(self) -> dict[str, MenuItemReadModel]:
+        """Copy the contents for a snapshot file; read models are shared."""
+        return self._store.copy()
 
     async def find_by_id(self, menu_item_id: str) -> MenuItemReadModel | None:
-        rm = self._store.get(menu_item_id)
-        return copy.deepcopy(rm) if rm is not None else None
+        return self._store.get(menu_item_id)
 
     async def find_all_available(self) -> list[MenuItemReadModel]:
-        return [copy.deepcopy(rm) for rm in self._store.values() if rm.available]
+        return [rm for rm in self._store.values() if rm.available]
 
     async def save(self, read_model: MenuItemReadModel) -> None:
-        self._store[read_model.menu_item_id] = copy.deepcopy(read_model)
+        self._store[read_model.menu_item_id] = read_model
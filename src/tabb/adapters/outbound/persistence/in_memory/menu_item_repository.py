@@ -2,38 +2,37 @@
 
 from __future__ import annotations
 
-import copy
+from collections.abc import Sequence
 
+from tabb.adapters.outbound.persistence.in_memory.aggregate_repository import (
+    InMemoryAggregateRepository,
+)
 from tabb.domain.models.menu_item import MenuItem, MenuItemId
 from tabb.domain.ports.menu_item_repository import MenuItemRepository
 
 
-class InMemoryMenuItemRepository(MenuItemRepository):
+class InMemoryMenuItemRepository(
+    InMemoryAggregateRepository[MenuItem], MenuItemRepository
+):
     """In-memory write-side repository for MenuItem aggregates.
 
-    Supports staged writes for UoW integration.
+    Supports staged writes for UoW integration. MenuItem state is
+    immutable apart from its pending events, so loads hand out cheap
+    ``fork()`` copies instead of deep copies.
     """
 
-    def __init__(self, store: dict[str, MenuItem]) -> None:
-        self._store = store
-        self._staging: dict[str, MenuItem] = {}
+    aggregate_type = "MenuItem"
 
     async def find_by_id(self, item_id: MenuItemId) -> MenuItem | None:
-        key = str(item_id)
-        if key in self._staging:
-            return copy.deepcopy(self._staging[key])
-        if key in self._store:
-            return copy.deepcopy(self._store[key])
-        return None
+        return self._load(str(item_id))
 
-    async def save(self, item: MenuItem) -> None:
-        self._staging[str(item.id)] = copy.deepcopy(item)
-
-    def flush(self) -> None:
-        """Apply staged writes to the committed store."""
-        self._store.update(self._staging)
-        self._staging.clear()
+    async def find_by_ids(self, item_ids: Sequence[MenuItemId]) -> list[MenuItem]:
+        found: list[MenuItem] = []
+        for key in dict.fromkeys(str(item_id) for item_id in item_ids):
+            item = self._load(key)
+            if item is not None:
+                found.append(item)
+        return found
 
-    def discard(self) -> None:
-        """Discard staged writes."""
-        self._staging.clear()
+    async def save(self, item: MenuItem) -> None:
+        self._track(item)
@@ -2,26 +2,113 @@
 
 from __future__ import annotations
 
-import copy
+from collections.abc import Hashable
+from dataclasses import dataclass
 
+from tabb.adapters.outbound.persistence.in_memory.encoded_records import (
+    EncodedRecords,
+)
 from tabb.application.ports.outbound.order_read_model_repository import (
     OrderReadModelRepository,
 )
 from tabb.application.read_models.order_read_model import OrderReadModel
 
+type _Index = dict[Hashable, dict[str, None]]
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrderReadModelState:
+    """Contents and indexes of the repository at one point in time."""
+
+    read_models: dict[str, OrderReadModel] | EncodedRecords[OrderReadModel]
+    by_table: _Index
+    by_status: _Index
+    by_table_status: _Index
+
 
 class InMemoryOrderReadModelRepository(OrderReadModelRepository):
-    """In-memory repository for order read models."""
+    """In-memory repository for order read models.
+
+    Read models are immutable, so they are stored and handed out by
+    reference without copying.
+
+    Secondary indexes by table, by status and by (table, status) map a key
+    to the insertion-ordered ids of matching orders. They are updated on
+    every ``save`` and ``delete``, so lookups cost O(result size) however
+    many orders are stored.
+
+    ``export_state()`` copies the contents and indexes for a snapshot file;
+    passing such a state to the constructor restores it without re-indexing.
+    """
+
+    def __init__(self, state: OrderReadModelState | None = None) -> None:
+        self._store: dict[str, OrderReadModel] | EncodedRecords[OrderReadModel] = (
+            state.read_models if state else {}
+        )
+        self._by_table: _Index = state.by_table if state else {}
+        self._by_status: _Index = state.by_status if state else {}
+        self._by_table_status: _Index = state.by_table_status if state else {}
 
-    def __init__(self) -> None:
-        self._store: dict[str, OrderReadModel] = {}
+    def export_state(self) -> OrderReadModelState:
+        """Copy the contents and indexes; read models are shared, not copied."""
+        return OrderReadModelState(
+            read_models=self._store.copy(),
+            by_table=_copy_index(self._by_table),
+            by_status=_copy_index(self._by_status),
+            by_table_status=_copy_index(self._by_table_status),
+        )
 
     async def find_by_id(self, order_id: str) -> OrderReadModel | None:
-        rm = self._store.get(order_id)
-        return copy.deepcopy(rm) if rm is not None else None
+        return self._store.get(order_id)
+
+    async def find_by_table(
+        self, table_number: int, status: str | None = None
+    ) -> list[OrderReadModel]:
+        if status is None:
+            return self._lookup(self._by_table, table_number)
+        return self._lookup(self._by_table_status, (table_number, status))
+
+    async def find_by_status(self, status: str) -> list[OrderReadModel]:
+        return self._lookup(self._by_status, status)
 
     async def save(self, read_model: OrderReadModel) -> None:
-        self._store[read_model.order_id] = copy.deepcopy(read_model)
+        previous = self._store.get(read_model.order_id)
+        self._store[read_model.order_id] = read_model
+        if previous is None:
+            self._index(read_model)
+        elif (previous.table_number, previous.status) != (
+            read_model.table_number,
+            read_model.status,
+        ):
+            self._unindex(previous)
+            self._index(read_model)
 
     async def delete(self, order_id: str) -> None:
-        self._store.pop(order_id, None)
+        previous = self._store.pop(order_id, None)
+        if previous is not None:
+            self._unindex(previous)
+
+    def _lookup(self, index: _Index, key: Hashable) -> list[OrderReadModel]:
+        return [self._store[order_id] for order_id in index.get(key, ())]
+
+    def _index(self, read_model: OrderReadModel) -> None:
+        for index, key in self._keys(read_model):
+            index.setdefault(key, {})[read_model.order_id] = None
+
+    def _unindex(self, read_model: OrderReadModel) -> None:
+        for index, key in self._keys(read_model):
+            bucket = index[key]
+            del bucket[read_model.order_id]
+            if not bucket:
+                del index[key]
+
+    def _keys(self, read_model: OrderReadModel) -> tuple[tuple[_Index, Hashable], ...]:
+        return (
+            (self._by_table, read_model.table_number),
+            (self._by_status, read_model.status),
+            (self._by_table_status, (read_model.table_number, read_model.status)),
+        )
+
+
+def _copy_index(index: _Index) -> _Index:
+    return {key: bucket.copy() for key, bucket in index.items()}
@@ -2,40 +2,40 @@
 
 from __future__ import annotations
 
-import copy
-
+from tabb.adapters.outbound.persistence.in_memory.aggregate_repository import (
+    InMemoryAggregateRepository,
+)
 from tabb.domain.models.order import Order, OrderId
 from tabb.domain.ports.order_repository import OrderRepository
 
 
-class InMemoryOrderRepository(OrderRepository):
+class InMemoryOrderRepository(InMemoryAggregateRepository[Order], OrderRepository):
     """In-memory write-side repository for Order aggregates.
 
-    Supports staged writes: saves go to a staging area, which is
-    applied to the committed store on UoW commit, or discarded on rollback.
-    Reads check staging first (read-your-writes), then committed store.
+    Supports staged writes: changed orders are staged on UoW commit and
+    applied to the committed store, or discarded on rollback. Within a unit
+    of work each order is loaded once and the same instance is returned
+    (read-your-writes).
+
+    Loads hand out ``Order.fork()`` copies rather than deep copies: items
+    stay shared until a command changes one, at which point only that item
+    is copied, so units of work remain isolated.
+
+    If another unit of work commits the same order first, commuting changes
+    are merged (``Order.merge_concurrent``) and only real conflicts raise
+    ``ConcurrencyConflictError``.
     """
 
-    def __init__(self, store: dict[str, Order]) -> None:
-        self._store = store
-        self._staging: dict[str, Order] = {}
+    aggregate_type = "Order"
 
     async def find_by_id(self, order_id: OrderId) -> Order | None:
-        key = str(order_id)
-        if key in self._staging:
-            return copy.deepcopy(self._staging[key])
-        if key in self._store:
-            return copy.deepcopy(self._store[key])
-        return None
+        return self._load(str(order_id))
 
     async def save(self, order: Order) -> None:
-        self._staging[str(order.id)] = copy.deepcopy(order)
-
-    def flush(self) -> None:
-        """Apply staged writes to the committed store."""
-        self._store.update(self._staging)
-        self._staging.clear()
+        self._track(order)
 
-    def discard(self) -> None:
-        """Discard staged writes."""
-        self._staging.clear()
+    def _merge(self, key: str, staged: Order, committed: Order | None) -> Order | None:
+        base = self._bases.get(key)
+        if base is None or committed is None or base.version != staged.version:
+            return None
+        return staged.merge_concurrent(base, committed)
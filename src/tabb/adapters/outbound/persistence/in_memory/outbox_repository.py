@@ -2,59 +2,55 @@
 
 from __future__ import annotations
 
-import copy
-
-from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.application.outbox import OutboxEntry
 from tabb.application.ports.outbound.outbox_repository import OutboxRepository
 
 
 class InMemoryOutboxRepository(OutboxRepository):
     """In-memory repository for outbox entries.
 
-    Supports staged writes for UoW integration.
+    Supports staged writes for UoW integration. Committed entries live in
+    an indexed ``InMemoryOutboxStore`` so polling and status updates do
+    not scan the whole outbox. Saved entries are stored as given, not
+    copied: the caller hands them over and must not mutate them.
     """
 
-    def __init__(self, store: list[OutboxEntry]) -> None:
+    def __init__(self, store: InMemoryOutboxStore) -> None:
         self._store = store
         self._staging: list[OutboxEntry] = []
 
     async def save(self, entry: OutboxEntry) -> None:
-        self._staging.append(copy.deepcopy(entry))
+        self._staging.append(entry)
 
     async def find_pending(self, limit: int = 10) -> list[OutboxEntry]:
         """Return pending or failed (retryable) entries from the committed store."""
-        pending = [
-            e
-            for e in self._store
-            if e.status in (OutboxEntryStatus.PENDING, OutboxEntryStatus.FAILED)
-            and e.can_retry
-            and e.is_ready_for_retry
-        ]
-        pending.sort(key=lambda e: e.occurred_at)
-        return pending[:limit]
+        return self._store.find_ready(limit)
+
+    async def count_pending(self) -> int:
+        return self._store.pending_count
 
     async def mark_processed(self, entry_id: str) -> None:
-        for entry in self._store:
-            if entry.entry_id == entry_id:
-                entry.mark_processed()
-                return
+        self._store.mark_processed(entry_id)
 
     async def mark_failed(self, entry_id: str, error: str) -> None:
-        for entry in self._store:
-            if entry.entry_id == entry_id:
-                entry.mark_failed(error)
-                return
+        self._store.mark_failed(entry_id, error)
 
     async def mark_dead_lettered(self, entry_id: str) -> None:
-        for entry in self._store:
-            if entry.entry_id == entry_id:
-                entry._status = OutboxEntryStatus.DEAD_LETTERED
-                return
-
-    def flush(self) -> None:
-        """Apply staged writes to the committed store."""
-        self._store.extend(self._staging)
+        self._store.mark_dead_lettered(entry_id)
+
+    def flush(self) -> int:
+        """Apply staged writes to the committed store.
+
+        Returns the number of entries flushed.
+        """
+        for entry in self._staging:
+            self._store.add(entry)
+        flushed = len(self._staging)
         self._staging.clear()
+        return flushed
 
     def discard(self) -> None:
         """Discard staged writes."""
@@ -0,0 +1,88 @@
+"""In-memory outbox retention: archives and reclaims processed entries."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.application.outbox import OutboxEntry
+from tabb.application.ports.inbound.outbox_retention import (
+    OutboxRetention,
+    OutboxRetentionStats,
+)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class InMemoryOutboxRetention(OutboxRetention):
+    """Moves processed entries from the live store into a bounded archive.
+
+    Processed entries are reclaimed once they are older than
+    ``max_age_seconds`` or once more than ``max_processed`` of them are
+    held live. Each ``compact`` call works in slices of ``batch_size``
+    entries and yields to the event loop between slices, stopping once
+    ``time_budget_seconds`` is spent. The archive keeps only the most
+    recent ``archive_size`` entries.
+    """
+
+    def __init__(
+        self,
+        store: InMemoryOutboxStore,
+        max_age_seconds: float = 300.0,
+        max_processed: int = 10_000,
+        archive_size: int = 1_000,
+        batch_size: int = 500,
+        time_budget_seconds: float = 0.005,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self._store = store
+        self._max_age = timedelta(seconds=max_age_seconds)
+        self._max_processed = max_processed
+        self._batch_size = batch_size
+        self._time_budget = time_budget_seconds
+        self._clock = clock
+        self._archive: deque[OutboxEntry] = deque(maxlen=archive_size)
+        self._reclaimed_total = 0
+        self._last_reclaimed = 0
+
+    @property
+    def archive(self) -> list[OutboxEntry]:
+        """Most recently reclaimed entries, oldest first."""
+        return list(self._archive)
+
+    async def compact(self) -> int:
+        deadline = time.monotonic() + self._time_budget
+        processed_before = self._clock() - self._max_age
+        reclaimed = 0
+
+        while True:
+            batch = self._store.reclaim_processed(
+                limit=self._batch_size,
+                keep_latest=self._max_processed,
+                processed_before=processed_before,
+            )
+            self._archive.extend(batch)
+            reclaimed += len(batch)
+            if len(batch) < self._batch_size or time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(0)
+
+        self._reclaimed_total += reclaimed
+        self._last_reclaimed = reclaimed
+        return reclaimed
+
+    def stats(self) -> OutboxRetentionStats:
+        return OutboxRetentionStats(
+            reclaimed_total=self._reclaimed_total,
+            last_reclaimed=self._last_reclaimed,
+            archived=len(self._archive),
+            live_entries=len(self._store),
+        )
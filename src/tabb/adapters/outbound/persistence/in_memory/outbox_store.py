@@ -0,0 +1,402 @@
+"""Indexed in-memory outbox store shared by UoW and outbox repositories."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections import deque
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+
+from tabb.adapters.outbound.persistence.in_memory.timer_wheel import TimerWheel
+from tabb.application.backoff import BackoffStrategy
+from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+
+_UNSETTLED = (OutboxEntryStatus.PENDING, OutboxEntryStatus.FAILED)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class OutboxGapError(RuntimeError):
+    """Raised when entries a log reader has not read were already reclaimed."""
+
+
+class InMemoryOutboxStore:
+    """Committed outbox entries as a log in commit order.
+
+    Every added entry gets the next global ``sequence`` number, so the
+    store is a gap-free log in commit order; entries restored from a
+    snapshot or the write-ahead log keep the number they were committed
+    with.
+
+    - ``_entries``: entry_id -> entry (O(1) lookup for status updates)
+    - ``_log``: sequence -> entry_id (O(1) lookup by position)
+    - ``_gaps`` / ``_gap_ends``: runs of reclaimed sequence numbers, keyed
+      by their first and last number, so a read jumps a whole run at once
+    - ``_readers``: positions of registered log readers; retention keeps
+      every entry after the lowest one
+    - ``_cursor``: every entry at or below it has been dispatched: it is
+      settled, or it has moved to a side queue. Fresh entries are read
+      forward from the cursor, so a batch costs O(batch) however long the
+      history is, and a failed entry never holds the cursor back.
+    - ``_retry``: side queue of failed entries, a ``TimerWheel`` that hands
+      each back at the first 0.1 s tick at or after its next_retry_at
+      (O(1) insert and expiry)
+    - ``_due``: side-queue entries that may run now, a min-heap by sequence
+    - ``_processed``: processed entry ids in completion order, so the
+      oldest can be reclaimed without scanning
+    - ``_blocked`` / ``_parked``: per-aggregate ordering. While an entry
+      waits for a retry, later entries of the same aggregate are parked
+      and only return, through ``_due``, once it is processed or
+      dead-lettered.
+
+    Heaps use lazy deletion: each live heap record carries a token that is
+    also held in ``_retry_tokens`` / ``_due_tokens``. Status changes drop
+    the token, and stale records are discarded when they reach the top.
+
+    ``backoff`` sets the delay before each retry of a failed entry; by
+    default a plain exponential backoff. Retry times are counted on
+    ``clock``.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], datetime] = _utc_now,
+        backoff: BackoffStrategy | None = None,
+    ) -> None:
+        self._clock = clock
+        self._backoff = backoff
+        self._entries: dict[str, OutboxEntry] = {}
+        self._log: dict[int, str] = {}
+        self._last_sequence = 0
+        self._gaps: dict[int, int] = {}
+        self._gap_ends: dict[int, int] = {}
+        self._highest_reclaimed = 0
+        self._readers: dict[int, int] = {}
+        self._reader_ids = itertools.count(1)
+        self._cursor = 0
+        self._retry: TimerWheel[tuple[int, str]] = TimerWheel(start=clock().timestamp())
+        self._due: list[tuple[int, int, str]] = []
+        self._retry_tokens: dict[str, int] = {}
+        self._due_tokens: dict[str, int] = {}
+        self._sidelined: set[str] = set()
+        self._processed: deque[str] = deque()
+        self._blocked: dict[str, str] = {}
+        self._parked: dict[str, list[str]] = {}
+        self._pending_count = 0
+        self._tokens = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[OutboxEntry]:
+        """Iterate over all committed entries in insertion order."""
+        return iter(self._entries.values())
+
+    @property
+    def pending_count(self) -> int:
+        """Number of entries not yet processed or dead-lettered."""
+        return self._pending_count
+
+    @property
+    def processed_count(self) -> int:
+        """Number of processed entries still held in the live store."""
+        return len(self._processed)
+
+    @property
+    def last_sequence(self) -> int:
+        """Sequence number of the latest committed entry (0 if none)."""
+        return self._last_sequence
+
+    def next_retry_at(self) -> datetime | None:
+        """Earliest time ``find_ready`` may hand a failed entry back, if any.
+
+        Never later than that, so a consumer that sleeps until then picks
+        the entry up as soon as it is due.
+        """
+        deadline = self._retry.next_deadline()
+        return None if deadline is None else datetime.fromtimestamp(deadline, UTC)
+
+    def get(self, entry_id: str) -> OutboxEntry | None:
+        return self._entries.get(entry_id)
+
+    def add(self, entry: OutboxEntry) -> None:
+        """Append a committed entry to the log and index it by its status.
+
+        An entry without a sequence number gets the next one. Entries that
+        already have one must be added in sequence order; numbers missing
+        between them belong to reclaimed entries.
+        """
+        caught_up = self._cursor == self._last_sequence
+        if entry._sequence is None:
+            entry._sequence = self._last_sequence + 1
+        sequence = entry._sequence
+        if sequence <= self._last_sequence:
+            raise ValueError(
+                f"Outbox sequence {sequence} is not after {self._last_sequence}"
+            )
+        if sequence > self._last_sequence + 1:
+            self._add_gap(self._last_sequence + 1, sequence - 1)
+        self._last_sequence = sequence
+        self._entries[entry.entry_id] = entry
+        self._log[sequence] = entry.entry_id
+        if caught_up:
+            self._cursor = sequence - 1
+
+        if entry.status == OutboxEntryStatus.PENDING:
+            self._pending_count += 1
+        elif entry.status == OutboxEntryStatus.PROCESSED:
+            self._processed.append(entry.entry_id)
+        elif entry.status == OutboxEntryStatus.FAILED and entry.can_retry:
+            self._pending_count += 1
+            self._push_retry(entry)
+        if caught_up and not self._is_fresh(entry.entry_id):
+            self._cursor = sequence
+
+    def find_ready(self, limit: int) -> list[OutboxEntry]:
+        """Return up to ``limit`` processable entries, in sequence order.
+
+        Due retries join the side queue first; its entries are merged with
+        fresh entries read forward from the cursor. Nothing is consumed:
+        entries stay ready until they are marked, at a cost of
+        O(limit log s) for s side-queue entries, not the log length.
+        """
+        self._promote_due_retries()
+        fresh = self._read_fresh(limit)
+
+        side: list[tuple[int, int, str]] = []
+        while self._due and len(side) < limit:
+            record = heapq.heappop(self._due)
+            _, token, entry_id = record
+            if self._due_tokens.get(entry_id) != token:
+                continue  # stale record
+            if self._park_if_blocked(entry_id):
+                del self._due_tokens[entry_id]
+                continue
+            side.append(record)
+        for record in side:
+            heapq.heappush(self._due, record)
+
+        merged = heapq.merge(
+            [(sequence, entry_id) for sequence, _, entry_id in side], fresh
+        )
+        return [
+            self._entries[entry_id] for _, entry_id in itertools.islice(merged, limit)
+        ]
+
+    def read_after(self, sequence: int, limit: int) -> list[OutboxEntry]:
+        """Return up to ``limit`` live entries after ``sequence``, in order.
+
+        Whatever their status: this is the log as a cursor-holding
+        consumer reads it. Runs of reclaimed entries are jumped in one
+        step, so a read costs O(limit) however much was reclaimed.
+        """
+        entries: list[OutboxEntry] = []
+        while sequence < self._last_sequence and len(entries) < limit:
+            sequence += 1
+            gap_end = self._gaps.get(sequence)
+            if gap_end is not None:
+                sequence = gap_end
+                continue
+            entries.append(self._entries[self._log[sequence]])
+        return entries
+
+    def open_reader(self, position: int) -> int:
+        """Register a log reader at ``position`` and return its id.
+
+        Until the reader is closed, ``reclaim_processed`` keeps every entry
+        after its position. Raises ``ValueError`` for a position past the
+        end of the log, and ``OutboxGapError`` if entries after it were
+        already reclaimed.
+        """
+        if position > self._last_sequence:
+            raise ValueError(
+                f"Reader position {position} is past the end of the log "
+                f"({self._last_sequence})"
+            )
+        if position < self._highest_reclaimed:
+            raise OutboxGapError(
+                f"Entries after {position} were reclaimed; the log is complete "
+                f"after {self._highest_reclaimed}"
+            )
+        reader = next(self._reader_ids)
+        self._readers[reader] = position
+        return reader
+
+    def move_reader(self, reader: int, position: int) -> None:
+        self._readers[reader] = position
+
+    def close_reader(self, reader: int) -> None:
+        self._readers.pop(reader, None)
+
+    def mark_processed(self, entry_id: str) -> None:
+        entry = self._entries.get(entry_id)
+        if entry is None or entry.status == OutboxEntryStatus.PROCESSED:
+            return
+        self._settle(entry)
+        entry.mark_processed()
+        self._processed.append(entry_id)
+        self._unblock(entry)
+
+    def mark_failed(self, entry_id: str, error: str) -> None:
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            return
+        self._settle(entry)
+        entry.mark_failed(error, self._backoff, now=self._clock())
+        if entry.status == OutboxEntryStatus.FAILED:
+            self._pending_count += 1
+            self._blocked.setdefault(entry.aggregate_id, entry_id)
+            self._push_retry(entry)
+        else:
+            self._unblock(entry)
+
+    def mark_dead_lettered(self, entry_id: str) -> None:
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            return
+        self._settle(entry)
+        entry._status = OutboxEntryStatus.DEAD_LETTERED
+        self._unblock(entry)
+
+    def reclaim_processed(
+        self,
+        limit: int,
+        keep_latest: int,
+        processed_before: datetime | None = None,
+    ) -> list[OutboxEntry]:
+        """Remove up to ``limit`` of the oldest processed entries.
+
+        An entry is reclaimed while more than ``keep_latest`` processed
+        entries remain, or while it was processed before
+        ``processed_before``, unless a registered reader has yet to read
+        it. Work is bounded by ``limit``, so callers can compact
+        incrementally.
+        """
+        read_up_to = min(self._readers.values(), default=self._last_sequence)
+        reclaimed: list[OutboxEntry] = []
+        while self._processed and len(reclaimed) < limit:
+            entry = self._entries[self._processed[0]]
+            if entry.sequence is not None and entry.sequence > read_up_to:
+                break
+            over_count = len(self._processed) > keep_latest
+            expired = (
+                processed_before is not None
+                and entry.processed_at is not None
+                and entry.processed_at <= processed_before
+            )
+            if not (over_count or expired):
+                break
+            self._processed.popleft()
+            del self._entries[entry.entry_id]
+            if entry.sequence is not None:
+                del self._log[entry.sequence]
+                self._add_gap(entry.sequence, entry.sequence)
+            reclaimed.append(entry)
+        return reclaimed
+
+    # -- Index maintenance ------------------------------------------------
+
+    def _is_fresh(self, entry_id: str) -> bool:
+        """True for a pending entry that no side queue has taken."""
+        return (
+            self._entries[entry_id].status == OutboxEntryStatus.PENDING
+            and entry_id not in self._sidelined
+        )
+
+    def _read_fresh(self, limit: int) -> list[tuple[int, str]]:
+        """Read fresh entries forward from the cursor, advancing it.
+
+        The cursor moves past every dispatched entry before the first
+        fresh one; fresh entries blocked behind a failed entry of their
+        aggregate are parked on the way.
+        """
+        fresh: list[tuple[int, str]] = []
+        sequence = self._cursor
+        while sequence < self._last_sequence and len(fresh) < limit:
+            sequence += 1
+            gap_end = self._gaps.get(sequence)
+            if gap_end is not None:
+                if self._cursor == sequence - 1:
+                    self._cursor = gap_end
+                sequence = gap_end
+                continue
+            entry_id = self._log[sequence]
+            if self._is_fresh(entry_id) and not self._park_if_blocked(entry_id):
+                fresh.append((sequence, entry_id))
+            elif self._cursor == sequence - 1:
+                self._cursor = sequence
+        return fresh
+
+    def _add_gap(self, first: int, last: int) -> None:
+        """Record ``first``..``last`` as reclaimed, merging adjacent runs."""
+        start = self._gap_ends.pop(first - 1, None)
+        if start is not None:
+            del self._gaps[start]
+            first = start
+        end = self._gaps.pop(last + 1, None)
+        if end is not None:
+            del self._gap_ends[end]
+            last = end
+        self._gaps[first] = last
+        self._gap_ends[last] = first
+        self._highest_reclaimed = max(self._highest_reclaimed, last)
+
+    def _settle(self, entry: OutboxEntry) -> None:
+        """Drop an entry from the indexes before its status changes."""
+        self._unindex(entry.entry_id)
+        self._sidelined.discard(entry.entry_id)
+        if entry.status in _UNSETTLED:
+            self._pending_count -= 1
+
+    def _push_retry(self, entry: OutboxEntry) -> None:
+        self._sidelined.add(entry.entry_id)
+        if entry.next_retry_at is None:
+            self._push_due(entry)
+            return
+        token = next(self._tokens)
+        self._retry_tokens[entry.entry_id] = token
+        self._retry.schedule(entry.next_retry_at.timestamp(), (token, entry.entry_id))
+
+    def _push_due(self, entry: OutboxEntry) -> None:
+        self._sidelined.add(entry.entry_id)
+        token = next(self._tokens)
+        self._due_tokens[entry.entry_id] = token
+        heapq.heappush(self._due, (entry.sequence or 0, token, entry.entry_id))
+
+    def _unindex(self, entry_id: str) -> None:
+        self._retry_tokens.pop(entry_id, None)
+        self._due_tokens.pop(entry_id, None)
+
+    def _park_if_blocked(self, entry_id: str) -> bool:
+        """Park an entry whose aggregate waits on an earlier failed entry."""
+        aggregate_id = self._entries[entry_id].aggregate_id
+        blocker = self._blocked.get(aggregate_id)
+        if blocker is None or blocker == entry_id:
+            return False
+        self._sidelined.add(entry_id)
+        self._parked.setdefault(aggregate_id, []).append(entry_id)
+        return True
+
+    def _unblock(self, entry: OutboxEntry) -> None:
+        """Release parked entries once the blocking entry is resolved."""
+        if self._blocked.get(entry.aggregate_id) != entry.entry_id:
+            return
+        del self._blocked[entry.aggregate_id]
+        for entry_id in self._parked.pop(entry.aggregate_id, []):
+            parked = self._entries[entry_id]
+            if parked.status == OutboxEntryStatus.PENDING:
+                self._push_due(parked)
+            elif parked.status == OutboxEntryStatus.FAILED:
+                self._push_retry(parked)
+
+    def _promote_due_retries(self) -> None:
+        if not self._retry:
+            return
+        for token, entry_id in self._retry.expire(self._clock().timestamp()):
+            if self._retry_tokens.get(entry_id) != token:
+                continue  # stale record
+            del self._retry_tokens[entry_id]
+            self._push_due(self._entries[entry_id])
@@ -0,0 +1,182 @@
+"""Persistent hash array mapped trie (HAMT) for the in-memory stores."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_MASK = (1 << 64) - 1
+
+type _Node = _Leaf | _BitmapNode | _CollisionNode
+
+
+class _Leaf:
+    __slots__ = ("hash", "key", "value")
+
+    def __init__(self, hash_: int, key: Any, value: Any) -> None:
+        self.hash = hash_
+        self.key = key
+        self.value = value
+
+
+class _BitmapNode:
+    """Up to 32 children, indexed by the popcount of ``bitmap`` below a bit."""
+
+    __slots__ = ("bitmap", "children")
+
+    def __init__(self, bitmap: int, children: tuple[_Node, ...]) -> None:
+        self.bitmap = bitmap
+        self.children = children
+
+
+class _CollisionNode:
+    """Leaves whose keys share one full 64-bit hash."""
+
+    __slots__ = ("hash", "leaves")
+
+    def __init__(self, hash_: int, leaves: tuple[_Leaf, ...]) -> None:
+        self.hash = hash_
+        self.leaves = leaves
+
+
+_EMPTY = _BitmapNode(0, ())
+_MISSING = object()
+
+
+class PersistentMap[K: Hashable, V]:
+    """Immutable mapping whose updates share structure with the original.
+
+    ``set`` returns a new map and copies only the O(log32 n) nodes on the
+    path to the changed key; every other node is shared, so keeping old
+    versions alive is cheap and reading one never needs a lock or a copy.
+    Keys are never removed: the write stores only insert and replace.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, items: Iterable[tuple[K, V]] = ()) -> None:
+        self._root: _Node = _EMPTY
+        self._size = 0
+        for key, value in items:
+            self._root, added = _assoc(self._root, _hash(key), 0, key, value)
+            self._size += added
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        value = _find(self._root, _hash(key), 0, key)
+        return default if value is _MISSING else value
+
+    def set(self, key: K, value: V) -> PersistentMap[K, V]:
+        """Return a new map with ``key`` bound to ``value``."""
+        return self.update(((key, value),))
+
+    def update(self, items: Iterable[tuple[K, V]]) -> PersistentMap[K, V]:
+        """Return a new map with every ``(key, value)`` pair applied."""
+        root, size = self._root, self._size
+        for key, value in items:
+            root, added = _assoc(root, _hash(key), 0, key, value)
+            size += added
+        updated: PersistentMap[K, V] = PersistentMap.__new__(PersistentMap)
+        updated._root, updated._size = root, size
+        return updated
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        for leaf in _leaves(self._root):
+            yield leaf.key, leaf.value
+
+    def __getitem__(self, key: K) -> V:
+        value: V = _find(self._root, _hash(key), 0, key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return _find(self._root, _hash(key), 0, key) is not _MISSING
+
+    def __iter__(self) -> Iterator[K]:
+        for leaf in _leaves(self._root):
+            yield leaf.key
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def _hash(key: object) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _find(node: _Node, hash_: int, shift: int, key: object) -> Any:
+    while True:
+        if isinstance(node, _BitmapNode):
+            bit = 1 << ((hash_ >> shift) & _MASK)
+            if not node.bitmap & bit:
+                return _MISSING
+            node = node.children[(node.bitmap & (bit - 1)).bit_count()]
+            shift += _BITS
+        elif isinstance(node, _Leaf):
+            if node.hash == hash_ and node.key == key:
+                return node.value
+            return _MISSING
+        else:
+            if node.hash == hash_:
+                for leaf in node.leaves:
+                    if leaf.key == key:
+                        return leaf.value
+            return _MISSING
+
+
+def _assoc(
+    node: _Node, hash_: int, shift: int, key: Hashable, value: Any
+) -> tuple[_Node, bool]:
+    """Return (new node, whether a key was added) for ``key`` -> ``value``."""
+    if isinstance(node, _BitmapNode):
+        bit = 1 << ((hash_ >> shift) & _MASK)
+        index = (node.bitmap & (bit - 1)).bit_count()
+        if not node.bitmap & bit:
+            children = (
+                *node.children[:index],
+                _Leaf(hash_, key, value),
+                *node.children[index:],
+            )
+            return _BitmapNode(node.bitmap | bit, children), True
+        child, added = _assoc(node.children[index], hash_, shift + _BITS, key, value)
+        children = (*node.children[:index], child, *node.children[index + 1 :])
+        return _BitmapNode(node.bitmap, children), added
+
+    if isinstance(node, _Leaf):
+        if node.hash != hash_:
+            return _split(node, _Leaf(hash_, key, value), shift), True
+        if node.key == key:
+            return _Leaf(hash_, key, value), False
+        return _CollisionNode(hash_, (node, _Leaf(hash_, key, value))), True
+
+    if node.hash != hash_:
+        return _split(node, _Leaf(hash_, key, value), shift), True
+    for i, leaf in enumerate(node.leaves):
+        if leaf.key == key:
+            leaves = (*node.leaves[:i], _Leaf(hash_, key, value), *node.leaves[i + 1 :])
+            return _CollisionNode(hash_, leaves), False
+    return _CollisionNode(hash_, (*node.leaves, _Leaf(hash_, key, value))), True
+
+
+def _split(existing: _Leaf | _CollisionNode, leaf: _Leaf, shift: int) -> _Node:
+    """Build the subtree holding ``existing`` and a ``leaf`` of another hash."""
+    old_index = (existing.hash >> shift) & _MASK
+    new_index = (leaf.hash >> shift) & _MASK
+    if old_index == new_index:
+        return _BitmapNode(1 << old_index, (_split(existing, leaf, shift + _BITS),))
+    children: tuple[_Node, ...] = (
+        (existing, leaf) if old_index < new_index else (leaf, existing)
+    )
+    return _BitmapNode((1 << old_index) | (1 << new_index), children)
+
+
+def _leaves(node: _Node) -> Iterator[_Leaf]:
+    if isinstance(node, _Leaf):
+        yield node
+    elif isinstance(node, _CollisionNode):
+        yield from node.leaves
+    else:
+        for child in node.children:
+            yield from _leaves(child)
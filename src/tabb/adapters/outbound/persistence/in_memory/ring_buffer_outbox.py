@@ -0,0 +1,429 @@
+"""Outbox kept in a memory-mapped ring buffer of fixed-size records."""
+
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+import struct
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
+from tabb.application.backoff import BackoffStrategy
+from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+from tabb.application.ports.outbound.outbox_repository import OutboxRepository
+
+_MAGIC = b"TABBRING"
+_FORMAT = 2
+_HEADER = struct.Struct("<8sHIIQQ")
+_HEADER_SIZE = 64
+_TAIL_OFFSET = 18
+_HEAD_OFFSET = 26
+
+# sequence, status, retry count, max retries, payload length, error length,
+# occurred_at and next_retry_at as POSIX timestamps (NaN for no retry), and
+# the last retry delay in seconds, as a 32-bit float to keep the header small.
+_SLOT = struct.Struct("<QBBBxIHxxddf")
+_STATUS_OFFSET = 8
+_RETRY_OFFSET = 9
+_PAYLOAD_LENGTH_OFFSET = 12
+_ERROR_LENGTH_OFFSET = 16
+_NEXT_RETRY_OFFSET = 28
+
+_EMPTY = 0
+_STATUS_CODES = {
+    OutboxEntryStatus.PENDING: 1,
+    OutboxEntryStatus.PROCESSED: 2,
+    OutboxEntryStatus.FAILED: 3,
+    OutboxEntryStatus.DEAD_LETTERED: 4,
+}
+_STATUSES = {code: status for status, code in _STATUS_CODES.items()}
+_PENDING = _STATUS_CODES[OutboxEntryStatus.PENDING]
+_FAILED = _STATUS_CODES[OutboxEntryStatus.FAILED]
+_SETTLED = frozenset(
+    (
+        _STATUS_CODES[OutboxEntryStatus.PROCESSED],
+        _STATUS_CODES[OutboxEntryStatus.DEAD_LETTERED],
+    )
+)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class RingBufferFullError(RuntimeError):
+    """Raised when every slot of the ring holds an unsettled entry."""
+
+
+class RingBufferOutbox:
+    """Outbox entries encoded into fixed-size slots of a memory-mapped file.
+
+    Entries get consecutive sequence numbers, which are their ids, and
+    live in slot ``sequence % capacity``. A slot holds a fixed header
+    (status, retry count, timestamps) followed by the event as compact
+    JSON and the last error, so a status change or retry rewrites a few
+    header bytes in place and no Python object is kept per entry.
+
+    ``head`` and ``tail`` sequence numbers live in the file header.
+    ``tail`` advances past processed and dead-lettered entries, freeing
+    their slots for reuse; appending to a ring whose ``capacity`` slots
+    are all unsettled raises ``RingBufferFullError``. ``find_ready``
+    returns pending entries and failed ones whose retry time has passed,
+    in sequence order.
+
+    As in ``InMemoryOutboxStore``, an aggregate whose entry failed and
+    waits to be retried has its later entries held back, so they are
+    projected in order. The blocking entry of each aggregate is kept in
+    memory and found again from the failed slots on reopening.
+
+    ``backoff`` sets the delay before each retry of a failed entry; by
+    default a plain exponential backoff.
+
+    The mapping is written back by the OS; ``flush`` forces it to disk.
+    Reopening the file resumes from the saved head and tail.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        capacity: int = 65_536,
+        record_size: int = 512,
+        clock: Callable[[], datetime] = _utc_now,
+        backoff: BackoffStrategy | None = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if record_size <= _SLOT.size:
+            raise ValueError(f"record_size must exceed {_SLOT.size} bytes")
+        self._path = Path(path)
+        self._clock = clock
+        self._backoff = backoff
+        self._capacity = capacity
+        self._record_size = record_size
+        size = _HEADER_SIZE + capacity * record_size
+
+        existing = self._path.exists() and self._path.stat().st_size > 0
+        with self._path.open("r+b" if existing else "w+b") as file:
+            if not existing:
+                file.truncate(size)
+            elif self._path.stat().st_size != size:
+                raise ValueError(f"{self._path} does not match the ring geometry")
+            self._map = mmap.mmap(file.fileno(), size)
+
+        if existing:
+            magic, fmt, stored_record_size, stored_capacity, tail, head = (
+                _HEADER.unpack_from(self._map, 0)
+            )
+            if magic != _MAGIC or fmt != _FORMAT:
+                raise ValueError(f"{self._path} is not a ring buffer outbox")
+            if (stored_record_size, stored_capacity) != (record_size, capacity):
+                raise ValueError(f"{self._path} does not match the ring geometry")
+        else:
+            tail = head = 0
+            _HEADER.pack_into(
+                self._map, 0, _MAGIC, _FORMAT, record_size, capacity, tail, head
+            )
+        self._tail: int = tail
+        self._head: int = head
+        self._pending = 0
+        self._blocked: dict[str, int] = {}
+        for sequence in range(self._tail, self._head):
+            status = self._status(sequence)
+            if status not in _SETTLED:
+                self._pending += 1
+            if status == _FAILED:
+                self._blocked.setdefault(self._decode(sequence).aggregate_id, sequence)
+
+    def __len__(self) -> int:
+        """Number of entries held, settled ones not yet reclaimed included."""
+        return self._head - self._tail
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def pending_count(self) -> int:
+        """Number of entries not yet processed or dead-lettered."""
+        return self._pending
+
+    def add(self, entry: OutboxEntry) -> str:
+        """Append ``entry`` and return the id it is stored under."""
+        return self.add_all([entry])[0]
+
+    def add_all(self, entries: Sequence[OutboxEntry]) -> list[str]:
+        """Append ``entries`` in order and return the ids they are stored under.
+
+        Every entry is checked before any is written, so if one does not
+        fit, nothing is appended.
+        """
+        free = self._capacity - (self._head - self._tail)
+        if len(entries) > free:
+            raise RingBufferFullError(
+                f"{len(entries)} entries do not fit the {free} free of "
+                f"{self._capacity} outbox slots"
+            )
+        payloads = [self._encode(entry) for entry in entries]
+        return [
+            self._append(entry, payload)
+            for entry, payload in zip(entries, payloads, strict=True)
+        ]
+
+    def find_ready(self, limit: int) -> list[OutboxEntry]:
+        """Return up to ``limit`` processable entries, oldest first."""
+        now = self._clock().timestamp()
+        ready: list[OutboxEntry] = []
+        sequence = self._tail
+        while sequence < self._head and len(ready) < limit:
+            offset = self._offset(sequence)
+            status = self._map[offset + _STATUS_OFFSET]
+            if status == _PENDING or (status == _FAILED and self._due(offset, now)):
+                entry = self._decode(sequence)
+                if self._blocked.get(entry.aggregate_id, sequence) == sequence:
+                    ready.append(entry)
+            sequence += 1
+        return ready
+
+    def get(self, entry_id: str) -> OutboxEntry | None:
+        sequence = self._sequence(entry_id)
+        return self._decode(sequence) if sequence is not None else None
+
+    def mark_processed(self, entry_id: str) -> None:
+        sequence = self._sequence(entry_id)
+        if sequence is None or self._status(sequence) in _SETTLED:
+            return
+        self._set_status(sequence, OutboxEntryStatus.PROCESSED)
+
+    def mark_failed(self, entry_id: str, error: str) -> None:
+        sequence = self._sequence(entry_id)
+        if sequence is None or self._status(sequence) in _SETTLED:
+            return
+        entry = self._decode(sequence)
+        entry.mark_failed(error, self._backoff, now=self._clock())
+        offset = self._offset(sequence)
+        self._map[offset + _RETRY_OFFSET] = min(entry.retry_count, 255)
+        struct.pack_into(
+            "<df",
+            self._map,
+            offset + _NEXT_RETRY_OFFSET,
+            _timestamp(entry.next_retry_at),
+            entry.retry_delay_seconds,
+        )
+        self._write_error(offset, error)
+        if entry.status == OutboxEntryStatus.FAILED:
+            self._blocked.setdefault(entry.aggregate_id, sequence)
+        self._set_status(sequence, entry.status)
+
+    def mark_dead_lettered(self, entry_id: str) -> None:
+        sequence = self._sequence(entry_id)
+        if sequence is None or self._status(sequence) in _SETTLED:
+            return
+        self._set_status(sequence, OutboxEntryStatus.DEAD_LETTERED)
+
+    def flush(self) -> None:
+        """Write the mapping back to the file."""
+        self._map.flush()
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.flush()
+            self._map.close()
+
+    # -- Slots ------------------------------------------------------------
+
+    def _encode(self, entry: OutboxEntry) -> bytes:
+        """The slot payload of ``entry``; raises if it does not fit a slot."""
+        payload = json.dumps(
+            [
+                entry.event_type,
+                entry.aggregate_type,
+                entry.aggregate_id,
+                dict(entry.event_data),
+            ],
+            separators=(",", ":"),
+        ).encode()
+        if entry.max_retries > 255:
+            raise ValueError("max_retries must fit in one byte")
+        if _SLOT.size + len(payload) > self._record_size:
+            raise ValueError(
+                f"event of {len(payload)} bytes does not fit a "
+                f"{self._record_size}-byte outbox slot"
+            )
+        return payload
+
+    def _append(self, entry: OutboxEntry, payload: bytes) -> str:
+        sequence = self._head
+        offset = self._offset(sequence)
+        self._map[offset + _SLOT.size : offset + _SLOT.size + len(payload)] = payload
+        _SLOT.pack_into(
+            self._map,
+            offset,
+            sequence,
+            _STATUS_CODES[entry.status],
+            entry.retry_count,
+            entry.max_retries,
+            len(payload),
+            0,
+            entry.occurred_at.timestamp(),
+            _timestamp(entry.next_retry_at),
+            entry.retry_delay_seconds,
+        )
+        self._head += 1
+        struct.pack_into("<Q", self._map, _HEAD_OFFSET, self._head)
+        if entry.status not in (
+            OutboxEntryStatus.PROCESSED,
+            OutboxEntryStatus.DEAD_LETTERED,
+        ):
+            self._pending += 1
+        return str(sequence)
+
+    def _offset(self, sequence: int) -> int:
+        return _HEADER_SIZE + (sequence % self._capacity) * self._record_size
+
+    def _sequence(self, entry_id: str) -> int | None:
+        """The live sequence number ``entry_id`` names, if it is still held."""
+        try:
+            sequence = int(entry_id)
+        except ValueError:
+            return None
+        if not self._tail <= sequence < self._head:
+            return None
+        return sequence
+
+    def _status(self, sequence: int) -> int:
+        return self._map[self._offset(sequence) + _STATUS_OFFSET]
+
+    def _due(self, offset: int, now: float) -> bool:
+        """True if the failed entry at ``offset`` may be retried at ``now``."""
+        (retry_at,) = struct.unpack_from("<d", self._map, offset + _NEXT_RETRY_OFFSET)
+        return math.isnan(retry_at) or retry_at <= now
+
+    def _set_status(self, sequence: int, status: OutboxEntryStatus) -> None:
+        code = _STATUS_CODES[status]
+        if code in _SETTLED and self._status(sequence) == _FAILED:
+            self._unblock(sequence)
+        self._map[self._offset(sequence) + _STATUS_OFFSET] = code
+        if code in _SETTLED:
+            self._pending -= 1
+            self._reclaim()
+
+    def _unblock(self, sequence: int) -> None:
+        """Release the aggregate a failed entry was holding back, if any."""
+        aggregate_id = self._decode(sequence).aggregate_id
+        if self._blocked.get(aggregate_id) == sequence:
+            del self._blocked[aggregate_id]
+
+    def _reclaim(self) -> None:
+        """Advance the tail past settled entries, freeing their slots."""
+        tail = self._tail
+        while tail < self._head and self._status(tail) in _SETTLED:
+            self._map[self._offset(tail) + _STATUS_OFFSET] = _EMPTY
+            tail += 1
+        if tail != self._tail:
+            self._tail = tail
+            struct.pack_into("<Q", self._map, _TAIL_OFFSET, tail)
+
+    def _write_error(self, offset: int, error: str) -> None:
+        (payload_length,) = struct.unpack_from(
+            "<I", self._map, offset + _PAYLOAD_LENGTH_OFFSET
+        )
+        start = offset + _SLOT.size + payload_length
+        room = self._record_size - _SLOT.size - payload_length
+        encoded = error.encode()[:room]
+        self._map[start : start + len(encoded)] = encoded
+        struct.pack_into("<H", self._map, offset + _ERROR_LENGTH_OFFSET, len(encoded))
+
+    def _decode(self, sequence: int) -> OutboxEntry:
+        offset = self._offset(sequence)
+        (
+            _,
+            status,
+            retry_count,
+            max_retries,
+            payload_length,
+            error_length,
+            occurred_at,
+            next_retry_at,
+            retry_delay_seconds,
+        ) = _SLOT.unpack_from(self._map, offset)
+        start = offset + _SLOT.size
+        event_type, aggregate_type, aggregate_id, event_data = json.loads(
+            self._map[start : start + payload_length]
+        )
+        error_start = start + payload_length
+        last_error = (
+            self._map[error_start : error_start + error_length].decode(errors="ignore")
+            if error_length
+            else None
+        )
+        return OutboxEntry(
+            _entry_id=str(sequence),
+            _event_type=event_type,
+            _event_data=event_data,
+            _aggregate_id=aggregate_id,
+            _aggregate_type=aggregate_type,
+            _occurred_at=datetime.fromtimestamp(occurred_at, UTC),
+            _status=_STATUSES[status],
+            _retry_count=retry_count,
+            _max_retries=max_retries,
+            _last_error=last_error,
+            _next_retry_at=(
+                datetime.fromtimestamp(next_retry_at, UTC)
+                if not math.isnan(next_retry_at)
+                else None
+            ),
+            _retry_delay_seconds=retry_delay_seconds,
+        )
+
+
+class RingBufferOutboxRepository(OutboxRepository):
+    """Outbox repository over a ``RingBufferOutbox``.
+
+    Supports staged writes for UoW integration, as
+    ``InMemoryOutboxRepository`` does. Entry ids given on save are not
+    kept: once in the ring, an entry's id is its sequence number.
+    """
+
+    def __init__(self, ring: RingBufferOutbox) -> None:
+        self._ring = ring
+        self._staging: list[OutboxEntry] = []
+
+    async def save(self, entry: OutboxEntry) -> None:
+        self._staging.append(entry)
+
+    async def find_pending(self, limit: int = 10) -> list[OutboxEntry]:
+        """Return pending or failed (retryable) entries, oldest first."""
+        return self._ring.find_ready(limit)
+
+    async def count_pending(self) -> int:
+        return self._ring.pending_count
+
+    async def mark_processed(self, entry_id: str) -> None:
+        self._ring.mark_processed(entry_id)
+
+    async def mark_failed(self, entry_id: str, error: str) -> None:
+        self._ring.mark_failed(entry_id, error)
+
+    async def mark_dead_lettered(self, entry_id: str) -> None:
+        self._ring.mark_dead_lettered(entry_id)
+
+    def flush(self) -> int:
+        """Append staged entries to the ring.
+
+        Returns the number of entries flushed.
+        """
+        self._ring.add_all(self._staging)
+        flushed = len(self._staging)
+        self._staging.clear()
+        return flushed
+
+    def discard(self) -> None:
+        """Discard staged writes."""
+        self._staging.clear()
+
+
+def _timestamp(value: datetime | None) -> float:
+    return value.timestamp() if value is not None else math.nan
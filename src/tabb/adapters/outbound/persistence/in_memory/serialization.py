@@ -0,0 +1,162 @@
+"""Plain-data records of stored state for durable in-memory storage.
+
+Each ``*_to_record`` function returns a JSON-compatible dict and the
+matching ``*_from_record`` rebuilds an equal object, including the
+aggregate version used for optimistic concurrency. Pending domain events
+are not part of a record: they are already in the outbox.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+from tabb.application.read_models.menu_item_read_model import MenuItemReadModel
+from tabb.application.read_models.order_read_model import (
+    OrderItemReadModel,
+    OrderReadModel,
+)
+from tabb.domain.models.menu_item import MenuItem, MenuItemId
+from tabb.domain.models.order import (
+    Order,
+    OrderId,
+    OrderItem,
+    OrderItemId,
+    OrderItemStatus,
+    OrderStatus,
+)
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+type Record = dict[str, Any]
+
+
+def order_to_record(order: Order) -> Record:
+    return {
+        "id": str(order.id),
+        "table": order.table.value,
+        "status": order.status.value,
+        "version": order.version,
+        "items": [
+            {
+                "id": str(item.id),
+                "menu_item_id": item.menu_item_id,
+                "name": item.name,
+                "unit_price": str(item.unit_price.amount),
+                "quantity": item.quantity.value,
+                "status": item.status.value,
+            }
+            for item in order.items
+        ],
+    }
+
+
+def order_from_record(record: Record) -> Order:
+    order = Order(
+        _id=OrderId(record["id"]),
+        _table=TableNumber(record["table"]),
+        _items=[
+            OrderItem(
+                _id=OrderItemId(item["id"]),
+                _menu_item_id=item["menu_item_id"],
+                _name=item["name"],
+                _unit_price=Money(Decimal(item["unit_price"])),
+                _quantity=Quantity(item["quantity"]),
+                _status=OrderItemStatus(item["status"]),
+            )
+            for item in record["items"]
+        ],
+        _status=OrderStatus(record["status"]),
+    )
+    order._version = record["version"]
+    return order
+
+
+def menu_item_to_record(item: MenuItem) -> Record:
+    return {
+        "id": str(item.id),
+        "name": item.name,
+        "price": str(item.price.amount),
+        "available": item.available,
+        "version": item.version,
+    }
+
+
+def menu_item_from_record(record: Record) -> MenuItem:
+    item = MenuItem(
+        _id=MenuItemId(record["id"]),
+        _name=record["name"],
+        _price=Money(Decimal(record["price"])),
+        _available=record["available"],
+    )
+    item._version = record["version"]
+    return item
+
+
+def outbox_entry_to_record(entry: OutboxEntry) -> Record:
+    return {
+        "id": entry.entry_id,
+        "event_type": entry.event_type,
+        "event_data": dict(entry.event_data),
+        "aggregate_id": entry.aggregate_id,
+        "aggregate_type": entry.aggregate_type,
+        "occurred_at": entry.occurred_at.isoformat(),
+        "status": entry.status.value,
+        "retry_count": entry.retry_count,
+        "max_retries": entry.max_retries,
+        "last_error": entry.last_error,
+        "processed_at": _isoformat(entry.processed_at),
+        "next_retry_at": _isoformat(entry.next_retry_at),
+        "sequence": entry.sequence,
+        "retry_delay_seconds": entry.retry_delay_seconds,
+    }
+
+
+def outbox_entry_from_record(record: Record) -> OutboxEntry:
+    return OutboxEntry(
+        _entry_id=record["id"],
+        _event_type=record["event_type"],
+        _event_data=dict(record["event_data"]),
+        _aggregate_id=record["aggregate_id"],
+        _aggregate_type=record["aggregate_type"],
+        _occurred_at=datetime.fromisoformat(record["occurred_at"]),
+        _status=OutboxEntryStatus(record["status"]),
+        _retry_count=record["retry_count"],
+        _max_retries=record["max_retries"],
+        _last_error=record["last_error"],
+        _processed_at=_fromisoformat(record["processed_at"]),
+        _next_retry_at=_fromisoformat(record["next_retry_at"]),
+        _sequence=record.get("sequence"),
+        _retry_delay_seconds=record.get("retry_delay_seconds", 0.0),
+    )
+
+
+def order_read_model_to_record(read_model: OrderReadModel) -> Record:
+    return asdict(read_model)
+
+
+def order_read_model_from_record(record: Record) -> OrderReadModel:
+    return OrderReadModel(
+        order_id=record["order_id"],
+        table_number=record["table_number"],
+        status=record["status"],
+        items=tuple(OrderItemReadModel(**item) for item in record["items"]),
+    )
+
+
+def menu_item_read_model_to_record(read_model: MenuItemReadModel) -> Record:
+    return asdict(read_model)
+
+
+def menu_item_read_model_from_record(record: Record) -> MenuItemReadModel:
+    return MenuItemReadModel(**record)
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _fromisoformat(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
@@ -0,0 +1,221 @@
+"""Snapshot files of the in-memory stores for fast warm restarts."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import pickle  # nosec B403 — snapshot files are only written by this process
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from tabb.adapters.outbound.persistence.in_memory.encoded_records import (
+    EncodedRecords,
+)
+from tabb.adapters.outbound.persistence.in_memory.menu_item_read_model_repository import (
+    InMemoryMenuItemReadModelRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.order_read_model_repository import (
+    InMemoryOrderReadModelRepository,
+    OrderReadModelState,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.serialization import (
+    Record,
+    menu_item_from_record,
+    menu_item_read_model_from_record,
+    menu_item_read_model_to_record,
+    menu_item_to_record,
+    order_from_record,
+    order_read_model_from_record,
+    order_read_model_to_record,
+    order_to_record,
+    outbox_entry_from_record,
+    outbox_entry_to_record,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.write_ahead_log import (
+    WriteAheadLog,
+)
+from tabb.application.backoff import BackoffStrategy
+from tabb.domain.models.menu_item import MenuItem
+from tabb.domain.models.order import Order
+
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True, kw_only=True)
+class InMemoryStores:
+    """The shared in-memory stores of one application instance."""
+
+    order_store: InMemoryVersionedStore[Order]
+    menu_item_store: InMemoryVersionedStore[MenuItem]
+    outbox_store: InMemoryOutboxStore
+    order_read_models: InMemoryOrderReadModelRepository
+    menu_item_read_models: InMemoryMenuItemReadModelRepository
+
+    @classmethod
+    def empty(cls, backoff: BackoffStrategy | None = None) -> InMemoryStores:
+        return cls(
+            order_store=InMemoryVersionedStore(),
+            menu_item_store=InMemoryVersionedStore(),
+            outbox_store=InMemoryOutboxStore(backoff=backoff),
+            order_read_models=InMemoryOrderReadModelRepository(),
+            menu_item_read_models=InMemoryMenuItemReadModelRepository(),
+        )
+
+
+@dataclass(frozen=True, kw_only=True)
+class RestoredSnapshot:
+    """Stores loaded from a snapshot file and the log offset it covers."""
+
+    stores: InMemoryStores
+    log_offset: int
+
+
+class SnapshotFile:
+    """Point-in-time copy of every in-memory store, in one file.
+
+    ``save()`` captures the stores in a single synchronous step, so the
+    copy matches one commit boundary and one write-ahead log ``position``;
+    it then waits for the log to be durable up to that point and writes the
+    file in a worker thread, replacing the previous one atomically. After a
+    restart, ``load()`` returns the stores and the offset to open the log
+    at, so only the commits made after the snapshot are replayed.
+
+    Aggregates and order read models are stored as one encoded blob per
+    record and decoded on first read (see ``EncodedRecords``), so loading
+    costs one read and one unpickle of a flat dict, however many records
+    there are. Outbox entries are restored eagerly to rebuild its indexes.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._path = Path(path)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def load(self, backoff: BackoffStrategy | None = None) -> RestoredSnapshot | None:
+        """Read the snapshot file, or return None if there is none yet.
+
+        ``backoff`` is the retry backoff of the restored outbox store.
+        """
+        try:
+            data = self._path.read_bytes()
+        except FileNotFoundError:
+            return None
+        payload = pickle.loads(data)  # nosec B301 — written by save()
+        if payload["format"] != _FORMAT_VERSION:
+            raise ValueError(
+                f"{self._path} has unsupported snapshot format {payload['format']}"
+            )
+
+        outbox_store = InMemoryOutboxStore(backoff=backoff)
+        for record in payload["outbox"]:
+            outbox_store.add(outbox_entry_from_record(record))
+        stores = InMemoryStores(
+            order_store=InMemoryVersionedStore(
+                base=EncodedRecords(_decoder(order_from_record), payload["orders"])
+            ),
+            menu_item_store=InMemoryVersionedStore(
+                base=EncodedRecords(
+                    _decoder(menu_item_from_record), payload["menu_items"]
+                )
+            ),
+            outbox_store=outbox_store,
+            order_read_models=InMemoryOrderReadModelRepository(
+                OrderReadModelState(
+                    read_models=EncodedRecords(
+                        _decoder(order_read_model_from_record),
+                        payload["order_read_models"],
+                    ),
+                    by_table=payload["by_table"],
+                    by_status=payload["by_status"],
+                    by_table_status=payload["by_table_status"],
+                )
+            ),
+            menu_item_read_models=InMemoryMenuItemReadModelRepository(
+                {
+                    key: menu_item_read_model_from_record(record)
+                    for key, record in payload["menu_item_read_models"].items()
+                }
+            ),
+        )
+        return RestoredSnapshot(stores=stores, log_offset=payload["log_offset"])
+
+    async def save(
+        self, stores: InMemoryStores, write_ahead_log: WriteAheadLog | None = None
+    ) -> None:
+        """Write a snapshot of ``stores`` covering every commit made so far."""
+        orders = stores.order_store.snapshot()
+        menu_items = stores.menu_item_store.snapshot()
+        try:
+            outbox = [outbox_entry_to_record(entry) for entry in stores.outbox_store]
+            order_read_models = stores.order_read_models.export_state()
+            menu_item_read_models = stores.menu_item_read_models.export_state()
+            log_offset = 0
+            if write_ahead_log is not None:
+                log_offset = write_ahead_log.position
+                await write_ahead_log.sync(write_ahead_log.last_lsn)
+
+            def encode() -> dict[str, Any]:
+                read_models = order_read_models.read_models
+                return {
+                    "format": _FORMAT_VERSION,
+                    "log_offset": log_offset,
+                    "orders": orders.encoded(_encoder(order_to_record)),
+                    "menu_items": menu_items.encoded(_encoder(menu_item_to_record)),
+                    "outbox": outbox,
+                    "order_read_models": (
+                        read_models.encoded(_encoder(order_read_model_to_record))
+                        if isinstance(read_models, EncodedRecords)
+                        else {
+                            key: _encode(order_read_model_to_record(read_model))
+                            for key, read_model in read_models.items()
+                        }
+                    ),
+                    "by_table": order_read_models.by_table,
+                    "by_status": order_read_models.by_status,
+                    "by_table_status": order_read_models.by_table_status,
+                    "menu_item_read_models": {
+                        key: menu_item_read_model_to_record(read_model)
+                        for key, read_model in menu_item_read_models.items()
+                    },
+                }
+
+            await asyncio.to_thread(self._write, encode)
+        finally:
+            orders.release()
+            menu_items.release()
+
+    def _write(self, encode: Callable[[], dict[str, Any]]) -> None:
+        data = pickle.dumps(encode(), protocol=pickle.HIGHEST_PROTOCOL)
+        temporary = self._path.with_name(self._path.name + ".tmp")
+        with temporary.open("wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self._path)
+        directory = os.open(self._path.parent, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def _encode(record: Record) -> bytes:
+    return pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _encoder[V](to_record: Callable[[V], Record]) -> Callable[[V], bytes]:
+    return lambda value: _encode(to_record(value))
+
+
+def _decoder[V](from_record: Callable[[Record], V]) -> Callable[[bytes], V]:
+    return lambda data: from_record(pickle.loads(data))  # nosec B301
@@ -0,0 +1,119 @@
+"""Hierarchical timer wheel for scheduling outbox retries."""
+
+from __future__ import annotations
+
+import math
+
+
+class TimerWheel[T]:
+    """Items scheduled by deadline, handed back once the deadline passes.
+
+    Time is counted in ticks of ``resolution`` seconds. Level 0 has one
+    slot per tick for the next ``slots`` ticks; each higher level has
+    slots ``slots`` times wider than the one below, so ``levels`` levels
+    cover ``slots ** levels`` ticks. ``schedule`` appends to one slot in
+    O(1). ``expire`` walks the ticks since the last call, empties the
+    level-0 slot of each, and when a tick starts a slot of a higher level
+    it moves that slot's items down to the level matching their remaining
+    time. Each item moves down at most ``levels - 1`` times, so expiry is
+    amortized O(1) per item plus O(1) per tick walked; an empty wheel
+    skips ahead without walking.
+
+    Items are never handed back early: an item is due at the first tick
+    at or after its deadline. Deadlines past the wheel's horizon wait in
+    its last slot and are placed again when it is reached.
+    """
+
+    def __init__(
+        self,
+        start: float,
+        resolution: float = 0.1,
+        slots: int = 64,
+        levels: int = 4,
+    ) -> None:
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        if levels < 1:
+            raise ValueError("levels must be at least 1")
+        self._resolution = resolution
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._levels = levels
+        self._wheels: list[list[list[tuple[int, T]]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        self._tick = math.floor(start / resolution)  # next tick to expire
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def schedule(self, deadline: float, item: T) -> None:
+        """Hand ``item`` back from the first ``expire`` at or after ``deadline``."""
+        self._place(max(math.ceil(deadline / self._resolution), self._tick), item)
+        self._size += 1
+
+    def expire(self, now: float) -> list[T]:
+        """Return the items due at ``now``, in deadline order by tick."""
+        target = math.floor(now / self._resolution)
+        expired: list[T] = []
+        while self._tick <= target:
+            if not self._size:
+                self._tick = target + 1
+                break
+            self._cascade()
+            slot = self._wheels[0][self._tick & self._mask]
+            if slot:
+                self._wheels[0][self._tick & self._mask] = []
+                self._size -= len(slot)
+                expired.extend(item for _, item in slot)
+            self._tick += 1
+        return expired
+
+    def next_deadline(self) -> float | None:
+        """Earliest time at which ``expire`` may return an item, or None.
+
+        Exact for items within ``slots`` ticks; for later ones it is the
+        start of their higher-level slot, which is never after the item's
+        own deadline.
+        """
+        if not self._size:
+            return None
+        slots = self._mask + 1
+        for level in range(self._levels):
+            shift = self._bits * level
+            base = self._tick >> shift
+            for offset in range(slots):
+                if self._wheels[level][(base + offset) & self._mask]:
+                    tick = max((base + offset) << shift, self._tick)
+                    return tick * self._resolution
+        return None
+
+    def _place(self, tick: int, item: T) -> None:
+        for level in range(self._levels):
+            shift = self._bits * level
+            if (tick >> shift) - (self._tick >> shift) <= self._mask:
+                self._wheels[level][(tick >> shift) & self._mask].append((tick, item))
+                return
+        # Past the horizon: park in the last slot of the top level.
+        shift = self._bits * (self._levels - 1)
+        slot = ((self._tick >> shift) + self._mask) & self._mask
+        self._wheels[-1][slot].append((tick, item))
+
+    def _cascade(self) -> None:
+        """Move the higher-level slots that start at this tick down."""
+        top = 0
+        while (
+            top + 1 < self._levels
+            and self._tick & ((1 << (self._bits * (top + 1))) - 1) == 0
+        ):
+            top += 1
+        for level in range(top, 0, -1):
+            index = (self._tick >> (self._bits * level)) & self._mask
+            slot = self._wheels[level][index]
+            if slot:
+                self._wheels[level][index] = []
+                for tick, item in slot:
+                    self._place(tick, item)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from types import TracebackType
 
+from tabb.adapters.outbound.id_generator.uuid_generator import UuidIdGenerator
 from tabb.adapters.outbound.persistence.in_memory.menu_item_repository import (
     InMemoryMenuItemRepository,
 )
@@ -13,11 +14,27 @@ from tabb.adapters.outbound.persistence.in_memory.order_repository import (
 from tabb.adapters.outbound.persistence.in_memory.outbox_repository import (
     InMemoryOutboxRepository,
 )
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.serialization import (
+    menu_item_to_record,
+    order_to_record,
+    outbox_entry_to_record,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.write_ahead_log import (
+    WriteAheadLog,
+)
 from tabb.application.outbox import OutboxEntry
+from tabb.application.ports.outbound.outbox_notifier import OutboxNotifier
 from tabb.application.ports.outbound.outbox_repository import OutboxRepository
 from tabb.application.ports.outbound.unit_of_work import UnitOfWork
 from tabb.domain.models.menu_item import MenuItem
 from tabb.domain.models.order import Order
+from tabb.domain.ports.id_generator import IdGenerator
 from tabb.domain.ports.menu_item_repository import MenuItemRepository
 from tabb.domain.ports.order_repository import OrderRepository
 
@@ -25,20 +42,49 @@ from tabb.domain.ports.order_repository import OrderRepository
 class InMemoryUnitOfWork(UnitOfWork):
     """In-memory UoW using staged writes pattern.
 
-    Each ``async with uow`` creates fresh staging-area repositories.
-    ``commit()`` flushes all staged changes to the shared stores.
+    Each ``async with uow`` creates fresh staging-area repositories, which
+    act as identity maps for the aggregates loaded or saved through them
+    and read from store snapshots pinned on entry, so every lookup in the
+    block sees the same committed state. The pins are released on exit.
+    ``commit()`` stages only the aggregates that changed, turns the events
+    they recorded into outbox entries, and publishes everything to the
+    shared stores as new versions. Before writing, it checks every staged
+    aggregate's version against the latest store version, merging commuting
+    order changes, and raises
+    ``ConcurrencyConflictError`` without writing anything if a conflict
+    remains.
     ``rollback()`` discards staged changes.
+    When a notifier is given, a commit that flushes outbox entries signals
+    it so the outbox worker wakes immediately.
+
+    With a ``write_ahead_log``, ``commit()`` also appends one record of the
+    committed orders, menu items and outbox entries, and returns only once
+    the log has it on disk; ``restore_from_log`` rebuilds the stores from
+    it on startup. The record is appended in the same step that publishes
+    the writes, so log order matches commit order; other units of work may
+    read the writes before they are durable, but none of their own commits
+    can become durable first. If the append or fsync fails, the commit
+    raises with its writes published but not durable, and the log is
+    failed: every later commit raises before publishing anything. The
+    log's ``on_failure`` hook should then stop the process, so it restarts
+    from the durable state.
     """
 
     def __init__(
         self,
-        order_store: dict[str, Order],
-        menu_item_store: dict[str, MenuItem],
-        outbox_store: list[OutboxEntry],
+        order_store: InMemoryVersionedStore[Order],
+        menu_item_store: InMemoryVersionedStore[MenuItem],
+        outbox_store: InMemoryOutboxStore,
+        notifier: OutboxNotifier | None = None,
+        id_generator: IdGenerator | None = None,
+        write_ahead_log: WriteAheadLog | None = None,
     ) -> None:
         self._order_store = order_store
         self._menu_item_store = menu_item_store
         self._outbox_store = outbox_store
+        self._notifier = notifier
+        self._id_generator = id_generator or UuidIdGenerator()
+        self._write_ahead_log = write_ahead_log
 
         self._order_repo: InMemoryOrderRepository | None = None
         self._menu_item_repo: InMemoryMenuItemRepository | None = None
@@ -63,12 +109,49 @@ class InMemoryUnitOfWork(UnitOfWork):
         return self._outbox_repo
 
     async def commit(self) -> None:
-        if self._order_repo is not None:
-            self._order_repo.flush()
-        if self._menu_item_repo is not None:
-            self._menu_item_repo.flush()
+        aggregate_repos = [
+            repo
+            for repo in (self._order_repo, self._menu_item_repo)
+            if repo is not None
+        ]
+        changes = [
+            change for repo in aggregate_repos for change in repo.stage_changes()
+        ]
+        for repo in aggregate_repos:
+            repo.prepare_commit()
+
+        entries: list[OutboxEntry] = []
         if self._outbox_repo is not None:
-            self._outbox_repo.flush()
+            for aggregate, events in changes:
+                for event in events:
+                    entry = OutboxEntry.create(
+                        entry_id=self._id_generator.generate(),
+                        event=event,
+                        aggregate_id=str(aggregate.id),
+                        aggregate_type=type(aggregate).__name__,
+                    )
+                    await self._outbox_repo.save(entry)
+                    entries.append(entry)
+
+        if self._write_ahead_log is not None:
+            self._write_ahead_log.check()
+        orders = self._order_repo.flush() if self._order_repo else []
+        menu_items = self._menu_item_repo.flush() if self._menu_item_repo else []
+        flushed = self._outbox_repo.flush() if self._outbox_repo else 0
+        try:
+            if self._write_ahead_log is not None and (orders or menu_items or entries):
+                lsn = self._write_ahead_log.append(
+                    {
+                        "orders": [order_to_record(o) for o in orders],
+                        "menu_items": [menu_item_to_record(m) for m in menu_items],
+                        "outbox": [outbox_entry_to_record(e) for e in entries],
+                    }
+                )
+                await self._write_ahead_log.sync(lsn)
+        finally:
+            # Published entries are visible either way; let the worker see them.
+            if flushed and self._notifier is not None:
+                self._notifier.notify()
 
     async def rollback(self) -> None:
         if self._order_repo is not None:
@@ -92,6 +175,10 @@ class InMemoryUnitOfWork(UnitOfWork):
     ) -> None:
         if exc_type is not None:
             await self.rollback()
+        if self._order_repo is not None:
+            self._order_repo.close()
+        if self._menu_item_repo is not None:
+            self._menu_item_repo.close()
         self._order_repo = None
         self._menu_item_repo = None
         self._outbox_repo = None
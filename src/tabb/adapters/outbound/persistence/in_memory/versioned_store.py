@@ -0,0 +1,154 @@
+"""Multi-version in-memory aggregate store shared by units of work."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+
+from tabb.adapters.outbound.persistence.in_memory.encoded_records import (
+    EncodedRecords,
+)
+from tabb.adapters.outbound.persistence.in_memory.persistent_map import (
+    PersistentMap,
+)
+
+
+class StoreSnapshot[V]:
+    """Read-only view of an ``InMemoryVersionedStore`` at one version.
+
+    Holds the root of that version, so lookups see exactly the aggregates
+    committed up to it, whatever is committed afterwards. ``release()``
+    unpins the version and drops the root.
+    """
+
+    __slots__ = ("_base", "_root", "_store", "_version")
+
+    def __init__(
+        self,
+        store: InMemoryVersionedStore[V],
+        version: int,
+        root: PersistentMap[str, V],
+    ) -> None:
+        self._store: InMemoryVersionedStore[V] | None = store
+        self._version = version
+        self._root: PersistentMap[str, V] | None = root
+        self._base = store._base
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, key: str) -> V | None:
+        if self._root is None:
+            raise RuntimeError("Snapshot released")
+        value = self._root.get(key)
+        if value is None and self._base is not None and key in self._base:
+            return self._base[key]
+        return value
+
+    def encoded(self, encode: Callable[[V], bytes]) -> dict[str, bytes]:
+        """Every value at this version as bytes, keyed by id.
+
+        Values still encoded in the restored base are reused as they are;
+        only aggregates read or committed since the restore are encoded.
+        """
+        if self._root is None:
+            raise RuntimeError("Snapshot released")
+        encoded = self._base.copy().encoded(encode) if self._base else {}
+        for key, value in self._root.items():
+            encoded[key] = encode(value)
+        return encoded
+
+    def __contains__(self, key: object) -> bool:
+        if self._root is None:
+            return False
+        return key in self._root or (self._base is not None and key in self._base)
+
+    def release(self) -> None:
+        """Unpin this snapshot's version. Calling it again does nothing."""
+        if self._store is None:
+            return
+        self._store._unpin(self._version)
+        self._store = None
+        self._root = None
+
+
+class InMemoryVersionedStore[V](Mapping[str, V]):
+    """Committed aggregates by id, kept as versions of a persistent map.
+
+    - ``snapshot()`` pins the current version; readers of a snapshot never
+      block writers and never copy.
+    - ``commit()`` applies a batch of writes to a new root and publishes it
+      in one assignment, so a reader sees all of a commit or none of it.
+    - Versions are only referenced by the current root and by unreleased
+      snapshots; an old version is reclaimed by the garbage collector once
+      the last snapshot pinning it is released. Nodes it shares with newer
+      versions stay alive.
+    - An optional ``base`` holds the aggregates restored from a snapshot
+      file, decoded on first read. It never changes and is shared by every
+      version; a key committed since the restore shadows its base value.
+
+    The mapping interface reads the latest committed version.
+    """
+
+    def __init__(
+        self,
+        initial: Mapping[str, V] | None = None,
+        base: EncodedRecords[V] | None = None,
+    ) -> None:
+        self._root: PersistentMap[str, V] = PersistentMap((initial or {}).items())
+        self._base = base
+        self._size = len(self._root)
+        if base is not None:
+            self._size += len(base) - sum(1 for key in self._root if key in base)
+        self._version = 0
+        self._pins: dict[int, int] = {}
+
+    @property
+    def version(self) -> int:
+        """Version of the latest committed root; advances on every commit."""
+        return self._version
+
+    @property
+    def live_versions(self) -> list[int]:
+        """Versions still reachable: the pinned ones and the latest."""
+        return sorted({*self._pins, self._version})
+
+    def snapshot(self) -> StoreSnapshot[V]:
+        """Pin and return the latest committed version."""
+        self._pins[self._version] = self._pins.get(self._version, 0) + 1
+        return StoreSnapshot(self, self._version, self._root)
+
+    def commit(self, updates: Mapping[str, V]) -> int:
+        """Publish a new version with ``updates`` applied; return it."""
+        self._size += sum(1 for key in updates if key not in self)
+        self._root = self._root.update(updates.items())
+        self._version += 1
+        return self._version
+
+    def _unpin(self, version: int) -> None:
+        remaining = self._pins[version] - 1
+        if remaining:
+            self._pins[version] = remaining
+        else:
+            del self._pins[version]
+
+    def __getitem__(self, key: str) -> V:
+        value = self._root.get(key)
+        if value is None:
+            if self._base is None:
+                raise KeyError(key)
+            return self._base[key]
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._root or (self._base is not None and key in self._base)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._root
+        if self._base is not None:
+            for key in self._base:
+                if key not in self._root:
+                    yield key
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,233 @@
+"""Append-only write-ahead log with group commit for the in-memory stores."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import zlib
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import IO, Any
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.serialization import (
+    menu_item_from_record,
+    order_from_record,
+    outbox_entry_from_record,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.domain.models.menu_item import MenuItem
+from tabb.domain.models.order import Order
+
+type Record = dict[str, Any]
+
+
+class WriteAheadLog:
+    """Commit records appended to a file, made durable with fsync.
+
+    Each record is one line: the CRC-32 of its JSON payload in hex, a
+    space, the payload. On open, a torn or corrupt tail left by a crash is
+    truncated, so ``replay()`` yields every complete record in order. With
+    a ``start_offset`` (a ``position`` saved in a snapshot file), only the
+    records after that offset are validated and replayed.
+
+    ``append`` writes a record to the file buffer without waiting and
+    returns its sequence number; ``sync(lsn)`` returns once that record is
+    on disk. With ``group_commit``, a single background task runs one
+    fsync for every record appended since the previous fsync, so
+    concurrent commits share it. Otherwise every ``sync`` runs its own.
+    Records are durable in append order, so a synced record implies every
+    earlier one is too.
+
+    A failed append or fsync leaves the log ``failed``: it fails every
+    waiter, and every later ``append``, ``sync`` and ``check`` raises, as
+    a retried fsync may report success for data it never wrote.
+    ``on_failure`` is called once with the error, so the owner can stop
+    the process and recover from the log as after a crash.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        group_commit: bool = True,
+        start_offset: int = 0,
+        on_failure: Callable[[BaseException], None] | None = None,
+    ) -> None:
+        self._path = Path(path)
+        self._group_commit = group_commit
+        self._start_offset = start_offset
+        self._path.touch()
+        if self._path.stat().st_size < start_offset:
+            raise ValueError(f"{self._path} is shorter than offset {start_offset}")
+        valid_length = start_offset + sum(len(line) for line in self._records())
+        self._file: IO[bytes] = self._path.open("ab")
+        if self._file.tell() > valid_length:
+            self._file.truncate(valid_length)
+            self._file.seek(valid_length)
+
+        self._appended = 0
+        self._synced = 0
+        self._syncs = 0
+        self._waiters: list[tuple[int, asyncio.Future[None]]] = []
+        self._sync_task: asyncio.Task[None] | None = None
+        self._error: Exception | None = None
+        self._on_failure = on_failure
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def position(self) -> int:
+        """Byte offset just past the last appended record."""
+        return self._file.tell()
+
+    @property
+    def last_lsn(self) -> int:
+        """Sequence number of the last appended record (0 if none)."""
+        return self._appended
+
+    @property
+    def failed(self) -> bool:
+        """True once an append or fsync has failed."""
+        return self._error is not None
+
+    @property
+    def sync_count(self) -> int:
+        """Number of fsync calls made so far."""
+        return self._syncs
+
+    def replay(self) -> Iterator[Record]:
+        """Yield every complete record from the start offset, oldest first."""
+        for line in self._records():
+            yield json.loads(line[9:])
+
+    def check(self) -> None:
+        """Raise if the log has failed and can take no more records."""
+        if self._error is not None:
+            raise RuntimeError("write-ahead log failed") from self._error
+
+    def append(self, record: Record) -> int:
+        """Buffer ``record`` and return its sequence number for ``sync``."""
+        self.check()
+        try:
+            payload = json.dumps(record, separators=(",", ":")).encode()
+            self._file.write(b"%08x %s\n" % (zlib.crc32(payload), payload))
+        except (OSError, TypeError, ValueError) as exc:
+            self._fail(exc)
+            raise
+        self._appended += 1
+        return self._appended
+
+    async def sync(self, lsn: int) -> None:
+        """Return once the record with sequence number ``lsn`` is on disk."""
+        self.check()
+        if self._synced >= lsn:
+            return
+        if not self._group_commit:
+            target = self._appended
+            try:
+                self._file.flush()
+                await asyncio.to_thread(os.fsync, self._file.fileno())
+            except OSError as exc:
+                self._fail(exc)
+                raise
+            self._syncs += 1
+            self._synced = max(self._synced, target)
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((lsn, future))
+        if self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._sync_waiters())
+        await future
+
+    def close(self) -> None:
+        """Flush, fsync and close the file."""
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    async def _sync_waiters(self) -> None:
+        try:
+            while self._waiters:
+                # Let commits that are about to append join this fsync.
+                await asyncio.sleep(0)
+                target = self._appended
+                self._file.flush()
+                await asyncio.to_thread(os.fsync, self._file.fileno())
+                self._syncs += 1
+                self._synced = target
+                waiting = []
+                for lsn, future in self._waiters:
+                    if lsn > target:
+                        waiting.append((lsn, future))
+                    elif not future.done():
+                        future.set_result(None)
+                self._waiters = waiting
+        except OSError as exc:
+            self._fail(exc)
+            for _, future in self._waiters:
+                if not future.done():
+                    future.set_exception(exc)
+            self._waiters.clear()
+        finally:
+            self._sync_task = None
+
+    def _fail(self, exc: Exception) -> None:
+        if self._error is not None:
+            return
+        self._error = exc
+        if self._on_failure is not None:
+            self._on_failure(exc)
+
+    def _records(self) -> Iterator[bytes]:
+        """Yield complete, checksummed lines up to the first bad one."""
+        with self._path.open("rb") as log:
+            log.seek(self._start_offset)
+            for line in log:
+                if not line.endswith(b"\n") or len(line) < 10 or line[8:9] != b" ":
+                    return
+                payload = line[9:-1]
+                try:
+                    checksum = int(line[:8], 16)
+                except ValueError:
+                    return
+                if zlib.crc32(payload) != checksum:
+                    return
+                yield line
+
+
+def restore_from_log(
+    log: WriteAheadLog,
+    order_store: InMemoryVersionedStore[Order],
+    menu_item_store: InMemoryVersionedStore[MenuItem],
+    outbox_store: InMemoryOutboxStore,
+) -> int:
+    """Apply every commit record in ``log`` to the stores; return the count.
+
+    Replayed outbox entries keep the status they were committed with, so
+    the outbox worker projects them again and rebuilds the read models.
+    """
+    orders: dict[str, Order] = {}
+    menu_items: dict[str, MenuItem] = {}
+    commits = 0
+    for record in log.replay():
+        for data in record["orders"]:
+            orders[data["id"]] = order_from_record(data)
+        for data in record["menu_items"]:
+            menu_items[data["id"]] = menu_item_from_record(data)
+        for data in record["outbox"]:
+            outbox_store.add(outbox_entry_from_record(data))
+        commits += 1
+    if orders:
+        order_store.commit(orders)
+    if menu_items:
+        menu_item_store.commit(menu_items)
+    return commits
@@ -0,0 +1 @@
+"""SQLAlchemy async persistence adapters for the write side."""
@@ -0,0 +1,138 @@
+"""Shared unit-of-work machinery for the SQLAlchemy write repositories."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any, ClassVar
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from tabb.application.exceptions import ConcurrencyConflictError
+from tabb.domain.events.base import DomainEvent
+from tabb.domain.shared.building_blocks import AggregateRoot
+
+
+class SqlAlchemyAggregateRepository[A: AggregateRoot[Any]](ABC):
+    """Identity map, dirty tracking and versioned writes for one unit of work.
+
+    - Reads run on the unit of work's connection, inside its transaction.
+      Loading keeps an unchanged copy of each aggregate as its base;
+      repeated loads return the same instance.
+    - ``save`` only registers an aggregate with the identity map.
+    - ``stage_changes`` collects the events of every tracked aggregate and
+      stages those that recorded events, are new or differ from their
+      base; unchanged aggregates are not written.
+    - ``flush`` inserts new aggregates and updates changed ones only where
+      the stored version still matches the loaded one, then advances the
+      aggregate versions. A stale write is passed to ``_merge``; if that
+      does not reconcile it, ``ConcurrencyConflictError`` is raised and the
+      unit of work rolls the transaction back.
+
+    Subclasses provide ``_fetch``, ``_insert`` and ``_update``.
+    """
+
+    aggregate_type: ClassVar[str]
+
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+        self._identity: dict[str, A] = {}
+        self._bases: dict[str, A] = {}
+        self._staging: dict[str, A] = {}
+
+    def stage_changes(self) -> list[tuple[A, list[DomainEvent]]]:
+        """Stage changed aggregates; return each with its collected events."""
+        changes: list[tuple[A, list[DomainEvent]]] = []
+        for key, aggregate in self._identity.items():
+            events = aggregate.collect_events()
+            base = self._bases.get(key)
+            if not events and base is not None and aggregate == base:
+                continue
+            self._staging[key] = aggregate.fork()
+            changes.append((aggregate, events))
+        return changes
+
+    async def flush(self) -> list[A]:
+        """Write staged aggregates in the current transaction; return them.
+
+        Tracked instances advance with their staged copy, unless it was
+        merged with a concurrent write, in which case they keep their old
+        version and base.
+        """
+        if not self._staging:
+            return []
+        new = [a for key, a in self._staging.items() if key not in self._bases]
+        if new:
+            try:
+                await self._insert(new)
+            except IntegrityError as exc:
+                # Another transaction inserted one of them first.
+                keys = ", ".join(str(aggregate.id) for aggregate in new)
+                raise ConcurrencyConflictError(self.aggregate_type, keys, 0, 1) from exc
+        for key, staged in list(self._staging.items()):
+            if key in self._bases and not await self._update(staged):
+                self._staging[key] = await self._reconcile(key, staged)
+
+        for key, staged in self._staging.items():
+            tracked = self._identity[key]
+            if tracked.version == staged.version:
+                tracked._version += 1
+                self._bases[key] = staged
+            staged._version += 1
+        committed = list(self._staging.values())
+        self._staging.clear()
+        return committed
+
+    def discard(self) -> None:
+        """Discard staged writes and forget every tracked aggregate."""
+        self._staging.clear()
+        self._identity.clear()
+        self._bases.clear()
+
+    async def _load(self, key: str) -> A | None:
+        found = await self._load_many([key])
+        return found[0] if found else None
+
+    async def _load_many(self, keys: Sequence[str]) -> list[A]:
+        """Tracked instances for ``keys`` in order, fetching the rest at once."""
+        keys = list(dict.fromkeys(keys))
+        missing = [key for key in keys if key not in self._identity]
+        if missing:
+            for key, committed in (await self._fetch(missing)).items():
+                self._bases[key] = committed
+                self._identity[key] = committed.fork()
+        return [self._identity[key] for key in keys if key in self._identity]
+
+    def _track(self, aggregate: A) -> None:
+        self._identity[str(aggregate.id)] = aggregate
+
+    async def _reconcile(self, key: str, staged: A) -> A:
+        committed = (await self._fetch([key])).get(key)
+        current = committed.version if committed is not None else 0
+        merged = self._merge(key, staged, committed)
+        if merged is None or not await self._update(merged):
+            raise ConcurrencyConflictError(
+                self.aggregate_type, key, staged.version, current
+            )
+        return merged
+
+    @abstractmethod
+    async def _fetch(self, keys: Sequence[str]) -> dict[str, A]:
+        """Load committed aggregates by id, in as few queries as possible."""
+
+    @abstractmethod
+    async def _insert(self, aggregates: Sequence[A]) -> None:
+        """Insert new aggregates at version 1."""
+
+    @abstractmethod
+    async def _update(self, aggregate: A) -> bool:
+        """Write ``aggregate`` if its stored version is unchanged.
+
+        Advances the stored version; returns False, writing nothing, if the
+        row is at another version.
+        """
+
+    def _merge(self, key: str, staged: A, committed: A | None) -> A | None:
+        """Reconcile a stale staged write; None rejects it. Merges nothing."""
+        return None
@@ -0,0 +1,40 @@
+"""Async engine (connection pool) shared by the SQLAlchemy adapters."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from tabb.adapters.config.settings import Settings
+from tabb.adapters.outbound.persistence.sqlalchemy.tables import metadata
+
+
+def create_engine(settings: Settings) -> AsyncEngine:
+    """Create the engine for ``settings.database_url``.
+
+    One engine owns one connection pool; create it once per process and
+    pass it to every ``SqlAlchemyUnitOfWork``. The ``db_pool_*`` settings
+    size the pool. SQLite URLs keep SQLAlchemy's default pool, which does
+    not take sizing options, and asyncpg URLs also get
+    ``db_command_timeout``.
+    """
+    url = make_url(settings.database_url)
+    options: dict[str, Any] = {"pool_pre_ping": True}
+    if url.get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {"command_timeout": settings.db_command_timeout}
+    return create_async_engine(url, **options)
+
+
+async def create_tables(engine: AsyncEngine) -> None:
+    """Create any missing tables; for tests and local development."""
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
@@ -0,0 +1,80 @@
+"""SQLAlchemy MenuItem repository adapter with staged writes for UoW."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from sqlalchemy import insert, select, update
+
+from tabb.adapters.outbound.persistence.sqlalchemy.aggregate_repository import (
+    SqlAlchemyAggregateRepository,
+)
+from tabb.adapters.outbound.persistence.sqlalchemy.tables import menu_items
+from tabb.domain.models.menu_item import MenuItem, MenuItemId
+from tabb.domain.models.value_objects import Money
+from tabb.domain.ports.menu_item_repository import MenuItemRepository
+
+
+class SqlAlchemyMenuItemRepository(
+    SqlAlchemyAggregateRepository[MenuItem], MenuItemRepository
+):
+    """SQLAlchemy write-side repository for MenuItem aggregates.
+
+    ``find_by_ids`` fetches every item not yet loaded in one ``IN`` query.
+    """
+
+    aggregate_type = "MenuItem"
+
+    async def find_by_id(self, item_id: MenuItemId) -> MenuItem | None:
+        return await self._load(str(item_id))
+
+    async def find_by_ids(self, item_ids: Sequence[MenuItemId]) -> list[MenuItem]:
+        return await self._load_many([str(item_id) for item_id in item_ids])
+
+    async def save(self, item: MenuItem) -> None:
+        self._track(item)
+
+    async def _fetch(self, keys: Sequence[str]) -> dict[str, MenuItem]:
+        result = await self._connection.execute(
+            select(menu_items).where(menu_items.c.id.in_(keys))
+        )
+        found: dict[str, MenuItem] = {}
+        for row in result:
+            item = MenuItem(
+                _id=MenuItemId(row.id),
+                _name=row.name,
+                _price=Money(row.price),
+                _available=row.available,
+            )
+            item._version = row.version
+            found[row.id] = item
+        return found
+
+    async def _insert(self, aggregates: Sequence[MenuItem]) -> None:
+        await self._connection.execute(
+            insert(menu_items),
+            [
+                {
+                    "id": str(item.id),
+                    "name": item.name,
+                    "price": item.price.amount,
+                    "available": item.available,
+                    "version": item.version + 1,
+                }
+                for item in aggregates
+            ],
+        )
+
+    async def _update(self, aggregate: MenuItem) -> bool:
+        result = await self._connection.execute(
+            update(menu_items)
+            .where(menu_items.c.id == str(aggregate.id))
+            .where(menu_items.c.version == aggregate.version)
+            .values(
+                name=aggregate.name,
+                price=aggregate.price.amount,
+                available=aggregate.available,
+                version=aggregate.version + 1,
+            )
+        )
+        return result.rowcount == 1
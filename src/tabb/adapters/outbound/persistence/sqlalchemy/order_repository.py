@@ -0,0 +1,147 @@
+"""SQLAlchemy Order repository adapter with staged writes for UoW."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import delete, insert, select, update
+
+from tabb.adapters.outbound.persistence.sqlalchemy.aggregate_repository import (
+    SqlAlchemyAggregateRepository,
+)
+from tabb.adapters.outbound.persistence.sqlalchemy.tables import order_items, orders
+from tabb.domain.models.order import (
+    Order,
+    OrderId,
+    OrderItem,
+    OrderItemId,
+    OrderItemStatus,
+    OrderStatus,
+)
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+from tabb.domain.ports.order_repository import OrderRepository
+
+_LOAD = (
+    select(
+        orders.c.id,
+        orders.c.table_number,
+        orders.c.status,
+        orders.c.version,
+        order_items.c.id.label("item_id"),
+        order_items.c.menu_item_id,
+        order_items.c.name,
+        order_items.c.unit_price,
+        order_items.c.quantity,
+        order_items.c.status.label("item_status"),
+    )
+    .outerjoin(order_items, order_items.c.order_id == orders.c.id)
+    .order_by(orders.c.id, order_items.c.position)
+)
+
+
+class SqlAlchemyOrderRepository(SqlAlchemyAggregateRepository[Order], OrderRepository):
+    """SQLAlchemy write-side repository for Order aggregates.
+
+    An order and its items load in one query (``orders`` left-joined to
+    ``order_items``). Writing a changed order replaces its item rows, in
+    one bulk insert, in the same transaction as the version-checked update
+    of its ``orders`` row.
+
+    If another unit of work commits the same order first, commuting changes
+    are merged (``Order.merge_concurrent``) and only real conflicts raise
+    ``ConcurrencyConflictError``.
+    """
+
+    aggregate_type = "Order"
+
+    async def find_by_id(self, order_id: OrderId) -> Order | None:
+        return await self._load(str(order_id))
+
+    async def save(self, order: Order) -> None:
+        self._track(order)
+
+    async def _fetch(self, keys: Sequence[str]) -> dict[str, Order]:
+        result = await self._connection.execute(_LOAD.where(orders.c.id.in_(keys)))
+        found: dict[str, Order] = {}
+        for row in result:
+            order = found.get(row.id)
+            if order is None:
+                order = Order(
+                    _id=OrderId(row.id),
+                    _table=TableNumber(row.table_number),
+                    _items=[],
+                    _status=OrderStatus(row.status),
+                )
+                order._version = row.version
+                found[row.id] = order
+            if row.item_id is not None:
+                order._items.append(
+                    OrderItem(
+                        _id=OrderItemId(row.item_id),
+                        _menu_item_id=row.menu_item_id,
+                        _name=row.name,
+                        _unit_price=Money(row.unit_price),
+                        _quantity=Quantity(row.quantity),
+                        _status=OrderItemStatus(row.item_status),
+                    )
+                )
+        return found
+
+    async def _insert(self, aggregates: Sequence[Order]) -> None:
+        await self._connection.execute(
+            insert(orders),
+            [
+                {
+                    "id": str(order.id),
+                    "table_number": order.table.value,
+                    "status": order.status.value,
+                    "version": order.version + 1,
+                }
+                for order in aggregates
+            ],
+        )
+        await self._insert_items(aggregates)
+
+    async def _update(self, aggregate: Order) -> bool:
+        result = await self._connection.execute(
+            update(orders)
+            .where(orders.c.id == str(aggregate.id))
+            .where(orders.c.version == aggregate.version)
+            .values(
+                table_number=aggregate.table.value,
+                status=aggregate.status.value,
+                version=aggregate.version + 1,
+            )
+        )
+        if result.rowcount != 1:
+            return False
+        await self._connection.execute(
+            delete(order_items).where(order_items.c.order_id == str(aggregate.id))
+        )
+        await self._insert_items([aggregate])
+        return True
+
+    async def _insert_items(self, aggregates: Sequence[Order]) -> None:
+        rows: list[dict[str, Any]] = [
+            {
+                "order_id": str(order.id),
+                "position": position,
+                "id": str(item.id),
+                "menu_item_id": item.menu_item_id,
+                "name": item.name,
+                "unit_price": item.unit_price.amount,
+                "quantity": item.quantity.value,
+                "status": item.status.value,
+            }
+            for order in aggregates
+            for position, item in enumerate(order.items)
+        ]
+        if rows:
+            await self._connection.execute(insert(order_items), rows)
+
+    def _merge(self, key: str, staged: Order, committed: Order | None) -> Order | None:
+        base = self._bases.get(key)
+        if base is None or committed is None or base.version != staged.version:
+            return None
+        return staged.merge_concurrent(base, committed)
@@ -0,0 +1,261 @@
+"""SQLAlchemy Outbox repository adapter with staged writes for UoW."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Row, and_, exists, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from tabb.adapters.outbound.persistence.sqlalchemy.tables import outbox
+from tabb.application.backoff import BackoffStrategy
+from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+from tabb.application.ports.outbound.outbox_repository import OutboxRepository
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class SqlAlchemyOutboxRepository(OutboxRepository):
+    """SQLAlchemy repository for outbox entries.
+
+    Bound to a connection, as in a unit of work, it stages saved entries
+    and ``flush`` inserts them all in one executemany statement inside the
+    unit of work's transaction. Bound to an engine, as for the outbox
+    processor, every call runs in its own short transaction.
+
+    ``find_pending`` returns pending entries and failed ones that may be
+    retried and whose retry time has passed, oldest first; the
+    ``(status, sequence)`` index serves it. Entries are ordered by their
+    autoincrement ``sequence``, which follows insertion order, and while an
+    entry waits for a retry the later entries of its aggregate are held
+    back, as the in-memory stores do; the ``(aggregate_id, sequence)``
+    index serves that check.
+
+    Several processes may consume the same table. ``find_pending`` claims
+    the entries it returns for ``claim_seconds`` in one
+    ``UPDATE ... RETURNING`` statement, selecting them ``FOR UPDATE SKIP
+    LOCKED`` on Postgres (SQLite serializes writers instead), so each
+    entry goes to one consumer at a time. Marking an entry releases the
+    claim; a consumer that dies leaves it to be claimed again once the
+    claim runs out. Later entries of an aggregate also wait while another
+    consumer holds an earlier one. Each consumer projects only the
+    entries it claimed, so read models held in process memory are only
+    complete with a single consuming process.
+
+    ``backoff`` sets the delay before each retry of a failed entry; by
+    default a plain exponential backoff.
+    """
+
+    def __init__(
+        self,
+        bind: AsyncConnection | AsyncEngine,
+        clock: Callable[[], datetime] = _utc_now,
+        consumer_id: str | None = None,
+        claim_seconds: float = 30.0,
+        backoff: BackoffStrategy | None = None,
+    ) -> None:
+        self._bind = bind
+        self._clock = clock
+        self._backoff = backoff
+        self._consumer_id = consumer_id or uuid.uuid4().hex
+        self._claim = timedelta(seconds=claim_seconds)
+        self._staging: list[dict[str, Any]] = []
+
+    async def save(self, entry: OutboxEntry) -> None:
+        self._staging.append(_to_row(entry))
+
+    async def find_pending(self, limit: int = 10) -> list[OutboxEntry]:
+        """Claim and return ready entries, in sequence order."""
+        now = self._clock()
+        claimable = (
+            select(outbox.c.id)
+            .where(self._pending(now), self._unclaimed(outbox, now))
+            .order_by(outbox.c.sequence)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        async with self._connect() as connection:
+            result = await connection.execute(
+                update(outbox)
+                .where(outbox.c.id.in_(claimable.scalar_subquery()))
+                .values(claimed_by=self._consumer_id, claimed_until=now + self._claim)
+                .returning(*outbox.c)
+            )
+            entries = [_from_row(row) for row in result]
+        entries.sort(key=lambda entry: entry.sequence or 0)
+        return entries
+
+    async def count_pending(self) -> int:
+        async with self._connect() as connection:
+            count = await connection.scalar(
+                select(func.count())
+                .select_from(outbox)
+                .where(self._ready(self._clock()))
+            )
+            return count or 0
+
+    async def mark_processed(self, entry_id: str) -> None:
+        async with self._connect() as connection:
+            await connection.execute(
+                update(outbox)
+                .where(outbox.c.id == entry_id)
+                .values(
+                    status=OutboxEntryStatus.PROCESSED.value,
+                    processed_at=self._clock(),
+                    **_RELEASED,
+                )
+            )
+
+    async def mark_failed(self, entry_id: str, error: str) -> None:
+        async with self._connect() as connection:
+            row = (
+                await connection.execute(select(outbox).where(outbox.c.id == entry_id))
+            ).one_or_none()
+            if row is None:
+                return
+            entry = _from_row(row)
+            entry.mark_failed(error, self._backoff, now=self._clock())
+            await connection.execute(
+                update(outbox)
+                .where(outbox.c.id == entry_id)
+                .values(
+                    status=entry.status.value,
+                    retry_count=entry.retry_count,
+                    last_error=entry.last_error,
+                    next_retry_at=entry.next_retry_at,
+                    retry_delay_seconds=entry.retry_delay_seconds,
+                    **_RELEASED,
+                )
+            )
+
+    async def mark_dead_lettered(self, entry_id: str) -> None:
+        async with self._connect() as connection:
+            await connection.execute(
+                update(outbox)
+                .where(outbox.c.id == entry_id)
+                .values(
+                    status=OutboxEntryStatus.DEAD_LETTERED.value,
+                    next_retry_at=None,
+                    **_RELEASED,
+                )
+            )
+
+    async def flush(self) -> int:
+        """Insert staged entries in the current transaction.
+
+        Returns the number of entries flushed.
+        """
+        if not self._staging:
+            return 0
+        async with self._connect() as connection:
+            await connection.execute(insert(outbox), self._staging)
+        flushed = len(self._staging)
+        self._staging.clear()
+        return flushed
+
+    def discard(self) -> None:
+        """Discard staged writes."""
+        self._staging.clear()
+
+    def _pending(self, now: datetime) -> Any:
+        return and_(self._ready(now), ~self._blocked(now))
+
+    def _ready(self, now: datetime) -> Any:
+        """Pending, or failed and due for a retry."""
+        return or_(
+            outbox.c.status == OutboxEntryStatus.PENDING.value,
+            and_(
+                outbox.c.status == OutboxEntryStatus.FAILED.value,
+                outbox.c.retry_count < outbox.c.max_retries,
+                or_(
+                    outbox.c.next_retry_at.is_(None),
+                    outbox.c.next_retry_at <= now,
+                ),
+            ),
+        )
+
+    def _blocked(self, now: datetime) -> Any:
+        """An earlier entry of the same aggregate is failed or claimed."""
+        earlier = outbox.alias("earlier")
+        return exists().where(
+            earlier.c.aggregate_id == outbox.c.aggregate_id,
+            earlier.c.sequence < outbox.c.sequence,
+            or_(
+                earlier.c.status == OutboxEntryStatus.FAILED.value,
+                and_(
+                    earlier.c.status == OutboxEntryStatus.PENDING.value,
+                    ~self._unclaimed(earlier, now),
+                ),
+            ),
+        )
+
+    def _unclaimed(self, table: Any, now: datetime) -> Any:
+        """No other consumer holds a live claim on the row."""
+        return or_(
+            table.c.claimed_until.is_(None),
+            table.c.claimed_until <= now,
+            table.c.claimed_by == self._consumer_id,
+        )
+
+    @asynccontextmanager
+    async def _connect(self) -> AsyncIterator[AsyncConnection]:
+        if isinstance(self._bind, AsyncConnection):
+            yield self._bind
+            return
+        async with self._bind.begin() as connection:
+            yield connection
+
+
+_RELEASED: dict[str, Any] = {"claimed_by": None, "claimed_until": None}
+
+
+def _to_row(entry: OutboxEntry) -> dict[str, Any]:
+    return {
+        "id": entry.entry_id,
+        "event_type": entry.event_type,
+        "event_data": dict(entry.event_data),
+        "aggregate_id": entry.aggregate_id,
+        "aggregate_type": entry.aggregate_type,
+        "occurred_at": entry.occurred_at,
+        "status": entry.status.value,
+        "retry_count": entry.retry_count,
+        "max_retries": entry.max_retries,
+        "last_error": entry.last_error,
+        "processed_at": entry.processed_at,
+        "next_retry_at": entry.next_retry_at,
+        "retry_delay_seconds": entry.retry_delay_seconds,
+    }
+
+
+def _from_row(row: Row[Any]) -> OutboxEntry:
+    return OutboxEntry(
+        _entry_id=row.id,
+        _event_type=row.event_type,
+        _event_data=dict(row.event_data),
+        _aggregate_id=row.aggregate_id,
+        _aggregate_type=row.aggregate_type,
+        _occurred_at=_as_utc(row.occurred_at),
+        _status=OutboxEntryStatus(row.status),
+        _retry_count=row.retry_count,
+        _max_retries=row.max_retries,
+        _last_error=row.last_error,
+        _processed_at=_as_utc_or_none(row.processed_at),
+        _next_retry_at=_as_utc_or_none(row.next_retry_at),
+        _retry_delay_seconds=row.retry_delay_seconds,
+        _sequence=row.sequence,
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Attach UTC to naive timestamps, as SQLite returns them."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _as_utc_or_none(value: datetime | None) -> datetime | None:
+    return _as_utc(value) if value is not None else None
@@ -0,0 +1,88 @@
+"""Table definitions for the SQLAlchemy write-side adapters."""
+
+from __future__ import annotations
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    Text,
+)
+
+metadata = MetaData()
+
+orders = Table(
+    "orders",
+    metadata,
+    Column("id", String(64), primary_key=True),
+    Column("table_number", Integer, nullable=False),
+    Column("status", String(16), nullable=False),
+    Column("version", Integer, nullable=False),
+)
+
+order_items = Table(
+    "order_items",
+    metadata,
+    Column(
+        "order_id",
+        String(64),
+        ForeignKey("orders.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("position", Integer, primary_key=True),
+    Column("id", String(64), nullable=False),
+    Column("menu_item_id", String(64), nullable=False),
+    Column("name", String(255), nullable=False),
+    Column("unit_price", Numeric(12, 2), nullable=False),
+    Column("quantity", Integer, nullable=False),
+    Column("status", String(16), nullable=False),
+)
+
+menu_items = Table(
+    "menu_items",
+    metadata,
+    Column("id", String(64), primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("price", Numeric(12, 2), nullable=False),
+    Column("available", Boolean, nullable=False),
+    Column("version", Integer, nullable=False),
+)
+
+outbox = Table(
+    "outbox",
+    metadata,
+    # Commit order: ordering by time alone leaves ties in arbitrary order.
+    Column(
+        "sequence",
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    Column("id", String(64), nullable=False, unique=True),
+    Column("event_type", String(128), nullable=False),
+    Column("event_data", JSON, nullable=False),
+    Column("aggregate_id", String(64), nullable=False),
+    Column("aggregate_type", String(64), nullable=False),
+    Column("occurred_at", DateTime(timezone=True), nullable=False),
+    Column("status", String(16), nullable=False),
+    Column("retry_count", Integer, nullable=False),
+    Column("max_retries", Integer, nullable=False),
+    Column("last_error", Text),
+    Column("processed_at", DateTime(timezone=True)),
+    Column("next_retry_at", DateTime(timezone=True)),
+    Column("retry_delay_seconds", Float, nullable=False),
+    Column("claimed_by", String(64)),
+    Column("claimed_until", DateTime(timezone=True)),
+    Index("ix_outbox_status_sequence", "status", "sequence"),
+    Index("ix_outbox_aggregate_id_sequence", "aggregate_id", "sequence"),
+)
@@ -0,0 +1,143 @@
+"""SQLAlchemy async Unit of Work adapter."""
+
+from __future__ import annotations
+
+from types import TracebackType
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from tabb.adapters.outbound.id_generator.uuid_generator import UuidIdGenerator
+from tabb.adapters.outbound.persistence.sqlalchemy.menu_item_repository import (
+    SqlAlchemyMenuItemRepository,
+)
+from tabb.adapters.outbound.persistence.sqlalchemy.order_repository import (
+    SqlAlchemyOrderRepository,
+)
+from tabb.adapters.outbound.persistence.sqlalchemy.outbox_repository import (
+    SqlAlchemyOutboxRepository,
+)
+from tabb.application.outbox import OutboxEntry
+from tabb.application.ports.outbound.outbox_notifier import OutboxNotifier
+from tabb.application.ports.outbound.outbox_repository import OutboxRepository
+from tabb.application.ports.outbound.unit_of_work import UnitOfWork
+from tabb.domain.ports.id_generator import IdGenerator
+from tabb.domain.ports.menu_item_repository import MenuItemRepository
+from tabb.domain.ports.order_repository import OrderRepository
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """UoW over one pooled connection and one database transaction.
+
+    Each ``async with uow`` checks a connection out of the engine's pool
+    and creates fresh repositories on it, which act as identity maps for
+    the aggregates loaded or saved through them. ``commit()`` writes only
+    the aggregates that changed, turns the events they recorded into
+    outbox rows inserted in one statement, and commits the transaction.
+    A stale aggregate version that cannot be merged raises
+    ``ConcurrencyConflictError`` after rolling the transaction back.
+    ``rollback()`` discards staged changes and the transaction. The
+    connection returns to the pool on exit.
+    When a notifier is given, a commit that inserts outbox entries signals
+    it so an in-process outbox worker wakes immediately.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        notifier: OutboxNotifier | None = None,
+        id_generator: IdGenerator | None = None,
+    ) -> None:
+        self._engine = engine
+        self._notifier = notifier
+        self._id_generator = id_generator or UuidIdGenerator()
+
+        self._connection: AsyncConnection | None = None
+        self._order_repo: SqlAlchemyOrderRepository | None = None
+        self._menu_item_repo: SqlAlchemyMenuItemRepository | None = None
+        self._outbox_repo: SqlAlchemyOutboxRepository | None = None
+
+    @property
+    def order_repository(self) -> OrderRepository:
+        if self._order_repo is None:
+            raise RuntimeError("UnitOfWork not entered")
+        return self._order_repo
+
+    @property
+    def menu_item_repository(self) -> MenuItemRepository:
+        if self._menu_item_repo is None:
+            raise RuntimeError("UnitOfWork not entered")
+        return self._menu_item_repo
+
+    @property
+    def outbox_repository(self) -> OutboxRepository:
+        if self._outbox_repo is None:
+            raise RuntimeError("UnitOfWork not entered")
+        return self._outbox_repo
+
+    async def commit(self) -> None:
+        if self._connection is None:
+            raise RuntimeError("UnitOfWork not entered")
+        aggregate_repos = [
+            repo
+            for repo in (self._order_repo, self._menu_item_repo)
+            if repo is not None
+        ]
+        changes = [
+            change for repo in aggregate_repos for change in repo.stage_changes()
+        ]
+
+        if self._outbox_repo is not None:
+            for aggregate, events in changes:
+                for event in events:
+                    entry = OutboxEntry.create(
+                        entry_id=self._id_generator.generate(),
+                        event=event,
+                        aggregate_id=str(aggregate.id),
+                        aggregate_type=type(aggregate).__name__,
+                    )
+                    await self._outbox_repo.save(entry)
+
+        try:
+            for repo in aggregate_repos:
+                await repo.flush()
+            flushed = await self._outbox_repo.flush() if self._outbox_repo else 0
+            await self._connection.commit()
+        except BaseException:
+            await self.rollback()
+            raise
+        if flushed and self._notifier is not None:
+            self._notifier.notify()
+
+    async def rollback(self) -> None:
+        if self._connection is not None:
+            await self._connection.rollback()
+        if self._order_repo is not None:
+            self._order_repo.discard()
+        if self._menu_item_repo is not None:
+            self._menu_item_repo.discard()
+        if self._outbox_repo is not None:
+            self._outbox_repo.discard()
+
+    async def __aenter__(self) -> SqlAlchemyUnitOfWork:
+        self._connection = await self._engine.connect()
+        self._order_repo = SqlAlchemyOrderRepository(self._connection)
+        self._menu_item_repo = SqlAlchemyMenuItemRepository(self._connection)
+        self._outbox_repo = SqlAlchemyOutboxRepository(self._connection)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        try:
+            if exc_type is not None:
+                await self.rollback()
+        finally:
+            if self._connection is not None:
+                await self._connection.close()
+            self._connection = None
+            self._order_repo = None
+            self._menu_item_repo = None
+            self._outbox_repo = None
@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import replace
+
 from tabb.application.ports.inbound.projector import Projector
 from tabb.application.ports.outbound.menu_item_read_model_repository import (
     MenuItemReadModelRepository,
 )
 from tabb.application.read_models.menu_item_read_model import MenuItemReadModel
 
+type _Apply = Callable[
+    [MenuItemReadModel | None, Mapping[str, object]], MenuItemReadModel | None
+]
+
 
 class MenuItemProjector(Projector):
-    """Projects menu-item-related events into MenuItemReadModel."""
+    """Projects menu-item-related events into MenuItemReadModel.
+
+    Each ``_apply_<EventType>`` method takes the current read model (or
+    None) and returns a new version of it, or None when nothing changed.
+    A batch loads each read model once and saves it once.
+    """
 
     def __init__(self, repository: MenuItemReadModelRepository) -> None:
         self._repo = repository
@@ -22,40 +34,51 @@ class MenuItemProjector(Projector):
             "MenuItemAvailable",
         ]
 
-    async def project(self, event_type: str, event_data: dict[str, object]) -> None:
-        handler = getattr(self, f"_handle_{event_type}", None)
-        if handler is None:
-            return
-        await handler(event_data)
+    async def project(self, event_type: str, event_data: Mapping[str, object]) -> None:
+        await self.project_batch([(event_type, event_data)])
+
+    async def project_batch(
+        self, events: Sequence[tuple[str, Mapping[str, object]]]
+    ) -> None:
+        models: dict[str, MenuItemReadModel | None] = {}
+        changed: dict[str, MenuItemReadModel] = {}
 
-    async def _handle_MenuItemCreated(self, data: dict[str, object]) -> None:
-        menu_item_id = str(data["menu_item_id"])
-        existing = await self._repo.find_by_id(menu_item_id)
-        if existing is not None:
-            return  # idempotent
+        for event_type, data in events:
+            apply: _Apply | None = getattr(self, f"_apply_{event_type}", None)
+            if apply is None:
+                continue
+            menu_item_id = str(data["menu_item_id"])
+            if menu_item_id not in models:
+                models[menu_item_id] = await self._repo.find_by_id(menu_item_id)
+            updated = apply(models[menu_item_id], data)
+            if updated is not None:
+                models[menu_item_id] = changed[menu_item_id] = updated
 
-        read_model = MenuItemReadModel(
-            menu_item_id=menu_item_id,
+        for read_model in changed.values():
+            await self._repo.save(read_model)
+
+    def _apply_MenuItemCreated(
+        self, read_model: MenuItemReadModel | None, data: Mapping[str, object]
+    ) -> MenuItemReadModel | None:
+        if read_model is not None:
+            return None  # idempotent
+        return MenuItemReadModel(
+            menu_item_id=str(data["menu_item_id"]),
             name=str(data["name"]),
             price=str(data["price"]),
             available=True,
         )
-        await self._repo.save(read_model)
 
-    async def _handle_MenuItemSoldOut(self, data: dict[str, object]) -> None:
-        menu_item_id = str(data["menu_item_id"])
-        read_model = await self._repo.find_by_id(menu_item_id)
+    def _apply_MenuItemSoldOut(
+        self, read_model: MenuItemReadModel | None, data: Mapping[str, object]
+    ) -> MenuItemReadModel | None:
         if read_model is None:
-            return
-
-        read_model.available = False
-        await self._repo.save(read_model)
+            return None
+        return replace(read_model, available=False)
 
-    async def _handle_MenuItemAvailable(self, data: dict[str, object]) -> None:
-        menu_item_id = str(data["menu_item_id"])
-        read_model = await self._repo.find_by_id(menu_item_id)
+    def _apply_MenuItemAvailable(
+        self, read_model: MenuItemReadModel | None, data: Mapping[str, object]
+    ) -> MenuItemReadModel | None:
         if read_model is None:
-            return
-
-        read_model.available = True
-        await self._repo.save(read_model)
+            return None
+        return replace(read_model, available=True)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import replace
 from decimal import Decimal
 
 from tabb.application.ports.inbound.projector import Projector
@@ -13,9 +15,19 @@ from tabb.application.read_models.order_read_model import (
     OrderReadModel,
 )
 
+type _Apply = Callable[
+    [OrderReadModel | None, Mapping[str, object]], OrderReadModel | None
+]
+
 
 class OrderProjector(Projector):
-    """Projects order-related events into OrderReadModel."""
+    """Projects order-related events into OrderReadModel.
+
+    Each ``_apply_<EventType>`` method takes the current read model (or
+    None) and returns a new version of it, or None when nothing changed.
+    A batch loads each order's read model once, applies all of its events
+    in memory and saves it once.
+    """
 
     def __init__(self, repository: OrderReadModelRepository) -> None:
         self._repo = repository
@@ -30,93 +42,101 @@ class OrderProjector(Projector):
             "OrderCancelled",
         ]
 
-    async def project(self, event_type: str, event_data: dict[str, object]) -> None:
-        handler = getattr(self, f"_handle_{event_type}", None)
-        if handler is None:
-            return
-        await handler(event_data)
-
-    async def _handle_OrderPlaced(self, data: dict[str, object]) -> None:
-        order_id = str(data["order_id"])
-        existing = await self._repo.find_by_id(order_id)
-        if existing is not None:
-            return  # idempotent
-        read_model = OrderReadModel(
-            order_id=order_id,
+    async def project(self, event_type: str, event_data: Mapping[str, object]) -> None:
+        await self.project_batch([(event_type, event_data)])
+
+    async def project_batch(
+        self, events: Sequence[tuple[str, Mapping[str, object]]]
+    ) -> None:
+        models: dict[str, OrderReadModel | None] = {}
+        changed: dict[str, OrderReadModel] = {}
+
+        for event_type, data in events:
+            apply: _Apply | None = getattr(self, f"_apply_{event_type}", None)
+            if apply is None:
+                continue
+            order_id = str(data["order_id"])
+            if order_id not in models:
+                models[order_id] = await self._repo.find_by_id(order_id)
+            updated = apply(models[order_id], data)
+            if updated is not None:
+                models[order_id] = changed[order_id] = updated
+
+        for read_model in changed.values():
+            await self._repo.save(read_model)
+
+    def _apply_OrderPlaced(
+        self, read_model: OrderReadModel | None, data: Mapping[str, object]
+    ) -> OrderReadModel | None:
+        if read_model is not None:
+            return None  # idempotent
+        return OrderReadModel(
+            order_id=str(data["order_id"]),
             table_number=int(str(data["table_number"])),
             status="open",
-            items=[],
         )
-        await self._repo.save(read_model)
 
-    async def _handle_OrderItemAdded(self, data: dict[str, object]) -> None:
-        order_id = str(data["order_id"])
-        read_model = await self._repo.find_by_id(order_id)
+    def _apply_OrderItemAdded(
+        self, read_model: OrderReadModel | None, data: Mapping[str, object]
+    ) -> OrderReadModel | None:
         if read_model is None:
-            return
+            return None
 
         order_item_id = str(data["order_item_id"])
         # idempotent: skip if item already exists
         if any(i.order_item_id == order_item_id for i in read_model.items):
-            return
+            return None
 
         quantity = int(str(data["quantity"]))
         unit_price = str(data["unit_price"])
         total_price = str(Decimal(unit_price) * quantity)
 
-        read_model.items.append(
-            OrderItemReadModel(
-                order_item_id=order_item_id,
-                menu_item_id=str(data["menu_item_id"]),
-                name=str(data["name"]),
-                unit_price=unit_price,
-                quantity=quantity,
-                status="pending",
-                total_price=total_price,
-            )
+        item = OrderItemReadModel(
+            order_item_id=order_item_id,
+            menu_item_id=str(data["menu_item_id"]),
+            name=str(data["name"]),
+            unit_price=unit_price,
+            quantity=quantity,
+            status="pending",
+            total_price=total_price,
+        )
+        return replace(read_model, items=(*read_model.items, item))
+
+    def _apply_DishMarkedReady(
+        self, read_model: OrderReadModel | None, data: Mapping[str, object]
+    ) -> OrderReadModel | None:
+        return self._set_item_status(read_model, str(data["order_item_id"]), "ready")
+
+    def _apply_OrderItemCancelled(
+        self, read_model: OrderReadModel | None, data: Mapping[str, object]
+    ) -> OrderReadModel | None:
+        return self._set_item_status(
+            read_model, str(data["order_item_id"]), "cancelled"
         )
-        await self._repo.save(read_model)
-
-    async def _handle_DishMarkedReady(self, data: dict[str, object]) -> None:
-        order_id = str(data["order_id"])
-        read_model = await self._repo.find_by_id(order_id)
-        if read_model is None:
-            return
-
-        order_item_id = str(data["order_item_id"])
-        for item in read_model.items:
-            if item.order_item_id == order_item_id:
-                item.status = "ready"
-                break
-        await self._repo.save(read_model)
 
-    async def _handle_OrderItemCancelled(self, data: dict[str, object]) -> None:
-        order_id = str(data["order_id"])
-        read_model = await self._repo.find_by_id(order_id)
+    def _apply_OrderCompleted(
+        self, read_model: OrderReadModel | None, data: Mapping[str, object]
+    ) -> OrderReadModel | None:
         if read_model is None:
-            return
-
-        order_item_id = str(data["order_item_id"])
-        for item in read_model.items:
-            if item.order_item_id == order_item_id:
-                item.status = "cancelled"
-                break
-        await self._repo.save(read_model)
+            return None
+        return replace(read_model, status="completed")
 
-    async def _handle_OrderCompleted(self, data: dict[str, object]) -> None:
-        order_id = str(data["order_id"])
-        read_model = await self._repo.find_by_id(order_id)
+    def _apply_OrderCancelled(
+        self, read_model: OrderReadModel | None, data: Mapping[str, object]
+    ) -> OrderReadModel | None:
         if read_model is None:
-            return
+            return None
+        return replace(read_model, status="cancelled")
 
-        read_model.status = "completed"
-        await self._repo.save(read_model)
-
-    async def _handle_OrderCancelled(self, data: dict[str, object]) -> None:
-        order_id = str(data["order_id"])
-        read_model = await self._repo.find_by_id(order_id)
+    @staticmethod
+    def _set_item_status(
+        read_model: OrderReadModel | None, order_item_id: str, status: str
+    ) -> OrderReadModel | None:
         if read_model is None:
-            return
-
-        read_model.status = "cancelled"
-        await self._repo.save(read_model)
+            return None
+        for index, item in enumerate(read_model.items):
+            if item.order_item_id == order_item_id:
+                items = list(read_model.items)
+                items[index] = replace(item, status=status)
+                return replace(read_model, items=tuple(items))
+        return None
@@ -0,0 +1,86 @@
+"""Adaptive batch sizing and idle backoff for the outbox worker."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True)
+class AdaptiveBatchStats:
+    """Current controller state, for monitoring under load."""
+
+    batch_size: int
+    backlog: int
+    idle_delay_seconds: float
+    last_batch_seconds: float
+
+
+class AdaptiveBatchController:
+    """Chooses the next batch size and poll delay from observed batches.
+
+    - Backlog remaining and the last batch made progress: poll again
+      immediately. The batch doubles while a batch takes less than half of
+      ``target_batch_seconds`` and shrinks proportionally when it overruns.
+    - Nothing to do: back off exponentially from ``min_idle_seconds`` up to
+      ``max_idle_seconds``. Any progress resets the backoff.
+    """
+
+    def __init__(
+        self,
+        min_batch_size: int = 10,
+        max_batch_size: int = 1_000,
+        target_batch_seconds: float = 0.05,
+        min_idle_seconds: float = 0.05,
+        max_idle_seconds: float = 5.0,
+    ) -> None:
+        if not 1 <= min_batch_size <= max_batch_size:
+            raise ValueError("batch sizes must satisfy 1 <= min <= max")
+        if not 0 < min_idle_seconds <= max_idle_seconds:
+            raise ValueError("idle delays must satisfy 0 < min <= max")
+        self._min_batch = min_batch_size
+        self._max_batch = max_batch_size
+        self._target = target_batch_seconds
+        self._min_idle = min_idle_seconds
+        self._max_idle = max_idle_seconds
+
+        self._batch_size = min_batch_size
+        self._idle_delay = min_idle_seconds
+        self._backlog = 0
+        self._last_batch_seconds = 0.0
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def backlog(self) -> int:
+        return self._backlog
+
+    def record(self, processed: int, elapsed: float, backlog: int) -> float:
+        """Record a finished batch. Returns the delay before the next poll."""
+        self._backlog = backlog
+        self._last_batch_seconds = elapsed
+
+        if processed == 0 or backlog == 0:
+            delay = self._idle_delay
+            if processed == 0:
+                self._idle_delay = min(self._idle_delay * 2, self._max_idle)
+            else:
+                self._idle_delay = self._min_idle
+            return delay
+
+        self._idle_delay = self._min_idle
+        if elapsed > self._target:
+            scaled = int(self._batch_size * self._target / elapsed)
+            self._batch_size = max(self._min_batch, scaled)
+        elif elapsed < self._target / 2 and backlog > self._batch_size:
+            self._batch_size = min(self._max_batch, self._batch_size * 2)
+        return 0.0
+
+    def stats(self) -> AdaptiveBatchStats:
+        return AdaptiveBatchStats(
+            batch_size=self._batch_size,
+            backlog=self._backlog,
+            idle_delay_seconds=self._idle_delay,
+            last_batch_seconds=self._last_batch_seconds,
+        )
@@ -3,24 +3,53 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
 
+from tabb.adapters.outbound.workers.adaptive_batch import AdaptiveBatchController
+from tabb.adapters.outbound.workers.outbox_wakeup import AsyncioOutboxWakeup
 from tabb.application.ports.inbound.outbox_processor import OutboxProcessor
+from tabb.application.ports.inbound.outbox_retention import OutboxRetention
 from tabb.application.ports.inbound.outbox_worker import OutboxWorker
 from tabb.application.ports.outbound.logger import LoggerPort
 
 
 class AsyncOutboxWorker(OutboxWorker):
-    """Periodically polls the outbox processor using an asyncio background task."""
+    """Drives the outbox processor using an asyncio background task.
+
+    After a poll that processed entries, the worker polls again right away
+    until the backlog is drained. When idle it waits for a commit wakeup,
+    falling back to polling every ``interval_seconds`` as a safety net.
+    When a retention policy is given, each poll is followed by an
+    incremental compaction pass over processed entries.
+
+    With an ``AdaptiveBatchController`` the batch size and idle delay
+    follow the observed backlog and batch latency instead of the fixed
+    processor batch and ``interval_seconds``.
+
+    With ``next_retry_at``, a callable returning when the next failed
+    entry is due, an idle wait ends at that time, so retries are handed
+    to the processor when they become due rather than at the next poll.
+    """
 
     def __init__(
         self,
         processor: OutboxProcessor,
         interval_seconds: float = 1.0,
         logger: LoggerPort | None = None,
+        retention: OutboxRetention | None = None,
+        wakeup: AsyncioOutboxWakeup | None = None,
+        controller: AdaptiveBatchController | None = None,
+        next_retry_at: Callable[[], datetime | None] | None = None,
     ) -> None:
         self._processor = processor
         self._interval = interval_seconds
         self._logger = logger
+        self._retention = retention
+        self._wakeup = wakeup
+        self._controller = controller
+        self._next_retry_at = next_retry_at
         self._running = False
         self._task: asyncio.Task[None] | None = None
 
@@ -51,9 +80,52 @@ class AsyncOutboxWorker(OutboxWorker):
     async def _poll_loop(self) -> None:
         """Run process_pending in a loop until stopped."""
         while self._running:
-            try:
-                await self._processor.process_pending()
-            except Exception as exc:
-                if self._logger:
-                    self._logger.error("Outbox worker poll error: %s", exc)
-            await asyncio.sleep(self._interval)
+            delay = await self._poll_once()
+            await self._compact()
+            if delay == 0:
+                await asyncio.sleep(0)  # keep draining, but let others run
+                continue
+            await self._wait_for_work(delay)
+
+    async def _poll_once(self) -> float:
+        """Process one batch. Returns the delay before the next poll."""
+        limit = self._controller.batch_size if self._controller else None
+        started = time.perf_counter()
+        processed = 0
+        try:
+            processed = await self._processor.process_pending(limit)
+            if self._controller is None:
+                return 0.0 if processed else self._interval
+            backlog = await self._processor.backlog()
+        except Exception as exc:
+            if self._logger:
+                self._logger.error("Outbox worker poll error: %s", exc)
+            return self._interval
+        return self._controller.record(
+            processed, time.perf_counter() - started, backlog
+        )
+
+    async def _wait_for_work(self, delay: float) -> None:
+        """Sleep until a commit wakeup, the next retry or ``delay`` elapses."""
+        if self._next_retry_at is not None:
+            due = self._next_retry_at()
+            if due is not None:
+                until_due = (due - datetime.now(UTC)).total_seconds()
+                delay = min(delay, max(until_due, 0.0))
+        if self._wakeup is None:
+            await asyncio.sleep(delay)
+            return
+        await self._wakeup.wait(delay)
+
+    async def _compact(self) -> None:
+        """Run one incremental retention pass, if configured."""
+        if self._retention is None:
+            return
+        try:
+            reclaimed = await self._retention.compact()
+        except Exception as exc:
+            if self._logger:
+                self._logger.error("Outbox retention error: %s", exc)
+            return
+        if reclaimed and self._logger:
+            self._logger.debug("Outbox retention reclaimed %d entries", reclaimed)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+
+from tabb.application.outbox import OutboxEntry
 from tabb.application.ports.inbound.outbox_processor import OutboxProcessor
 from tabb.application.ports.inbound.projector import Projector
 from tabb.application.ports.outbound.logger import LoggerPort
@@ -16,6 +19,15 @@ class InMemoryOutboxProcessor(OutboxProcessor):
     3. On success: mark_processed
     4. On failure: mark_failed (increments retry_count)
     5. When retry_count >= max_retries: entry becomes DEAD_LETTERED
+
+    With ``lanes > 1`` the batch is partitioned by ``aggregate_id`` into
+    lanes that run as concurrent asyncio tasks. Entries of one aggregate
+    always share a lane and are processed in order; once one of them
+    fails, the rest of that aggregate's entries in the batch are skipped.
+
+    Within a lane, entries for the same projector go through
+    ``Projector.project_batch`` in a single call. If the batch raises, the
+    entries are replayed one at a time to pin down the failing entry.
     """
 
     def __init__(
@@ -23,31 +35,96 @@ class InMemoryOutboxProcessor(OutboxProcessor):
         outbox_repository: OutboxRepository,
         projectors: list[Projector],
         logger: LoggerPort | None = None,
+        lanes: int = 1,
+        batch_size: int = 10,
     ) -> None:
+        if lanes < 1:
+            raise ValueError("lanes must be at least 1")
         self._outbox_repo = outbox_repository
         self._projector_map: dict[str, Projector] = {}
         self._logger = logger
+        self._lanes = lanes
+        self._batch_size = batch_size
         for projector in projectors:
             for event_type in projector.handles():
                 self._projector_map[event_type] = projector
 
-    async def process_pending(self) -> int:
+    async def process_pending(self, limit: int | None = None) -> int:
         """Process pending outbox entries. Returns count of successfully processed."""
-        entries = await self._outbox_repo.find_pending(limit=10)
-        processed_count = 0
+        batch_size = self._batch_size if limit is None else limit
+        entries = await self._outbox_repo.find_pending(limit=batch_size)
+        if self._lanes == 1 or len(entries) <= 1:
+            return await self._process_lane(entries)
+
+        lanes: list[list[OutboxEntry]] = [[] for _ in range(self._lanes)]
+        for entry in entries:
+            lanes[hash(entry.aggregate_id) % self._lanes].append(entry)
+        results = await asyncio.gather(
+            *(self._process_lane(lane) for lane in lanes if lane)
+        )
+        return sum(results)
+
+    async def backlog(self) -> int:
+        return await self._outbox_repo.count_pending()
+
+    async def _process_lane(self, entries: list[OutboxEntry]) -> int:
+        """Project a lane's entries, batching per projector where possible."""
+        failed_aggregates: set[str] = set()
+        batches: dict[Projector, list[OutboxEntry]] = {}
 
         for entry in entries:
+            if entry.aggregate_id in failed_aggregates:
+                continue
             projector = self._projector_map.get(entry.event_type)
             if projector is None:
                 error_msg = (
                     f"No projector registered for event type: {entry.event_type}"
                 )
-                await self._outbox_repo.mark_failed(entry.entry_id, error_msg)
-                self._log_failure(
-                    entry.entry_id, entry.retry_count, entry.max_retries, error_msg
-                )
+                await self._fail(entry, error_msg, failed_aggregates)
                 continue
+            batches.setdefault(projector, []).append(entry)
+
+        processed_count = 0
+        for projector, batch in batches.items():
+            if len(batch) > 1 and await self._project_batch(projector, batch):
+                processed_count += len(batch)
+            else:
+                processed_count += await self._project_each(
+                    projector, batch, failed_aggregates
+                )
+        return processed_count
+
+    async def _project_batch(
+        self, projector: Projector, batch: list[OutboxEntry]
+    ) -> bool:
+        """Project a batch in one call. Returns False if it must be replayed."""
+        try:
+            await projector.project_batch([(e.event_type, e.event_data) for e in batch])
+        except Exception as exc:
+            if self._logger:
+                self._logger.debug(
+                    "Batch projection failed, replaying %d entries: %s",
+                    len(batch),
+                    exc,
+                )
+            return False
+        for entry in batch:
+            await self._outbox_repo.mark_processed(entry.entry_id)
+        if self._logger:
+            self._logger.debug("Outbox batch processed: %d entries", len(batch))
+        return True
 
+    async def _project_each(
+        self,
+        projector: Projector,
+        entries: list[OutboxEntry],
+        failed_aggregates: set[str],
+    ) -> int:
+        """Project entries one at a time; an aggregate stops at its first failure."""
+        processed_count = 0
+        for entry in entries:
+            if entry.aggregate_id in failed_aggregates:
+                continue
             try:
                 await projector.project(entry.event_type, entry.event_data)
                 await self._outbox_repo.mark_processed(entry.entry_id)
@@ -55,13 +132,16 @@ class InMemoryOutboxProcessor(OutboxProcessor):
                 if self._logger:
                     self._logger.debug("Outbox entry processed: %s", entry.entry_id)
             except Exception as exc:
-                await self._outbox_repo.mark_failed(entry.entry_id, str(exc))
-                self._log_failure(
-                    entry.entry_id, entry.retry_count, entry.max_retries, str(exc)
-                )
-
+                await self._fail(entry, str(exc), failed_aggregates)
         return processed_count
 
+    async def _fail(
+        self, entry: OutboxEntry, error: str, failed_aggregates: set[str]
+    ) -> None:
+        await self._outbox_repo.mark_failed(entry.entry_id, error)
+        failed_aggregates.add(entry.aggregate_id)
+        self._log_failure(entry.entry_id, entry.retry_count, entry.max_retries, error)
+
     def _log_failure(
         self,
         entry_id: str,
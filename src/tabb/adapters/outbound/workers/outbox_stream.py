@@ -0,0 +1,109 @@
+"""Cursor-based consumption of the in-memory outbox log."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.workers.outbox_wakeup import AsyncioOutboxWakeup
+from tabb.application.outbox import OutboxEntry
+
+
+class OutboxCursorFile:
+    """A consumer's position in the outbox log, kept in a small file.
+
+    The position is the sequence number of the last entry the consumer
+    finished with. ``save`` replaces the file atomically; a missing or
+    unreadable file reads as 0, the start of the log.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._path = Path(path)
+
+    def load(self) -> int:
+        try:
+            return int(self._path.read_text())
+        except FileNotFoundError, ValueError:
+            return 0
+
+    def save(self, sequence: int) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(".tmp")
+        tmp_path.write_text(str(sequence))
+        os.replace(tmp_path, self._path)
+
+
+class OutboxStream:
+    """Committed outbox entries as an async stream of batches.
+
+    ``async for batch in stream`` reads the log forward from the cursor in
+    sequence order, whatever the entries' status, so a consumer keeps its
+    own position instead of sharing the store's pending queues. A batch's
+    position is saved when the consumer asks for the next one: a consumer
+    that stops mid-batch sees the batch again (at-least-once delivery).
+    Each read costs O(batch). Once caught up, the stream waits for a
+    commit wakeup, or polls every ``poll_interval`` seconds without one.
+
+    The stream registers as a reader of the store, so retention keeps
+    every entry it has not acknowledged until it is closed. A saved
+    position that the log cannot serve is refused rather than skipped:
+    ``OutboxGapError`` if entries after it were reclaimed before the
+    stream opened, ``ValueError`` if it lies past the end of the log (a
+    log restarted without its write-ahead log).
+    """
+
+    def __init__(
+        self,
+        store: InMemoryOutboxStore,
+        cursor: OutboxCursorFile | None = None,
+        batch_size: int = 100,
+        wakeup: AsyncioOutboxWakeup | None = None,
+        poll_interval: float = 1.0,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._store = store
+        self._cursor = cursor
+        self._batch_size = batch_size
+        self._wakeup = wakeup
+        self._poll_interval = poll_interval
+        self._position = cursor.load() if cursor is not None else 0
+        self._reader = store.open_reader(self._position)
+
+    @property
+    def position(self) -> int:
+        """Sequence number of the last entry handed out and acknowledged."""
+        return self._position
+
+    def close(self) -> None:
+        """Unregister from the store, releasing entries for retention."""
+        self._store.close_reader(self._reader)
+
+    def __aiter__(self) -> AsyncIterator[list[OutboxEntry]]:
+        return self._batches()
+
+    async def _batches(self) -> AsyncIterator[list[OutboxEntry]]:
+        while True:
+            batch = self._store.read_after(self._position, self._batch_size)
+            if not batch:
+                await self._wait()
+                continue
+            yield batch
+            self._advance(batch[-1].sequence or self._position)
+
+    def _advance(self, sequence: int) -> None:
+        self._position = sequence
+        self._store.move_reader(self._reader, sequence)
+        if self._cursor is not None:
+            self._cursor.save(sequence)
+
+    async def _wait(self) -> None:
+        if self._wakeup is None:
+            await asyncio.sleep(self._poll_interval)
+            return
+        await self._wakeup.wait(self._poll_interval)
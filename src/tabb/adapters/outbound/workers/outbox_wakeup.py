@@ -0,0 +1,34 @@
+"""Asyncio wakeup signal connecting UoW commits to the outbox worker."""
+
+from __future__ import annotations
+
+import asyncio
+
+from tabb.application.ports.outbound.outbox_notifier import OutboxNotifier
+
+
+class AsyncioOutboxWakeup(OutboxNotifier):
+    """Edge-triggered wakeup backed by an ``asyncio.Event``.
+
+    Any number of ``notify`` calls between two waits collapse into a
+    single wakeup. Must be used from the event loop thread.
+    """
+
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+
+    def notify(self) -> None:
+        self._event.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for a notification or ``timeout`` seconds.
+
+        Returns True if woken by a notification, False on timeout.
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except TimeoutError:
+            return False
+        finally:
+            self._event.clear()
+        return True
@@ -0,0 +1,79 @@
+"""Async background worker that snapshots the in-memory stores."""
+
+from __future__ import annotations
+
+import asyncio
+
+from tabb.adapters.outbound.persistence.in_memory.snapshot_file import (
+    InMemoryStores,
+    SnapshotFile,
+)
+from tabb.adapters.outbound.persistence.in_memory.write_ahead_log import (
+    WriteAheadLog,
+)
+from tabb.application.ports.outbound.logger import LoggerPort
+
+
+class AsyncSnapshotWorker:
+    """Saves a store snapshot every ``interval_seconds`` and on stop.
+
+    Each snapshot bounds the write-ahead log tail replayed on the next
+    start. A failed periodic save is logged and retried on the next tick;
+    the final save on ``stop()`` propagates its error.
+    """
+
+    def __init__(
+        self,
+        snapshot_file: SnapshotFile,
+        stores: InMemoryStores,
+        write_ahead_log: WriteAheadLog | None = None,
+        interval_seconds: float = 300.0,
+        logger: LoggerPort | None = None,
+    ) -> None:
+        self._snapshot_file = snapshot_file
+        self._stores = stores
+        self._write_ahead_log = write_ahead_log
+        self._interval = interval_seconds
+        self._logger = logger
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start the background snapshot loop. Idempotent."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._snapshot_loop())
+        if self._logger:
+            self._logger.info("Snapshot worker started")
+
+    async def stop(self) -> None:
+        """Stop the loop and save a final snapshot."""
+        if not self._running:
+            return
+        self._running = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.save()
+        if self._logger:
+            self._logger.info("Snapshot worker stopped")
+
+    async def save(self) -> None:
+        """Write a snapshot of the stores now."""
+        await self._snapshot_file.save(self._stores, self._write_ahead_log)
+        if self._logger:
+            self._logger.debug("Saved snapshot to %s", self._snapshot_file.path)
+
+    async def _snapshot_loop(self) -> None:
+        while self._running:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.save()
+            except Exception as exc:
+                if self._logger:
+                    self._logger.error("Snapshot worker save error: %s", exc)
@@ -0,0 +1,66 @@
+"""Retry backoff strategies for failed outbox entries."""
+
+from __future__ import annotations
+
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+
+class BackoffStrategy(ABC):
+    """Computes how long a failed outbox entry waits before its next retry."""
+
+    @abstractmethod
+    def delay(self, attempt: int, previous: float) -> float:
+        """Seconds to wait before retry ``attempt`` (1 for the first retry).
+
+        ``previous`` is the delay chosen before the previous attempt, or 0.
+        """
+
+
+@dataclass(frozen=True)
+class ExponentialBackoff(BackoffStrategy):
+    """``base * 2 ** (attempt - 1)`` seconds, capped at ``cap``. No jitter."""
+
+    base: float = 1.0
+    cap: float | None = None
+
+    def delay(self, attempt: int, previous: float) -> float:
+        delay = self.base * 2.0 ** (attempt - 1)
+        return delay if self.cap is None else min(delay, self.cap)
+
+
+@dataclass(frozen=True)
+class FullJitterBackoff(BackoffStrategy):
+    """A uniformly random delay up to the capped exponential backoff.
+
+    Entries that failed together spread over the whole window instead of
+    retrying at the same instant.
+    """
+
+    base: float = 1.0
+    cap: float | None = None
+    rng: random.Random = field(default_factory=random.Random, compare=False)
+
+    def delay(self, attempt: int, previous: float) -> float:
+        ceiling = self.base * 2.0 ** (attempt - 1)
+        if self.cap is not None:
+            ceiling = min(ceiling, self.cap)
+        return self.rng.uniform(0, ceiling)
+
+
+@dataclass(frozen=True)
+class DecorrelatedJitterBackoff(BackoffStrategy):
+    """A random delay between ``base`` and three times the previous delay.
+
+    Each entry's delays grow from its own previous one rather than from
+    the attempt number, so retries stay spread out after many failures.
+    """
+
+    base: float = 1.0
+    cap: float | None = None
+    rng: random.Random = field(default_factory=random.Random, compare=False)
+
+    def delay(self, attempt: int, previous: float) -> float:
+        delay = self.rng.uniform(self.base, max(previous, self.base) * 3)
+        return delay if self.cap is None else min(delay, self.cap)
@@ -1,21 +1,109 @@
 """In-process CQRS bus implementations (pure Python)."""
 
+import asyncio
+import time
+from collections import OrderedDict
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
+from tabb.application.exceptions import ConcurrencyConflictError
 from tabb.application.ports.inbound.commands import Command, CommandBus, CommandHandler
 from tabb.application.ports.inbound.queries import Query, QueryBus, QueryHandler
 
+_AGGREGATE_ID_FIELDS = ("order_id", "menu_item_id")
+
+
+def command_aggregate_key(command: Command) -> str | None:
+    """Mailbox key of the aggregate a command targets, or None.
+
+    Uses the first of ``order_id`` / ``menu_item_id`` the command has,
+    prefixed with the field name so order and menu item ids never share a
+    mailbox.
+    """
+    for field in _AGGREGATE_ID_FIELDS:
+        value = getattr(command, field, None)
+        if value is not None:
+            return f"{field}:{value}"
+    return None
+
+
+@dataclass(frozen=True, kw_only=True)
+class MailboxStats:
+    """Queueing observed for one aggregate's mailbox."""
+
+    key: str
+    depth: int
+    max_depth: int
+    dispatched: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+class _Mailbox:
+    __slots__ = (
+        "depth",
+        "dispatched",
+        "lock",
+        "max_depth",
+        "max_wait",
+        "total_wait",
+    )
+
+    def __init__(self, previous: MailboxStats | None) -> None:
+        self.lock = asyncio.Lock()
+        self.depth = 0
+        self.max_depth = previous.max_depth if previous else 0
+        self.dispatched = previous.dispatched if previous else 0
+        self.total_wait = previous.total_wait_seconds if previous else 0.0
+        self.max_wait = previous.max_wait_seconds if previous else 0.0
+
+    def stats(self, key: str) -> MailboxStats:
+        return MailboxStats(
+            key=key,
+            depth=self.depth,
+            max_depth=self.max_depth,
+            dispatched=self.dispatched,
+            total_wait_seconds=self.total_wait,
+            max_wait_seconds=self.max_wait,
+        )
+
 
 class InProcessCommandBus(CommandBus):
     """Routes commands to handler factories. Pure Python, no external deps.
 
     Handler factories (callables returning CommandHandler) are used because
     handlers hold per-request repository references injected at dispatch time.
+
+    A command whose commit raises ConcurrencyConflictError is retried with a
+    fresh handler, which reloads current state, up to ``max_attempts`` times
+    in total; the last conflict is re-raised.
+
+    Mailbox mode (``mailbox_key``, e.g. ``command_aggregate_key``): commands
+    with the same key are queued and run one at a time, in arrival order,
+    while different keys run concurrently. Commands without a key are not
+    queued. A mailbox is dropped as soon as it is empty; the counters of the
+    most recently idle ``stats_capacity`` keys are kept for
+    ``mailbox_stats()``. A handler must not dispatch a command with its own
+    key, which would wait on itself.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        mailbox_key: Callable[[Command], str | None] | None = None,
+        stats_capacity: int = 1_024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
         self._registry: dict[type[Command], Callable[[], CommandHandler]] = {}
+        self._max_attempts = max_attempts
+        self._mailbox_key = mailbox_key
+        self._stats_capacity = stats_capacity
+        self._clock = clock
+        self._mailboxes: dict[str, _Mailbox] = {}
+        self._idle_stats: OrderedDict[str, MailboxStats] = OrderedDict()
 
     def register(
         self,
@@ -33,14 +121,62 @@ class InProcessCommandBus(CommandBus):
     async def dispatch(self, command: Command) -> Any:
         """Create a handler via its factory and execute the command.
 
+        Retries on ConcurrencyConflictError and, in mailbox mode, waits for
+        earlier commands on the same aggregate (see class docstring).
         Raises LookupError if no handler is registered for the command type.
         """
         command_type = type(command)
         factory = self._registry.get(command_type)
         if factory is None:
             raise LookupError(f"No handler registered for {command_type.__name__}")
-        handler = factory()
-        return await handler.handle(command)
+        key = self._mailbox_key(command) if self._mailbox_key else None
+        if key is None:
+            return await self._execute(command, factory)
+
+        mailbox = self._mailboxes.get(key)
+        if mailbox is None:
+            mailbox = self._mailboxes[key] = _Mailbox(self._idle_stats.pop(key, None))
+        mailbox.depth += 1
+        mailbox.max_depth = max(mailbox.max_depth, mailbox.depth)
+        enqueued = self._clock()
+        try:
+            async with mailbox.lock:
+                waited = self._clock() - enqueued
+                mailbox.dispatched += 1
+                mailbox.total_wait += waited
+                mailbox.max_wait = max(mailbox.max_wait, waited)
+                return await self._execute(command, factory)
+        finally:
+            mailbox.depth -= 1
+            if mailbox.depth == 0:
+                self._reclaim(key, mailbox)
+
+    def mailbox_stats(self) -> list[MailboxStats]:
+        """Stats of live and recently idle mailboxes, longest total wait first."""
+        stats = [*self._idle_stats.values()]
+        stats.extend(mailbox.stats(key) for key, mailbox in self._mailboxes.items())
+        return sorted(stats, key=lambda s: s.total_wait_seconds, reverse=True)
+
+    def _reclaim(self, key: str, mailbox: _Mailbox) -> None:
+        del self._mailboxes[key]
+        if self._stats_capacity <= 0:
+            return
+        self._idle_stats[key] = mailbox.stats(key)
+        if len(self._idle_stats) > self._stats_capacity:
+            self._idle_stats.popitem(last=False)
+
+    async def _execute(
+        self, command: Command, factory: Callable[[], CommandHandler]
+    ) -> Any:
+        attempt = 1
+        while True:
+            handler = factory()
+            try:
+                return await handler.handle(command)
+            except ConcurrencyConflictError:
+                if attempt >= self._max_attempts:
+                    raise
+                attempt += 1
 
 
 class InProcessQueryBus(QueryBus):
@@ -4,7 +4,6 @@ from dataclasses import dataclass
 from typing import Any
 
 from tabb.application.dto.order_dtos import OrderItemRequest
-from tabb.application.outbox import OutboxEntry
 from tabb.application.ports.inbound.commands import Command, CommandHandler
 from tabb.application.ports.outbound.unit_of_work import UnitOfWork
 from tabb.domain.exceptions.business import EmptyOrderError
@@ -42,14 +41,13 @@ class PlaceOrderHandler(CommandHandler):
             raise EmptyOrderError()
 
         async with self._uow:
-            requested_menu_ids = [MenuItemId(item.menu_item_id) for item in cmd.items]
+            requested_menu_ids = list(
+                dict.fromkeys(MenuItemId(item.menu_item_id) for item in cmd.items)
+            )
 
-            menu_items = [
-                mi
-                for mid in requested_menu_ids
-                if (mi := await self._uow.menu_item_repository.find_by_id(mid))
-                is not None
-            ]
+            menu_items = await self._uow.menu_item_repository.find_by_ids(
+                requested_menu_ids
+            )
 
             OrderDomainService.verify_items_available(requested_menu_ids, menu_items)
 
@@ -69,13 +67,4 @@ class PlaceOrderHandler(CommandHandler):
 
             await self._uow.order_repository.save(order)
 
-            for event in order.collect_events():
-                entry = OutboxEntry.create(
-                    entry_id=self._id_generator.generate(),
-                    event=event,
-                    aggregate_id=str(order.id),
-                    aggregate_type="Order",
-                )
-                await self._uow.outbox_repository.save(entry)
-
             await self._uow.commit()
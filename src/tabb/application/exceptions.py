@@ -27,3 +27,25 @@ class MenuItemNotFoundError(ApplicationError):
 
     def __init__(self, menu_item_id: str) -> None:
         super().__init__(f"Menu item '{menu_item_id}' not found.")
+
+
+class ConcurrencyConflictError(ApplicationError):
+    """Raised when a commit finds an aggregate changed since it was loaded."""
+
+    code = "CONCURRENCY_CONFLICT"
+
+    def __init__(
+        self,
+        aggregate_type: str,
+        aggregate_id: str,
+        expected_version: int,
+        actual_version: int,
+    ) -> None:
+        super().__init__(
+            f"{aggregate_type} '{aggregate_id}' was modified concurrently "
+            f"(expected version {expected_version}, found {actual_version})."
+        )
+        self.aggregate_type = aggregate_type
+        self.aggregate_id = aggregate_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, fields
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum, auto
+from types import MappingProxyType
 
+from tabb.application.backoff import BackoffStrategy
 from tabb.domain.events.base import DomainEvent
+from tabb.domain.events.codecs import codec_for
 
 
 class OutboxEntryStatus(StrEnum):
@@ -16,12 +20,18 @@ class OutboxEntryStatus(StrEnum):
     DEAD_LETTERED = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class OutboxEntry:
     """Represents an event stored in the transactional outbox.
 
     Events are written atomically with aggregate changes, then
     projected to read models by a background processor.
+
+    Entries are slotted and ``event_data`` is a read-only view of the
+    payload rather than a copy, so readers share one dict per entry.
+
+    ``sequence`` is the entry's position in commit order, assigned by the
+    outbox store when the entry is committed; None until then.
     """
 
     _entry_id: str
@@ -37,13 +47,13 @@ class OutboxEntry:
     _processed_at: datetime | None = None
     _next_retry_at: datetime | None = None
     _base_delay_seconds: int = 1
+    _sequence: int | None = None
+    _retry_delay_seconds: float = 0.0
 
     def __post_init__(self) -> None:
-        optional_fields = ("_last_error", "_processed_at", "_next_retry_at")
-        for f in fields(self):
-            val = getattr(self, f.name)
-            if val is None and f.name not in optional_fields:
-                raise ValueError(f"{f.name} is required")
+        for name in _REQUIRED_FIELDS:
+            if getattr(self, name) is None:
+                raise ValueError(f"{name} is required")
 
     @property
     def entry_id(self) -> str:
@@ -54,8 +64,8 @@ class OutboxEntry:
         return self._event_type
 
     @property
-    def event_data(self) -> dict[str, object]:
-        return dict(self._event_data)
+    def event_data(self) -> Mapping[str, object]:
+        return MappingProxyType(self._event_data)
 
     @property
     def aggregate_id(self) -> str:
@@ -97,6 +107,15 @@ class OutboxEntry:
     def next_retry_at(self) -> datetime | None:
         return self._next_retry_at
 
+    @property
+    def sequence(self) -> int | None:
+        return self._sequence
+
+    @property
+    def retry_delay_seconds(self) -> float:
+        """Delay chosen at the latest failure (0 before any)."""
+        return self._retry_delay_seconds
+
     @property
     def is_ready_for_retry(self) -> bool:
         """True if entry has no scheduled retry or the retry time has passed."""
@@ -112,9 +131,7 @@ class OutboxEntry:
         aggregate_type: str,
     ) -> OutboxEntry:
         """Factory: create a new pending outbox entry from a domain event."""
-        event_data: dict[str, object] = {
-            f.name: getattr(event, f.name) for f in fields(event)
-        }
+        event_data: dict[str, object] = codec_for(type(event)).encode(event)
         return OutboxEntry(
             _entry_id=entry_id,
             _event_type=event.event_name,
@@ -129,11 +146,17 @@ class OutboxEntry:
         self._status = OutboxEntryStatus.PROCESSED
         self._processed_at = datetime.now(UTC)
 
-    def mark_failed(self, error: str) -> None:
+    def mark_failed(
+        self,
+        error: str,
+        backoff: BackoffStrategy | None = None,
+        now: datetime | None = None,
+    ) -> None:
         """Mark this entry as failed. Increments retry count.
 
         If max retries exceeded, entry becomes dead-lettered.
-        Sets exponential backoff delay for retryable failures.
+        Sets the retry delay for retryable failures from ``backoff``,
+        by default a plain exponential backoff, counted from ``now``.
         """
         self._retry_count += 1
         self._last_error = error
@@ -142,5 +165,15 @@ class OutboxEntry:
             self._next_retry_at = None
         else:
             self._status = OutboxEntryStatus.FAILED
-            delay = self._base_delay_seconds * (2 ** (self._retry_count - 1))
-            self._next_retry_at = datetime.now(UTC) + timedelta(seconds=delay)
+            if backoff is None:
+                delay = float(self._base_delay_seconds * (2 ** (self._retry_count - 1)))
+            else:
+                delay = backoff.delay(self._retry_count, self._retry_delay_seconds)
+            self._retry_delay_seconds = delay
+            self._next_retry_at = (now or datetime.now(UTC)) + timedelta(seconds=delay)
+
+
+_OPTIONAL_FIELDS = ("_last_error", "_processed_at", "_next_retry_at", "_sequence")
+_REQUIRED_FIELDS = tuple(
+    f.name for f in fields(OutboxEntry) if f.name not in _OPTIONAL_FIELDS
+)
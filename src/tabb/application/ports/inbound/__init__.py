@@ -2,6 +2,10 @@
 
 from tabb.application.ports.inbound.commands import Command, CommandBus, CommandHandler
 from tabb.application.ports.inbound.outbox_processor import OutboxProcessor
+from tabb.application.ports.inbound.outbox_retention import (
+    OutboxRetention,
+    OutboxRetentionStats,
+)
 from tabb.application.ports.inbound.outbox_worker import OutboxWorker
 from tabb.application.ports.inbound.projector import Projector
 from tabb.application.ports.inbound.queries import Query, QueryBus, QueryHandler
@@ -11,6 +15,8 @@ __all__ = [
     "CommandBus",
     "CommandHandler",
     "OutboxProcessor",
+    "OutboxRetention",
+    "OutboxRetentionStats",
     "OutboxWorker",
     "Projector",
     "Query",
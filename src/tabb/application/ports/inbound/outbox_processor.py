@@ -7,8 +7,13 @@ class OutboxProcessor(ABC):
     """Processes pending outbox entries by dispatching to projectors."""
 
     @abstractmethod
-    async def process_pending(self) -> int:
-        """Process pending outbox entries.
+    async def process_pending(self, limit: int | None = None) -> int:
+        """Process up to ``limit`` pending outbox entries.
 
+        ``None`` uses the processor's default batch size.
         Returns the number of successfully processed entries.
         """
+
+    @abstractmethod
+    async def backlog(self) -> int:
+        """Return the number of entries still waiting to be processed."""
@@ -0,0 +1,33 @@
+"""Inbound port — outbox retention (reclaiming processed entries)."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True)
+class OutboxRetentionStats:
+    """Snapshot of retention activity for monitoring."""
+
+    reclaimed_total: int
+    last_reclaimed: int
+    archived: int
+    live_entries: int
+
+
+class OutboxRetention(ABC):
+    """Moves processed outbox entries out of the live outbox.
+
+    Implementations must work incrementally so that a single ``compact``
+    call never blocks the caller for long.
+    """
+
+    @abstractmethod
+    async def compact(self) -> int:
+        """Reclaim eligible processed entries.
+
+        Returns the number of entries reclaimed by this call.
+        """
+
+    @abstractmethod
+    def stats(self) -> OutboxRetentionStats:
+        """Return cumulative retention statistics."""
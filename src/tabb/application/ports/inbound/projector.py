@@ -1,6 +1,7 @@
 """Inbound port — projector interface for event-driven read model updates."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
 
 
 class Projector(ABC):
@@ -15,5 +16,18 @@ class Projector(ABC):
         """Return the event type names this projector handles."""
 
     @abstractmethod
-    async def project(self, event_type: str, event_data: dict[str, object]) -> None:
+    async def project(self, event_type: str, event_data: Mapping[str, object]) -> None:
         """Project an event into the read model."""
+
+    async def project_batch(
+        self, events: Sequence[tuple[str, Mapping[str, object]]]
+    ) -> None:
+        """Project several events, in order, as one unit.
+
+        The default projects each event on its own. Implementations should
+        override this to load and save each read model once per batch.
+        Projection must be idempotent: if this raises, the caller may
+        replay the events one by one.
+        """
+        for event_type, event_data in events:
+            await self.project(event_type, event_data)
@@ -14,6 +14,16 @@ class OrderReadModelRepository(ABC):
     async def find_by_id(self, order_id: str) -> OrderReadModel | None:
         """Find an order read model by its ID."""
 
+    @abstractmethod
+    async def find_by_table(
+        self, table_number: int, status: str | None = None
+    ) -> list[OrderReadModel]:
+        """Find the orders for a table, optionally only those in ``status``."""
+
+    @abstractmethod
+    async def find_by_status(self, status: str) -> list[OrderReadModel]:
+        """Find all orders in the given status."""
+
     @abstractmethod
     async def save(self, read_model: OrderReadModel) -> None:
         """Persist an order read model (insert or update)."""
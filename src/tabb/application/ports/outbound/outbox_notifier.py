@@ -0,0 +1,15 @@
+"""Outbound port — notification that new outbox entries were committed."""
+
+from abc import ABC, abstractmethod
+
+
+class OutboxNotifier(ABC):
+    """Signals outbox consumers that committed entries are waiting.
+
+    The Unit of Work calls ``notify`` after flushing outbox entries so a
+    background worker can start draining without waiting for its next poll.
+    """
+
+    @abstractmethod
+    def notify(self) -> None:
+        """Signal that new outbox entries are available. Must not block."""
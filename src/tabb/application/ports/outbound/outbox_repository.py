@@ -18,6 +18,10 @@ class OutboxRepository(ABC):
     async def find_pending(self, limit: int = 10) -> list[OutboxEntry]:
         """Return pending or failed (retryable) entries, ordered by occurred_at."""
 
+    @abstractmethod
+    async def count_pending(self) -> int:
+        """Return the number of pending or failed (retryable) entries."""
+
     @abstractmethod
     async def mark_processed(self, entry_id: str) -> None:
         """Mark an outbox entry as processed."""
@@ -13,13 +13,17 @@ from tabb.domain.ports.order_repository import OrderRepository
 class UnitOfWork(ABC):
     """Ensures atomic persistence of aggregate state and outbox entries.
 
+    Aggregates loaded or saved through the repositories are tracked for the
+    lifetime of the unit of work. ``commit`` persists those that changed and
+    writes the domain events they recorded to the outbox, so handlers do not
+    collect events themselves.
+
     Usage::
 
         async with uow:
             order = await uow.order_repository.find_by_id(order_id)
             order.cancel()
             await uow.order_repository.save(order)
-            await uow.outbox_repository.save(outbox_entry)
             await uow.commit()
     """
 
@@ -40,7 +44,7 @@ class UnitOfWork(ABC):
 
     @abstractmethod
     async def commit(self) -> None:
-        """Atomically commit all changes."""
+        """Atomically commit changed aggregates and their events."""
 
     @abstractmethod
     async def rollback(self) -> None:
@@ -10,6 +10,7 @@ from tabb.application.ports.inbound.queries import Query, QueryHandler
 from tabb.application.ports.outbound.order_read_model_repository import (
     OrderReadModelRepository,
 )
+from tabb.application.read_models.order_read_model import OrderReadModel
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -32,20 +33,25 @@ class GetOrderHandler(QueryHandler):
         if read_model is None:
             raise OrderNotFoundError(q.order_id)
 
-        return OrderResult(
-            order_id=read_model.order_id,
-            table_number=read_model.table_number,
-            status=read_model.status,
-            items=[
-                OrderItemResult(
-                    order_item_id=item.order_item_id,
-                    menu_item_id=item.menu_item_id,
-                    name=item.name,
-                    unit_price=Decimal(item.unit_price),
-                    quantity=item.quantity,
-                    status=item.status,
-                    total_price=Decimal(item.total_price),
-                )
-                for item in read_model.items
-            ],
-        )
+        return to_order_result(read_model)
+
+
+def to_order_result(read_model: OrderReadModel) -> OrderResult:
+    """Map an order read model to its result DTO."""
+    return OrderResult(
+        order_id=read_model.order_id,
+        table_number=read_model.table_number,
+        status=read_model.status,
+        items=[
+            OrderItemResult(
+                order_item_id=item.order_item_id,
+                menu_item_id=item.menu_item_id,
+                name=item.name,
+                unit_price=Decimal(item.unit_price),
+                quantity=item.quantity,
+                status=item.status,
+                total_price=Decimal(item.total_price),
+            )
+            for item in read_model.items
+        ],
+    )
@@ -0,0 +1,32 @@
+"""Get orders by status — query and handler."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from tabb.application.dto.order_dtos import OrderResult
+from tabb.application.ports.inbound.queries import Query, QueryHandler
+from tabb.application.ports.outbound.order_read_model_repository import (
+    OrderReadModelRepository,
+)
+from tabb.application.queries.get_order import to_order_result
+
+
+@dataclass(frozen=True, kw_only=True)
+class GetOrdersByStatusQuery(Query):
+    """Query to retrieve all orders in a given status."""
+
+    status: str
+
+
+class GetOrdersByStatusHandler(QueryHandler):
+    """Retrieves orders in a status from the read model index."""
+
+    def __init__(self, order_read_model_repository: OrderReadModelRepository) -> None:
+        self._read_repo = order_read_model_repository
+
+    async def handle(self, query: Any) -> list[OrderResult]:
+        q: GetOrdersByStatusQuery = query
+
+        read_models = await self._read_repo.find_by_status(q.status)
+
+        return [to_order_result(rm) for rm in read_models]
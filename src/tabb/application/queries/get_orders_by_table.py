@@ -0,0 +1,33 @@
+"""Get the orders for a table — query and handler."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from tabb.application.dto.order_dtos import OrderResult
+from tabb.application.ports.inbound.queries import Query, QueryHandler
+from tabb.application.ports.outbound.order_read_model_repository import (
+    OrderReadModelRepository,
+)
+from tabb.application.queries.get_order import to_order_result
+
+
+@dataclass(frozen=True, kw_only=True)
+class GetOrdersByTableQuery(Query):
+    """Query to retrieve a table's orders, optionally filtered by status."""
+
+    table_number: int
+    status: str | None = None
+
+
+class GetOrdersByTableHandler(QueryHandler):
+    """Retrieves a table's orders from the read model index."""
+
+    def __init__(self, order_read_model_repository: OrderReadModelRepository) -> None:
+        self._read_repo = order_read_model_repository
+
+    async def handle(self, query: Any) -> list[OrderResult]:
+        q: GetOrdersByTableQuery = query
+
+        read_models = await self._read_repo.find_by_table(q.table_number, q.status)
+
+        return [to_order_result(rm) for rm in read_models]
@@ -3,9 +3,9 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, kw_only=True)
 class MenuItemReadModel:
-    """Flat read model for a menu item."""
+    """Flat, immutable read model for a menu item."""
 
     menu_item_id: str
     name: str
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, kw_only=True)
 class OrderItemReadModel:
-    """Flat read model for an order item."""
+    """Flat, immutable read model for an order item."""
 
     order_item_id: str
     menu_item_id: str
@@ -18,11 +18,11 @@ class OrderItemReadModel:
     total_price: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, kw_only=True)
 class OrderReadModel:
-    """Flat read model for an order."""
+    """Flat, immutable read model for an order."""
 
     order_id: str
     table_number: int
     status: str
-    items: list[OrderItemReadModel] = field(default_factory=list)
+    items: tuple[OrderItemReadModel, ...] = ()
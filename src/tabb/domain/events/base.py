@@ -1,8 +1,8 @@
 """Base domain event for tabb."""
 
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 
-from tabb.domain.exceptions import RequiredFieldError
+from tabb.domain.events.codecs import codec_for
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -10,13 +10,12 @@ class DomainEvent:
     """Base class for all domain events.
 
     Events are immutable records of something meaningful that happened
-    in the domain. All fields are required and validated on construction.
+    in the domain. All fields are required and validated on construction
+    by the event type's generated codec (see ``codecs``).
     """
 
     def __post_init__(self) -> None:
-        for f in fields(self):
-            if getattr(self, f.name) is None:
-                raise RequiredFieldError(type(self).__name__, f.name)
+        codec_for(type(self)).validate(self)
 
     @property
     def event_name(self) -> str:
@@ -0,0 +1,114 @@
+"""Per-event-type encode, decode and validate functions.
+
+Each ``DomainEvent`` subclass gets a codec whose functions are generated
+from its fields once, as ``dataclasses`` generates ``__init__``, so the
+hot paths that turn events into payloads and back, and check them on
+construction, do not reflect over ``dataclasses.fields`` per event.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any
+
+from tabb.domain.exceptions import RequiredFieldError
+
+if TYPE_CHECKING:
+    from tabb.domain.events.base import DomainEvent
+
+
+@dataclass(frozen=True, slots=True)
+class EventCodec:
+    """Generated functions for one event type.
+
+    ``encode`` returns the event's field values as a new dict, ``decode``
+    builds the event from such a mapping and ``validate`` raises
+    ``RequiredFieldError`` for the first field that is None.
+    """
+
+    event_type: type[DomainEvent]
+    field_names: tuple[str, ...]
+    encode: Callable[[DomainEvent], dict[str, Any]]
+    decode: Callable[[Mapping[str, Any]], DomainEvent]
+    validate: Callable[[DomainEvent], None]
+
+    @property
+    def name(self) -> str:
+        return self.event_type.__name__
+
+
+_CODECS: dict[type[DomainEvent], EventCodec] = {}
+_CODECS_BY_NAME: dict[str, EventCodec] = {}
+
+
+def codec_for(event_type: type[DomainEvent]) -> EventCodec:
+    """Return the codec for an event type, compiling it on first use."""
+    codec = _CODECS.get(event_type)
+    if codec is None:
+        codec = _CODECS[event_type] = _CODECS_BY_NAME[event_type.__name__] = (
+            compile_codec(event_type)
+        )
+    return codec
+
+
+def codec_named(name: str) -> EventCodec:
+    """Return the codec for the event type with this class name."""
+    codec = _CODECS_BY_NAME.get(name)
+    if codec is None:
+        raise ValueError(f"Unknown event type: {name}")
+    return codec
+
+
+def register_events(event_types: Iterable[type[DomainEvent]]) -> None:
+    """Compile the codecs of event types ahead of their first use."""
+    for event_type in event_types:
+        codec_for(event_type)
+
+
+def compile_codec(event_type: type[DomainEvent]) -> EventCodec:
+    """Generate the codec functions for an event type from its fields."""
+    names = tuple(f.name for f in fields(event_type))
+    namespace: dict[str, Any] = {
+        "cls": event_type,
+        "class_name": event_type.__name__,
+        "RequiredFieldError": RequiredFieldError,
+    }
+    encode = _function(
+        "encode",
+        "event",
+        ["return {" + ", ".join(f"{n!r}: event.{n}" for n in names) + "}"],
+        namespace,
+    )
+    decode = _function(
+        "decode",
+        "data",
+        ["return cls(" + ", ".join(f"{n}=data[{n!r}]" for n in names) + ")"],
+        namespace,
+    )
+    validate = _function(
+        "validate",
+        "event",
+        [
+            line
+            for n in names
+            for line in (
+                f"if event.{n} is None:",
+                f"    raise RequiredFieldError(class_name, {n!r})",
+            )
+        ]
+        or ["pass"],
+        namespace,
+    )
+    return EventCodec(event_type, names, encode, decode, validate)
+
+
+def _function(
+    name: str, parameter: str, body: list[str], namespace: dict[str, Any]
+) -> Callable[..., Any]:
+    source = f"def {name}({parameter}):\n" + "".join(f"    {line}\n" for line in body)
+    # The source is built only from dataclass field names, which are
+    # identifiers, so there is nothing to inject.
+    exec(source, namespace)  # noqa: S102  # nosec B102 — field names only
+    function: Callable[..., Any] = namespace.pop(name)
+    return function
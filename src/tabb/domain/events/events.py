@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 
 from tabb.domain.events.base import DomainEvent
+from tabb.domain.events.codecs import register_events
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -76,3 +77,18 @@ class MenuItemAvailable(DomainEvent):
     """Raised when a menu item becomes available again."""
 
     menu_item_id: str
+
+
+register_events(
+    [
+        OrderPlaced,
+        OrderItemAdded,
+        OrderItemCancelled,
+        DishMarkedReady,
+        OrderCompleted,
+        OrderCancelled,
+        MenuItemSoldOut,
+        MenuItemCreated,
+        MenuItemAvailable,
+    ]
+)
@@ -1,8 +1,11 @@
 """MenuItem aggregate — manages dish availability."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from decimal import Decimal
 from typing import Self
 
+from tabb.domain.events.base import DomainEvent
 from tabb.domain.events.events import (
     MenuItemAvailable,
     MenuItemCreated,
@@ -68,6 +71,41 @@ class MenuItem(AggregateRoot[MenuItemId]):
         )
         return item
 
+    @classmethod
+    def from_events(cls, events: Iterable[DomainEvent]) -> Self:
+        """Rebuild a menu item from its history, oldest event first.
+
+        The history must start with ``MenuItemCreated``. Replaying records
+        no new events.
+        """
+        history = iter(events)
+        match next(history, None):
+            case MenuItemCreated() as created:
+                pass
+            case _:
+                raise ValueError(
+                    "A menu item's history must start with MenuItemCreated"
+                )
+        item = cls(
+            _id=MenuItemId(created.menu_item_id),
+            _name=created.name,
+            _price=Money(Decimal(created.price)),
+            _available=True,
+        )
+        for event in history:
+            item.apply(event)
+        return item
+
+    def apply(self, event: DomainEvent) -> None:
+        """Apply an event this menu item recorded earlier to its state."""
+        match event:
+            case MenuItemSoldOut():
+                self._available = False
+            case MenuItemAvailable():
+                self._available = True
+            case _:
+                raise ValueError(f"MenuItem cannot apply {event.event_name}")
+
     def mark_sold_out(self) -> None:
         """Mark this menu item as sold out."""
         if not self._available:
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from decimal import Decimal
 from enum import StrEnum, auto
+from typing import Self
 
+from tabb.domain.events.base import DomainEvent
 from tabb.domain.events.events import (
     DishMarkedReady,
     OrderCancelled,
@@ -150,6 +155,9 @@ class Order(AggregateRoot[OrderId]):
     _table: TableNumber
     _items: list[OrderItem] = field(default_factory=list)
     _status: OrderStatus = OrderStatus.OPEN
+    _shared_item_ids: set[OrderItemId] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         cls_name = type(self).__name__
@@ -182,6 +190,60 @@ class Order(AggregateRoot[OrderId]):
     def active_items(self) -> list[OrderItem]:
         return [i for i in self._items if i.status != OrderItemStatus.CANCELLED]
 
+    # -- Copy-on-write ----------------------------------------------------
+
+    def fork(self) -> Self:
+        """Return an independent copy that shares items until they change.
+
+        Both this order and the copy mark every current item as shared; a
+        command that changes a shared item replaces it with a private copy
+        first, so neither side ever sees the other's changes.
+        """
+        shared = {item.id for item in self._items}
+        self._shared_item_ids = shared
+        clone = super().fork()
+        clone._items = list(self._items)
+        clone._shared_item_ids = set(shared)
+        return clone
+
+    def merge_concurrent(self, base: Order, theirs: Order) -> Order | None:
+        """Replay this order's item changes since ``base`` onto ``theirs``.
+
+        ``base`` is the version this order was loaded from and ``theirs`` a
+        version committed concurrently on top of it. Changes commute when
+        they touch different items: status changes on distinct items and
+        items added to an open order. Returns the merged order at the
+        version of ``theirs``, or None when the changes conflict: an order
+        status change on either side, one item changed differently on both
+        sides, or a merge that leaves every item of an open order cancelled.
+        """
+        if self._status != base._status or theirs._status != base._status:
+            return None
+
+        base_items = {item.id: item for item in base._items}
+        their_items = {item.id: item for item in theirs._items}
+        merged = theirs.fork()
+        positions = {item.id: index for index, item in enumerate(merged._items)}
+
+        for item in self._items:
+            original = base_items.get(item.id)
+            if original is None:
+                if item.id in their_items:
+                    return None
+                merged._items.append(item)
+            elif item is original or item == original:
+                continue
+            else:
+                current = their_items[item.id]
+                if current is not original and current not in (original, item):
+                    return None
+                merged._items[positions[item.id]] = item
+            merged._shared_item_ids.add(item.id)
+
+        if merged._all_items_cancelled():
+            return None
+        return merged
+
     # -- Factory ----------------------------------------------------------
 
     @staticmethod
@@ -207,6 +269,65 @@ class Order(AggregateRoot[OrderId]):
         )
         return order
 
+    @staticmethod
+    def from_events(events: Iterable[DomainEvent]) -> Order:
+        """Rebuild an order from its history, oldest event first.
+
+        The history must start with ``OrderPlaced``. Replaying records no
+        new events.
+        """
+        history = iter(events)
+        match next(history, None):
+            case OrderPlaced() as placed:
+                pass
+            case _:
+                raise ValueError("An order's history must start with OrderPlaced")
+        order = Order(
+            _id=OrderId(placed.order_id),
+            _table=TableNumber(placed.table_number),
+            _items=[],
+            _status=OrderStatus.OPEN,
+        )
+        for event in history:
+            order.apply(event)
+        return order
+
+    def apply(self, event: DomainEvent) -> None:
+        """Apply an event this order recorded earlier to its state.
+
+        Events are facts, so they are not validated again; ``from_events``
+        and event-sourced repositories use this to catch an order up.
+        """
+        match event:
+            case OrderItemAdded():
+                self._items.append(
+                    OrderItem(
+                        _id=OrderItemId(event.order_item_id),
+                        _menu_item_id=event.menu_item_id,
+                        _name=event.name,
+                        _unit_price=Money(Decimal(event.unit_price)),
+                        _quantity=Quantity(event.quantity),
+                    )
+                )
+            case OrderItemCancelled():
+                item_id = OrderItemId(event.order_item_id)
+                self._find_item(item_id)._status = OrderItemStatus.CANCELLED
+            case DishMarkedReady():
+                item_id = OrderItemId(event.order_item_id)
+                self._find_item(item_id)._status = OrderItemStatus.READY
+            case OrderCompleted():
+                self._status = OrderStatus.COMPLETED
+            case OrderCancelled():
+                for index, item in enumerate(self._items):
+                    if item.status not in (
+                        OrderItemStatus.CANCELLED,
+                        OrderItemStatus.READY,
+                    ):
+                        self._writable_item(index)._status = OrderItemStatus.CANCELLED
+                self._status = OrderStatus.CANCELLED
+            case _:
+                raise ValueError(f"Order cannot apply {event.event_name}")
+
     # -- Commands ---------------------------------------------------------
 
     def add_item(
@@ -271,9 +392,9 @@ class Order(AggregateRoot[OrderId]):
     def cancel(self) -> None:
         """Cancel the entire order."""
         self._assert_open()
-        for item in self._items:
+        for index, item in enumerate(self._items):
             if item.status not in (OrderItemStatus.CANCELLED, OrderItemStatus.READY):
-                item._status = OrderItemStatus.CANCELLED
+                self._writable_item(index)._status = OrderItemStatus.CANCELLED
         self._status = OrderStatus.CANCELLED
         self._record_event(OrderCancelled(order_id=str(self.id)))
 
@@ -284,10 +405,19 @@ class Order(AggregateRoot[OrderId]):
             raise OrderNotOpenError(str(self.id), self._status.value)
 
     def _find_item(self, item_id: OrderItemId) -> OrderItem:
-        for item in self._items:
+        for index, item in enumerate(self._items):
             if item.id == item_id:
-                return item
+                return self._writable_item(index)
         raise OrderItemNotFoundError(str(self.id), str(item_id))
 
+    def _writable_item(self, index: int) -> OrderItem:
+        """Return the item at ``index``, copying it first if it is shared."""
+        item = self._items[index]
+        if item.id in self._shared_item_ids:
+            item = copy.copy(item)
+            self._items[index] = item
+            self._shared_item_ids.discard(item.id)
+        return item
+
     def _all_items_cancelled(self) -> bool:
         return all(i.status == OrderItemStatus.CANCELLED for i in self._items)
@@ -1,6 +1,7 @@
 """Repository port for the MenuItem aggregate."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from tabb.domain.models.menu_item import MenuItem, MenuItemId
 
@@ -12,6 +13,14 @@ class MenuItemRepository(ABC):
     async def find_by_id(self, item_id: MenuItemId) -> MenuItem | None:
         """Find a menu item by its identity. Returns None if not found."""
 
+    @abstractmethod
+    async def find_by_ids(self, item_ids: Sequence[MenuItemId]) -> list[MenuItem]:
+        """Find several menu items in one lookup.
+
+        Duplicate IDs are looked up once and missing items are omitted, so
+        the result may be shorter than ``item_ids``.
+        """
+
     @abstractmethod
     async def save(self, item: MenuItem) -> None:
         """Persist a menu item (insert or update)."""
@@ -1,6 +1,8 @@
 """Domain building blocks for the shared kernel."""
 
+import copy
 from dataclasses import dataclass, field
+from typing import Self
 
 from tabb.domain.events.base import DomainEvent
 from tabb.domain.exceptions import RequiredFieldError
@@ -71,13 +73,34 @@ class AggregateRoot[IdT](Entity[IdT]):
     An aggregate root is the entry point to an aggregate — a cluster of
     entities and value objects treated as a single consistency boundary.
     It also collects domain events for later dispatch.
+
+    ``version`` counts committed changes. Persistence adapters compare it
+    on commit for optimistic concurrency control and advance it afterwards;
+    domain code never changes it.
     """
 
     _events: list[DomainEvent] = field(default_factory=list, init=False, repr=False)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     def _record_event(self, event: DomainEvent) -> None:
         self._events.append(event)
 
+    def fork(self) -> Self:
+        """Return an independent copy that shares immutable state.
+
+        Value objects are frozen, so a shallow copy is enough; aggregates
+        holding mutable entities extend this so that the entities are
+        copied only when a command changes them. Pending events stay with
+        the original; the copy starts with none.
+        """
+        clone = copy.copy(self)
+        clone._events = []
+        return clone
+
     def collect_events(self) -> list[DomainEvent]:
         events = self._events.copy()
         self._events.clear()
@@ -1 +1,30 @@
 """Shared test fixtures for tabb."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Controllable clock for outbox retry timing
+# ---------------------------------------------------------------------------
+
+
+class _Clock:
+    """Controllable clock so tests can skip past retry backoff."""
+
+    def __init__(self) -> None:
+        self.now = datetime.now(UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance_to(self, moment: datetime | None) -> None:
+        assert moment is not None
+        self.now = max(self.now, moment) + timedelta(seconds=1)
+
+
+@pytest.fixture()
+def clock() -> _Clock:
+    return _Clock()
@@ -8,7 +8,6 @@ Demonstrates:
 5. Failed projections retry and eventually succeed or dead-letter
 """
 
-from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
 import pytest
@@ -23,9 +22,15 @@ from tabb.adapters.outbound.persistence.in_memory.order_read_model_repository im
 from tabb.adapters.outbound.persistence.in_memory.outbox_repository import (
     InMemoryOutboxRepository,
 )
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
 from tabb.adapters.outbound.persistence.in_memory.unit_of_work import (
     InMemoryUnitOfWork,
 )
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
 from tabb.adapters.outbound.projectors.menu_item_projector import MenuItemProjector
 from tabb.adapters.outbound.projectors.order_projector import OrderProjector
 from tabb.adapters.outbound.workers.outbox_processor import InMemoryOutboxProcessor
@@ -68,12 +73,12 @@ pytestmark = pytest.mark.asyncio
 
 
 @pytest.fixture()
-def stores():
+def stores(clock):
     """Create fresh shared stores for each test."""
     return {
-        "orders": {},
-        "menu_items": {},
-        "outbox": [],
+        "orders": InMemoryVersionedStore(),
+        "menu_items": InMemoryVersionedStore(),
+        "outbox": InMemoryOutboxStore(clock=clock),
     }
 
 
@@ -129,7 +134,7 @@ class TestCqrsFlow:
         outbox_processor,
     ):
         # Step 1: Create a menu item
-        handler = CreateMenuItemHandler(_uow(stores), id_generator)
+        handler = CreateMenuItemHandler(_uow(stores))
         await handler.handle(
             CreateMenuItemCommand(
                 menu_item_id="m-1", name="Burger", price=Decimal("9.99")
@@ -191,7 +196,7 @@ class TestCqrsFlow:
 
         # Step 5: Mark item ready
         item_id = order_result.items[0].order_item_id
-        handler = MarkItemReadyHandler(_uow(stores), id_generator)
+        handler = MarkItemReadyHandler(_uow(stores))
         await handler.handle(
             MarkItemReadyCommand(order_id="o-1", order_item_id=item_id)
         )
@@ -201,7 +206,7 @@ class TestCqrsFlow:
         assert order_result.items[0].status == "ready"
 
         # Step 6: Complete the order
-        handler = CompleteOrderHandler(_uow(stores), id_generator)
+        handler = CompleteOrderHandler(_uow(stores))
         await handler.handle(CompleteOrderCommand(order_id="o-1"))
         await outbox_processor.process_pending()
 
@@ -217,7 +222,7 @@ class TestCqrsFlow:
         outbox_processor,
     ):
         # Create menu item and process
-        handler = CreateMenuItemHandler(_uow(stores), id_generator)
+        handler = CreateMenuItemHandler(_uow(stores))
         await handler.handle(
             CreateMenuItemCommand(
                 menu_item_id="m-1", name="Fries", price=Decimal("4.99")
@@ -244,7 +249,7 @@ class TestCqrsFlow:
         await outbox_processor.process_pending()
 
         # Cancel order and process
-        handler = CancelOrderHandler(_uow(stores), id_generator)
+        handler = CancelOrderHandler(_uow(stores))
         await handler.handle(CancelOrderCommand(order_id="o-2"))
         await outbox_processor.process_pending()
 
@@ -256,7 +261,7 @@ class TestCqrsFlow:
         self, stores, menu_item_read_repo, id_generator, outbox_processor
     ):
         # Create menu item and process
-        handler = CreateMenuItemHandler(_uow(stores), id_generator)
+        handler = CreateMenuItemHandler(_uow(stores))
         await handler.handle(
             CreateMenuItemCommand(
                 menu_item_id="m-2", name="Salad", price=Decimal("7.50")
@@ -269,7 +274,7 @@ class TestCqrsFlow:
         assert len(result) == 1
 
         # Mark sold out and process
-        handler = MarkMenuItemSoldOutHandler(_uow(stores), id_generator)
+        handler = MarkMenuItemSoldOutHandler(_uow(stores))
         await handler.handle(MarkMenuItemSoldOutCommand(menu_item_id="m-2"))
         await outbox_processor.process_pending()
 
@@ -281,10 +286,10 @@ class TestOutboxRetry:
     """Tests retry and dead-lettering behavior."""
 
     async def test_failed_projection_retries(
-        self, stores, order_read_repo, menu_item_read_repo, id_generator
+        self, stores, clock, order_read_repo, menu_item_read_repo, id_generator
     ):
         # Create menu item to generate an outbox entry
-        handler = CreateMenuItemHandler(_uow(stores), id_generator)
+        handler = CreateMenuItemHandler(_uow(stores))
         await handler.handle(
             CreateMenuItemCommand(
                 menu_item_id="m-1", name="Burger", price=Decimal("9.99")
@@ -293,7 +298,7 @@ class TestOutboxRetry:
 
         # Verify outbox has a pending entry
         assert len(stores["outbox"]) == 1
-        entry = stores["outbox"][0]
+        entry = next(iter(stores["outbox"]))
         assert entry.status == OutboxEntryStatus.PENDING
 
         # Create a projector that fails
@@ -317,14 +322,14 @@ class TestOutboxRetry:
         assert entry.retry_count == 1
 
         # Simulate backoff elapsed so entry is re-fetched
-        entry._next_retry_at = datetime.now(UTC) - timedelta(seconds=1)
+        clock.advance_to(entry.next_retry_at)
 
         # Second failure
         await processor.process_pending()
         assert entry.retry_count == 2
 
         # Simulate backoff elapsed again
-        entry._next_retry_at = datetime.now(UTC) - timedelta(seconds=1)
+        clock.advance_to(entry.next_retry_at)
 
         # Third failure -> dead-lettered
         await processor.process_pending()
@@ -336,18 +341,18 @@ class TestOutboxRetry:
         assert len(entries) == 0
 
     async def test_failed_entry_recovers_on_retry(
-        self, stores, order_read_repo, menu_item_read_repo, id_generator
+        self, stores, clock, order_read_repo, menu_item_read_repo, id_generator
     ):
         """Fail → backoff blocks immediate retry → simulate time → succeed."""
         # Create menu item to generate an outbox entry
-        handler = CreateMenuItemHandler(_uow(stores), id_generator)
+        handler = CreateMenuItemHandler(_uow(stores))
         await handler.handle(
             CreateMenuItemCommand(
                 menu_item_id="m-1", name="Burger", price=Decimal("9.99")
             )
         )
 
-        entry = stores["outbox"][0]
+        entry = next(iter(stores["outbox"]))
         assert entry.status == OutboxEntryStatus.PENDING
 
         # Create a projector that fails on first call, succeeds after
@@ -384,7 +389,7 @@ class TestOutboxRetry:
         assert entry.retry_count == 1  # unchanged
 
         # Simulate time passing (backoff expired)
-        entry._next_retry_at = datetime.now(UTC) - timedelta(seconds=1)
+        clock.advance_to(entry.next_retry_at)
 
         # Retry now succeeds
         processed = await processor.process_pending()
@@ -406,7 +411,7 @@ class TestEventualConsistency:
         self, stores, order_read_repo, menu_item_read_repo, id_generator
     ):
         # Create a menu item (writes to write DB + outbox)
-        handler = CreateMenuItemHandler(_uow(stores), id_generator)
+        handler = CreateMenuItemHandler(_uow(stores))
         await handler.handle(
             CreateMenuItemCommand(
                 menu_item_id="m-1", name="Burger", price=Decimal("9.99")
@@ -423,4 +428,4 @@ class TestEventualConsistency:
 
         # Outbox has the pending event
         assert len(stores["outbox"]) == 1
-        assert stores["outbox"][0].event_type == "MenuItemCreated"
+        assert next(iter(stores["outbox"])).event_type == "MenuItemCreated"
@@ -0,0 +1,390 @@
+"""Integration tests for the SQLAlchemy write-side adapters.
+
+Run against a temporary SQLite database (aiosqlite) by default. Set
+``TABB_TEST_DATABASE_URL`` (e.g. ``postgresql+asyncpg://...``) to run the
+same tests against another database; its tables are dropped and recreated.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from tabb.adapters.config.settings import Settings
+from tabb.adapters.outbound.id_generator.uuid_generator import UuidIdGenerator
+from tabb.adapters.outbound.persistence.in_memory.order_read_model_repository import (
+    InMemoryOrderReadModelRepository,
+)
+from tabb.adapters.outbound.persistence.sqlalchemy.engine import (
+    create_engine,
+    create_tables,
+)
+from tabb.adapters.outbound.persistence.sqlalchemy.outbox_repository import (
+    SqlAlchemyOutboxRepository,
+)
+from tabb.adapters.outbound.persistence.sqlalchemy.tables import metadata
+from tabb.adapters.outbound.persistence.sqlalchemy.unit_of_work import (
+    SqlAlchemyUnitOfWork,
+)
+from tabb.adapters.outbound.projectors.order_projector import OrderProjector
+from tabb.adapters.outbound.workers.outbox_processor import InMemoryOutboxProcessor
+from tabb.application.backoff import ExponentialBackoff
+from tabb.application.commands.create_menu_item import (
+    CreateMenuItemCommand,
+    CreateMenuItemHandler,
+)
+from tabb.application.commands.place_order import PlaceOrderCommand, PlaceOrderHandler
+from tabb.application.dto.order_dtos import OrderItemRequest
+from tabb.application.exceptions import ConcurrencyConflictError
+from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+from tabb.domain.models.menu_item import MenuItem, MenuItemId
+from tabb.domain.models.order import (
+    Order,
+    OrderId,
+    OrderItemId,
+    OrderItemStatus,
+    OrderStatus,
+)
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture()
+async def engine(tmp_path):
+    url = os.environ.get(
+        "TABB_TEST_DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'tabb.db'}"
+    )
+    engine = create_engine(Settings(database_url=url))
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.drop_all)
+    await create_tables(engine)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture()
+def statements(engine):
+    """SQL statements executed on ``engine``, in order."""
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement.split(None, 1)[0].upper() + " " + statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    return executed
+
+
+def _order(order_id: str = "o-1", items: int = 3) -> Order:
+    order = Order.place(OrderId(order_id), TableNumber(1))
+    for i in range(items):
+        order.add_item(
+            OrderItemId(f"oi-{i}"),
+            MenuItemId("m-1"),
+            "Burger",
+            Money(Decimal("9.99")),
+            Quantity(1),
+        )
+    return order
+
+
+async def _save(engine, order: Order) -> None:
+    uow = SqlAlchemyUnitOfWork(engine)
+    async with uow:
+        await uow.order_repository.save(order)
+        await uow.commit()
+
+
+class TestSqlAlchemyUnitOfWork:
+    async def test_order_round_trip_loads_in_one_query(self, engine, statements):
+        await _save(engine, _order())
+        statements.clear()
+
+        uow = SqlAlchemyUnitOfWork(engine)
+        async with uow:
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+
+        assert [s for s in statements if s.startswith("SELECT")] == statements[-1:]
+        assert order.version == 1
+        assert order.table == TableNumber(1)
+        assert [str(item.id) for item in order.items] == ["oi-0", "oi-1", "oi-2"]
+        assert order.items[0].unit_price == Money(Decimal("9.99"))
+
+    async def test_outbox_rows_are_inserted_in_one_statement(self, engine, statements):
+        await _save(engine, _order())
+
+        outbox_inserts = [s for s in statements if "INSERT INTO outbox" in s]
+        assert len(outbox_inserts) == 1
+        pending = await SqlAlchemyOutboxRepository(engine).find_pending(limit=10)
+        assert [e.event_type for e in pending].count("OrderItemAdded") == 3
+        assert len(pending) == 4
+        assert all(e.occurred_at.tzinfo is not None for e in pending)
+
+    async def test_unchanged_aggregate_is_not_written(self, engine, statements):
+        await _save(engine, _order())
+        statements.clear()
+
+        uow = SqlAlchemyUnitOfWork(engine)
+        async with uow:
+            await uow.order_repository.find_by_id(OrderId("o-1"))
+            await uow.commit()
+
+        assert not [s for s in statements if s.startswith(("INSERT", "UPDATE"))]
+
+    async def test_changes_advance_version_and_replace_items(self, engine):
+        await _save(engine, _order())
+
+        uow = SqlAlchemyUnitOfWork(engine)
+        async with uow:
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+            order.cancel_item(OrderItemId("oi-1"))
+            await uow.commit()
+            assert order.version == 2
+        async with uow:
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+
+        assert order.version == 2
+        assert order.items[1].status == OrderItemStatus.CANCELLED
+
+    async def test_commuting_concurrent_changes_are_merged(self, engine):
+        await _save(engine, _order())
+        first, second = SqlAlchemyUnitOfWork(engine), SqlAlchemyUnitOfWork(engine)
+
+        async with first:
+            mine = await first.order_repository.find_by_id(OrderId("o-1"))
+            async with second:
+                theirs = await second.order_repository.find_by_id(OrderId("o-1"))
+                theirs.mark_item_ready(OrderItemId("oi-0"))
+                await second.commit()
+            mine.mark_item_ready(OrderItemId("oi-2"))
+            await first.commit()
+
+        async with first:
+            order = await first.order_repository.find_by_id(OrderId("o-1"))
+        assert order.version == 3
+        assert [item.status for item in order.items] == [
+            OrderItemStatus.READY,
+            OrderItemStatus.PENDING,
+            OrderItemStatus.READY,
+        ]
+
+    async def test_conflicting_change_raises_and_rolls_back(self, engine):
+        await _save(engine, _order())
+        first, second = SqlAlchemyUnitOfWork(engine), SqlAlchemyUnitOfWork(engine)
+
+        async with first:
+            mine = await first.order_repository.find_by_id(OrderId("o-1"))
+            async with second:
+                theirs = await second.order_repository.find_by_id(OrderId("o-1"))
+                theirs.cancel()
+                await second.commit()
+            mine.mark_item_ready(OrderItemId("oi-0"))
+            with pytest.raises(ConcurrencyConflictError):
+                await first.commit()
+
+        async with first:
+            order = await first.order_repository.find_by_id(OrderId("o-1"))
+        assert order.status == OrderStatus.CANCELLED
+        assert order.version == 2
+        assert await SqlAlchemyOutboxRepository(engine).count_pending() == 5
+
+    async def test_duplicate_insert_raises_conflict(self, engine):
+        await _save(engine, _order())
+
+        with pytest.raises(ConcurrencyConflictError):
+            await _save(engine, _order())
+
+    async def test_find_by_ids_fetches_missing_items_in_one_query(
+        self, engine, statements
+    ):
+        uow = SqlAlchemyUnitOfWork(engine)
+        async with uow:
+            for item_id in ("m-1", "m-2"):
+                await uow.menu_item_repository.save(
+                    MenuItem.create(
+                        MenuItemId(item_id), "Burger", Money(Decimal("9.99"))
+                    )
+                )
+            await uow.commit()
+        statements.clear()
+
+        async with uow:
+            items = await uow.menu_item_repository.find_by_ids(
+                [MenuItemId("m-2"), MenuItemId("m-9"), MenuItemId("m-1")]
+            )
+
+        assert [str(item.id) for item in items] == ["m-2", "m-1"]
+        assert items[0].price == Money(Decimal("9.99"))
+        assert items[0].version == 1
+        assert len([s for s in statements if s.startswith("SELECT")]) == 1
+
+    async def test_exception_rolls_back(self, engine):
+        uow = SqlAlchemyUnitOfWork(engine)
+
+        with pytest.raises(RuntimeError):
+            async with uow:
+                await uow.order_repository.save(_order())
+                raise RuntimeError("boom")
+
+        async with uow:
+            assert await uow.order_repository.find_by_id(OrderId("o-1")) is None
+
+
+class TestSqlAlchemyOutboxRepository:
+    async def test_failed_entry_is_retried_after_backoff(self, engine):
+        await _save(engine, _order(items=0))
+        now = datetime.now(UTC)
+        repo = SqlAlchemyOutboxRepository(engine, clock=lambda: now)
+        [entry] = await repo.find_pending()
+
+        await repo.mark_failed(entry.entry_id, "boom")
+
+        assert await repo.find_pending() == []
+        later = SqlAlchemyOutboxRepository(
+            engine, clock=lambda: now + timedelta(minutes=1)
+        )
+        [retried] = await later.find_pending()
+        assert retried.status == OutboxEntryStatus.FAILED
+        assert retried.retry_count == 1
+        assert retried.last_error == "boom"
+        await later.mark_processed(entry.entry_id)
+        assert await later.count_pending() == 0
+
+    async def test_failed_entry_waits_for_the_configured_backoff(self, engine):
+        await _save(engine, _order(items=0))
+        now = datetime.now(UTC)
+        repo = SqlAlchemyOutboxRepository(
+            engine, clock=lambda: now, backoff=ExponentialBackoff(base=10)
+        )
+        [entry] = await repo.find_pending()
+
+        await repo.mark_failed(entry.entry_id, "boom")
+
+        later = SqlAlchemyOutboxRepository(
+            engine, clock=lambda: now + timedelta(seconds=11)
+        )
+        [retried] = await later.find_pending()
+        assert retried.next_retry_at == now + timedelta(seconds=10)
+        assert retried.retry_delay_seconds == 10
+
+    async def test_later_entries_of_aggregate_wait_behind_failed_entry(self, engine):
+        await _save(engine, _order("o-1", items=2))
+        await _save(engine, _order("o-2", items=0))
+        now = datetime.now(UTC)
+        repo = SqlAlchemyOutboxRepository(engine, clock=lambda: now)
+        first, *rest = [e for e in await repo.find_pending() if e.aggregate_id == "o-1"]
+        assert len(rest) == 2
+
+        await repo.mark_failed(first.entry_id, "boom")
+
+        assert [e.aggregate_id for e in await repo.find_pending()] == ["o-2"]
+        later = SqlAlchemyOutboxRepository(
+            engine, clock=lambda: now + timedelta(minutes=1)
+        )
+        ready = [e.entry_id for e in await later.find_pending()]
+        assert first.entry_id in ready
+        assert not {e.entry_id for e in rest} & set(ready)
+        await later.mark_processed(first.entry_id)
+        ready = await later.find_pending()
+        assert [e.entry_id for e in ready if e.aggregate_id == "o-1"] == [
+            e.entry_id for e in rest
+        ]
+
+    async def test_entries_with_equal_timestamps_keep_insertion_order(self, engine):
+        occurred_at = datetime.now(UTC)
+        async with engine.begin() as connection:
+            repo = SqlAlchemyOutboxRepository(connection)
+            for entry_id in ("e-2", "e-1", "e-3"):
+                await repo.save(
+                    OutboxEntry(
+                        _entry_id=entry_id,
+                        _event_type="OrderItemAdded",
+                        _event_data={"order_id": "o-1"},
+                        _aggregate_id="o-1",
+                        _aggregate_type="Order",
+                        _occurred_at=occurred_at,
+                    )
+                )
+            await repo.flush()
+        repo = SqlAlchemyOutboxRepository(engine)
+
+        ready = await repo.find_pending()
+        await repo.mark_failed("e-2", "boom")
+
+        assert [e.entry_id for e in ready] == ["e-2", "e-1", "e-3"]
+        assert [e.sequence for e in ready] == [1, 2, 3]
+        assert await repo.find_pending() == []
+
+    async def test_consumers_claim_disjoint_entries(self, engine):
+        await _save(engine, _order("o-1", items=1))
+        await _save(engine, _order("o-2", items=0))
+        now = datetime.now(UTC)
+        first = SqlAlchemyOutboxRepository(engine, clock=lambda: now)
+        second = SqlAlchemyOutboxRepository(engine, clock=lambda: now)
+
+        [claimed] = await first.find_pending(limit=1)
+        taken = await second.find_pending()
+
+        assert claimed.aggregate_id == "o-1"
+        # o-1's next entry waits behind the one the first consumer holds.
+        assert [e.aggregate_id for e in taken] == ["o-2"]
+        assert await second.find_pending() == taken
+        assert await second.count_pending() == 3
+
+    async def test_expired_claim_can_be_taken_over(self, engine):
+        await _save(engine, _order(items=0))
+        now = datetime.now(UTC)
+        first = SqlAlchemyOutboxRepository(engine, clock=lambda: now)
+        [entry] = await first.find_pending()
+
+        second = SqlAlchemyOutboxRepository(
+            engine, clock=lambda: now + timedelta(seconds=31)
+        )
+        assert [e.entry_id for e in await second.find_pending()] == [entry.entry_id]
+
+    async def test_dead_lettered_entry_is_not_pending(self, engine):
+        await _save(engine, _order(items=0))
+        repo = SqlAlchemyOutboxRepository(engine)
+        [entry] = await repo.find_pending()
+
+        await repo.mark_dead_lettered(entry.entry_id)
+
+        assert await repo.count_pending() == 0
+
+    async def test_place_order_projects_through_the_processor(self, engine):
+        read_repo = InMemoryOrderReadModelRepository()
+        processor = InMemoryOutboxProcessor(
+            outbox_repository=SqlAlchemyOutboxRepository(engine),
+            projectors=[OrderProjector(read_repo)],
+        )
+
+        await CreateMenuItemHandler(SqlAlchemyUnitOfWork(engine)).handle(
+            CreateMenuItemCommand(
+                menu_item_id="m-1", name="Burger", price=Decimal("9.99")
+            )
+        )
+        await PlaceOrderHandler(SqlAlchemyUnitOfWork(engine), UuidIdGenerator()).handle(
+            PlaceOrderCommand(
+                order_id="o-1",
+                table_number=5,
+                items=[
+                    OrderItemRequest(
+                        menu_item_id="m-1",
+                        name="Burger",
+                        unit_price=Decimal("9.99"),
+                        quantity=2,
+                    )
+                ],
+            )
+        )
+        await processor.process_pending()
+
+        read_model = await read_repo.find_by_id("o-1")
+        assert read_model is not None
+        assert read_model.table_number == 5
+        assert len(read_model.items) == 1
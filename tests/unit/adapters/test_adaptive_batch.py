@@ -0,0 +1,85 @@
+"""Unit tests for AdaptiveBatchController."""
+
+from __future__ import annotations
+
+import pytest
+
+from tabb.adapters.outbound.workers.adaptive_batch import AdaptiveBatchController
+
+
+def _controller(**overrides) -> AdaptiveBatchController:
+    params = {
+        "min_batch_size": 10,
+        "max_batch_size": 80,
+        "target_batch_seconds": 0.1,
+        "min_idle_seconds": 0.5,
+        "max_idle_seconds": 4.0,
+    }
+    params.update(overrides)
+    return AdaptiveBatchController(**params)
+
+
+class TestAdaptiveBatchController:
+    def test_grows_batch_while_fast_and_backlogged(self):
+        controller = _controller()
+
+        delays = [controller.record(10, 0.01, backlog=1_000) for _ in range(5)]
+
+        assert delays == [0.0] * 5
+        assert controller.batch_size == 80  # capped at max
+
+    def test_shrinks_batch_when_over_target_latency(self):
+        controller = _controller()
+        for _ in range(3):
+            controller.record(10, 0.01, backlog=1_000)
+        assert controller.batch_size == 80
+
+        controller.record(80, 0.4, backlog=1_000)
+
+        assert controller.batch_size == 20
+
+    def test_never_shrinks_below_min(self):
+        controller = _controller()
+
+        controller.record(10, 10.0, backlog=1_000)
+
+        assert controller.batch_size == 10
+
+    def test_does_not_grow_beyond_backlog(self):
+        controller = _controller()
+
+        controller.record(10, 0.01, backlog=5)
+
+        assert controller.batch_size == 10
+
+    def test_backs_off_exponentially_when_idle(self):
+        controller = _controller()
+
+        delays = [controller.record(0, 0.0, backlog=0) for _ in range(5)]
+
+        assert delays == [0.5, 1.0, 2.0, 4.0, 4.0]
+
+    def test_progress_resets_idle_backoff(self):
+        controller = _controller()
+        for _ in range(3):
+            controller.record(0, 0.0, backlog=0)
+
+        controller.record(5, 0.01, backlog=3)
+
+        assert controller.record(0, 0.0, backlog=0) == 0.5
+
+    def test_stats_expose_batch_size_and_backlog(self):
+        controller = _controller()
+
+        controller.record(10, 0.02, backlog=500)
+        stats = controller.stats()
+
+        assert stats.batch_size == 20
+        assert stats.backlog == 500
+        assert stats.last_batch_seconds == 0.02
+
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError):
+            _controller(min_batch_size=100, max_batch_size=10)
+        with pytest.raises(ValueError):
+            _controller(min_idle_seconds=0)
@@ -0,0 +1,152 @@
+"""Unit tests for AggregateSnapshotStore and snapshotted order loads."""
+
+from __future__ import annotations
+
+import json
+import zlib
+from decimal import Decimal
+
+import pytest
+
+from tabb.adapters.outbound.persistence.event_store.aggregate_snapshots import (
+    AggregateSnapshot,
+    AggregateSnapshotStore,
+    SnapshotPolicy,
+)
+from tabb.adapters.outbound.persistence.event_store.order_repository import (
+    EventSourcedOrderRepository,
+)
+from tabb.adapters.outbound.persistence.event_store.segmented_event_store import (
+    SegmentedEventStore,
+)
+from tabb.domain.models.menu_item import MenuItemId
+from tabb.domain.models.order import (
+    Order,
+    OrderId,
+    OrderItemId,
+    OrderItemStatus,
+)
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+
+def _add(order: Order, item_id: str) -> None:
+    order.add_item(
+        OrderItemId(item_id),
+        MenuItemId("m-1"),
+        "Beer",
+        Money(Decimal("5.50")),
+        Quantity(1),
+    )
+
+
+async def _commit(
+    repo: EventSourcedOrderRepository, event_store: SegmentedEventStore
+) -> None:
+    repo.stage_changes()
+    repo.prepare_commit()
+    repo.flush()
+    await event_store.sync()
+    repo.write_snapshots()
+
+
+async def _tab(event_store, snapshots, rounds: int) -> None:
+    """Place a bar tab, then add one item per commit."""
+    repo = EventSourcedOrderRepository(event_store, snapshots=snapshots)
+    await repo.save(Order.place(OrderId("tab"), TableNumber(1)))
+    await _commit(repo, event_store)
+    for n in range(rounds):
+        order = await repo.find_by_id(OrderId("tab"))
+        assert order is not None
+        _add(order, f"oi-{n}")
+        await _commit(repo, event_store)
+
+
+class TestSnapshotPolicy:
+    def test_due_on_either_threshold(self):
+        policy = SnapshotPolicy(every_events=10, every_bytes=1000)
+
+        assert not policy.due(9, 999)
+        assert policy.due(10, 0)
+        assert policy.due(1, 1000)
+
+    def test_rejects_non_positive_thresholds(self):
+        with pytest.raises(ValueError):
+            SnapshotPolicy(every_events=0)
+
+
+class TestAggregateSnapshotStore:
+    def test_round_trips_the_latest_snapshot(self, tmp_path):
+        store = AggregateSnapshotStore(tmp_path)
+        store.save("Order", "o/1", AggregateSnapshot(3, {"a": 1}))
+        store.save("Order", "o/1", AggregateSnapshot(5, {"a": 2}))
+
+        reopened = AggregateSnapshotStore(tmp_path)
+
+        assert reopened.load("Order", "o/1") == AggregateSnapshot(5, {"a": 2})
+        assert reopened.version("Order", "o/1") == 5
+        assert reopened.version("Order", "o-2") == 0
+
+    def test_other_formats_and_corrupt_files_are_ignored(self, tmp_path):
+        store = AggregateSnapshotStore(tmp_path)
+        store.save("Order", "o-1", AggregateSnapshot(3, {}))
+        store.save("Order", "o-2", AggregateSnapshot(3, {}))
+        path = tmp_path / "Order" / "o-1.snap"
+        payload = json.dumps({"format": 999, "version": 3, "state": {}}).encode()
+
+        path.write_bytes(b"%08x %s\n" % (zlib.crc32(payload), payload))
+        (tmp_path / "Order" / "o-2.snap").write_bytes(b"00000000 {}\n")
+
+        assert store.load("Order", "o-1") is None
+        assert store.load("Order", "o-2") is None
+
+
+@pytest.mark.asyncio
+class TestSnapshottedOrderLoads:
+    async def test_snapshots_every_n_events_and_replays_the_tail(self, tmp_path):
+        event_store = SegmentedEventStore(tmp_path)
+        snapshots = AggregateSnapshotStore(
+            tmp_path / "snapshots", SnapshotPolicy(every_events=4)
+        )
+        await _tab(event_store, snapshots, rounds=10)
+
+        assert snapshots.version("Order", "tab") == 8
+        order = await EventSourcedOrderRepository(
+            event_store, snapshots=AggregateSnapshotStore(tmp_path / "snapshots")
+        ).find_by_id(OrderId("tab"))
+
+        assert order is not None
+        assert order.version == 11
+        assert [str(item.id) for item in order.items] == [f"oi-{n}" for n in range(10)]
+        assert order == await EventSourcedOrderRepository(event_store).find_by_id(
+            OrderId("tab")
+        )
+
+    async def test_snapshots_wait_for_the_events_to_be_synced(self, tmp_path):
+        event_store = SegmentedEventStore(tmp_path)
+        snapshots = AggregateSnapshotStore(
+            tmp_path / "snapshots", SnapshotPolicy(every_events=1)
+        )
+        repo = EventSourcedOrderRepository(event_store, snapshots=snapshots)
+        await repo.save(Order.place(OrderId("tab"), TableNumber(1)))
+        repo.stage_changes()
+        repo.prepare_commit()
+        repo.flush()
+
+        assert snapshots.version("Order", "tab") == 0
+        await event_store.sync()
+        repo.write_snapshots()
+        assert snapshots.version("Order", "tab") == 1
+
+    async def test_snapshot_ahead_of_the_log_is_ignored(self, tmp_path):
+        event_store = SegmentedEventStore(tmp_path)
+        snapshots = AggregateSnapshotStore(tmp_path / "snapshots")
+        await _tab(event_store, None, rounds=2)
+        snapshots.save("Order", "tab", AggregateSnapshot(9, {"bogus": True}))
+
+        order = await EventSourcedOrderRepository(
+            event_store, snapshots=snapshots
+        ).find_by_id(OrderId("tab"))
+
+        assert order is not None
+        assert len(order.items) == 2
+        assert order.items[0].status == OrderItemStatus.PENDING
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock
 
 import pytest
 
+from tabb.adapters.outbound.workers.adaptive_batch import AdaptiveBatchController
 from tabb.adapters.outbound.workers.background_outbox_worker import AsyncOutboxWorker
+from tabb.adapters.outbound.workers.outbox_wakeup import AsyncioOutboxWakeup
 
 pytestmark = pytest.mark.asyncio
 
@@ -62,3 +65,92 @@ class TestAsyncOutboxWorker:
 
         # Worker kept polling despite exceptions
         assert processor.process_pending.call_count >= 2
+
+    async def test_runs_retention_after_each_poll(self):
+        processor = _make_processor()
+        retention = AsyncMock()
+        retention.compact = AsyncMock(return_value=0)
+        worker = AsyncOutboxWorker(
+            processor=processor, interval_seconds=0.05, retention=retention
+        )
+
+        await worker.start()
+        await asyncio.sleep(0.15)
+        await worker.stop()
+
+        assert retention.compact.await_count >= 2
+
+    async def test_poll_survives_retention_exception(self):
+        processor = _make_processor()
+        retention = AsyncMock()
+        retention.compact = AsyncMock(side_effect=RuntimeError("boom"))
+        worker = AsyncOutboxWorker(
+            processor=processor, interval_seconds=0.05, retention=retention
+        )
+
+        await worker.start()
+        await asyncio.sleep(0.15)
+        await worker.stop()
+
+        assert processor.process_pending.call_count >= 2
+
+    async def test_wakeup_triggers_poll_before_interval(self):
+        processor = _make_processor()
+        wakeup = AsyncioOutboxWakeup()
+        worker = AsyncOutboxWorker(
+            processor=processor, interval_seconds=10, wakeup=wakeup
+        )
+
+        await worker.start()
+        await asyncio.sleep(0.01)
+        assert processor.process_pending.call_count == 1
+
+        wakeup.notify()
+        await asyncio.sleep(0.01)
+        await worker.stop()
+
+        assert processor.process_pending.call_count == 2
+
+    async def test_drains_backlog_without_waiting(self):
+        processor = _make_processor()
+        processor.process_pending = AsyncMock(side_effect=[10, 10, 3, 0])
+        worker = AsyncOutboxWorker(processor=processor, interval_seconds=10)
+
+        await worker.start()
+        await asyncio.sleep(0.01)
+        await worker.stop()
+
+        assert processor.process_pending.call_count == 4
+
+    async def test_controller_sets_batch_limit_and_tracks_backlog(self):
+        processor = _make_processor()
+        processor.process_pending = AsyncMock(side_effect=[10, 20, 0, 0])
+        processor.backlog = AsyncMock(side_effect=[500, 480, 0, 0])
+        controller = AdaptiveBatchController(
+            min_batch_size=10,
+            max_batch_size=100,
+            min_idle_seconds=10,
+            max_idle_seconds=10,
+        )
+        worker = AsyncOutboxWorker(processor=processor, controller=controller)
+
+        await worker.start()
+        await asyncio.sleep(0.01)
+        await worker.stop()
+
+        limits = [c.args[0] for c in processor.process_pending.call_args_list]
+        assert limits == [10, 20, 40]
+        assert controller.backlog == 0
+
+    async def test_wakes_up_for_the_next_retry(self):
+        processor = _make_processor()
+        due = datetime.now(UTC) + timedelta(seconds=0.02)
+        worker = AsyncOutboxWorker(
+            processor=processor, interval_seconds=10, next_retry_at=lambda: due
+        )
+
+        await worker.start()
+        await asyncio.sleep(0.1)
+        await worker.stop()
+
+        assert processor.process_pending.call_count >= 2
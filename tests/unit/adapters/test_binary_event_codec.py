@@ -0,0 +1,73 @@
+"""Unit tests for the binary event codec."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+import pytest
+
+from tabb.adapters.outbound.persistence.event_store.binary_codec import (
+    BINARY_FORMAT,
+    decode_binary,
+    encode_binary,
+)
+from tabb.domain.events.base import DomainEvent
+from tabb.domain.events.events import (
+    MenuItemCreated,
+    OrderCompleted,
+    OrderItemAdded,
+    OrderPlaced,
+)
+
+EVENTS: list[DomainEvent] = [
+    OrderPlaced(order_id="o-1", table_number=4),
+    OrderItemAdded(
+        order_id="o-1",
+        order_item_id="oi-1",
+        menu_item_id="m-1",
+        name="Burger",
+        unit_price="9.99",
+        quantity=-2,
+    ),
+    OrderCompleted(order_id=""),
+]
+
+
+class TestBinaryEventCodec:
+    @pytest.mark.parametrize("event", EVENTS, ids=lambda e: e.event_name)
+    def test_round_trips(self, event: DomainEvent) -> None:
+        assert decode_binary(encode_binary(event)) == event
+
+    def test_record_starts_with_format_and_type_name(self) -> None:
+        record = encode_binary(OrderPlaced(order_id="o-1", table_number=4))
+
+        assert record[0] == BINARY_FORMAT
+        assert record[2 : 2 + record[1]] == b"OrderPlaced"
+
+    def test_non_ascii_text_round_trips(self) -> None:
+        event = MenuItemCreated(menu_item_id="m-1", name="Crème brûlée", price="7.5")
+
+        assert decode_binary(encode_binary(event)) == event
+
+    def test_other_format_is_rejected(self) -> None:
+        record = bytearray(encode_binary(OrderPlaced(order_id="o-1", table_number=4)))
+        record[0] = BINARY_FORMAT + 1
+
+        with pytest.raises(ValueError, match="Unsupported binary event format"):
+            decode_binary(bytes(record))
+
+    def test_trailing_bytes_are_rejected(self) -> None:
+        record = encode_binary(OrderPlaced(order_id="o-1", table_number=4))
+
+        with pytest.raises(ValueError, match="trailing bytes"):
+            decode_binary(record + b"x")
+
+    def test_unsupported_field_type_is_rejected(self) -> None:
+        @dataclass(frozen=True, kw_only=True)
+        class TipAdded(DomainEvent):
+            order_id: str
+            amount: Decimal
+
+        with pytest.raises(TypeError, match="TipAdded.amount"):
+            encode_binary(TipAdded(order_id="o-1", amount=Decimal("2.00")))
@@ -0,0 +1,42 @@
+"""Unit tests for EncodedRecords."""
+
+from __future__ import annotations
+
+from tabb.adapters.outbound.persistence.in_memory.encoded_records import (
+    EncodedRecords,
+)
+
+
+class TestEncodedRecords:
+    def test_decodes_each_value_once_on_first_read(self):
+        decoded: list[bytes] = []
+
+        def decode(data: bytes) -> str:
+            decoded.append(data)
+            return data.decode()
+
+        records = EncodedRecords(decode, {"a": b"x", "b": b"y"})
+
+        assert records["a"] == "x"
+        assert records["a"] == "x"
+        assert decoded == [b"x"]
+        assert "b" in records
+        assert len(records) == 2
+
+    def test_encoded_passes_undecoded_values_through(self):
+        records = EncodedRecords(bytes.decode, {"a": b"x", "b": b"y"})
+        records["b"]
+        records["c"] = "z"
+
+        encoded = records.encoded(lambda value: value.upper().encode())
+
+        assert encoded == {"a": b"x", "b": b"Y", "c": b"Z"}
+
+    def test_copy_is_independent(self):
+        records = EncodedRecords(bytes.decode, {"a": b"x"})
+
+        clone = records.copy()
+        del records["a"]
+
+        assert clone["a"] == "x"
+        assert "a" not in records
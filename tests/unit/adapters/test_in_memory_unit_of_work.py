@@ -0,0 +1,401 @@
+"""Unit tests for InMemoryUnitOfWork."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.unit_of_work import (
+    InMemoryUnitOfWork,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.application.exceptions import ConcurrencyConflictError
+from tabb.application.outbox import OutboxEntry
+from tabb.domain.models.menu_item import MenuItem, MenuItemId
+from tabb.domain.models.order import (
+    Order,
+    OrderId,
+    OrderItemId,
+    OrderItemStatus,
+    OrderStatus,
+)
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+pytestmark = pytest.mark.asyncio
+
+
+def _menu_item(item_id: str = "m-1") -> MenuItem:
+    return MenuItem.create(MenuItemId(item_id), "Burger", Money(Decimal("9.99")))
+
+
+def _uow(notifier=None) -> InMemoryUnitOfWork:
+    return InMemoryUnitOfWork(
+        order_store=InMemoryVersionedStore(),
+        menu_item_store=InMemoryVersionedStore(),
+        outbox_store=InMemoryOutboxStore(),
+        notifier=notifier,
+    )
+
+
+def _order(order_id: str = "o-1") -> Order:
+    order = Order.place(OrderId(order_id), TableNumber(1))
+    for i in range(3):
+        order.add_item(
+            OrderItemId(f"oi-{i}"),
+            MenuItemId("m-1"),
+            "Burger",
+            Money(Decimal("9.99")),
+            Quantity(1),
+        )
+    order.collect_events()
+    return order
+
+
+class TestInMemoryUnitOfWorkIsolation:
+    async def test_uncommitted_changes_stay_private(self):
+        order_store = InMemoryVersionedStore({"o-1": _order()})
+        outbox_store = InMemoryOutboxStore()
+        writer = InMemoryUnitOfWork(order_store, InMemoryVersionedStore(), outbox_store)
+        reader = InMemoryUnitOfWork(order_store, InMemoryVersionedStore(), outbox_store)
+
+        async with writer:
+            order = await writer.order_repository.find_by_id(OrderId("o-1"))
+            order.mark_item_ready(OrderItemId("oi-0"))
+            await writer.order_repository.save(order)
+
+            async with reader:
+                seen = await reader.order_repository.find_by_id(OrderId("o-1"))
+            assert seen.items[0].status == OrderItemStatus.PENDING
+
+            await writer.rollback()
+
+        assert order_store["o-1"].items[0].status == OrderItemStatus.PENDING
+
+    async def test_commit_shares_unchanged_items(self):
+        committed = _order()
+        order_store = InMemoryVersionedStore({"o-1": committed})
+        uow = InMemoryUnitOfWork(
+            order_store, InMemoryVersionedStore(), InMemoryOutboxStore()
+        )
+
+        async with uow:
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+            order.mark_item_ready(OrderItemId("oi-0"))
+            await uow.order_repository.save(order)
+            # tracked aggregates are staged at commit, not at save
+            order.cancel_item(OrderItemId("oi-1"))
+            await uow.commit()
+
+        stored = order_store["o-1"].items
+        assert stored[0].status == OrderItemStatus.READY
+        assert stored[1].status == OrderItemStatus.CANCELLED
+        assert stored[2] is committed.items[2]
+        assert committed.items[0].status == OrderItemStatus.PENDING
+
+
+class TestInMemoryUnitOfWorkSnapshot:
+    async def test_reads_ignore_commits_made_after_entry(self):
+        menu_item_store = InMemoryVersionedStore(
+            {"m-1": _menu_item("m-1"), "m-2": _menu_item("m-2")}
+        )
+        outbox_store = InMemoryOutboxStore()
+        reader = InMemoryUnitOfWork(
+            InMemoryVersionedStore(), menu_item_store, outbox_store
+        )
+        writer = InMemoryUnitOfWork(
+            InMemoryVersionedStore(), menu_item_store, outbox_store
+        )
+
+        async with reader:
+            first = await reader.menu_item_repository.find_by_id(MenuItemId("m-1"))
+            async with writer:
+                item = await writer.menu_item_repository.find_by_id(MenuItemId("m-2"))
+                item.mark_sold_out()
+                await writer.commit()
+            second = await reader.menu_item_repository.find_by_id(MenuItemId("m-2"))
+
+        assert first.available and second.available
+        assert menu_item_store["m-2"].available is False
+
+    async def test_exit_releases_pinned_versions(self):
+        order_store = InMemoryVersionedStore({"o-1": _order()})
+        menu_item_store: InMemoryVersionedStore[MenuItem] = InMemoryVersionedStore()
+        uow = InMemoryUnitOfWork(order_store, menu_item_store, InMemoryOutboxStore())
+
+        async with uow:
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+            order.mark_item_ready(OrderItemId("oi-0"))
+            await uow.commit()
+            assert order_store.live_versions == [1]
+
+        assert order_store.live_versions == [1]
+        assert menu_item_store.live_versions == [0]
+
+
+class TestInMemoryUnitOfWorkTracking:
+    async def test_repeated_loads_return_same_instance(self):
+        uow = InMemoryUnitOfWork(
+            InMemoryVersionedStore({"o-1": _order()}),
+            InMemoryVersionedStore(),
+            InMemoryOutboxStore(),
+        )
+
+        async with uow:
+            first = await uow.order_repository.find_by_id(OrderId("o-1"))
+            second = await uow.order_repository.find_by_id(OrderId("o-1"))
+
+        assert first is second
+
+    async def test_unchanged_aggregates_are_not_written(self):
+        committed = _order()
+        order_store = InMemoryVersionedStore({"o-1": committed})
+        uow = InMemoryUnitOfWork(
+            order_store, InMemoryVersionedStore(), InMemoryOutboxStore()
+        )
+
+        async with uow:
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+            await uow.order_repository.save(order)
+            await uow.commit()
+
+        assert order_store["o-1"] is committed
+        assert committed.version == 0
+
+    async def test_commit_writes_recorded_events_to_outbox(self):
+        outbox_store = InMemoryOutboxStore()
+        ids = iter(["e-1", "e-2"])
+        id_generator = MagicMock()
+        id_generator.generate.side_effect = lambda: next(ids)
+        uow = InMemoryUnitOfWork(
+            InMemoryVersionedStore({"o-1": _order()}),
+            InMemoryVersionedStore(),
+            outbox_store,
+            id_generator=id_generator,
+        )
+
+        async with uow:
+            # loaded but never saved: still tracked
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+            order.mark_item_ready(OrderItemId("oi-0"))
+            order.mark_item_ready(OrderItemId("oi-1"))
+            await uow.commit()
+
+        entries = list(outbox_store)
+        assert [e.entry_id for e in entries] == ["e-1", "e-2"]
+        assert {e.event_type for e in entries} == {"DishMarkedReady"}
+        assert {(e.aggregate_type, e.aggregate_id) for e in entries} == {
+            ("Order", "o-1")
+        }
+        assert order.collect_events() == []
+
+    async def test_second_commit_in_same_unit_of_work(self):
+        order_store = InMemoryVersionedStore({"o-1": _order()})
+        uow = InMemoryUnitOfWork(
+            order_store, InMemoryVersionedStore(), InMemoryOutboxStore()
+        )
+
+        async with uow:
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+            order.mark_item_ready(OrderItemId("oi-0"))
+            await uow.commit()
+            order.mark_item_ready(OrderItemId("oi-1"))
+            await uow.commit()
+
+        assert order_store["o-1"].version == 2
+        assert order_store["o-1"].items[1].status == OrderItemStatus.READY
+
+
+class TestInMemoryUnitOfWorkVersions:
+    async def test_commit_advances_version(self):
+        order_store = InMemoryVersionedStore()
+        uow = InMemoryUnitOfWork(
+            order_store, InMemoryVersionedStore(), InMemoryOutboxStore()
+        )
+
+        async with uow:
+            await uow.order_repository.save(_order())
+            await uow.commit()
+        async with uow:
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+            order.mark_item_ready(OrderItemId("oi-0"))
+            await uow.order_repository.save(order)
+            await uow.commit()
+
+        assert order_store["o-1"].version == 2
+
+    async def test_conflicting_commit_raises_and_writes_nothing(self):
+        order_store = InMemoryVersionedStore({"o-1": _order()})
+        menu_item_store = InMemoryVersionedStore()
+        outbox_store = InMemoryOutboxStore()
+        first = InMemoryUnitOfWork(order_store, menu_item_store, outbox_store)
+        second = InMemoryUnitOfWork(order_store, menu_item_store, outbox_store)
+
+        async with first, second:
+            a = await first.order_repository.find_by_id(OrderId("o-1"))
+            b = await second.order_repository.find_by_id(OrderId("o-1"))
+            a.cancel()
+            b.mark_item_ready(OrderItemId("oi-1"))
+            await first.order_repository.save(a)
+            await second.order_repository.save(b)
+            await second.menu_item_repository.save(_menu_item())
+
+            await first.commit()
+            with pytest.raises(ConcurrencyConflictError):
+                await second.commit()
+
+        order = order_store["o-1"]
+        assert order.status == OrderStatus.CANCELLED
+        assert order.items[1].status == OrderItemStatus.CANCELLED
+        assert menu_item_store == {}
+
+    async def test_concurrent_insert_conflicts(self):
+        order_store = InMemoryVersionedStore()
+        outbox_store = InMemoryOutboxStore()
+        first = InMemoryUnitOfWork(order_store, InMemoryVersionedStore(), outbox_store)
+        second = InMemoryUnitOfWork(order_store, InMemoryVersionedStore(), outbox_store)
+
+        async with first, second:
+            await first.order_repository.save(_order())
+            await second.order_repository.save(_order())
+            await first.commit()
+            with pytest.raises(ConcurrencyConflictError):
+                await second.commit()
+
+
+class TestInMemoryUnitOfWorkMerge:
+    async def _race(self, order_store, first_change, second_change):
+        outbox_store = InMemoryOutboxStore()
+        first = InMemoryUnitOfWork(order_store, InMemoryVersionedStore(), outbox_store)
+        second = InMemoryUnitOfWork(order_store, InMemoryVersionedStore(), outbox_store)
+        async with first, second:
+            a = await first.order_repository.find_by_id(OrderId("o-1"))
+            b = await second.order_repository.find_by_id(OrderId("o-1"))
+            first_change(a)
+            second_change(b)
+            await first.order_repository.save(a)
+            await second.order_repository.save(b)
+            await first.commit()
+            await second.commit()
+
+    async def test_status_changes_on_different_items_merge(self):
+        order_store = InMemoryVersionedStore({"o-1": _order()})
+
+        await self._race(
+            order_store,
+            lambda o: o.mark_item_ready(OrderItemId("oi-0")),
+            lambda o: o.cancel_item(OrderItemId("oi-1")),
+        )
+
+        order = order_store["o-1"]
+        assert [i.status for i in order.items] == [
+            OrderItemStatus.READY,
+            OrderItemStatus.CANCELLED,
+            OrderItemStatus.PENDING,
+        ]
+        assert order.version == 2
+
+    async def test_concurrent_adds_merge(self):
+        order_store = InMemoryVersionedStore({"o-1": _order()})
+
+        def add(item_id):
+            return lambda o: o.add_item(
+                OrderItemId(item_id),
+                MenuItemId("m-1"),
+                "Burger",
+                Money(Decimal("9.99")),
+                Quantity(1),
+            )
+
+        await self._race(order_store, add("oi-a"), add("oi-b"))
+
+        ids = [str(i.id) for i in order_store["o-1"].items]
+        assert ids == ["oi-0", "oi-1", "oi-2", "oi-a", "oi-b"]
+
+    async def test_same_item_changed_differently_conflicts(self):
+        order_store = InMemoryVersionedStore({"o-1": _order()})
+
+        with pytest.raises(ConcurrencyConflictError):
+            await self._race(
+                order_store,
+                lambda o: o.mark_item_ready(OrderItemId("oi-0")),
+                lambda o: o.cancel_item(OrderItemId("oi-0")),
+            )
+
+        assert order_store["o-1"].items[0].status == OrderItemStatus.READY
+
+    async def test_complete_racing_with_cancel_conflicts(self):
+        order = _order()
+        for i in range(3):
+            order.mark_item_ready(OrderItemId(f"oi-{i}"))
+        order_store = InMemoryVersionedStore({"o-1": order})
+
+        with pytest.raises(ConcurrencyConflictError):
+            await self._race(order_store, Order.complete, Order.cancel)
+
+        assert order_store["o-1"].status == OrderStatus.COMPLETED
+
+    async def test_merge_that_cancels_every_item_conflicts(self):
+        order = Order.place(OrderId("o-1"), TableNumber(1))
+        for i in range(2):
+            order.add_item(
+                OrderItemId(f"oi-{i}"),
+                MenuItemId("m-1"),
+                "Burger",
+                Money(Decimal("9.99")),
+                Quantity(1),
+            )
+        order_store = InMemoryVersionedStore({"o-1": order})
+
+        with pytest.raises(ConcurrencyConflictError):
+            await self._race(
+                order_store,
+                lambda o: o.cancel_item(OrderItemId("oi-0")),
+                lambda o: o.cancel_item(OrderItemId("oi-1")),
+            )
+
+
+class TestInMemoryUnitOfWorkNotifier:
+    async def test_commit_with_outbox_entries_notifies(self):
+        notifier = MagicMock()
+        uow = _uow(notifier)
+        item = _menu_item()
+
+        async with uow:
+            await uow.menu_item_repository.save(item)
+            await uow.commit()
+
+        notifier.notify.assert_called_once()
+
+    async def test_commit_without_outbox_entries_does_not_notify(self):
+        notifier = MagicMock()
+        uow = _uow(notifier)
+
+        item = _menu_item()
+        item.collect_events()
+
+        async with uow:
+            await uow.menu_item_repository.save(item)
+            await uow.commit()
+
+        notifier.notify.assert_not_called()
+
+    async def test_rollback_does_not_notify(self):
+        notifier = MagicMock()
+        uow = _uow(notifier)
+        item = _menu_item()
+
+        async with uow:
+            for event in item.collect_events():
+                await uow.outbox_repository.save(
+                    OutboxEntry.create("e-1", event, "m-1", "MenuItem")
+                )
+            await uow.rollback()
+
+        notifier.notify.assert_not_called()
@@ -0,0 +1,49 @@
+"""Unit tests for InMemoryMenuItemRepository."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.menu_item_repository import (
+    InMemoryMenuItemRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.domain.models.menu_item import MenuItem, MenuItemId
+from tabb.domain.models.value_objects import Money
+
+pytestmark = pytest.mark.asyncio
+
+
+def _menu_item(item_id: str, name: str = "Burger") -> MenuItem:
+    return MenuItem.create(MenuItemId(item_id), name, Money(Decimal("9.99")))
+
+
+class TestFindByIds:
+    async def test_returns_found_items_once_each(self):
+        store = InMemoryVersionedStore(
+            {"m-1": _menu_item("m-1"), "m-2": _menu_item("m-2", "Fries")}
+        )
+        repo = InMemoryMenuItemRepository(store)
+
+        found = await repo.find_by_ids(
+            [MenuItemId("m-2"), MenuItemId("missing"), MenuItemId("m-2")]
+        )
+
+        assert [str(item.id) for item in found] == ["m-2"]
+        assert found[0] is not store["m-2"]
+
+    async def test_prefers_staged_writes(self):
+        repo = InMemoryMenuItemRepository(
+            InMemoryVersionedStore({"m-1": _menu_item("m-1")})
+        )
+        staged = _menu_item("m-1")
+        staged.mark_sold_out()
+        await repo.save(staged)
+
+        (found,) = await repo.find_by_ids([MenuItemId("m-1")])
+
+        assert found.available is False
@@ -0,0 +1,115 @@
+"""Unit tests for OrderProjector batch projection."""
+
+from __future__ import annotations
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.order_read_model_repository import (
+    InMemoryOrderReadModelRepository,
+)
+from tabb.adapters.outbound.projectors.order_projector import OrderProjector
+from tabb.application.read_models.order_read_model import OrderReadModel
+
+pytestmark = pytest.mark.asyncio
+
+
+class _CountingRepository(InMemoryOrderReadModelRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.loads = 0
+        self.saves = 0
+
+    async def find_by_id(self, order_id: str) -> OrderReadModel | None:
+        self.loads += 1
+        return await super().find_by_id(order_id)
+
+    async def save(self, read_model: OrderReadModel) -> None:
+        self.saves += 1
+        await super().save(read_model)
+
+
+def _item_added(order_id: str, order_item_id: str) -> tuple[str, dict[str, object]]:
+    return (
+        "OrderItemAdded",
+        {
+            "order_id": order_id,
+            "order_item_id": order_item_id,
+            "menu_item_id": "m-1",
+            "name": "Burger",
+            "unit_price": "9.99",
+            "quantity": 2,
+        },
+    )
+
+
+class TestOrderProjectorBatch:
+    async def test_batch_loads_and_saves_each_order_once(self):
+        repo = _CountingRepository()
+        projector = OrderProjector(repo)
+
+        await projector.project_batch(
+            [
+                ("OrderPlaced", {"order_id": "o-1", "table_number": 1}),
+                _item_added("o-1", "oi-1"),
+                ("OrderPlaced", {"order_id": "o-2", "table_number": 2}),
+                _item_added("o-1", "oi-2"),
+                ("DishMarkedReady", {"order_id": "o-1", "order_item_id": "oi-1"}),
+                _item_added("o-2", "oi-3"),
+            ]
+        )
+
+        assert repo.loads == 2
+        assert repo.saves == 2
+        order = await repo.find_by_id("o-1")
+        assert order is not None
+        assert [i.status for i in order.items] == ["ready", "pending"]
+
+    async def test_batch_without_changes_saves_nothing(self):
+        repo = _CountingRepository()
+        projector = OrderProjector(repo)
+        await projector.project("OrderPlaced", {"order_id": "o-1", "table_number": 1})
+        repo.saves = 0
+
+        await projector.project_batch(
+            [
+                ("OrderPlaced", {"order_id": "o-1", "table_number": 1}),
+                ("DishMarkedReady", {"order_id": "o-1", "order_item_id": "nope"}),
+            ]
+        )
+
+        assert repo.saves == 0
+
+    async def test_replayed_batch_is_idempotent(self):
+        repo = _CountingRepository()
+        projector = OrderProjector(repo)
+        events = [
+            ("OrderPlaced", {"order_id": "o-1", "table_number": 1}),
+            _item_added("o-1", "oi-1"),
+        ]
+
+        await projector.project_batch(events)
+        await projector.project_batch(events)
+
+        order = await repo.find_by_id("o-1")
+        assert order is not None
+        assert len(order.items) == 1
+
+    async def test_projection_leaves_earlier_versions_untouched(self):
+        repo = _CountingRepository()
+        projector = OrderProjector(repo)
+        await projector.project_batch(
+            [
+                ("OrderPlaced", {"order_id": "o-1", "table_number": 1}),
+                _item_added("o-1", "oi-1"),
+            ]
+        )
+        before = await repo.find_by_id("o-1")
+
+        await projector.project(
+            "DishMarkedReady", {"order_id": "o-1", "order_item_id": "oi-1"}
+        )
+
+        after = await repo.find_by_id("o-1")
+        assert before is not None and after is not None
+        assert before.items[0].status == "pending"
+        assert after.items[0].status == "ready"
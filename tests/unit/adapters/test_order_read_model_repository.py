@@ -0,0 +1,66 @@
+"""Unit tests for InMemoryOrderReadModelRepository secondary indexes."""
+
+from __future__ import annotations
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.order_read_model_repository import (
+    InMemoryOrderReadModelRepository,
+)
+from tabb.application.read_models.order_read_model import OrderReadModel
+
+pytestmark = pytest.mark.asyncio
+
+
+def _order(order_id: str, table_number: int, status: str = "open") -> OrderReadModel:
+    return OrderReadModel(order_id=order_id, table_number=table_number, status=status)
+
+
+def _ids(read_models: list[OrderReadModel]) -> list[str]:
+    return [rm.order_id for rm in read_models]
+
+
+class TestOrderReadModelIndexes:
+    async def test_find_by_table_and_status(self):
+        repo = InMemoryOrderReadModelRepository()
+        await repo.save(_order("o-1", 12))
+        await repo.save(_order("o-2", 7))
+        await repo.save(_order("o-3", 12, status="completed"))
+
+        assert _ids(await repo.find_by_table(12)) == ["o-1", "o-3"]
+        assert _ids(await repo.find_by_table(12, "open")) == ["o-1"]
+        assert _ids(await repo.find_by_status("open")) == ["o-1", "o-2"]
+        assert await repo.find_by_table(99) == []
+
+    async def test_save_moves_order_between_status_buckets(self):
+        repo = InMemoryOrderReadModelRepository()
+        await repo.save(_order("o-1", 12))
+
+        await repo.save(_order("o-1", 12, status="completed"))
+
+        assert await repo.find_by_status("open") == []
+        assert _ids(await repo.find_by_status("completed")) == ["o-1"]
+        assert await repo.find_by_table(12, "open") == []
+        assert _ids(await repo.find_by_table(12)) == ["o-1"]
+
+    async def test_lookup_returns_latest_version(self):
+        repo = InMemoryOrderReadModelRepository()
+        await repo.save(_order("o-1", 12))
+        updated = _order("o-1", 12)
+
+        await repo.save(updated)
+
+        assert (await repo.find_by_table(12))[0] is updated
+
+    async def test_delete_removes_from_indexes(self):
+        repo = InMemoryOrderReadModelRepository()
+        await repo.save(_order("o-1", 12))
+
+        await repo.delete("o-1")
+        await repo.delete("o-1")
+
+        assert await repo.find_by_table(12) == []
+        assert await repo.find_by_status("open") == []
+        assert repo._by_table == {}
+        assert repo._by_status == {}
+        assert repo._by_table_status == {}
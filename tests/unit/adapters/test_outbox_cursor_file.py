@@ -0,0 +1,20 @@
+"""Unit tests for OutboxCursorFile."""
+
+from __future__ import annotations
+
+from tabb.adapters.outbound.workers.outbox_stream import OutboxCursorFile
+
+
+class TestOutboxCursorFile:
+    def test_missing_file_reads_as_start(self, tmp_path):
+        assert OutboxCursorFile(tmp_path / "cursor").load() == 0
+
+    def test_unreadable_file_reads_as_start(self, tmp_path):
+        (tmp_path / "cursor").write_text("not a number")
+
+        assert OutboxCursorFile(tmp_path / "cursor").load() == 0
+
+    def test_save_and_load(self, tmp_path):
+        OutboxCursorFile(tmp_path / "cursor").save(42)
+
+        assert OutboxCursorFile(tmp_path / "cursor").load() == 42
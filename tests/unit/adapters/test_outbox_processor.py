@@ -0,0 +1,170 @@
+"""Unit tests for InMemoryOutboxProcessor."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_repository import (
+    InMemoryOutboxRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.workers.outbox_processor import InMemoryOutboxProcessor
+from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+
+pytestmark = pytest.mark.asyncio
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _entry(entry_id: str, aggregate_id: str, offset_seconds: int) -> OutboxEntry:
+    return OutboxEntry(
+        _entry_id=entry_id,
+        _event_type="DishMarkedReady",
+        _event_data={"order_id": aggregate_id, "order_item_id": entry_id},
+        _aggregate_id=aggregate_id,
+        _aggregate_type="Order",
+        _occurred_at=_EPOCH + timedelta(seconds=offset_seconds),
+    )
+
+
+class _RecordingProjector:
+    """Records projected item ids; fails once for ids in ``fail_once``."""
+
+    def __init__(self, delay: float = 0.0, fail_once: set[str] | None = None):
+        self.delay = delay
+        self.fail_once = set(fail_once or ())
+        self.projected: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def handles(self):
+        return ["DishMarkedReady"]
+
+    async def project(self, event_type, event_data):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            item_id = str(event_data["order_item_id"])
+            if item_id in self.fail_once:
+                self.fail_once.discard(item_id)
+                raise RuntimeError("Simulated failure")
+            self.projected.append(item_id)
+        finally:
+            self.in_flight -= 1
+
+
+class _BatchProjector(_RecordingProjector):
+    """Records batches; a batch containing a ``fail_once`` id fails whole."""
+
+    def __init__(self, fail_once: set[str] | None = None):
+        super().__init__(fail_once=fail_once)
+        self.batches: list[list[str]] = []
+
+    async def project_batch(self, events):
+        item_ids = [str(data["order_item_id"]) for _, data in events]
+        if self.fail_once & set(item_ids):
+            raise RuntimeError("Simulated batch failure")
+        self.batches.append(item_ids)
+
+
+class TestInMemoryOutboxProcessor:
+    async def test_lanes_project_aggregates_concurrently(self):
+        store = InMemoryOutboxStore()
+        for i in range(8):
+            store.add(_entry(f"e-{i}", f"o-{i}", offset_seconds=i))
+        projector = _RecordingProjector(delay=0.01)
+        processor = InMemoryOutboxProcessor(
+            outbox_repository=InMemoryOutboxRepository(store),
+            projectors=[projector],
+            lanes=4,
+        )
+
+        processed = await processor.process_pending()
+
+        assert processed == 8
+        assert projector.max_in_flight > 1
+
+    async def test_single_lane_projects_sequentially(self):
+        store = InMemoryOutboxStore()
+        for i in range(4):
+            store.add(_entry(f"e-{i}", f"o-{i}", offset_seconds=i))
+        projector = _RecordingProjector(delay=0.001)
+        processor = InMemoryOutboxProcessor(
+            outbox_repository=InMemoryOutboxRepository(store),
+            projectors=[projector],
+        )
+
+        await processor.process_pending()
+
+        assert projector.max_in_flight == 1
+        assert projector.projected == ["e-0", "e-1", "e-2", "e-3"]
+
+    async def test_aggregate_order_survives_retry(self, clock):
+        store = InMemoryOutboxStore(clock=clock)
+        store.add(_entry("a-1", "o-1", offset_seconds=1))
+        store.add(_entry("a-2", "o-1", offset_seconds=2))
+        store.add(_entry("b-1", "o-2", offset_seconds=3))
+        projector = _RecordingProjector(fail_once={"a-1"})
+        processor = InMemoryOutboxProcessor(
+            outbox_repository=InMemoryOutboxRepository(store),
+            projectors=[projector],
+            lanes=2,
+        )
+
+        assert await processor.process_pending() == 1
+        assert projector.projected == ["b-1"]
+        assert store.get("a-2").status == OutboxEntryStatus.PENDING
+
+        # a-2 stays parked while a-1 waits for its retry
+        assert await processor.process_pending() == 0
+
+        clock.now += timedelta(seconds=10)
+        await processor.process_pending()
+        await processor.process_pending()
+
+        assert projector.projected == ["b-1", "a-1", "a-2"]
+
+    async def test_rejects_non_positive_lane_count(self):
+        with pytest.raises(ValueError):
+            InMemoryOutboxProcessor(
+                outbox_repository=InMemoryOutboxRepository(InMemoryOutboxStore()),
+                projectors=[],
+                lanes=0,
+            )
+
+    async def test_uses_project_batch_when_available(self):
+        store = InMemoryOutboxStore()
+        for i in range(4):
+            store.add(_entry(f"e-{i}", "o-1", offset_seconds=i))
+        projector = _BatchProjector()
+        processor = InMemoryOutboxProcessor(
+            outbox_repository=InMemoryOutboxRepository(store),
+            projectors=[projector],
+        )
+
+        assert await processor.process_pending() == 4
+        assert projector.batches == [["e-0", "e-1", "e-2", "e-3"]]
+        assert projector.projected == []
+
+    async def test_failed_batch_replays_entries_one_by_one(self):
+        store = InMemoryOutboxStore()
+        store.add(_entry("a-1", "o-1", offset_seconds=1))
+        store.add(_entry("a-2", "o-1", offset_seconds=2))
+        store.add(_entry("b-1", "o-2", offset_seconds=3))
+        projector = _BatchProjector(fail_once={"a-2"})
+        processor = InMemoryOutboxProcessor(
+            outbox_repository=InMemoryOutboxRepository(store),
+            projectors=[projector],
+        )
+
+        assert await processor.process_pending() == 2
+        assert projector.projected == ["a-1", "b-1"]
+        assert store.get("a-1").status == OutboxEntryStatus.PROCESSED
+        assert store.get("a-2").status == OutboxEntryStatus.FAILED
+        assert store.get("b-1").status == OutboxEntryStatus.PROCESSED
@@ -0,0 +1,109 @@
+"""Unit tests for InMemoryOutboxRetention."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_retention import (
+    InMemoryOutboxRetention,
+)
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+
+pytestmark = pytest.mark.asyncio
+
+
+def _entry(entry_id: str) -> OutboxEntry:
+    return OutboxEntry(
+        _entry_id=entry_id,
+        _event_type="MenuItemSoldOut",
+        _event_data={"menu_item_id": "m-1"},
+        _aggregate_id="m-1",
+        _aggregate_type="MenuItem",
+        _occurred_at=datetime.now(UTC),
+    )
+
+
+def _store_with_processed(count: int, pending: int = 0) -> InMemoryOutboxStore:
+    store = InMemoryOutboxStore()
+    for i in range(count):
+        store.add(_entry(f"p-{i}"))
+        store.mark_processed(f"p-{i}")
+    for i in range(pending):
+        store.add(_entry(f"q-{i}"))
+    return store
+
+
+class TestInMemoryOutboxRetention:
+    async def test_reclaims_processed_entries_beyond_max_count(self):
+        store = _store_with_processed(5, pending=2)
+        retention = InMemoryOutboxRetention(store, max_processed=2)
+
+        reclaimed = await retention.compact()
+
+        assert reclaimed == 3
+        assert len(store) == 4
+        assert store.get("p-0") is None
+        assert store.get("p-4") is not None
+        assert [e.entry_id for e in retention.archive] == ["p-0", "p-1", "p-2"]
+
+    async def test_reclaims_processed_entries_older_than_max_age(self):
+        store = _store_with_processed(3)
+        later = datetime.now(UTC) + timedelta(seconds=120)
+        retention = InMemoryOutboxRetention(
+            store, max_age_seconds=60, clock=lambda: later
+        )
+
+        assert await retention.compact() == 3
+        assert len(store) == 0
+
+    async def test_never_reclaims_unprocessed_entries(self):
+        store = _store_with_processed(0, pending=3)
+        store.mark_failed("q-0", "boom")
+        store.mark_dead_lettered("q-1")
+        later = datetime.now(UTC) + timedelta(days=1)
+        retention = InMemoryOutboxRetention(
+            store, max_age_seconds=0, max_processed=0, clock=lambda: later
+        )
+
+        assert await retention.compact() == 0
+        assert {e.status for e in store} == {
+            OutboxEntryStatus.FAILED,
+            OutboxEntryStatus.DEAD_LETTERED,
+            OutboxEntryStatus.PENDING,
+        }
+
+    async def test_archive_is_bounded(self):
+        store = _store_with_processed(10)
+        retention = InMemoryOutboxRetention(store, max_processed=0, archive_size=4)
+
+        await retention.compact()
+
+        assert [e.entry_id for e in retention.archive] == ["p-6", "p-7", "p-8", "p-9"]
+
+    async def test_compacts_incrementally_in_batches(self):
+        store = _store_with_processed(10)
+        retention = InMemoryOutboxRetention(
+            store, max_processed=0, batch_size=3, time_budget_seconds=0
+        )
+
+        assert await retention.compact() == 3
+        assert await retention.compact() == 3
+        assert store.processed_count == 4
+
+    async def test_stats_track_reclaimed_entries(self):
+        store = _store_with_processed(4, pending=1)
+        retention = InMemoryOutboxRetention(store, max_processed=1)
+
+        await retention.compact()
+        await retention.compact()
+        stats = retention.stats()
+
+        assert stats.reclaimed_total == 3
+        assert stats.last_reclaimed == 0
+        assert stats.archived == 3
+        assert stats.live_entries == 2
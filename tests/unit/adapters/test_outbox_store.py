@@ -0,0 +1,238 @@
+"""Unit tests for the indexed InMemoryOutboxStore."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+    OutboxGapError,
+)
+from tabb.application.backoff import ExponentialBackoff
+from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _entry(
+    entry_id: str, offset_seconds: int = 0, aggregate_id: str = "m-1"
+) -> OutboxEntry:
+    return OutboxEntry(
+        _entry_id=entry_id,
+        _event_type="MenuItemSoldOut",
+        _event_data={"menu_item_id": aggregate_id},
+        _aggregate_id=aggregate_id,
+        _aggregate_type="MenuItem",
+        _occurred_at=_EPOCH + timedelta(seconds=offset_seconds),
+    )
+
+
+class TestInMemoryOutboxStore:
+    def test_find_ready_orders_by_sequence(self):
+        store = InMemoryOutboxStore()
+        store.add(_entry("e-2", offset_seconds=2))
+        store.add(_entry("e-1", offset_seconds=1))
+        store.add(_entry("e-3", offset_seconds=2))
+
+        ready = store.find_ready(limit=3)
+
+        assert [e.entry_id for e in ready] == ["e-2", "e-1", "e-3"]
+
+    def test_add_assigns_gap_free_sequence_numbers(self):
+        store = InMemoryOutboxStore()
+        entries = [_entry(f"e-{n}") for n in range(3)]
+
+        for entry in entries:
+            store.add(entry)
+
+        assert [e.sequence for e in entries] == [1, 2, 3]
+        assert store.last_sequence == 3
+
+    def test_restored_entries_keep_their_sequence(self):
+        store = InMemoryOutboxStore()
+        first, second = _entry("e-1"), _entry("e-2")
+        first._sequence, second._sequence = 4, 7
+
+        store.add(first)
+        store.add(second)
+        store.add(_entry("e-3"))
+
+        assert store.get("e-3").sequence == 8
+        with pytest.raises(ValueError, match="not after 8"):
+            restored = _entry("e-4")
+            restored._sequence = 5
+            store.add(restored)
+
+    def test_cursor_moves_past_settled_and_failed_entries(self):
+        store = InMemoryOutboxStore()
+        for n in range(4):
+            store.add(_entry(f"e-{n}", aggregate_id=f"m-{n}"))
+
+        store.mark_processed("e-0")
+        store.mark_failed("e-1", "boom")
+        ready = store.find_ready(limit=10)
+
+        assert [e.entry_id for e in ready] == ["e-2", "e-3"]
+        assert store._cursor == 2
+
+    def test_read_after_reads_the_log_forward(self):
+        store = InMemoryOutboxStore()
+        for n in range(5):
+            store.add(_entry(f"e-{n}"))
+        store.mark_processed("e-1")
+        store.reclaim_processed(limit=10, keep_latest=0)
+
+        assert [e.sequence for e in store.read_after(0, limit=3)] == [1, 3, 4]
+        assert [e.sequence for e in store.read_after(4, limit=3)] == [5]
+        assert store.read_after(5, limit=3) == []
+
+    def test_read_after_jumps_reclaimed_runs(self):
+        store = InMemoryOutboxStore()
+        for n in range(1, 7):
+            store.add(_entry(f"e-{n}"))
+        for n in (2, 4, 3):
+            store.mark_processed(f"e-{n}")
+        store.reclaim_processed(limit=10, keep_latest=0)
+
+        assert store._gaps == {2: 4}
+        assert [e.sequence for e in store.read_after(1, limit=2)] == [5, 6]
+
+    def test_restored_sequence_gap_is_a_reclaimed_run(self):
+        store = InMemoryOutboxStore()
+        entry = _entry("e-9")
+        entry._sequence = 9
+        store.add(entry)
+
+        assert [e.sequence for e in store.read_after(0, limit=5)] == [9]
+        with pytest.raises(OutboxGapError):
+            store.open_reader(0)
+        assert store.open_reader(8)
+
+    def test_find_ready_is_non_destructive(self):
+        store = InMemoryOutboxStore()
+        store.add(_entry("e-1"))
+
+        assert len(store.find_ready(limit=10)) == 1
+        assert len(store.find_ready(limit=10)) == 1
+
+    def test_processed_entries_leave_ready_queue(self):
+        store = InMemoryOutboxStore()
+        store.add(_entry("e-1", offset_seconds=1))
+        store.add(_entry("e-2", offset_seconds=2))
+
+        store.mark_processed("e-1")
+
+        assert [e.entry_id for e in store.find_ready(limit=10)] == ["e-2"]
+        assert store.get("e-1").status == OutboxEntryStatus.PROCESSED
+        assert len(store) == 2
+
+    def test_failed_entry_waits_for_next_retry_at(self, clock):
+        store = InMemoryOutboxStore(clock=clock)
+        store.add(_entry("e-1"))
+
+        store.mark_failed("e-1", "boom")
+        assert store.find_ready(limit=10) == []
+
+        clock.now = store.get("e-1").next_retry_at + timedelta(seconds=1)
+        ready = store.find_ready(limit=10)
+
+        assert [e.entry_id for e in ready] == ["e-1"]
+        assert ready[0].status == OutboxEntryStatus.FAILED
+
+    def test_retried_entry_keeps_occurred_at_order(self, clock):
+        store = InMemoryOutboxStore(clock=clock)
+        store.add(_entry("e-1", offset_seconds=1, aggregate_id="m-1"))
+        store.add(_entry("e-2", offset_seconds=2, aggregate_id="m-2"))
+
+        store.mark_failed("e-1", "boom")
+        clock.now += timedelta(seconds=10)
+
+        assert [e.entry_id for e in store.find_ready(limit=10)] == ["e-1", "e-2"]
+
+    def test_later_entries_of_aggregate_wait_behind_failed_entry(self, clock):
+        store = InMemoryOutboxStore(clock=clock)
+        store.add(_entry("a-1", offset_seconds=1, aggregate_id="o-1"))
+        store.add(_entry("a-2", offset_seconds=2, aggregate_id="o-1"))
+        store.add(_entry("b-1", offset_seconds=3, aggregate_id="o-2"))
+
+        store.mark_failed("a-1", "boom")
+        assert [e.entry_id for e in store.find_ready(limit=10)] == ["b-1"]
+
+        clock.now += timedelta(seconds=10)
+        assert [e.entry_id for e in store.find_ready(limit=10)] == ["a-1", "b-1"]
+
+        store.mark_processed("a-1")
+        assert [e.entry_id for e in store.find_ready(limit=10)] == ["a-2", "b-1"]
+
+    def test_dead_lettering_releases_parked_entries(self):
+        store = InMemoryOutboxStore()
+        store.add(_entry("a-1", offset_seconds=1, aggregate_id="o-1"))
+        store.add(_entry("a-2", offset_seconds=2, aggregate_id="o-1"))
+
+        store.mark_failed("a-1", "boom")
+        assert store.find_ready(limit=10) == []
+
+        store.mark_dead_lettered("a-1")
+        assert [e.entry_id for e in store.find_ready(limit=10)] == ["a-2"]
+
+    def test_dead_lettered_entry_is_never_returned(self, clock):
+        store = InMemoryOutboxStore(clock=clock)
+        store.add(_entry("e-1"))
+
+        store.mark_failed("e-1", "boom")
+        store.mark_dead_lettered("e-1")
+        clock.now += timedelta(seconds=10)
+
+        assert store.find_ready(limit=10) == []
+        assert store.get("e-1").status == OutboxEntryStatus.DEAD_LETTERED
+
+    def test_unknown_entry_ids_are_ignored(self):
+        store = InMemoryOutboxStore()
+
+        store.mark_processed("missing")
+        store.mark_failed("missing", "boom")
+        store.mark_dead_lettered("missing")
+
+        assert len(store) == 0
+
+    def test_pending_count_includes_waiting_and_parked_entries(self):
+        store = InMemoryOutboxStore()
+        store.add(_entry("a-1", offset_seconds=1, aggregate_id="o-1"))
+        store.add(_entry("a-2", offset_seconds=2, aggregate_id="o-1"))
+        store.add(_entry("b-1", offset_seconds=3, aggregate_id="o-2"))
+
+        store.mark_failed("a-1", "boom")
+        store.find_ready(limit=10)  # parks a-2
+        assert store.pending_count == 3
+
+        store.mark_processed("b-1")
+        store.mark_dead_lettered("a-1")
+        assert store.pending_count == 1
+
+    def test_mark_failed_uses_the_configured_backoff(self, clock):
+        store = InMemoryOutboxStore(clock=clock, backoff=ExponentialBackoff(base=30.0))
+        store.add(_entry("e-1"))
+
+        store.mark_failed("e-1", "boom")
+
+        entry = store.get("e-1")
+        assert entry.retry_delay_seconds == 30.0
+        assert entry.next_retry_at == clock.now + timedelta(seconds=30)
+        clock.now += timedelta(seconds=29.9)
+        assert store.find_ready(limit=10) == []
+        clock.now += timedelta(seconds=0.2)  # within one wheel tick of due
+        assert [e.entry_id for e in store.find_ready(limit=10)] == ["e-1"]
+
+    def test_next_retry_at_reports_the_earliest_waiting_retry(self, clock):
+        store = InMemoryOutboxStore(clock=clock, backoff=ExponentialBackoff(base=5.0))
+        assert store.next_retry_at() is None
+
+        store.add(_entry("e-1"))
+        store.mark_failed("e-1", "boom")
+
+        next_retry_at = store.next_retry_at()
+        assert next_retry_at is not None
+        due = store.get("e-1").next_retry_at
+        assert due <= next_retry_at <= due + timedelta(seconds=0.1)
@@ -0,0 +1,145 @@
+"""Unit tests for OutboxStream."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+    OutboxGapError,
+)
+from tabb.adapters.outbound.workers.outbox_stream import (
+    OutboxCursorFile,
+    OutboxStream,
+)
+from tabb.adapters.outbound.workers.outbox_wakeup import AsyncioOutboxWakeup
+from tabb.application.outbox import OutboxEntry
+
+pytestmark = pytest.mark.asyncio
+
+
+def _entry(entry_id: str) -> OutboxEntry:
+    return OutboxEntry(
+        _entry_id=entry_id,
+        _event_type="MenuItemSoldOut",
+        _event_data={"menu_item_id": "m-1"},
+        _aggregate_id="m-1",
+        _aggregate_type="MenuItem",
+        _occurred_at=datetime.now(UTC),
+    )
+
+
+def _store(count: int) -> InMemoryOutboxStore:
+    store = InMemoryOutboxStore()
+    for n in range(1, count + 1):
+        store.add(_entry(f"e-{n}"))
+    return store
+
+
+def _reclaim_all(store: InMemoryOutboxStore) -> list[str]:
+    for entry in list(store):
+        store.mark_processed(entry.entry_id)
+    return [e.entry_id for e in store.reclaim_processed(limit=100, keep_latest=0)]
+
+
+class TestOutboxStream:
+    async def test_reads_batches_in_sequence_order(self):
+        stream = aiter(OutboxStream(_store(5), batch_size=2))
+
+        batches = [await anext(stream) for _ in range(3)]
+
+        assert [[e.entry_id for e in b] for b in batches] == [
+            ["e-1", "e-2"],
+            ["e-3", "e-4"],
+            ["e-5"],
+        ]
+
+    async def test_position_is_saved_when_next_batch_is_requested(self, tmp_path):
+        cursor = OutboxCursorFile(tmp_path / "cursor")
+        stream = OutboxStream(_store(5), cursor=cursor, batch_size=2)
+        batches = aiter(stream)
+
+        await anext(batches)
+        assert cursor.load() == 0
+        await anext(batches)
+
+        assert stream.position == 2
+        assert cursor.load() == 2
+
+    async def test_resumes_from_persisted_cursor(self, tmp_path):
+        cursor = OutboxCursorFile(tmp_path / "cursor")
+        cursor.save(3)
+
+        batch = await anext(aiter(OutboxStream(_store(5), cursor=cursor)))
+
+        assert [e.entry_id for e in batch] == ["e-4", "e-5"]
+
+    async def test_failed_entries_do_not_hold_the_stream_back(self):
+        store = _store(3)
+        store.mark_failed("e-1", "boom")
+
+        batch = await anext(aiter(OutboxStream(store)))
+
+        assert [e.entry_id for e in batch] == ["e-1", "e-2", "e-3"]
+
+    async def test_waits_for_commit_wakeup_when_caught_up(self):
+        store = _store(1)
+        wakeup = AsyncioOutboxWakeup()
+        batches = aiter(OutboxStream(store, wakeup=wakeup, poll_interval=10))
+        await anext(batches)
+
+        waiter = asyncio.create_task(anext(batches))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        store.add(_entry("e-2"))
+        wakeup.notify()
+
+        batch = await asyncio.wait_for(waiter, 1)
+        assert [e.entry_id for e in batch] == ["e-2"]
+
+    async def test_retention_keeps_entries_the_stream_has_not_acknowledged(self):
+        store = _store(4)
+        batches = aiter(OutboxStream(store, batch_size=2))
+        await anext(batches)
+
+        assert _reclaim_all(store) == []
+        await anext(batches)
+
+        assert _reclaim_all(store) == ["e-1", "e-2"]
+
+    async def test_closing_releases_entries_for_retention(self):
+        store = _store(2)
+        OutboxStream(store).close()
+
+        assert _reclaim_all(store) == ["e-1", "e-2"]
+
+    async def test_refuses_cursor_behind_reclaimed_entries(self, tmp_path):
+        store = _store(3)
+        _reclaim_all(store)
+        store.add(_entry("e-4"))
+        cursor = OutboxCursorFile(tmp_path / "cursor")
+        cursor.save(1)
+
+        with pytest.raises(OutboxGapError):
+            OutboxStream(store, cursor=cursor)
+
+    async def test_reads_on_from_cursor_at_the_reclaimed_boundary(self, tmp_path):
+        store = _store(3)
+        _reclaim_all(store)
+        store.add(_entry("e-4"))
+        cursor = OutboxCursorFile(tmp_path / "cursor")
+        cursor.save(3)
+
+        batch = await anext(aiter(OutboxStream(store, cursor=cursor)))
+
+        assert [e.entry_id for e in batch] == ["e-4"]
+
+    async def test_refuses_cursor_past_the_end_of_the_log(self, tmp_path):
+        cursor = OutboxCursorFile(tmp_path / "cursor")
+        cursor.save(5)
+
+        with pytest.raises(ValueError, match="past the end"):
+            OutboxStream(_store(2), cursor=cursor)
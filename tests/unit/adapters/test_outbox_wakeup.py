@@ -0,0 +1,35 @@
+"""Unit tests for AsyncioOutboxWakeup."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from tabb.adapters.outbound.workers.outbox_wakeup import AsyncioOutboxWakeup
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestAsyncioOutboxWakeup:
+    async def test_wait_times_out_without_notification(self):
+        wakeup = AsyncioOutboxWakeup()
+
+        assert await wakeup.wait(0.01) is False
+
+    async def test_notify_wakes_waiter(self):
+        wakeup = AsyncioOutboxWakeup()
+        waiter = asyncio.create_task(wakeup.wait(10))
+        await asyncio.sleep(0)
+
+        wakeup.notify()
+
+        assert await waiter is True
+
+    async def test_notifications_collapse_into_one_wakeup(self):
+        wakeup = AsyncioOutboxWakeup()
+        wakeup.notify()
+        wakeup.notify()
+
+        assert await wakeup.wait(0.01) is True
+        assert await wakeup.wait(0.01) is False
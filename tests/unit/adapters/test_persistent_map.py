@@ -0,0 +1,76 @@
+"""Unit tests for PersistentMap."""
+
+from __future__ import annotations
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.persistent_map import (
+    PersistentMap,
+)
+
+
+class _CollidingKey:
+    """Key whose hash collides with every other key of the same bucket."""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return self.value % 3
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CollidingKey) and other.value == self.value
+
+
+class TestPersistentMap:
+    def test_set_returns_new_map_and_leaves_original_unchanged(self):
+        original = PersistentMap([("a", 1)])
+
+        updated = original.set("a", 2).set("b", 3)
+
+        assert dict(original.items()) == {"a": 1}
+        assert dict(updated.items()) == {"a": 2, "b": 3}
+        assert len(original) == 1
+        assert len(updated) == 2
+
+    def test_many_keys_match_a_dict(self):
+        expected = {f"k-{n}": n for n in range(5_000)}
+        versions = []
+        current: PersistentMap[str, int] = PersistentMap()
+        for key, value in expected.items():
+            current = current.set(key, value)
+            versions.append(current)
+
+        assert dict(current.items()) == expected
+        assert len(versions[999]) == 1_000
+        assert versions[999].get("k-1000") is None
+        assert versions[999]["k-999"] == 999
+
+    def test_replacing_a_value_keeps_size(self):
+        current = PersistentMap((f"k-{n}", n) for n in range(100))
+
+        updated = current.update([("k-1", -1), ("k-2", -2)])
+
+        assert len(updated) == 100
+        assert updated["k-1"] == -1
+        assert current["k-1"] == 1
+
+    def test_missing_keys(self):
+        current = PersistentMap([("a", 1)])
+
+        assert current.get("b") is None
+        assert current.get("b", 0) == 0
+        assert "b" not in current
+        with pytest.raises(KeyError):
+            current["b"]
+
+    def test_hash_collisions(self):
+        current = PersistentMap((_CollidingKey(n), n) for n in range(30))
+
+        updated = current.set(_CollidingKey(4), "four")
+
+        assert len(updated) == 30
+        assert updated[_CollidingKey(4)] == "four"
+        assert current[_CollidingKey(4)] == 4
+        assert _CollidingKey(30) not in updated
+        assert sorted(key.value for key in updated) == list(range(30))
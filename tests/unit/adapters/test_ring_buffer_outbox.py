@@ -0,0 +1,205 @@
+"""Unit tests for the memory-mapped RingBufferOutbox."""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.order_read_model_repository import (
+    InMemoryOrderReadModelRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.ring_buffer_outbox import (
+    RingBufferFullError,
+    RingBufferOutbox,
+    RingBufferOutboxRepository,
+)
+from tabb.adapters.outbound.projectors.order_projector import OrderProjector
+from tabb.adapters.outbound.workers.outbox_processor import InMemoryOutboxProcessor
+from tabb.application.backoff import DecorrelatedJitterBackoff
+from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _entry(
+    event_type: str = "MenuItemSoldOut",
+    event_data: dict[str, object] | None = None,
+    aggregate_id: str = "m-1",
+) -> OutboxEntry:
+    return OutboxEntry(
+        _entry_id="ignored",
+        _event_type=event_type,
+        _event_data=event_data or {"menu_item_id": aggregate_id},
+        _aggregate_id=aggregate_id,
+        _aggregate_type="MenuItem",
+        _occurred_at=_EPOCH,
+    )
+
+
+class TestRingBufferOutbox:
+    def test_round_trips_entries_in_sequence_order(self, tmp_path):
+        ring = RingBufferOutbox(tmp_path / "outbox.ring", capacity=8)
+        ids = [ring.add(_entry(aggregate_id=f"m-{n}")) for n in range(3)]
+
+        ready = ring.find_ready(limit=2)
+
+        assert ids == ["0", "1", "2"]
+        assert [e.entry_id for e in ready] == ["0", "1"]
+        assert ready[1].event_data == {"menu_item_id": "m-1"}
+        assert ready[1].occurred_at == _EPOCH
+        assert ready[1].status == OutboxEntryStatus.PENDING
+        assert ring.pending_count == 3
+
+    def test_failed_entry_waits_for_its_retry_time(self, clock, tmp_path):
+        ring = RingBufferOutbox(tmp_path / "outbox.ring", capacity=8, clock=clock)
+        ring.add(_entry())
+
+        ring.mark_failed("0", "boom")
+
+        assert ring.find_ready(limit=10) == []
+        clock.now += timedelta(minutes=1)
+        [retried] = ring.find_ready(limit=10)
+        assert retried.status == OutboxEntryStatus.FAILED
+        assert retried.retry_count == 1
+        assert retried.last_error == "boom"
+        assert ring.pending_count == 1
+
+    def test_retry_delay_follows_the_configured_backoff(self, clock, tmp_path):
+        path = tmp_path / "outbox.ring"
+        backoff = DecorrelatedJitterBackoff(base=10, rng=random.Random(1))
+        ring = RingBufferOutbox(path, capacity=8, clock=clock, backoff=backoff)
+        ring.add(_entry())
+
+        ring.mark_failed("0", "boom")
+        ring.close()
+        ring = RingBufferOutbox(path, capacity=8, clock=clock, backoff=backoff)
+        clock.now += timedelta(minutes=1)
+        [failed] = ring.find_ready(limit=10)
+
+        assert 10 <= failed.retry_delay_seconds <= 30
+
+    def test_later_entries_of_aggregate_wait_behind_failed_entry(self, clock, tmp_path):
+        path = tmp_path / "outbox.ring"
+        ring = RingBufferOutbox(path, capacity=8, clock=clock)
+        ring.add(_entry(aggregate_id="o-1"))
+        ring.add(_entry(aggregate_id="o-1"))
+        ring.add(_entry(aggregate_id="o-2"))
+
+        ring.mark_failed("0", "boom")
+
+        assert [e.entry_id for e in ring.find_ready(limit=10)] == ["2"]
+        ring.close()
+        ring = RingBufferOutbox(path, capacity=8, clock=clock)
+        assert [e.entry_id for e in ring.find_ready(limit=10)] == ["2"]
+        clock.now += timedelta(minutes=1)
+        assert [e.entry_id for e in ring.find_ready(limit=10)] == ["0", "2"]
+        ring.mark_processed("0")
+        assert [e.entry_id for e in ring.find_ready(limit=10)] == ["1", "2"]
+
+    def test_dead_lettering_releases_held_back_entries(self, tmp_path):
+        ring = RingBufferOutbox(tmp_path / "outbox.ring", capacity=8)
+        ring.add(_entry(aggregate_id="o-1"))
+        ring.add(_entry(aggregate_id="o-1"))
+        ring.mark_failed("0", "boom")
+
+        ring.mark_dead_lettered("0")
+
+        assert [e.entry_id for e in ring.find_ready(limit=10)] == ["1"]
+
+    def test_exhausted_retries_dead_letter_the_entry(self, tmp_path):
+        ring = RingBufferOutbox(tmp_path / "outbox.ring", capacity=8)
+        ring.add(_entry())
+
+        for _ in range(3):
+            ring.mark_failed("0", "boom")
+
+        assert ring.pending_count == 0
+        assert len(ring) == 0
+
+    def test_settled_slots_are_reused(self, tmp_path):
+        ring = RingBufferOutbox(tmp_path / "outbox.ring", capacity=2)
+        ring.add(_entry(aggregate_id="m-0"))
+        ring.add(_entry(aggregate_id="m-1"))
+
+        with pytest.raises(RingBufferFullError):
+            ring.add(_entry())
+        ring.mark_processed("0")
+        ring.add(_entry(aggregate_id="m-2"))
+
+        assert [e.aggregate_id for e in ring.find_ready(limit=10)] == ["m-1", "m-2"]
+        assert ring.get("0") is None
+
+    def test_oversized_event_is_rejected(self, tmp_path):
+        ring = RingBufferOutbox(tmp_path / "outbox.ring", capacity=2, record_size=64)
+
+        with pytest.raises(ValueError):
+            ring.add(_entry(event_data={"name": "x" * 100}))
+        assert len(ring) == 0
+
+    def test_reopening_resumes_from_the_saved_head_and_tail(self, tmp_path):
+        path = tmp_path / "outbox.ring"
+        ring = RingBufferOutbox(path, capacity=4)
+        for n in range(3):
+            ring.add(_entry(aggregate_id=f"m-{n}"))
+        ring.mark_processed("0")
+        ring.mark_failed("2", "boom")
+        ring.close()
+
+        reopened = RingBufferOutbox(path, capacity=4)
+
+        assert reopened.pending_count == 2
+        entry = reopened.get("2")
+        assert entry is not None
+        assert entry.last_error == "boom"
+        assert reopened.add(_entry()) == "3"
+        with pytest.raises(ValueError):
+            RingBufferOutbox(path, capacity=8)
+
+
+@pytest.mark.asyncio
+class TestRingBufferOutboxRepository:
+    async def test_flush_that_does_not_fit_writes_nothing(self, tmp_path):
+        ring = RingBufferOutbox(tmp_path / "outbox.ring", capacity=2, record_size=128)
+        repo = RingBufferOutboxRepository(ring)
+        await repo.save(_entry())
+        await repo.save(_entry(event_data={"menu_item_id": "m" * 200}))
+
+        with pytest.raises(ValueError):
+            repo.flush()
+        assert len(ring) == 0
+        await repo.save(_entry())
+        with pytest.raises(RingBufferFullError):
+            repo.flush()
+        assert len(ring) == 0
+
+        repo.discard()
+        await repo.save(_entry())
+        assert repo.flush() == 1
+        assert len(ring) == 1
+
+    async def test_processor_projects_from_the_ring(self, tmp_path):
+        ring = RingBufferOutbox(tmp_path / "outbox.ring", capacity=16)
+        repo = RingBufferOutboxRepository(ring)
+        read_repo = InMemoryOrderReadModelRepository()
+        processor = InMemoryOutboxProcessor(
+            outbox_repository=repo, projectors=[OrderProjector(read_repo)]
+        )
+
+        await repo.save(
+            _entry("OrderPlaced", {"order_id": "o-1", "table_number": 4}, "o-1")
+        )
+        await repo.save(_entry("Unprojected", {"order_id": "o-9"}, "o-9"))
+        assert repo.flush() == 2
+        repo.discard()
+
+        assert await processor.process_pending() == 1
+        read_model = await read_repo.find_by_id("o-1")
+        assert read_model is not None
+        assert read_model.table_number == 4
+        failed = ring.get("1")
+        assert failed is not None
+        assert failed.status == OutboxEntryStatus.FAILED
+        assert failed.retry_count == 1
+        assert await repo.count_pending() == 1
@@ -0,0 +1,362 @@
+"""Unit tests for SegmentedEventStore and the event-sourced unit of work."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from tabb.adapters.outbound.persistence.event_store.aggregate_cache import (
+    AggregateCache,
+)
+from tabb.adapters.outbound.persistence.event_store.outbox import (
+    EventLogOutbox,
+    EventLogOutboxRepository,
+)
+from tabb.adapters.outbound.persistence.event_store.segmented_event_store import (
+    EventRecord,
+    SegmentedEventStore,
+)
+from tabb.adapters.outbound.persistence.event_store.unit_of_work import (
+    EventSourcedUnitOfWork,
+    restore_menu_items,
+)
+from tabb.adapters.outbound.persistence.in_memory.order_read_model_repository import (
+    InMemoryOrderReadModelRepository,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.adapters.outbound.projectors.order_projector import OrderProjector
+from tabb.adapters.outbound.workers.outbox_processor import InMemoryOutboxProcessor
+from tabb.application.backoff import ExponentialBackoff
+from tabb.application.exceptions import ConcurrencyConflictError
+from tabb.domain.models.menu_item import MenuItem, MenuItemId
+from tabb.domain.models.order import (
+    Order,
+    OrderId,
+    OrderItemId,
+    OrderItemStatus,
+    OrderStatus,
+)
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+pytestmark = pytest.mark.asyncio
+
+
+def _records(*event_types: str) -> list[EventRecord]:
+    return [
+        EventRecord(event_type, {"n": n}) for n, event_type in enumerate(event_types)
+    ]
+
+
+def _order(order_id: str = "o-1", items: int = 3) -> Order:
+    order = Order.place(OrderId(order_id), TableNumber(1))
+    for i in range(items):
+        order.add_item(
+            OrderItemId(f"oi-{i}"),
+            MenuItemId("m-1"),
+            "Burger",
+            Money(Decimal("9.99")),
+            Quantity(1),
+        )
+    return order
+
+
+class TestSegmentedEventStore:
+    async def test_reads_a_stream_by_version(self, tmp_path):
+        store = SegmentedEventStore(tmp_path)
+        store.append("Order", "o-1", 0, _records("A", "B"))
+        store.append("Order", "o-2", 0, _records("X"))
+        store.append("Order", "o-1", 1, _records("C"))
+
+        assert store.version("Order", "o-1") == 2
+        assert [e.event_type for e in store.read_stream("Order", "o-1")] == [
+            "A",
+            "B",
+            "C",
+        ]
+        [newer] = store.read_stream("Order", "o-1", after_version=1)
+        assert (newer.position, newer.version) == (3, 2)
+        assert store.stream_of(2) == ("Order", "o-2")
+
+    async def test_stale_expected_version_raises(self, tmp_path):
+        store = SegmentedEventStore(tmp_path)
+        store.append("Order", "o-1", 0, _records("A"))
+
+        with pytest.raises(ConcurrencyConflictError):
+            store.append("Order", "o-1", 0, _records("B"))
+        assert store.head == 1
+
+    async def test_rolls_segments_and_reopens_from_their_indexes(self, tmp_path):
+        store = SegmentedEventStore(tmp_path, segment_bytes=200)
+        for n in range(10):
+            store.append("Order", f"o-{n % 3}", None, _records("A", "B"))
+        await store.sync()
+        store.close()
+
+        segments = len(list(tmp_path.glob("*.seg")))
+        assert segments > 1
+        assert len(list(tmp_path.glob("*.idx"))) == segments - 1
+        reopened = SegmentedEventStore(tmp_path, segment_bytes=200)
+
+        assert reopened.head == 20
+        assert reopened.version("Order", "o-0") == 4
+        assert [e.position for e in reopened.read_all(17)] == [17, 18, 19]
+        assert len(reopened.read_stream("Order", "o-1")) == 6
+
+    async def test_torn_tail_is_truncated_on_open(self, tmp_path):
+        store = SegmentedEventStore(tmp_path)
+        store.append("Order", "o-1", 0, _records("A"))
+        store.close()
+        [segment] = tmp_path.glob("*.seg")
+        with segment.open("ab") as file:
+            file.write(b"0000beef {partial")
+
+        reopened = SegmentedEventStore(tmp_path)
+        reopened.append("Order", "o-1", 1, _records("B"))
+
+        assert [e.event_type for e in reopened.read_all()] == ["A", "B"]
+
+    async def test_concurrent_syncs_share_one_fsync(self, tmp_path):
+        store = SegmentedEventStore(tmp_path)
+        for n in range(5):
+            store.append("Order", f"o-{n}", 0, _records("A"))
+
+        await asyncio.gather(*(store.sync() for _ in range(5)))
+
+        assert store.sync_count == 1
+
+    async def test_failed_fsync_fails_the_store(self, tmp_path, monkeypatch):
+        failures: list[BaseException] = []
+        store = SegmentedEventStore(tmp_path, on_failure=failures.append)
+        store.append("Order", "o-1", 0, _records("A"))
+
+        def fsync(fd: int) -> None:
+            raise OSError(5, "Input/output error")
+
+        monkeypatch.setattr(os, "fsync", fsync)
+
+        with pytest.raises(OSError):
+            await store.sync()
+
+        assert store.failed
+        with pytest.raises(RuntimeError):
+            store.append("Order", "o-1", 1, _records("B"))
+        with pytest.raises(RuntimeError):
+            await store.sync()
+        assert len(failures) == 1
+        assert store.head == 1
+
+    async def test_failed_write_is_truncated_before_indexing(
+        self, tmp_path, monkeypatch
+    ):
+        store = SegmentedEventStore(tmp_path)
+        store.append("Order", "o-1", 0, _records("A"))
+        write = os.write
+
+        def partial_write(fd: int, data: bytes) -> int:
+            monkeypatch.setattr(os, "write", disk_full)
+            return write(fd, data[:5])
+
+        def disk_full(fd: int, data: bytes) -> int:
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(os, "write", partial_write)
+        with pytest.raises(OSError):
+            store.append("Order", "o-1", 1, _records("B", "C"))
+        monkeypatch.setattr(os, "write", write)
+
+        assert (store.head, store.version("Order", "o-1")) == (1, 1)
+        assert not store.failed
+        store.append("Order", "o-1", 1, _records("D"))
+        assert [e.event_type for e in store.read_stream("Order", "o-1")] == ["A", "D"]
+        store.close()
+        assert [e.event_type for e in SegmentedEventStore(tmp_path).read_all()] == [
+            "A",
+            "D",
+        ]
+
+
+class TestEventSourcedUnitOfWork:
+    @pytest.fixture()
+    def outbox(self, tmp_path):
+        return EventLogOutbox(SegmentedEventStore(tmp_path))
+
+    def _uow(self, outbox, cache=None, menu_items=None):
+        return EventSourcedUnitOfWork(
+            outbox,
+            menu_items if menu_items is not None else InMemoryVersionedStore(),
+            order_cache=cache,
+        )
+
+    async def _save(self, uow, order: Order) -> None:
+        async with uow:
+            await uow.order_repository.save(order)
+            await uow.commit()
+
+    async def test_commit_appends_only_new_events(self, outbox):
+        await self._save(self._uow(outbox), _order())
+        uow = self._uow(outbox)
+
+        async with uow:
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+            order.mark_item_ready(OrderItemId("oi-0"))
+            await uow.commit()
+
+        store = outbox.event_store
+        assert store.head == 5
+        assert store.read(4).event_type == "DishMarkedReady"
+        assert order.version == store.version("Order", "o-1") == 2
+
+    async def test_loads_rehydrate_and_catch_up_cached_orders(self, outbox):
+        cache: AggregateCache[Order] = AggregateCache(capacity=8)
+        await self._save(self._uow(outbox, cache), _order())
+        uow = self._uow(outbox)
+
+        async with uow:
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+            order.cancel_item(OrderItemId("oi-1"))
+            await uow.commit()
+        async with self._uow(outbox, cache) as cached_uow:
+            order = await cached_uow.order_repository.find_by_id(OrderId("o-1"))
+
+        assert cache.hits == 1
+        assert order.version == 2
+        assert order.items[1].status == OrderItemStatus.CANCELLED
+        assert order.collect_events() == []
+
+    async def test_commuting_concurrent_changes_are_merged(self, outbox):
+        await self._save(self._uow(outbox), _order())
+        first, second = self._uow(outbox), self._uow(outbox)
+
+        async with first:
+            mine = await first.order_repository.find_by_id(OrderId("o-1"))
+            async with second:
+                theirs = await second.order_repository.find_by_id(OrderId("o-1"))
+                theirs.mark_item_ready(OrderItemId("oi-0"))
+                await second.commit()
+            mine.mark_item_ready(OrderItemId("oi-2"))
+            await first.commit()
+
+        async with first:
+            order = await first.order_repository.find_by_id(OrderId("o-1"))
+        assert order.version == 3
+        assert [item.status for item in order.items] == [
+            OrderItemStatus.READY,
+            OrderItemStatus.PENDING,
+            OrderItemStatus.READY,
+        ]
+
+    async def test_conflicting_change_raises_without_appending(self, outbox):
+        await self._save(self._uow(outbox), _order())
+        first, second = self._uow(outbox), self._uow(outbox)
+
+        async with first:
+            mine = await first.order_repository.find_by_id(OrderId("o-1"))
+            async with second:
+                theirs = await second.order_repository.find_by_id(OrderId("o-1"))
+                theirs.cancel()
+                await second.commit()
+            mine.mark_item_ready(OrderItemId("oi-0"))
+            with pytest.raises(ConcurrencyConflictError):
+                await first.commit()
+
+        assert outbox.event_store.head == 5
+        async with first:
+            order = await first.order_repository.find_by_id(OrderId("o-1"))
+        assert order.status == OrderStatus.CANCELLED
+
+    async def test_menu_item_events_share_the_log(self, outbox):
+        menu_items: InMemoryVersionedStore[MenuItem] = InMemoryVersionedStore()
+        uow = self._uow(outbox, menu_items=menu_items)
+
+        async with uow:
+            await uow.menu_item_repository.save(
+                MenuItem.create(MenuItemId("m-1"), "Burger", Money(Decimal("9.99")))
+            )
+            await uow.commit()
+
+        assert menu_items.get("m-1") is not None
+        assert outbox.event_store.stream_of(0) == ("MenuItem", "m-1")
+
+    async def test_menu_items_are_restored_from_the_log(self, tmp_path):
+        menu_items: InMemoryVersionedStore[MenuItem] = InMemoryVersionedStore()
+        outbox = EventLogOutbox(SegmentedEventStore(tmp_path))
+        uow = self._uow(outbox, menu_items=menu_items)
+        async with uow:
+            await uow.menu_item_repository.save(
+                MenuItem.create(MenuItemId("m-1"), "Burger", Money(Decimal("9.99")))
+            )
+            await uow.menu_item_repository.save(
+                MenuItem.create(MenuItemId("m-2"), "Fries", Money(Decimal("3.50")))
+            )
+            await uow.order_repository.save(_order())
+            await uow.commit()
+        async with uow:
+            item = await uow.menu_item_repository.find_by_id(MenuItemId("m-1"))
+            item.mark_sold_out()
+            await uow.commit()
+        outbox.event_store.close()
+
+        reopened = EventLogOutbox(SegmentedEventStore(tmp_path))
+        restored: InMemoryVersionedStore[MenuItem] = InMemoryVersionedStore()
+        assert restore_menu_items(reopened.event_store, restored) == 2
+
+        uow = self._uow(reopened, menu_items=restored)
+        async with uow:
+            burger = await uow.menu_item_repository.find_by_id(MenuItemId("m-1"))
+            fries = await uow.menu_item_repository.find_by_id(MenuItemId("m-2"))
+            assert burger.available is False
+            assert burger.version == menu_items["m-1"].version == 2
+            assert fries.price == Money(Decimal("3.50"))
+            burger.mark_available()
+            await uow.commit()
+        assert restored["m-1"].available is True
+        assert reopened.event_store.version("MenuItem", "m-1") == 3
+
+    async def test_outbox_projects_from_the_log(self, outbox):
+        read_repo = InMemoryOrderReadModelRepository()
+        processor = InMemoryOutboxProcessor(
+            outbox_repository=EventLogOutboxRepository(outbox),
+            projectors=[OrderProjector(read_repo)],
+        )
+        await self._save(self._uow(outbox), _order(items=2))
+
+        assert await processor.process_pending() == 3
+        assert outbox.checkpoint == 3
+        assert await processor.backlog() == 0
+        read_model = await read_repo.find_by_id("o-1")
+        assert read_model is not None
+        assert len(read_model.items) == 2
+
+    async def test_failed_entry_holds_back_later_entries_of_its_stream(self, outbox):
+        await self._save(self._uow(outbox), _order("o-1", items=1))
+        await self._save(self._uow(outbox), _order("o-2", items=0))
+
+        outbox.mark_failed("0", "boom")
+
+        ready = outbox.find_ready(limit=10)
+        assert [e.entry_id for e in ready] == ["2"]
+        assert outbox.pending_count == 3
+        outbox.mark_dead_lettered("0")
+        assert [e.entry_id for e in outbox.find_ready(limit=10)] == ["1", "2"]
+
+    async def test_failed_entry_waits_for_the_configured_backoff(self, tmp_path):
+        now = datetime.now(UTC)
+        outbox = EventLogOutbox(
+            SegmentedEventStore(tmp_path),
+            clock=lambda: now,
+            backoff=ExponentialBackoff(base=10),
+        )
+        await self._save(self._uow(outbox), _order(items=0))
+
+        outbox.mark_failed("0", "boom")
+        outbox.mark_failed("0", "boom")
+
+        [entry] = outbox._failed.values()
+        assert entry.next_retry_at == now + timedelta(seconds=20)
+        assert entry.retry_delay_seconds == 20
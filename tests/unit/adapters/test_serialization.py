@@ -0,0 +1,75 @@
+"""Unit tests for write-side record serialization."""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+
+from tabb.adapters.outbound.persistence.in_memory.serialization import (
+    menu_item_from_record,
+    menu_item_to_record,
+    order_from_record,
+    order_to_record,
+    outbox_entry_from_record,
+    outbox_entry_to_record,
+)
+from tabb.application.outbox import OutboxEntry
+from tabb.domain.events.events import OrderPlaced
+from tabb.domain.models.menu_item import MenuItem, MenuItemId
+from tabb.domain.models.order import Order, OrderId, OrderItemId
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+
+def _roundtrip(record: dict) -> dict:
+    return json.loads(json.dumps(record))
+
+
+class TestSerialization:
+    def test_order_roundtrip(self):
+        order = Order.place(OrderId("o-1"), TableNumber(3))
+        order.add_item(
+            OrderItemId("oi-1"),
+            MenuItemId("m-1"),
+            "Burger",
+            Money(Decimal("9.99")),
+            Quantity(2),
+        )
+        order.cancel_item(OrderItemId("oi-1"))
+        order.collect_events()
+        order._version = 5
+
+        restored = order_from_record(_roundtrip(order_to_record(order)))
+
+        assert restored == order
+        assert restored.version == 5
+        assert restored.status == order.status
+        assert restored.items[0].status == order.items[0].status
+        assert restored.items[0].unit_price == Money(Decimal("9.99"))
+        assert restored.collect_events() == []
+
+    def test_menu_item_roundtrip(self):
+        item = MenuItem.create(MenuItemId("m-1"), "Fries", Money(Decimal("3.50")))
+        item.mark_sold_out()
+        item._version = 2
+
+        restored = menu_item_from_record(_roundtrip(menu_item_to_record(item)))
+
+        assert restored.name == "Fries"
+        assert restored.price == Money(Decimal("3.50"))
+        assert restored.available is False
+        assert restored.version == 2
+
+    def test_outbox_entry_roundtrip(self):
+        entry = OutboxEntry.create(
+            entry_id="e-1",
+            event=OrderPlaced(order_id="o-1", table_number=3),
+            aggregate_id="o-1",
+            aggregate_type="Order",
+        )
+        entry.mark_failed("boom")
+        entry._sequence = 42
+
+        restored = outbox_entry_from_record(_roundtrip(outbox_entry_to_record(entry)))
+
+        assert restored == entry
+        assert restored.sequence == 42
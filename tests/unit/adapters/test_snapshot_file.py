@@ -0,0 +1,197 @@
+"""Unit tests for SnapshotFile and AsyncSnapshotWorker."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.encoded_records import (
+    EncodedRecords,
+)
+from tabb.adapters.outbound.persistence.in_memory.snapshot_file import (
+    InMemoryStores,
+    SnapshotFile,
+)
+from tabb.adapters.outbound.persistence.in_memory.unit_of_work import (
+    InMemoryUnitOfWork,
+)
+from tabb.adapters.outbound.persistence.in_memory.write_ahead_log import (
+    WriteAheadLog,
+    restore_from_log,
+)
+from tabb.adapters.outbound.workers.snapshot_worker import AsyncSnapshotWorker
+from tabb.application.backoff import ExponentialBackoff
+from tabb.application.outbox import OutboxEntryStatus
+from tabb.application.read_models.menu_item_read_model import MenuItemReadModel
+from tabb.application.read_models.order_read_model import OrderReadModel
+from tabb.domain.models.menu_item import MenuItem, MenuItemId
+from tabb.domain.models.order import Order, OrderId, OrderItemId
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _place_order(
+    stores: InMemoryStores, order_id: str, log: WriteAheadLog | None = None
+) -> None:
+    uow = InMemoryUnitOfWork(
+        stores.order_store,
+        stores.menu_item_store,
+        stores.outbox_store,
+        write_ahead_log=log,
+    )
+    async with uow:
+        order = Order.place(OrderId(order_id), TableNumber(4))
+        order.add_item(
+            OrderItemId(f"{order_id}-item"),
+            MenuItemId("m-1"),
+            "Burger",
+            Money(Decimal("9.99")),
+            Quantity(2),
+        )
+        await uow.order_repository.save(order)
+        await uow.commit()
+
+
+async def _populate(stores: InMemoryStores) -> None:
+    uow = InMemoryUnitOfWork(
+        stores.order_store, stores.menu_item_store, stores.outbox_store
+    )
+    async with uow:
+        await uow.menu_item_repository.save(
+            MenuItem.create(MenuItemId("m-1"), "Burger", Money(Decimal("9.99")))
+        )
+        await uow.commit()
+    await _place_order(stores, "o-1")
+    await stores.order_read_models.save(
+        OrderReadModel(order_id="o-1", table_number=4, status="open")
+    )
+    await stores.menu_item_read_models.save(
+        MenuItemReadModel(
+            menu_item_id="m-1", name="Burger", price="9.99", available=True
+        )
+    )
+
+
+class TestSnapshotFile:
+    async def test_missing_file_loads_nothing(self, tmp_path):
+        assert SnapshotFile(tmp_path / "stores.snapshot").load() is None
+
+    async def test_round_trip_restores_every_store(self, tmp_path):
+        stores = InMemoryStores.empty()
+        await _populate(stores)
+        snapshot_file = SnapshotFile(tmp_path / "stores.snapshot")
+
+        await snapshot_file.save(stores)
+        restored = snapshot_file.load()
+
+        assert restored is not None
+        assert restored.log_offset == 0
+        order = restored.stores.order_store["o-1"]
+        assert order.version == 1
+        assert order.items[0].total_price == Money(Decimal("19.98"))
+        assert restored.stores.menu_item_store["m-1"].name == "Burger"
+        assert sorted(e.event_type for e in restored.stores.outbox_store) == [
+            "MenuItemCreated",
+            "OrderItemAdded",
+            "OrderPlaced",
+        ]
+        assert restored.stores.outbox_store.pending_count == 3
+        read_models = restored.stores.order_read_models
+        assert [rm.order_id for rm in await read_models.find_by_table(4)] == ["o-1"]
+        menu_read_models = restored.stores.menu_item_read_models
+        assert [
+            rm.menu_item_id for rm in await menu_read_models.find_all_available()
+        ] == ["m-1"]
+
+    async def test_restored_records_decode_lazily(self, tmp_path):
+        stores = InMemoryStores.empty()
+        await _populate(stores)
+        snapshot_file = SnapshotFile(tmp_path / "stores.snapshot")
+        await snapshot_file.save(stores)
+
+        order_store = snapshot_file.load().stores.order_store
+
+        base = order_store._base
+        assert isinstance(base, EncodedRecords)
+        assert isinstance(base._data["o-1"], bytes)
+        assert order_store["o-1"].table == TableNumber(4)
+        assert not isinstance(base._data["o-1"], bytes)
+
+    async def test_resaving_restored_stores_keeps_them(self, tmp_path):
+        stores = InMemoryStores.empty()
+        await _populate(stores)
+        snapshot_file = SnapshotFile(tmp_path / "stores.snapshot")
+        await snapshot_file.save(stores)
+        restored = snapshot_file.load().stores
+
+        await _place_order(restored, "o-2")
+        await snapshot_file.save(restored)
+
+        order_store = snapshot_file.load().stores.order_store
+        assert sorted(order_store) == ["o-1", "o-2"]
+        assert order_store["o-1"].table == TableNumber(4)
+
+    async def test_only_the_log_tail_is_replayed(self, tmp_path):
+        log = WriteAheadLog(tmp_path / "wal.log")
+        stores = InMemoryStores.empty()
+        snapshot_file = SnapshotFile(tmp_path / "stores.snapshot")
+        await _place_order(stores, "o-1", log)
+        await snapshot_file.save(stores, log)
+        await _place_order(stores, "o-2", log)
+        log.close()
+
+        restored = snapshot_file.load()
+        tail = WriteAheadLog(tmp_path / "wal.log", start_offset=restored.log_offset)
+        commits = restore_from_log(
+            tail,
+            restored.stores.order_store,
+            restored.stores.menu_item_store,
+            restored.stores.outbox_store,
+        )
+
+        assert commits == 1
+        assert sorted(restored.stores.order_store) == ["o-1", "o-2"]
+        assert len(restored.stores.outbox_store) == 4
+
+    async def test_outbox_status_is_kept(self, tmp_path):
+        stores = InMemoryStores.empty()
+        await _place_order(stores, "o-1")
+        for entry in stores.outbox_store:
+            stores.outbox_store.mark_processed(entry.entry_id)
+        snapshot_file = SnapshotFile(tmp_path / "stores.snapshot")
+
+        await snapshot_file.save(stores)
+
+        outbox_store = snapshot_file.load().stores.outbox_store
+        assert all(e.status == OutboxEntryStatus.PROCESSED for e in outbox_store)
+        assert outbox_store.pending_count == 0
+
+    async def test_restored_outbox_uses_the_given_backoff(self, tmp_path):
+        stores = InMemoryStores.empty()
+        await _place_order(stores, "o-1")
+        snapshot_file = SnapshotFile(tmp_path / "stores.snapshot")
+        await snapshot_file.save(stores)
+
+        outbox_store = snapshot_file.load(
+            ExponentialBackoff(base=10)
+        ).stores.outbox_store
+        entry = next(iter(outbox_store))
+        outbox_store.mark_failed(entry.entry_id, "boom")
+
+        assert entry.retry_delay_seconds == 10
+
+
+class TestAsyncSnapshotWorker:
+    async def test_stop_saves_a_final_snapshot(self, tmp_path):
+        stores = InMemoryStores.empty()
+        await _populate(stores)
+        snapshot_file = SnapshotFile(tmp_path / "stores.snapshot")
+        worker = AsyncSnapshotWorker(snapshot_file, stores, interval_seconds=60)
+
+        await worker.start()
+        await worker.stop()
+
+        assert worker._task is None
+        assert "o-1" in snapshot_file.load().stores.order_store
@@ -0,0 +1,93 @@
+"""Unit tests for the hierarchical TimerWheel."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.timer_wheel import TimerWheel
+
+
+class TestTimerWheel:
+    def test_items_are_returned_once_their_deadline_passes(self):
+        wheel: TimerWheel[str] = TimerWheel(start=0.0, resolution=1.0)
+        wheel.schedule(3.0, "a")
+
+        assert wheel.expire(2.0) == []
+        assert wheel.expire(3.0) == ["a"]
+        assert wheel.expire(10.0) == []
+        assert len(wheel) == 0
+
+    def test_items_are_never_returned_early(self):
+        wheel: TimerWheel[str] = TimerWheel(start=0.0, resolution=1.0)
+        wheel.schedule(2.5, "a")
+
+        assert wheel.expire(2.9) == []
+        assert wheel.expire(3.0) == ["a"]
+
+    def test_past_deadlines_are_due_at_once(self):
+        wheel: TimerWheel[str] = TimerWheel(start=10.0, resolution=1.0)
+        wheel.schedule(1.0, "late")
+
+        assert wheel.expire(10.0) == ["late"]
+
+    def test_expire_returns_items_in_tick_order(self):
+        wheel: TimerWheel[int] = TimerWheel(start=0.0, resolution=1.0, slots=4)
+        for deadline in (9, 2, 30, 5, 1):
+            wheel.schedule(float(deadline), deadline)
+
+        assert wheel.expire(100.0) == [1, 2, 5, 9, 30]
+
+    def test_cascades_items_down_the_levels(self):
+        wheel: TimerWheel[int] = TimerWheel(
+            start=0.0, resolution=1.0, slots=4, levels=3
+        )
+        deadlines = list(range(64))
+        random.Random(5).shuffle(deadlines)
+        for deadline in deadlines:
+            wheel.schedule(float(deadline), deadline)
+
+        for now in range(64):
+            assert wheel.expire(float(now)) == [now]
+
+    def test_items_past_the_horizon_wait_until_due(self):
+        wheel: TimerWheel[str] = TimerWheel(
+            start=0.0, resolution=1.0, slots=4, levels=2
+        )
+        wheel.schedule(100.0, "far")
+
+        assert wheel.expire(99.0) == []
+        assert wheel.expire(100.0) == ["far"]
+
+    def test_empty_wheel_skips_ahead(self):
+        wheel: TimerWheel[str] = TimerWheel(start=0.0, resolution=0.001)
+        wheel.expire(1e9)
+        wheel.schedule(1e9 + 1, "a")
+
+        assert wheel.expire(1e9 + 1) == ["a"]
+
+    def test_next_deadline_is_never_after_the_next_item(self):
+        wheel: TimerWheel[str] = TimerWheel(start=0.0, resolution=1.0, slots=4)
+        assert wheel.next_deadline() is None
+
+        wheel.schedule(2.0, "near")
+        assert wheel.next_deadline() == 2.0
+
+        wheel.expire(2.0)
+        wheel.schedule(50.0, "far")
+        next_deadline = wheel.next_deadline()
+        assert next_deadline is not None
+        assert 2.0 < next_deadline <= 50.0
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"resolution": 0.0}, "resolution"),
+            ({"slots": 6}, "power of two"),
+            ({"levels": 0}, "levels"),
+        ],
+    )
+    def test_rejects_invalid_configuration(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            TimerWheel(start=0.0, **kwargs)
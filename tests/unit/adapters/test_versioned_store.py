@@ -0,0 +1,111 @@
+"""Unit tests for InMemoryVersionedStore."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.encoded_records import (
+    EncodedRecords,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+
+
+class _Value:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class TestInMemoryVersionedStore:
+    def test_snapshot_ignores_later_commits(self):
+        store = InMemoryVersionedStore({"a": _Value("a0")})
+        snapshot = store.snapshot()
+
+        store.commit({"a": _Value("a1"), "b": _Value("b1")})
+
+        assert snapshot.version == 0
+        assert snapshot.get("a").name == "a0"
+        assert "b" not in snapshot
+        assert store.version == 1
+        assert store["a"].name == "a1"
+        assert len(store) == 2
+
+    def test_commit_publishes_all_updates_at_once(self):
+        store: InMemoryVersionedStore[_Value] = InMemoryVersionedStore()
+
+        version = store.commit({"a": _Value("a"), "b": _Value("b")})
+
+        snapshot = store.snapshot()
+        assert version == snapshot.version == 1
+        assert snapshot.get("a").name == "a"
+        assert snapshot.get("b").name == "b"
+
+    def test_live_versions_track_pins(self):
+        store: InMemoryVersionedStore[_Value] = InMemoryVersionedStore()
+        first = store.snapshot()
+        second = store.snapshot()
+        store.commit({"a": _Value("a")})
+        third = store.snapshot()
+
+        assert store.live_versions == [0, 1]
+        first.release()
+        assert store.live_versions == [0, 1]
+        second.release()
+        second.release()
+        assert store.live_versions == [1]
+        third.release()
+        assert store.live_versions == [1]
+
+    def test_released_version_is_reclaimed(self):
+        replaced = _Value("old")
+        store = InMemoryVersionedStore({"a": replaced})
+        snapshot = store.snapshot()
+        ref = weakref.ref(replaced)
+        del replaced
+        store.commit({"a": _Value("new")})
+        gc.collect()
+        assert ref() is not None
+
+        snapshot.release()
+        gc.collect()
+
+        assert ref() is None
+
+    def test_released_snapshot_cannot_be_read(self):
+        store = InMemoryVersionedStore({"a": _Value("a")})
+        snapshot = store.snapshot()
+        snapshot.release()
+
+        with pytest.raises(RuntimeError):
+            snapshot.get("a")
+
+
+class TestInMemoryVersionedStoreBase:
+    def _base(self) -> EncodedRecords[_Value]:
+        return EncodedRecords(
+            lambda data: _Value(data.decode()), {"a": b"a0", "b": b"b0"}
+        )
+
+    def test_reads_fall_back_to_base(self):
+        store = InMemoryVersionedStore(base=self._base())
+
+        store.commit({"b": _Value("b1"), "c": _Value("c1")})
+
+        assert store["a"].name == "a0"
+        assert store["b"].name == "b1"
+        assert sorted(store) == ["a", "b", "c"]
+        assert len(store) == 3
+
+    def test_snapshot_encodes_base_and_committed_values(self):
+        store = InMemoryVersionedStore(base=self._base())
+        store.commit({"b": _Value("b1")})
+        snapshot = store.snapshot()
+
+        encoded = snapshot.encoded(lambda value: value.name.encode())
+
+        assert snapshot.get("a").name == "a0"
+        assert encoded == {"a": b"a0", "b": b"b1"}
@@ -0,0 +1,245 @@
+"""Unit tests for WriteAheadLog and restore_from_log."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from decimal import Decimal
+
+import pytest
+
+from tabb.adapters.outbound.persistence.in_memory.outbox_store import (
+    InMemoryOutboxStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.unit_of_work import (
+    InMemoryUnitOfWork,
+)
+from tabb.adapters.outbound.persistence.in_memory.versioned_store import (
+    InMemoryVersionedStore,
+)
+from tabb.adapters.outbound.persistence.in_memory.write_ahead_log import (
+    WriteAheadLog,
+    restore_from_log,
+)
+from tabb.application.outbox import OutboxEntryStatus
+from tabb.domain.models.menu_item import MenuItem, MenuItemId
+from tabb.domain.models.order import Order, OrderId, OrderItemId, OrderItemStatus
+from tabb.domain.models.value_objects import Money, Quantity, TableNumber
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _append(log: WriteAheadLog, record: dict) -> None:
+    await log.sync(log.append(record))
+
+
+def _fail_fsync(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fsync(fd: int) -> None:
+        raise OSError(5, "Input/output error")
+
+    monkeypatch.setattr(os, "fsync", fsync)
+
+
+class _Notifier:
+    def __init__(self) -> None:
+        self.notified = 0
+
+    def notify(self) -> None:
+        self.notified += 1
+
+
+class TestWriteAheadLog:
+    async def test_replays_synced_records_in_order(self, tmp_path):
+        log = WriteAheadLog(tmp_path / "wal.log")
+        for n in range(3):
+            await _append(log, {"n": n})
+        log.close()
+
+        assert list(WriteAheadLog(tmp_path / "wal.log").replay()) == [
+            {"n": 0},
+            {"n": 1},
+            {"n": 2},
+        ]
+
+    async def test_group_commit_shares_fsyncs(self, tmp_path):
+        log = WriteAheadLog(tmp_path / "wal.log")
+
+        await asyncio.gather(*(_append(log, {"n": n}) for n in range(50)))
+
+        assert log.sync_count < 50
+        assert len(list(log.replay())) == 50
+
+    async def test_without_group_commit_every_sync_fsyncs(self, tmp_path):
+        log = WriteAheadLog(tmp_path / "wal.log", group_commit=False)
+
+        for n in range(5):
+            await _append(log, {"n": n})
+
+        assert log.sync_count == 5
+
+    async def test_torn_tail_is_truncated_on_open(self, tmp_path):
+        path = tmp_path / "wal.log"
+        log = WriteAheadLog(path)
+        await _append(log, {"n": 0})
+        log.close()
+        with path.open("ab") as file:
+            file.write(b'0badc0de {"n": 1')
+
+        reopened = WriteAheadLog(path)
+        await _append(reopened, {"n": 2})
+        reopened.close()
+
+        assert list(WriteAheadLog(path).replay()) == [{"n": 0}, {"n": 2}]
+
+    async def test_replay_stops_at_corrupt_record(self, tmp_path):
+        path = tmp_path / "wal.log"
+        log = WriteAheadLog(path)
+        await _append(log, {"n": 0})
+        await _append(log, {"n": 1})
+        log.close()
+        path.write_bytes(path.read_bytes().replace(b'"n":1', b'"n":7'))
+
+        assert list(WriteAheadLog(path).replay()) == [{"n": 0}]
+
+    async def test_start_offset_skips_earlier_records(self, tmp_path):
+        path = tmp_path / "wal.log"
+        log = WriteAheadLog(path)
+        await _append(log, {"n": 0})
+        offset = log.position
+        await _append(log, {"n": 1})
+        log.close()
+
+        assert list(WriteAheadLog(path, start_offset=offset).replay()) == [{"n": 1}]
+
+    async def test_start_offset_past_end_is_rejected(self, tmp_path):
+        path = tmp_path / "wal.log"
+        WriteAheadLog(path).close()
+
+        with pytest.raises(ValueError):
+            WriteAheadLog(path, start_offset=10)
+
+    @pytest.mark.parametrize("group_commit", [True, False])
+    async def test_failed_fsync_fails_the_log(
+        self, tmp_path, monkeypatch, group_commit
+    ):
+        failures: list[BaseException] = []
+        log = WriteAheadLog(
+            tmp_path / "wal.log",
+            group_commit=group_commit,
+            on_failure=failures.append,
+        )
+        _fail_fsync(monkeypatch)
+
+        with pytest.raises(OSError):
+            await _append(log, {"n": 0})
+
+        assert log.failed
+        assert len(failures) == 1
+        with pytest.raises(RuntimeError):
+            log.append({"n": 1})
+        with pytest.raises(RuntimeError):
+            await log.sync(1)
+        assert len(failures) == 1
+
+
+class TestRestoreFromLog:
+    async def test_committed_state_survives_restart(self, tmp_path):
+        log = WriteAheadLog(tmp_path / "wal.log")
+        uow = InMemoryUnitOfWork(
+            InMemoryVersionedStore(),
+            InMemoryVersionedStore(),
+            InMemoryOutboxStore(),
+            write_ahead_log=log,
+        )
+        async with uow:
+            await uow.menu_item_repository.save(
+                MenuItem.create(MenuItemId("m-1"), "Burger", Money(Decimal("9.99")))
+            )
+            order = Order.place(OrderId("o-1"), TableNumber(4))
+            order.add_item(
+                OrderItemId("oi-1"),
+                MenuItemId("m-1"),
+                "Burger",
+                Money(Decimal("9.99")),
+                Quantity(2),
+            )
+            await uow.order_repository.save(order)
+            await uow.commit()
+        async with uow:
+            order = await uow.order_repository.find_by_id(OrderId("o-1"))
+            order.mark_item_ready(OrderItemId("oi-1"))
+            await uow.commit()
+        log.close()
+
+        order_store: InMemoryVersionedStore[Order] = InMemoryVersionedStore()
+        menu_item_store: InMemoryVersionedStore[MenuItem] = InMemoryVersionedStore()
+        outbox_store = InMemoryOutboxStore()
+        commits = restore_from_log(
+            WriteAheadLog(tmp_path / "wal.log"),
+            order_store,
+            menu_item_store,
+            outbox_store,
+        )
+
+        assert commits == 2
+        restored = order_store["o-1"]
+        assert restored.version == 2
+        assert restored.table == TableNumber(4)
+        assert restored.items[0].status == OrderItemStatus.READY
+        assert restored.items[0].total_price == Money(Decimal("19.98"))
+        assert menu_item_store["m-1"].version == 1
+        assert sorted(e.event_type for e in outbox_store) == [
+            "DishMarkedReady",
+            "MenuItemCreated",
+            "OrderItemAdded",
+            "OrderPlaced",
+        ]
+        assert all(e.status == OutboxEntryStatus.PENDING for e in outbox_store)
+
+    async def test_unchanged_commit_appends_nothing(self, tmp_path):
+        log = WriteAheadLog(tmp_path / "wal.log")
+        uow = InMemoryUnitOfWork(
+            InMemoryVersionedStore(),
+            InMemoryVersionedStore(),
+            InMemoryOutboxStore(),
+            write_ahead_log=log,
+        )
+
+        async with uow:
+            await uow.commit()
+
+        assert list(log.replay()) == []
+
+    async def test_failed_sync_stops_later_commits_from_publishing(
+        self, tmp_path, monkeypatch
+    ):
+        log = WriteAheadLog(tmp_path / "wal.log")
+        menu_item_store: InMemoryVersionedStore[MenuItem] = InMemoryVersionedStore()
+        notifier = _Notifier()
+        uow = InMemoryUnitOfWork(
+            InMemoryVersionedStore(),
+            menu_item_store,
+            InMemoryOutboxStore(),
+            notifier=notifier,
+            write_ahead_log=log,
+        )
+        _fail_fsync(monkeypatch)
+
+        with pytest.raises(OSError):
+            async with uow:
+                await uow.menu_item_repository.save(
+                    MenuItem.create(MenuItemId("m-1"), "Burger", Money(Decimal("9.99")))
+                )
+                await uow.commit()
+
+        # Published before the fsync failed, and the worker was told.
+        assert "m-1" in menu_item_store
+        assert notifier.notified == 1
+        with pytest.raises(RuntimeError):
+            async with uow:
+                await uow.menu_item_repository.save(
+                    MenuItem.create(MenuItemId("m-2"), "Fries", Money(Decimal("3.50")))
+                )
+                await uow.commit()
+        assert "m-2" not in menu_item_store
+        assert notifier.notified == 1
@@ -0,0 +1,66 @@
+"""Unit tests for the outbox retry backoff strategies."""
+
+from __future__ import annotations
+
+import random
+
+from tabb.application.backoff import (
+    DecorrelatedJitterBackoff,
+    ExponentialBackoff,
+    FullJitterBackoff,
+)
+
+
+class TestExponentialBackoff:
+    def test_doubles_per_attempt(self):
+        backoff = ExponentialBackoff(base=1.0)
+
+        assert [backoff.delay(n, 0.0) for n in range(1, 5)] == [1.0, 2.0, 4.0, 8.0]
+
+    def test_is_capped(self):
+        backoff = ExponentialBackoff(base=1.0, cap=5.0)
+
+        assert backoff.delay(10, 0.0) == 5.0
+
+
+class TestFullJitterBackoff:
+    def test_stays_within_the_exponential_window(self):
+        backoff = FullJitterBackoff(base=1.0, cap=30.0, rng=random.Random(7))
+
+        for attempt in range(1, 10):
+            delay = backoff.delay(attempt, 0.0)
+            assert 0.0 <= delay <= min(2 ** (attempt - 1), 30.0)
+
+    def test_spreads_entries_that_failed_together(self):
+        backoff = FullJitterBackoff(base=1.0, cap=60.0, rng=random.Random(7))
+
+        delays = {round(backoff.delay(6, 0.0), 3) for _ in range(100)}
+
+        assert len(delays) > 90
+
+    def test_seeded_rng_is_reproducible(self):
+        first = FullJitterBackoff(rng=random.Random(3))
+        second = FullJitterBackoff(rng=random.Random(3))
+
+        assert [first.delay(4, 0.0) for _ in range(5)] == [
+            second.delay(4, 0.0) for _ in range(5)
+        ]
+
+
+class TestDecorrelatedJitterBackoff:
+    def test_first_delay_is_between_base_and_three_times_base(self):
+        backoff = DecorrelatedJitterBackoff(base=2.0, rng=random.Random(1))
+
+        for _ in range(50):
+            assert 2.0 <= backoff.delay(1, 0.0) <= 6.0
+
+    def test_grows_from_the_previous_delay(self):
+        backoff = DecorrelatedJitterBackoff(base=1.0, rng=random.Random(1))
+
+        for _ in range(50):
+            assert 1.0 <= backoff.delay(5, 10.0) <= 30.0
+
+    def test_is_capped(self):
+        backoff = DecorrelatedJitterBackoff(base=1.0, cap=4.0, rng=random.Random(1))
+
+        assert all(backoff.delay(9, 100.0) <= 4.0 for _ in range(50))
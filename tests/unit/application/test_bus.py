@@ -1,12 +1,18 @@
 """Tests for in-process CQRS bus implementations."""
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
 
-from tabb.application.bus import InProcessCommandBus, InProcessQueryBus
+from tabb.application.bus import (
+    InProcessCommandBus,
+    InProcessQueryBus,
+    command_aggregate_key,
+)
+from tabb.application.exceptions import ConcurrencyConflictError
 from tabb.application.ports.inbound.commands import Command, CommandHandler
 from tabb.application.ports.inbound.queries import Query, QueryHandler
 
@@ -36,6 +42,29 @@ class _StubCommandHandler(CommandHandler):
         return await self.handle_mock(command)
 
 
+@dataclass(frozen=True, kw_only=True)
+class _OrderCommand(Command):
+    order_id: str
+    step: int = 0
+
+
+class _RecordingHandler(CommandHandler):
+    """Records start/end of each command and yields to the loop in between."""
+
+    def __init__(self, log: list[str], running: dict[str, int]) -> None:
+        self._log = log
+        self._running = running
+
+    async def handle(self, command: Any) -> Any:
+        self._running[command.order_id] = self._running.get(command.order_id, 0) + 1
+        assert self._running[command.order_id] == 1
+        self._log.append(f"start {command.order_id}/{command.step}")
+        for _ in range(3):
+            await asyncio.sleep(0)
+        self._log.append(f"end {command.order_id}/{command.step}")
+        self._running[command.order_id] -= 1
+
+
 @dataclass(frozen=True, kw_only=True)
 class _StubQuery(Query):
     value: str
@@ -107,6 +136,140 @@ class TestInProcessCommandBus:
         assert len(handlers) == 2
         assert handlers[0] is not handlers[1]
 
+    async def test_conflict_is_retried_with_fresh_handler(self) -> None:
+        bus = InProcessCommandBus(max_attempts=3)
+        handlers: list[_StubCommandHandler] = []
+
+        def factory() -> _StubCommandHandler:
+            h = _StubCommandHandler()
+            if not handlers:
+                h.handle_mock.side_effect = ConcurrencyConflictError(
+                    "Order", "o-1", 1, 2
+                )
+            handlers.append(h)
+            return h
+
+        bus.register(_StubCommand, factory)
+
+        result = await bus.dispatch(_StubCommand(value="a"))
+
+        assert result == "handled"
+        assert len(handlers) == 2
+
+    async def test_conflict_reraised_after_max_attempts(self) -> None:
+        bus = InProcessCommandBus(max_attempts=2)
+        handler = _StubCommandHandler()
+        handler.handle_mock.side_effect = ConcurrencyConflictError("Order", "o-1", 1, 2)
+        bus.register(_StubCommand, lambda: handler)
+
+        with pytest.raises(ConcurrencyConflictError):
+            await bus.dispatch(_StubCommand(value="a"))
+
+        assert handler.handle_mock.await_count == 2
+
+    async def test_other_errors_are_not_retried(self, bus: InProcessCommandBus) -> None:
+        handler = _StubCommandHandler()
+        handler.handle_mock.side_effect = RuntimeError("boom")
+        bus.register(_StubCommand, lambda: handler)
+
+        with pytest.raises(RuntimeError):
+            await bus.dispatch(_StubCommand(value="a"))
+
+        assert handler.handle_mock.await_count == 1
+
+    async def test_rejects_non_positive_max_attempts(self) -> None:
+        with pytest.raises(ValueError):
+            InProcessCommandBus(max_attempts=0)
+
+
+class TestInProcessCommandBusMailboxes:
+    async def test_same_aggregate_runs_one_at_a_time_in_order(self) -> None:
+        bus = InProcessCommandBus(mailbox_key=command_aggregate_key)
+        log: list[str] = []
+        bus.register(_OrderCommand, lambda: _RecordingHandler(log, {}))
+
+        await asyncio.gather(
+            *(bus.dispatch(_OrderCommand(order_id="o-1", step=i)) for i in range(3))
+        )
+
+        assert log == [
+            "start o-1/0",
+            "end o-1/0",
+            "start o-1/1",
+            "end o-1/1",
+            "start o-1/2",
+            "end o-1/2",
+        ]
+
+    async def test_different_aggregates_run_concurrently(self) -> None:
+        bus = InProcessCommandBus(mailbox_key=command_aggregate_key)
+        log: list[str] = []
+        bus.register(_OrderCommand, lambda: _RecordingHandler(log, {}))
+
+        await asyncio.gather(
+            bus.dispatch(_OrderCommand(order_id="o-1")),
+            bus.dispatch(_OrderCommand(order_id="o-2")),
+        )
+
+        assert log[:2] == ["start o-1/0", "start o-2/0"]
+
+    async def test_idle_mailboxes_are_reclaimed(self) -> None:
+        bus = InProcessCommandBus(mailbox_key=command_aggregate_key, stats_capacity=0)
+        bus.register(_OrderCommand, lambda: _RecordingHandler([], {}))
+
+        await asyncio.gather(
+            *(bus.dispatch(_OrderCommand(order_id=f"o-{i % 2}")) for i in range(4))
+        )
+
+        assert bus.mailbox_stats() == []
+
+    async def test_stats_record_depth_and_wait(self) -> None:
+        now = 0.0
+
+        class _SlowHandler(CommandHandler):
+            async def handle(self, command: Any) -> Any:
+                nonlocal now
+                await asyncio.sleep(0)
+                now += 1.0
+
+        bus = InProcessCommandBus(mailbox_key=command_aggregate_key, clock=lambda: now)
+        bus.register(_OrderCommand, _SlowHandler)
+
+        await asyncio.gather(
+            *(bus.dispatch(_OrderCommand(order_id="o-1")) for _ in range(3)),
+            bus.dispatch(_OrderCommand(order_id="o-2")),
+        )
+
+        hottest, other = bus.mailbox_stats()
+        assert hottest.key == "order_id:o-1"
+        assert hottest.depth == 0
+        assert hottest.max_depth == 3
+        assert hottest.dispatched == 3
+        assert hottest.max_wait_seconds > 0
+        assert hottest.total_wait_seconds > hottest.max_wait_seconds
+        assert other.key == "order_id:o-2"
+        assert other.max_depth == 1
+
+    async def test_commands_without_key_are_not_queued(self) -> None:
+        bus = InProcessCommandBus(mailbox_key=command_aggregate_key)
+        handler = _StubCommandHandler()
+        bus.register(_StubCommand, lambda: handler)
+
+        assert await bus.dispatch(_StubCommand(value="a")) == "handled"
+        assert bus.mailbox_stats() == []
+
+    async def test_aggregate_key_distinguishes_id_fields(self) -> None:
+        @dataclass(frozen=True, kw_only=True)
+        class _MenuItemCommand(Command):
+            menu_item_id: str
+
+        assert command_aggregate_key(_OrderCommand(order_id="x")) == "order_id:x"
+        assert (
+            command_aggregate_key(_MenuItemCommand(menu_item_id="x"))
+            == "menu_item_id:x"
+        )
+        assert command_aggregate_key(_StubCommand(value="x")) is None
+
 
 # ---------------------------------------------------------------------------
 # QueryBus Tests
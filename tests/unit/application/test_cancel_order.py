@@ -1,7 +1,7 @@
 """Tests for CancelOrderCommand handler."""
 
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -51,12 +51,6 @@ def _mock_uow(order=None):
     return uow
 
 
-def _id_generator():
-    gen = MagicMock()
-    gen.generate = MagicMock(return_value="generated-id")
-    return gen
-
-
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -69,7 +63,7 @@ class TestCancelOrderHandler:
 
     @pytest.fixture()
     def handler(self, uow) -> CancelOrderHandler:
-        return CancelOrderHandler(uow, _id_generator())
+        return CancelOrderHandler(uow)
 
     async def test_cancels_order(self, handler, uow) -> None:
         await handler.handle(CancelOrderCommand(order_id="o-1"))
@@ -79,15 +73,17 @@ class TestCancelOrderHandler:
         assert saved_order.status == OrderStatus.CANCELLED
         uow.commit.assert_awaited_once()
 
-    async def test_saves_outbox_entries(self, handler, uow) -> None:
+    async def test_leaves_events_for_unit_of_work(self, handler, uow) -> None:
         await handler.handle(CancelOrderCommand(order_id="o-1"))
 
-        assert uow.outbox_repository.save.await_count >= 1
+        saved = uow.order_repository.save.call_args[0][0]
+        assert saved.collect_events()
+        uow.outbox_repository.save.assert_not_awaited()
 
     async def test_order_not_found_raises(self) -> None:
         uow = _mock_uow()
         uow.order_repository.find_by_id = AsyncMock(return_value=None)
-        handler = CancelOrderHandler(uow, _id_generator())
+        handler = CancelOrderHandler(uow)
 
         with pytest.raises(OrderNotFoundError):
             await handler.handle(CancelOrderCommand(order_id="o-1"))
@@ -1,7 +1,7 @@
 """Tests for CompleteOrderCommand handler."""
 
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -54,12 +54,6 @@ def _mock_uow(order=None):
     return uow
 
 
-def _id_generator():
-    gen = MagicMock()
-    gen.generate = MagicMock(return_value="generated-id")
-    return gen
-
-
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -72,7 +66,7 @@ class TestCompleteOrderHandler:
 
     @pytest.fixture()
     def handler(self, uow) -> CompleteOrderHandler:
-        return CompleteOrderHandler(uow, _id_generator())
+        return CompleteOrderHandler(uow)
 
     async def test_completes_order(self, handler, uow) -> None:
         await handler.handle(CompleteOrderCommand(order_id="o-1"))
@@ -82,22 +76,24 @@ class TestCompleteOrderHandler:
         assert saved_order.status == OrderStatus.COMPLETED
         uow.commit.assert_awaited_once()
 
-    async def test_saves_outbox_entries(self, handler, uow) -> None:
+    async def test_leaves_events_for_unit_of_work(self, handler, uow) -> None:
         await handler.handle(CompleteOrderCommand(order_id="o-1"))
 
-        assert uow.outbox_repository.save.await_count >= 1
+        saved = uow.order_repository.save.call_args[0][0]
+        assert saved.collect_events()
+        uow.outbox_repository.save.assert_not_awaited()
 
     async def test_order_not_found_raises(self) -> None:
         uow = _mock_uow()
         uow.order_repository.find_by_id = AsyncMock(return_value=None)
-        handler = CompleteOrderHandler(uow, _id_generator())
+        handler = CompleteOrderHandler(uow)
 
         with pytest.raises(OrderNotFoundError):
             await handler.handle(CompleteOrderCommand(order_id="o-1"))
 
     async def test_items_not_ready_raises(self) -> None:
         uow = _mock_uow(order=_order(ready=False))
-        handler = CompleteOrderHandler(uow, _id_generator())
+        handler = CompleteOrderHandler(uow)
 
         with pytest.raises(OrderNotFullyReadyError):
             await handler.handle(CompleteOrderCommand(order_id="o-1"))
@@ -1,7 +1,7 @@
 """Tests for CreateMenuItemCommand handler."""
 
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -27,12 +27,6 @@ def _mock_uow():
     return uow
 
 
-def _id_generator():
-    gen = MagicMock()
-    gen.generate = MagicMock(return_value="generated-id")
-    return gen
-
-
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -45,7 +39,7 @@ class TestCreateMenuItemHandler:
 
     @pytest.fixture()
     def handler(self, uow) -> CreateMenuItemHandler:
-        return CreateMenuItemHandler(uow, _id_generator())
+        return CreateMenuItemHandler(uow)
 
     async def test_creates_menu_item(self, handler, uow) -> None:
         await handler.handle(
@@ -64,7 +58,7 @@ class TestCreateMenuItemHandler:
         assert saved.available is True
         uow.commit.assert_awaited_once()
 
-    async def test_saves_outbox_entries(self, handler, uow) -> None:
+    async def test_leaves_events_for_unit_of_work(self, handler, uow) -> None:
         await handler.handle(
             CreateMenuItemCommand(
                 menu_item_id="m-1",
@@ -73,4 +67,6 @@ class TestCreateMenuItemHandler:
             )
         )
 
-        assert uow.outbox_repository.save.await_count >= 1
+        saved = uow.menu_item_repository.save.call_args[0][0]
+        assert saved.collect_events()
+        uow.outbox_repository.save.assert_not_awaited()
@@ -26,7 +26,7 @@ def _order_read_model() -> OrderReadModel:
         order_id="o-1",
         table_number=5,
         status="open",
-        items=[
+        items=(
             OrderItemReadModel(
                 order_item_id="oi-1",
                 menu_item_id="m-1",
@@ -35,8 +35,8 @@ def _order_read_model() -> OrderReadModel:
                 quantity=2,
                 status="pending",
                 total_price="19.98",
-            )
-        ],
+            ),
+        ),
     )
 
 
@@ -0,0 +1,41 @@
+"""Tests for GetOrdersByStatusQuery handler."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tabb.application.queries.get_orders_by_status import (
+    GetOrdersByStatusHandler,
+    GetOrdersByStatusQuery,
+)
+from tabb.application.read_models.order_read_model import OrderReadModel
+
+pytestmark = pytest.mark.asyncio
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestGetOrdersByStatusHandler:
+    async def test_returns_orders_in_status(self) -> None:
+        read_repo = AsyncMock()
+        read_repo.find_by_status = AsyncMock(
+            return_value=[OrderReadModel(order_id="o-1", table_number=3, status="open")]
+        )
+        handler = GetOrdersByStatusHandler(read_repo)
+
+        result = await handler.handle(GetOrdersByStatusQuery(status="open"))
+
+        assert [r.order_id for r in result] == ["o-1"]
+        read_repo.find_by_status.assert_awaited_once_with("open")
+
+    async def test_returns_empty_list_when_none_match(self) -> None:
+        read_repo = AsyncMock()
+        read_repo.find_by_status = AsyncMock(return_value=[])
+        handler = GetOrdersByStatusHandler(read_repo)
+
+        result = await handler.handle(GetOrdersByStatusQuery(status="cancelled"))
+
+        assert result == []
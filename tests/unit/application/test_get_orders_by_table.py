@@ -0,0 +1,48 @@
+"""Tests for GetOrdersByTableQuery handler."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tabb.application.dto.order_dtos import OrderResult
+from tabb.application.queries.get_orders_by_table import (
+    GetOrdersByTableHandler,
+    GetOrdersByTableQuery,
+)
+from tabb.application.read_models.order_read_model import OrderReadModel
+
+pytestmark = pytest.mark.asyncio
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestGetOrdersByTableHandler:
+    @pytest.fixture()
+    def read_repo(self):
+        repo = AsyncMock()
+        repo.find_by_table = AsyncMock(
+            return_value=[
+                OrderReadModel(order_id="o-1", table_number=12, status="open"),
+                OrderReadModel(order_id="o-2", table_number=12, status="open"),
+            ]
+        )
+        return repo
+
+    async def test_returns_order_results(self, read_repo) -> None:
+        handler = GetOrdersByTableHandler(read_repo)
+
+        result = await handler.handle(GetOrdersByTableQuery(table_number=12))
+
+        assert all(isinstance(r, OrderResult) for r in result)
+        assert [r.order_id for r in result] == ["o-1", "o-2"]
+        read_repo.find_by_table.assert_awaited_once_with(12, None)
+
+    async def test_passes_status_filter(self, read_repo) -> None:
+        handler = GetOrdersByTableHandler(read_repo)
+
+        await handler.handle(GetOrdersByTableQuery(table_number=12, status="open"))
+
+        read_repo.find_by_table.assert_awaited_once_with(12, "open")
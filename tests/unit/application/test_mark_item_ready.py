@@ -1,7 +1,7 @@
 """Tests for MarkItemReadyCommand handler."""
 
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -52,12 +52,6 @@ def _mock_uow(order=None):
     return uow
 
 
-def _id_generator():
-    gen = MagicMock()
-    gen.generate = MagicMock(return_value="generated-id")
-    return gen
-
-
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -70,7 +64,7 @@ class TestMarkItemReadyHandler:
 
     @pytest.fixture()
     def handler(self, uow) -> MarkItemReadyHandler:
-        return MarkItemReadyHandler(uow, _id_generator())
+        return MarkItemReadyHandler(uow)
 
     async def test_marks_item_ready(self, handler, uow) -> None:
         await handler.handle(MarkItemReadyCommand(order_id="o-1", order_item_id="oi-1"))
@@ -80,15 +74,17 @@ class TestMarkItemReadyHandler:
         assert saved_order.items[0].status == OrderItemStatus.READY
         uow.commit.assert_awaited_once()
 
-    async def test_saves_outbox_entries(self, handler, uow) -> None:
+    async def test_leaves_events_for_unit_of_work(self, handler, uow) -> None:
         await handler.handle(MarkItemReadyCommand(order_id="o-1", order_item_id="oi-1"))
 
-        assert uow.outbox_repository.save.await_count >= 1
+        saved = uow.order_repository.save.call_args[0][0]
+        assert saved.collect_events()
+        uow.outbox_repository.save.assert_not_awaited()
 
     async def test_order_not_found_raises(self) -> None:
         uow = _mock_uow()
         uow.order_repository.find_by_id = AsyncMock(return_value=None)
-        handler = MarkItemReadyHandler(uow, _id_generator())
+        handler = MarkItemReadyHandler(uow)
 
         with pytest.raises(OrderNotFoundError):
             await handler.handle(
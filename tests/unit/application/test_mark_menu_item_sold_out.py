@@ -1,7 +1,7 @@
 """Tests for MarkMenuItemSoldOutCommand handler."""
 
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -37,12 +37,6 @@ def _mock_uow(menu_item=None):
     return uow
 
 
-def _id_generator():
-    gen = MagicMock()
-    gen.generate = MagicMock(return_value="generated-id")
-    return gen
-
-
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -55,7 +49,7 @@ class TestMarkMenuItemSoldOutHandler:
 
     @pytest.fixture()
     def handler(self, uow) -> MarkMenuItemSoldOutHandler:
-        return MarkMenuItemSoldOutHandler(uow, _id_generator())
+        return MarkMenuItemSoldOutHandler(uow)
 
     async def test_marks_sold_out(self, handler, uow) -> None:
         await handler.handle(MarkMenuItemSoldOutCommand(menu_item_id="m-1"))
@@ -65,15 +59,17 @@ class TestMarkMenuItemSoldOutHandler:
         assert saved.available is False
         uow.commit.assert_awaited_once()
 
-    async def test_saves_outbox_entries(self, handler, uow) -> None:
+    async def test_leaves_events_for_unit_of_work(self, handler, uow) -> None:
         await handler.handle(MarkMenuItemSoldOutCommand(menu_item_id="m-1"))
 
-        assert uow.outbox_repository.save.await_count >= 1
+        saved = uow.menu_item_repository.save.call_args[0][0]
+        assert saved.collect_events()
+        uow.outbox_repository.save.assert_not_awaited()
 
     async def test_not_found_raises(self) -> None:
         uow = _mock_uow()
         uow.menu_item_repository.find_by_id = AsyncMock(return_value=None)
-        handler = MarkMenuItemSoldOutHandler(uow, _id_generator())
+        handler = MarkMenuItemSoldOutHandler(uow)
 
         with pytest.raises(MenuItemNotFoundError):
             await handler.handle(MarkMenuItemSoldOutCommand(menu_item_id="m-1"))
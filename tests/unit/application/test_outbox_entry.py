@@ -1,9 +1,11 @@
-"""Unit tests for OutboxEntry exponential backoff."""
+"""Unit tests for OutboxEntry backoff and payload access."""
 
 from datetime import UTC, datetime, timedelta
 
+import pytest
+
 from tabb.application.outbox import OutboxEntry, OutboxEntryStatus
-from tabb.domain.events.events import MenuItemCreated
+from tabb.domain.events.events import MenuItemCreated, OrderPlaced
 
 
 def _make_entry() -> OutboxEntry:
@@ -69,3 +71,36 @@ class TestOutboxEntryBackoff:
         # Manually set to the past
         entry._next_retry_at = datetime.now(UTC) - timedelta(seconds=10)
         assert entry.is_ready_for_retry is True
+
+
+class TestOutboxEntryPayload:
+    def test_event_data_is_read_only_view(self):
+        entry = _make_entry()
+
+        data = entry.event_data
+        assert data == {"menu_item_id": "m-1", "name": "Burger", "price": "9.99"}
+        with pytest.raises(TypeError):
+            data["name"] = "Fries"  # type: ignore[index]
+
+    def test_create_captures_every_event_field(self):
+        event = OrderPlaced(order_id="o-1", table_number=4)
+
+        entry = OutboxEntry.create("entry-1", event, "o-1", "Order")
+
+        assert dict(entry.event_data) == {"order_id": "o-1", "table_number": 4}
+
+    def test_entries_are_slotted(self):
+        entry = _make_entry()
+
+        assert not hasattr(entry, "__dict__")
+
+    def test_missing_required_field_is_rejected(self):
+        with pytest.raises(ValueError, match="_event_type is required"):
+            OutboxEntry(
+                _entry_id="entry-1",
+                _event_type=None,  # type: ignore[arg-type]
+                _event_data={},
+                _aggregate_id="m-1",
+                _aggregate_type="MenuItem",
+                _occurred_at=datetime.now(UTC),
+            )
@@ -55,8 +55,8 @@ def _mock_uow(menu_item=None):
     uow = AsyncMock()
     uow.order_repository = AsyncMock()
     uow.menu_item_repository = AsyncMock()
-    uow.menu_item_repository.find_by_id = AsyncMock(
-        return_value=menu_item if menu_item is not None else _menu_item()
+    uow.menu_item_repository.find_by_ids = AsyncMock(
+        return_value=[menu_item if menu_item is not None else _menu_item()]
     )
     uow.outbox_repository = AsyncMock()
     uow.__aenter__ = AsyncMock(return_value=uow)
@@ -94,14 +94,16 @@ class TestPlaceOrderHandler:
         assert len(saved_order.items) == 1
         uow.commit.assert_awaited_once()
 
-    async def test_saves_outbox_entries(self, handler, uow) -> None:
+    async def test_leaves_events_for_unit_of_work(self, handler, uow) -> None:
         await handler.handle(_command())
 
-        assert uow.outbox_repository.save.await_count >= 1
+        saved = uow.order_repository.save.call_args[0][0]
+        assert saved.collect_events()
+        uow.outbox_repository.save.assert_not_awaited()
 
     async def test_verifies_menu_item_availability(self, id_generator) -> None:
         uow = _mock_uow(menu_item=None)
-        uow.menu_item_repository.find_by_id = AsyncMock(return_value=None)
+        uow.menu_item_repository.find_by_ids = AsyncMock(return_value=[])
         handler = PlaceOrderHandler(uow, id_generator)
 
         with pytest.raises(MenuItemNotAvailableError):
@@ -118,6 +120,29 @@ class TestPlaceOrderHandler:
         with pytest.raises(MenuItemNotAvailableError):
             await handler.handle(_command())
 
+    async def test_looks_up_menu_items_in_one_deduplicated_batch(
+        self, handler, uow
+    ) -> None:
+        uow.menu_item_repository.find_by_ids.return_value = [
+            _menu_item(),
+            _menu_item("m-2", "Fries", "4.99"),
+        ]
+
+        await handler.handle(
+            _command(
+                items=[
+                    _item_request(quantity=2),
+                    _item_request(menu_item_id="m-2", name="Fries"),
+                    _item_request(),
+                ]
+            )
+        )
+
+        uow.menu_item_repository.find_by_ids.assert_awaited_once_with(
+            [MenuItemId("m-1"), MenuItemId("m-2")]
+        )
+        uow.menu_item_repository.find_by_id.assert_not_awaited()
+
     async def test_empty_items_raises(self, handler) -> None:
         with pytest.raises(EmptyOrderError):
             await handler.handle(_command(items=[]))
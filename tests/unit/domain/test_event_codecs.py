@@ -0,0 +1,85 @@
+"""Tests for the generated per-event-type codecs."""
+
+from dataclasses import asdict, dataclass
+
+import pytest
+
+from tabb.domain.events.base import DomainEvent
+from tabb.domain.events.codecs import codec_for, codec_named
+from tabb.domain.events.events import (
+    DishMarkedReady,
+    MenuItemAvailable,
+    MenuItemCreated,
+    MenuItemSoldOut,
+    OrderCancelled,
+    OrderCompleted,
+    OrderItemAdded,
+    OrderItemCancelled,
+    OrderPlaced,
+)
+from tabb.domain.exceptions import RequiredFieldError
+
+EVENTS: list[DomainEvent] = [
+    OrderPlaced(order_id="o-1", table_number=4),
+    OrderItemAdded(
+        order_id="o-1",
+        order_item_id="oi-1",
+        menu_item_id="m-1",
+        name="Burger",
+        unit_price="9.99",
+        quantity=2,
+    ),
+    OrderItemCancelled(order_id="o-1", order_item_id="oi-1"),
+    DishMarkedReady(order_id="o-1", order_item_id="oi-1"),
+    OrderCompleted(order_id="o-1"),
+    OrderCancelled(order_id="o-1"),
+    MenuItemSoldOut(menu_item_id="m-1"),
+    MenuItemCreated(menu_item_id="m-1", name="Burger", price="9.99"),
+    MenuItemAvailable(menu_item_id="m-1"),
+]
+
+
+class TestEventCodecs:
+    @pytest.mark.parametrize("event", EVENTS, ids=lambda e: e.event_name)
+    def test_encode_matches_fields(self, event: DomainEvent) -> None:
+        assert codec_for(type(event)).encode(event) == asdict(event)
+
+    @pytest.mark.parametrize("event", EVENTS, ids=lambda e: e.event_name)
+    def test_decode_round_trips(self, event: DomainEvent) -> None:
+        codec = codec_named(event.event_name)
+
+        assert codec.decode(codec.encode(event)) == event
+
+    def test_every_event_type_is_registered(self) -> None:
+        for event in EVENTS:
+            assert codec_named(event.event_name).event_type is type(event)
+
+    def test_unknown_name_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown event type: Nope"):
+            codec_named("Nope")
+
+    def test_validate_reports_first_missing_field(self) -> None:
+        with pytest.raises(RequiredFieldError) as exc_info:
+            OrderItemAdded(
+                order_id="o-1",
+                order_item_id=None,  # type: ignore[arg-type]
+                menu_item_id="m-1",
+                name=None,  # type: ignore[arg-type]
+                unit_price="9.99",
+                quantity=1,
+            )
+
+        assert exc_info.value.class_name == "OrderItemAdded"
+        assert exc_info.value.field_name == "order_item_id"
+
+    def test_unregistered_subclass_is_compiled_on_first_use(self) -> None:
+        @dataclass(frozen=True, kw_only=True)
+        class TabSplit(DomainEvent):
+            order_id: str
+            ways: int
+
+        event = TabSplit(order_id="o-1", ways=3)
+
+        assert codec_for(TabSplit).encode(event) == {"order_id": "o-1", "ways": 3}
+        with pytest.raises(RequiredFieldError):
+            TabSplit(order_id="o-1", ways=None)  # type: ignore[arg-type]
@@ -99,3 +99,22 @@ class TestMenuItemMarkAvailable:
         item.collect_events()  # clear MenuItemCreated
         item.mark_available()
         assert item.collect_events() == []
+
+
+class TestMenuItemFromEvents:
+    def test_rebuilds_state_without_recording_events(self) -> None:
+        item = MenuItem.create(MenuItemId("m-1"), "Burger", Money(Decimal("9.99")))
+        item.mark_sold_out()
+        item.mark_available()
+        item.mark_sold_out()
+
+        rebuilt = MenuItem.from_events(item.collect_events())
+
+        assert rebuilt == item
+        assert rebuilt.available is False
+        assert rebuilt.price == Money(Decimal("9.99"))
+        assert rebuilt.collect_events() == []
+
+    def test_history_must_start_with_menu_item_created(self) -> None:
+        with pytest.raises(ValueError):
+            MenuItem.from_events([MenuItemSoldOut(menu_item_id="m-1")])
@@ -471,3 +471,108 @@ class TestOrderQueries:
         items = order.items
         items.append(_item(item_id="oi-2"))
         assert len(order.items) == 1
+
+
+# ---------------------------------------------------------------------------
+# Order.fork (copy-on-write)
+# ---------------------------------------------------------------------------
+
+
+class TestOrderFork:
+    def _two_item_order(self) -> Order:
+        order = _place_and_add(
+            items=[
+                ("oi-1", "m-1", "Burger", "9.99", 1),
+                ("oi-2", "m-2", "Fries", "4.99", 1),
+            ]
+        )
+        order.collect_events()
+        return order
+
+    def test_fork_shares_items_until_changed(self) -> None:
+        order = self._two_item_order()
+        clone = order.fork()
+
+        assert clone is not order
+        assert all(a is b for a, b in zip(clone.items, order.items, strict=True))
+
+        clone.mark_item_ready(OrderItemId("oi-1"))
+
+        assert clone.items[0] is not order.items[0]
+        assert clone.items[1] is order.items[1]
+        assert clone.items[0].status == OrderItemStatus.READY
+        assert order.items[0].status == OrderItemStatus.PENDING
+
+    def test_original_changes_do_not_leak_into_fork(self) -> None:
+        order = self._two_item_order()
+        clone = order.fork()
+
+        order.cancel()
+
+        assert order.status == OrderStatus.CANCELLED
+        assert clone.status == OrderStatus.OPEN
+        assert all(i.status == OrderItemStatus.PENDING for i in clone.items)
+
+    def test_fork_has_its_own_items_and_events(self) -> None:
+        order = self._two_item_order()
+        clone = order.fork()
+
+        clone.add_item(
+            OrderItemId("oi-3"), MenuItemId("m-3"), "Soup", _money("3.00"), Quantity(1)
+        )
+
+        assert len(order.items) == 2
+        assert order.collect_events() == []
+        assert len(clone.collect_events()) == 1
+
+
+class TestOrderFromEvents:
+    def _history(self, order: Order) -> list:
+        return order.collect_events()
+
+    def test_rebuilds_state_without_recording_events(self) -> None:
+        order = _place_and_add(
+            items=[
+                ("oi-1", "m-1", "Burger", "9.99", 2),
+                ("oi-2", "m-2", "Fries", "4.99", 1),
+                ("oi-3", "m-3", "Soup", "3.00", 1),
+            ]
+        )
+        order.mark_item_ready(OrderItemId("oi-1"))
+        order.cancel_item(OrderItemId("oi-2"))
+
+        rebuilt = Order.from_events(self._history(order))
+
+        assert rebuilt == order
+        assert rebuilt.items[0].unit_price == _money("9.99")
+        assert rebuilt.collect_events() == []
+
+    def test_replays_completion_and_cancellation(self) -> None:
+        completed = _place_and_add()
+        completed.mark_item_ready(OrderItemId("oi-1"))
+        completed.complete()
+        cancelled = _place_and_add(
+            items=[
+                ("oi-1", "m-1", "Burger", "9.99", 1),
+                ("oi-2", "m-2", "Fries", "4.99", 1),
+            ]
+        )
+        cancelled.mark_item_ready(OrderItemId("oi-1"))
+        cancelled.cancel()
+
+        assert Order.from_events(self._history(completed)) == completed
+        assert Order.from_events(self._history(cancelled)) == cancelled
+
+    def test_apply_catches_up_a_fork_without_touching_the_original(self) -> None:
+        order = _place_and_add()
+        order.collect_events()
+        clone = order.fork()
+
+        clone.apply(DishMarkedReady(order_id="o-1", order_item_id="oi-1"))
+
+        assert clone.items[0].status == OrderItemStatus.READY
+        assert order.items[0].status == OrderItemStatus.PENDING
+
+    def test_history_must_start_with_order_placed(self) -> None:
+        with pytest.raises(ValueError):
+            Order.from_events([OrderCompleted(order_id="o-1")])